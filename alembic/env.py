@@ -27,6 +27,8 @@ from src.core.ingestion.domain.chunk import Chunk
 from src.core.ingestion.domain.folder import Folder
 from src.core.admin_ops.domain.benchmark_run import BenchmarkRun
 from src.core.admin_ops.domain.usage import UsageLog
+from src.core.admin_ops.domain.query_metric import QueryMetricRecord, QueryMetricRollup
+from src.core.admin_ops.domain.tenant_stats import TenantStats
 from src.core.admin_ops.domain.flag import Flag
 from src.core.generation.domain.memory_models import UserFact, ConversationSummary
 from src.core.admin_ops.domain.audit import AuditLog
@@ -0,0 +1,33 @@
+"""Add (tenant_id, id COLLATE "C") indexes to documents and chunks
+
+Graph garbage collection streams each tenant's IDs in byte order to merge
+them against the IDs stored in Neo4j; these indexes serve that keyset scan.
+
+Revision ID: 20261018_0900
+Revises: 20260128_1112
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261018_0900'
+down_revision = '20260128_1112'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS ix_documents_tenant_id_id_c '
+        'ON documents (tenant_id, id COLLATE "C")'
+    )
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS ix_chunks_tenant_id_id_c '
+        'ON chunks (tenant_id, id COLLATE "C")'
+    )
+
+
+def downgrade() -> None:
+    op.execute('DROP INDEX IF EXISTS ix_chunks_tenant_id_id_c')
+    op.execute('DROP INDEX IF EXISTS ix_documents_tenant_id_id_c')
@@ -0,0 +1,28 @@
+"""Add embeddings to user facts and conversation summaries
+
+Revision ID: 20261018_1000
+Revises: 20261018_0900
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '20261018_1000'
+down_revision = '20261018_0900'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for table in ('user_facts', 'conversation_summaries'):
+        op.add_column(table, sa.Column('embedding', postgresql.ARRAY(sa.Float()), nullable=True))
+        op.add_column(table, sa.Column('embedding_model', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    for table in ('conversation_summaries', 'user_facts'):
+        op.drop_column(table, 'embedding_model')
+        op.drop_column(table, 'embedding')
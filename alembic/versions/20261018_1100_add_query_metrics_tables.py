@@ -0,0 +1,87 @@
+"""add query_metrics and query_metric_rollups tables
+
+Query metrics move from capped Redis lists to Postgres: raw rows for
+history and joins by conversation, hourly rollups for dashboards.
+
+Revision ID: 20261018_1100
+Revises: 20261018_1000
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261018_1100'
+down_revision = '20261018_1000'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('query_metrics',
+    sa.Column('query_id', sa.String(), nullable=False),
+    sa.Column('tenant_id', sa.String(), nullable=False),
+    sa.Column('conversation_id', sa.String(), nullable=True),
+    sa.Column('timestamp', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('operation', sa.String(), nullable=False),
+    sa.Column('query', sa.Text(), nullable=False),
+    sa.Column('response', sa.Text(), nullable=False),
+    sa.Column('embedding_latency_ms', sa.Float(), nullable=True),
+    sa.Column('retrieval_latency_ms', sa.Float(), nullable=True),
+    sa.Column('reranking_latency_ms', sa.Float(), nullable=True),
+    sa.Column('generation_latency_ms', sa.Float(), nullable=True),
+    sa.Column('total_latency_ms', sa.Float(), nullable=True),
+    sa.Column('chunks_retrieved', sa.Integer(), nullable=True),
+    sa.Column('chunks_used', sa.Integer(), nullable=True),
+    sa.Column('cache_hit', sa.Boolean(), nullable=True),
+    sa.Column('tokens_used', sa.Integer(), nullable=True),
+    sa.Column('input_tokens', sa.Integer(), nullable=True),
+    sa.Column('output_tokens', sa.Integer(), nullable=True),
+    sa.Column('cost_estimate', sa.Float(), nullable=True),
+    sa.Column('model', sa.String(), nullable=False),
+    sa.Column('provider', sa.String(), nullable=False),
+    sa.Column('success', sa.Boolean(), nullable=True),
+    sa.Column('error_message', sa.Text(), nullable=True),
+    sa.Column('sources_cited', sa.Integer(), nullable=True),
+    sa.Column('answer_length', sa.Integer(), nullable=True),
+    sa.PrimaryKeyConstraint('query_id')
+    )
+    op.create_index(
+        'ix_query_metrics_tenant_ts', 'query_metrics', ['tenant_id', 'timestamp', 'query_id']
+    )
+    op.create_index('ix_query_metrics_ts', 'query_metrics', ['timestamp', 'query_id'])
+    op.create_index(
+        'ix_query_metrics_conversation', 'query_metrics', ['conversation_id', 'tenant_id']
+    )
+
+    op.create_table('query_metric_rollups',
+    sa.Column('tenant_id', sa.String(), nullable=False),
+    sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('operation', sa.String(), nullable=False),
+    sa.Column('model', sa.String(), nullable=False),
+    sa.Column('query_count', sa.Integer(), nullable=False),
+    sa.Column('error_count', sa.Integer(), nullable=False),
+    sa.Column('cache_hits', sa.Integer(), nullable=False),
+    sa.Column('tokens_used', sa.Integer(), nullable=False),
+    sa.Column('input_tokens', sa.Integer(), nullable=False),
+    sa.Column('output_tokens', sa.Integer(), nullable=False),
+    sa.Column('cost_estimate', sa.Float(), nullable=False),
+    sa.Column('total_latency_ms', sa.Float(), nullable=False),
+    sa.Column('max_latency_ms', sa.Float(), nullable=False),
+    sa.Column('sources_cited', sa.Integer(), nullable=False),
+    sa.Column('answer_length', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('tenant_id', 'bucket_start', 'operation', 'model')
+    )
+    op.create_index(
+        'ix_query_metric_rollups_bucket', 'query_metric_rollups', ['bucket_start']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_query_metric_rollups_bucket', table_name='query_metric_rollups')
+    op.drop_table('query_metric_rollups')
+    op.drop_index('ix_query_metrics_conversation', table_name='query_metrics')
+    op.drop_index('ix_query_metrics_ts', table_name='query_metrics')
+    op.drop_index('ix_query_metrics_tenant_ts', table_name='query_metrics')
+    op.drop_table('query_metrics')
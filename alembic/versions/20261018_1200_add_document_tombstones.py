@@ -0,0 +1,34 @@
+"""add documents.deleted_at tombstone
+
+Deleting a document marks it with deleted_at and returns; the row and its
+graph, vector and object-storage data are removed by a batched cleanup job.
+
+Revision ID: 20261018_1200
+Revises: 20261018_1100
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261018_1200'
+down_revision = '20261018_1100'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('documents', sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index(
+        'ix_documents_tenant_deleted_at',
+        'documents',
+        ['tenant_id', 'deleted_at'],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_documents_tenant_deleted_at', table_name='documents')
+    op.drop_column('documents', 'deleted_at')
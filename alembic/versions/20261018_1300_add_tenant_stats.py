@@ -0,0 +1,160 @@
+"""add tenant_stats counters
+
+Per-tenant counters for the admin stats endpoint. Statement-level triggers
+keep the document, chunk and vector counters in step with the documents and
+chunks tables; graph counters are maintained by the application and all
+counters are periodically recounted by the reconcile_tenant_stats task.
+
+Revision ID: 20261018_1300
+Revises: 20261018_1200
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261018_1300'
+down_revision = '20261018_1200'
+branch_labels = None
+depends_on = None
+
+PROCESSING = "('EXTRACTING', 'CLASSIFYING', 'CHUNKING', 'EMBEDDING', 'GRAPH_SYNC')"
+
+# Net change per tenant of the rows in {rows} (tenant_id, sign, status)
+DOCUMENTS_DELTA = f"""
+    INSERT INTO tenant_stats AS s (
+        tenant_id, documents_total, documents_ready, documents_processing,
+        documents_failed, updated_at
+    )
+    SELECT tenant_id,
+           sum(sign),
+           sum(sign * (status = 'READY')::int),
+           sum(sign * (status IN {PROCESSING})::int),
+           sum(sign * (status = 'FAILED')::int),
+           now()
+    FROM ({{rows}}) AS delta
+    GROUP BY tenant_id
+    ON CONFLICT (tenant_id) DO UPDATE SET
+        documents_total = s.documents_total + EXCLUDED.documents_total,
+        documents_ready = s.documents_ready + EXCLUDED.documents_ready,
+        documents_processing = s.documents_processing + EXCLUDED.documents_processing,
+        documents_failed = s.documents_failed + EXCLUDED.documents_failed,
+        updated_at = now();
+"""
+
+CHUNKS_DELTA = """
+    INSERT INTO tenant_stats AS s (tenant_id, chunks_total, vectors_total, updated_at)
+    SELECT tenant_id, sum(sign), sum(sign * (embedding_status = 'COMPLETED')::int), now()
+    FROM ({rows}) AS delta
+    GROUP BY tenant_id
+    ON CONFLICT (tenant_id) DO UPDATE SET
+        chunks_total = s.chunks_total + EXCLUDED.chunks_total,
+        vectors_total = s.vectors_total + EXCLUDED.vectors_total,
+        updated_at = now();
+"""
+
+# Tombstoned documents no longer count
+DOCUMENT_ROWS = "SELECT tenant_id, {sign} AS sign, status::text AS status FROM {table} " \
+    "WHERE deleted_at IS NULL"
+# Updates that leave the counted columns alone don't touch tenant_stats
+CHANGED_DOCUMENTS = """
+    SELECT n.tenant_id, 1 AS sign, n.status::text AS status
+    FROM new_rows n JOIN old_rows o USING (id)
+    WHERE n.deleted_at IS NULL
+      AND (n.tenant_id, n.status, o.deleted_at IS NULL)
+          IS DISTINCT FROM (o.tenant_id, o.status, true)
+    UNION ALL
+    SELECT o.tenant_id, -1, o.status::text
+    FROM old_rows o JOIN new_rows n USING (id)
+    WHERE o.deleted_at IS NULL
+      AND (o.tenant_id, o.status, n.deleted_at IS NULL)
+          IS DISTINCT FROM (n.tenant_id, n.status, true)
+"""
+
+CHUNK_ROWS = "SELECT tenant_id, {sign} AS sign, embedding_status::text AS embedding_status " \
+    "FROM {table}"
+CHANGED_CHUNKS = """
+    SELECT n.tenant_id, 1 AS sign, n.embedding_status::text AS embedding_status
+    FROM new_rows n JOIN old_rows o USING (id)
+    WHERE (n.tenant_id, n.embedding_status) IS DISTINCT FROM (o.tenant_id, o.embedding_status)
+    UNION ALL
+    SELECT o.tenant_id, -1, o.embedding_status::text
+    FROM old_rows o JOIN new_rows n USING (id)
+    WHERE (o.tenant_id, o.embedding_status) IS DISTINCT FROM (n.tenant_id, n.embedding_status)
+"""
+
+
+def _trigger_function(name: str, delta: str, rows: str, changed: str) -> str:
+    return f"""
+    CREATE OR REPLACE FUNCTION {name}() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            {delta.format(rows=rows.format(sign=1, table='new_rows'))}
+        ELSIF TG_OP = 'DELETE' THEN
+            {delta.format(rows=rows.format(sign=-1, table='old_rows'))}
+        ELSE
+            {delta.format(rows=changed)}
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """
+
+
+def _create_triggers(table: str, function: str) -> None:
+    # Transition tables allow only one event per trigger
+    for event, transition in (
+        ('INSERT', 'NEW TABLE AS new_rows'),
+        ('UPDATE', 'OLD TABLE AS old_rows NEW TABLE AS new_rows'),
+        ('DELETE', 'OLD TABLE AS old_rows'),
+    ):
+        op.execute(
+            f"CREATE TRIGGER {table}_stats_{event.lower()} AFTER {event} ON {table} "
+            f"REFERENCING {transition} FOR EACH STATEMENT EXECUTE FUNCTION {function}()"
+        )
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tenant_stats',
+        sa.Column('tenant_id', sa.String(), nullable=False),
+        sa.Column('documents_total', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('documents_ready', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('documents_processing', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('documents_failed', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('chunks_total', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('vectors_total', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('entities_total', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('relationships_total', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('communities_total', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('reconciled_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            'updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()
+        ),
+        sa.PrimaryKeyConstraint('tenant_id'),
+    )
+
+    op.execute(
+        _trigger_function(
+            'tenant_stats_documents', DOCUMENTS_DELTA, DOCUMENT_ROWS, CHANGED_DOCUMENTS
+        )
+    )
+    op.execute(_trigger_function('tenant_stats_chunks', CHUNKS_DELTA, CHUNK_ROWS, CHANGED_CHUNKS))
+    _create_triggers('documents', 'tenant_stats_documents')
+    _create_triggers('chunks', 'tenant_stats_chunks')
+
+    # Backfill; the triggers' table locks keep writers out until this commits
+    op.execute(
+        DOCUMENTS_DELTA.format(rows=DOCUMENT_ROWS.format(sign=1, table='documents'))
+    )
+    op.execute(CHUNKS_DELTA.format(rows=CHUNK_ROWS.format(sign=1, table='chunks')))
+
+
+def downgrade() -> None:
+    for table in ('documents', 'chunks'):
+        for event in ('insert', 'update', 'delete'):
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_stats_{event} ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS tenant_stats_documents()")
+    op.execute("DROP FUNCTION IF EXISTS tenant_stats_chunks()")
+    op.drop_table('tenant_stats')
@@ -66,24 +66,30 @@ async def inspect_latest_backup():
             size_kb = info.file_size / 1024
             print(f"{info.filename:<40} | {size_kb:.2f}")
             
-            if info.filename == "ingestion/chunks.json":
+            if info.filename in ("ingestion/chunks.json", "ingestion/chunks.jsonl"):
                 import json
                 try:
-                    chunks_data = json.loads(zf.read("ingestion/chunks.json"))
+                    with zf.open(info.filename) as f:
+                        if info.filename.endswith(".jsonl"):
+                            chunks_data = [json.loads(line) for line in f if line.strip()]
+                        else:
+                            chunks_data = json.load(f)
                     print(f"  [Chunks Analysis]: Found {len(chunks_data)} chunks.")
                     if chunks_data:
                         sample = chunks_data[0]
                         print(f"  Sample Chunk ID: {sample.get('id')}")
                         print(f"  Embedding Status: {sample.get('embedding_status')}")
                 except Exception as e:
-                    print(f"  Error reading chunks.json: {e}")
+                    print(f"  Error reading {info.filename}: {e}")
 
             if info.filename == "database/postgres_dump.sql":
                 has_dump = True
                 if info.file_size < 100: # suspiciously small
                     print("  WARNING: Dump file is extremely small!")
             
-            if info.filename == "vectors/vectors.jsonl":
+            if info.filename == "vectors/vectors.jsonl" or info.filename.startswith(
+                "vectors/part-"
+            ):
                 has_vectors = True
             
             if info.filename == "graph/graph.jsonl":
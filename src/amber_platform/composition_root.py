@@ -470,6 +470,17 @@ def build_upload_document_use_case(
     )
 
 
+def build_bulk_document_operations(session):
+    """
+    Build BulkDocumentOperations with the Celery dispatcher and Redis state events.
+    """
+    from src.core.ingestion.application.bulk_operations import BulkDocumentOperations
+    from src.infrastructure.adapters.celery_dispatcher import CeleryTaskDispatcher
+    from src.infrastructure.adapters.redis_state_publisher import RedisStatePublisher
+
+    return BulkDocumentOperations(session, CeleryTaskDispatcher(), RedisStatePublisher())
+
+
 # @lru_cache # Removed because it now depends on Session (request-scoped)
 def build_retrieval_service(session=None):
     """
@@ -577,7 +588,4 @@ def build_metrics_collector():
     """Build the MetricsCollector."""
     from src.core.admin_ops.application.metrics.collector import MetricsCollector
 
-    settings = get_settings_lazy()
-    return MetricsCollector(
-        redis_url=settings.db.redis_url,
-    )
+    return MetricsCollector()
@@ -75,6 +75,11 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to initialize platform clients: {e}")
 
+    # Drop cached tenant config snapshots when another process updates a tenant
+    from src.core.tenants.application.tenant_config_cache import get_tenant_config_cache
+
+    get_tenant_config_cache().ensure_listener(settings.db.redis_url)
+
     # Initialize LLM Providers
     try:
         from src.core.generation.infrastructure.providers.factory import init_providers
@@ -324,11 +329,38 @@ async def lifespan(app: FastAPI):
     if _rate_limiter:
         await safe_shutdown(_rate_limiter.close(), "rate limiter")
 
+    # Flush deferred API key usage and stop principal invalidation listener
+    from src.core.admin_ops.application.auth_principal_cache import shutdown_auth_cache
+
+    await safe_shutdown(shutdown_auth_cache(), "auth principal cache")
+    await safe_shutdown(get_tenant_config_cache().stop_listener(), "tenant config cache")
+
+    # Write buffered decision traces while the graph client is still open
+    from src.core.graph.application.context_writer import shutdown_context_graph_writer
+
+    await safe_shutdown(shutdown_context_graph_writer(), "context graph writer")
+
+    # Stop the shared SSE event hub
+    from src.infrastructure.adapters.redis_event_hub import close_event_hub
+
+    await safe_shutdown(close_event_hub(), "document event hub")
+
     # Shutdown Platform Clients
     from src.amber_platform.composition_root import platform
 
     await safe_shutdown(platform.shutdown(), "platform clients")
 
+    # Write buffered query metrics and graph stats before the engine is disposed
+    from src.core.admin_ops.application.metrics.store import shutdown_metrics_store
+    from src.core.admin_ops.application.tenant_stats import shutdown_tenant_stats
+
+    await safe_shutdown(shutdown_metrics_store(), "metrics store")
+    await safe_shutdown(shutdown_tenant_stats(), "tenant stats")
+
+    from src.core.cache.decorators import close_cache_client
+
+    await safe_shutdown(close_cache_client(), "cache client")
+
     # Shutdown Database
     from src.core.database.session import close_database
 
@@ -12,9 +12,10 @@ from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
 
+from src.api.config import settings
 from src.shared.context import set_current_tenant, set_permissions
 from src.shared.identifiers import TenantId
-from src.shared.security import mask_api_key
+from src.shared.security import hash_api_key, mask_api_key
 
 logger = logging.getLogger(__name__)
 
@@ -130,15 +131,24 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
                 origin,
             )
 
-        # Validate API key via Service
+        # Resolve the key's principal (cached per process, see auth_principal_cache)
         from src.api.deps import _get_async_session_maker
         from src.core.admin_ops.application.api_key_service import ApiKeyService
+        from src.core.admin_ops.application.auth_principal_cache import (
+            get_principal_cache,
+            get_usage_recorder,
+        )
+
+        principal_cache = get_principal_cache()
+        principal_cache.ensure_listener(settings.db.redis_url)
+
+        async def load_principal():
+            async with _get_async_session_maker()() as session:
+                return await ApiKeyService(session).resolve_principal(api_key)
 
         valid_key = None
         try:
-            async with _get_async_session_maker()() as session:
-                service = ApiKeyService(session)
-                valid_key = await service.validate_key(api_key)
+            valid_key = await principal_cache.resolve(hash_api_key(api_key), load_principal)
         except Exception as e:
             logger.error(f"Auth DB Error: {e}")
             return _cors_error_response(500, "INTERNAL_ERROR", "Authentication failed", origin)
@@ -147,9 +157,11 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
             logger.warning(f"Invalid API key {mask_api_key(api_key)} for {request.method} {path}")
             return _cors_error_response(401, "UNAUTHORIZED", "Invalid API key.", origin)
 
+        get_usage_recorder().record(valid_key.id)
+
         # Resolve Tenant Context
         header_tenant_id = request.headers.get("X-Tenant-ID")
-        allowed_tenants = {t.id for t in valid_key.tenants}
+        allowed_tenants = valid_key.allowed_tenants
         tenant_id = None
 
         if header_tenant_id:
@@ -192,29 +204,13 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
                     origin,
                 )
 
-        permissions = valid_key.scopes or []
+        permissions = list(valid_key.scopes)
 
         set_current_tenant(tenant_id)
         set_permissions(permissions)
 
         # Resolve Tenant Role from the ApiKeyTenant association
-        tenant_role = "user"  # Default role
-        if str(tenant_id) in allowed_tenants:
-            # Find the specific association to get the role
-            from src.core.admin_ops.domain.api_key import ApiKeyTenant
-
-            async with _get_async_session_maker()() as session:
-                from sqlalchemy import select
-
-                result = await session.execute(
-                    select(ApiKeyTenant.role).where(
-                        ApiKeyTenant.api_key_id == valid_key.id,
-                        ApiKeyTenant.tenant_id == str(tenant_id),
-                    )
-                )
-                role_row = result.scalar_one_or_none()
-                if role_row:
-                    tenant_role = role_row
+        tenant_role = valid_key.role_for(str(tenant_id))
 
         # Store in request state for easy access
         request.state.tenant_id = tenant_id
@@ -5,7 +5,6 @@ Backup & Restore API
 Admin endpoints for system backup and restore operations.
 """
 
-import io
 import logging
 from uuid import uuid4
 
@@ -177,18 +176,22 @@ async def download_backup(job_id: str, tenant_id: str = "default"):
     # Stream file from MinIO
     storage = MinIOClient()
     try:
-        file_bytes = storage.get_file(job.result_path)
+        stream = storage.get_file_stream(job.result_path)
 
         filename = f"backup_{tenant_id}_{job_id[:8]}.zip"
 
-        return StreamingResponse(
-            io.BytesIO(file_bytes),
-            media_type="application/zip",
-            headers={
-                "Content-Disposition": f'attachment; filename="{filename}"',
-                "Content-Length": str(len(file_bytes)),
-            },
-        )
+        def iter_backup():
+            try:
+                yield from stream.stream(1024 * 1024)
+            finally:
+                stream.close()
+                stream.release_conn()
+
+        headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+        if job.file_size:
+            headers["Content-Length"] = str(job.file_size)
+
+        return StreamingResponse(iter_backup(), media_type="application/zip", headers=headers)
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail="Backup file not found in storage") from e
 
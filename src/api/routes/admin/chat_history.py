@@ -5,6 +5,7 @@ Chat History Admin Router
 Endpoints for viewing chat conversation history.
 """
 
+import logging
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
@@ -15,6 +16,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.api.deps import get_db_session
 from src.core.admin_ops.domain.feedback import Feedback
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/chat", tags=["Admin - Chat History"])
 
 
@@ -123,29 +126,20 @@ async def list_chat_history(
         # Build response
         conversations = []
 
-        # Fetch QueryMetrics for cost/token data
-        from src.api.config import settings
-        from src.core.admin_ops.application.metrics.collector import MetricsCollector
-
-        collector = MetricsCollector(redis_url=settings.db.redis_url)
-        all_metrics = await collector.get_recent(tenant_id=tenant_id, limit=500)
-
-        # Build a lookup by conversation_id
-        metrics_by_conv: dict[str, dict] = {}
-        for m in all_metrics:
-            if m.conversation_id:
-                if m.conversation_id not in metrics_by_conv:
-                    metrics_by_conv[m.conversation_id] = {
-                        "total_tokens": 0,
-                        "cost": 0.0,
-                        "model": m.model,
-                        "provider": m.provider,
-                    }
-                metrics_by_conv[m.conversation_id]["total_tokens"] += m.tokens_used
-                metrics_by_conv[m.conversation_id]["cost"] += m.cost_estimate
+        conv_ids = [conv.id for conv in rows]
+
+        # Cost/token totals for just this page, joined by conversation id
+        from src.core.admin_ops.application.metrics.store import get_metrics_store
+
+        try:
+            metrics_by_conv = await get_metrics_store().totals_by_conversation(
+                conv_ids, tenant_id=tenant_id
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load query metrics for chat history: {e}")
+            metrics_by_conv = {}
 
         # Fetch all conversation IDs with feedback for bulk lookup
-        conv_ids = [conv.id for conv in rows]
         feedback_query = (
             select(Feedback.request_id).where(Feedback.request_id.in_(conv_ids)).distinct()
         )
@@ -21,6 +21,7 @@ from src.core.tenants.application.active_vector_collection import (
     backfill_active_vector_collections,
     ensure_active_collection_update_allowed,
 )
+from src.core.tenants.application.tenant_config_cache import invalidate_tenant_config
 from src.shared.model_registry import (
     DEFAULT_EMBEDDING_MODEL,
     DEFAULT_LLM_MODEL,
@@ -627,6 +628,7 @@ async def update_tenant_config(tenant_id: str, update: TenantConfigUpdate, reque
                     session.add(target_tenant)
 
                 await session.commit()
+                await invalidate_tenant_config()
 
                 tuning_service = TuningService(async_session_maker)
                 for tenant in tenants:
@@ -676,6 +678,7 @@ async def update_tenant_config(tenant_id: str, update: TenantConfigUpdate, reque
 
                 session.add(tenant)
                 await session.commit()
+                await invalidate_tenant_config(tenant_id)
 
                 tuning_service = TuningService(async_session_maker)
                 await tuning_service.log_change(
@@ -754,6 +757,7 @@ async def reset_tenant_config(tenant_id: str):
             tenant.config = {}
             session.add(tenant)
             await session.commit()
+            await invalidate_tenant_config(tenant_id)
 
             # Log the reset
             tuning_service = TuningService(async_session_maker)
@@ -794,6 +798,9 @@ async def backfill_active_vector_collection():
             updated = backfill_active_vector_collections(tenants)
             await session.commit()
 
+        if updated:
+            await invalidate_tenant_config()
+
         return {"updated": updated, "total": len(tenants)}
     except Exception as e:
         logger.error(f"Failed to backfill active collections: {e}")
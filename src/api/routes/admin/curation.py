@@ -337,65 +337,66 @@ async def get_curation_stats():
     """
     Get curation queue statistics with optimized queries and caching.
 
-    Returns counts by status and type, plus resolution time metrics.
+    Returns counts by status and type, plus resolution time metrics. Served
+    from cache for 30 seconds, then stale for up to 5 minutes while one
+    request recomputes them in the background.
     """
     try:
-        from src.core.cache.decorators import get_from_cache, set_cache
+        from src.core.cache.decorators import get_or_compute
 
-        # Check cache first
-        cache_key = "admin:stats:curation"
-        cached = await get_from_cache(cache_key)
-        if cached:
-            return CurationStats(**cached)
-
-        async with async_session_maker() as session:
-            # OPTIMIZED: Single query for counts by status using GROUP BY
-            status_query = select(Flag.status, func.count().label("count")).group_by(Flag.status)
-
-            status_result = await session.execute(status_query)
-            status_counts = {row.status: row.count for row in status_result}
-
-            # Total is sum of all status counts
-            total = sum(status_counts.values())
-
-            # Extract individual counts (default to 0 if status doesn't exist)
-            pending = status_counts.get(FlagStatus.PENDING.value, 0)
-            accepted = status_counts.get(FlagStatus.ACCEPTED.value, 0)
-            rejected = status_counts.get(FlagStatus.REJECTED.value, 0)
-            merged = status_counts.get(FlagStatus.MERGED.value, 0)
-
-            # Counts by type (already uses GROUP BY - keep as is)
-            type_result = await session.execute(select(Flag.type, func.count()).group_by(Flag.type))
-            by_type = {
-                row[0].value if hasattr(row[0], "value") else row[0]: row[1] for row in type_result
-            }
-
-            # OPTIMIZED: Calculate average resolution time in SQL
-            # Extract EPOCH from timestamp difference for resolution time calculation
-            resolution_query = select(
-                func.avg(
-                    func.extract("epoch", func.cast(Flag.resolved_at, DateTime) - Flag.created_at)
-                    / 3600
-                ).label("avg_hours")
-            ).where(Flag.resolved_at.isnot(None))
-
-            resolution_result = await session.execute(resolution_query)
-            avg_time = resolution_result.scalar()
-
-            stats = CurationStats(
-                total_flags=total,
-                pending_count=pending,
-                accepted_count=accepted,
-                rejected_count=rejected,
-                merged_count=merged,
-                avg_resolution_time_hours=round(avg_time, 2) if avg_time else None,
-                flags_by_type=by_type,
-            )
-
-            # Cache for 30 seconds
-            await set_cache(cache_key, stats.dict(), ttl=30)
-            return stats
+        stats = await get_or_compute(
+            "admin:stats:curation", _compute_curation_stats, ttl=30, stale_ttl=300
+        )
+        return CurationStats(**stats)
 
     except Exception as e:
         logger.error(f"Failed to get curation stats: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to get stats: {str(e)}") from e
+
+
+async def _compute_curation_stats() -> dict:
+    """Curation counts from the database (the cached value of get_curation_stats)."""
+    async with async_session_maker() as session:
+        # OPTIMIZED: Single query for counts by status using GROUP BY
+        status_query = select(Flag.status, func.count().label("count")).group_by(Flag.status)
+
+        status_result = await session.execute(status_query)
+        status_counts = {row.status: row.count for row in status_result}
+
+        # Total is sum of all status counts
+        total = sum(status_counts.values())
+
+        # Extract individual counts (default to 0 if status doesn't exist)
+        pending = status_counts.get(FlagStatus.PENDING.value, 0)
+        accepted = status_counts.get(FlagStatus.ACCEPTED.value, 0)
+        rejected = status_counts.get(FlagStatus.REJECTED.value, 0)
+        merged = status_counts.get(FlagStatus.MERGED.value, 0)
+
+        # Counts by type (already uses GROUP BY - keep as is)
+        type_result = await session.execute(select(Flag.type, func.count()).group_by(Flag.type))
+        by_type = {
+            row[0].value if hasattr(row[0], "value") else row[0]: row[1] for row in type_result
+        }
+
+        # OPTIMIZED: Calculate average resolution time in SQL
+        # Extract EPOCH from timestamp difference for resolution time calculation
+        resolution_query = select(
+            func.avg(
+                func.extract("epoch", func.cast(Flag.resolved_at, DateTime) - Flag.created_at)
+                / 3600
+            ).label("avg_hours")
+        ).where(Flag.resolved_at.isnot(None))
+
+        resolution_result = await session.execute(resolution_query)
+        avg_time = resolution_result.scalar()
+
+        stats = CurationStats(
+            total_flags=total,
+            pending_count=pending,
+            accepted_count=accepted,
+            rejected_count=rejected,
+            merged_count=merged,
+            avg_resolution_time_hours=round(avg_time, 2) if avg_time else None,
+            flags_by_type=by_type,
+        )
+        return stats.model_dump()
@@ -2,7 +2,8 @@
 Embedding Administration
 ========================
 
-Endpoints for managing embedding models, including compatibility checks and data migration.
+Endpoints for managing embedding models, including compatibility checks and data migration
+(destructive re-ingestion or online shadow collection migration).
 """
 
 from typing import Any
@@ -16,6 +17,8 @@ from src.api.config import settings
 from src.api.deps import get_db_session
 from src.api.schemas.base import ResponseSchema
 from src.core.admin_ops.application.migration_service import EmbeddingMigrationService
+from src.core.admin_ops.application.online_migration import OnlineEmbeddingMigrator
+from src.core.database.session import get_session_maker
 from src.core.ingestion.domain.document import Document
 from src.core.state.machine import DocumentStatus
 from src.infrastructure.adapters.celery_dispatcher import CeleryTaskDispatcher
@@ -252,3 +255,83 @@ async def cancel_migration(tenant_id: str, db: AsyncSession = Depends(get_db_ses
     await service.cancel_tenant_migration(state.get("task_ids", []))
 
     return ResponseSchema(data={"cancelled": True}, message="Migration cancelled")
+
+
+# -----------------------------------------------------------------------------
+# Online (shadow collection) migration
+# -----------------------------------------------------------------------------
+
+
+def _get_online_migrator() -> OnlineEmbeddingMigrator:
+    return OnlineEmbeddingMigrator(
+        session_factory=get_session_maker(),
+        settings=settings,
+        vector_store_factory=build_vector_store_factory(),
+    )
+
+
+@router.post("/online-migrations", response_model=ResponseSchema[Any])
+async def start_online_migration(
+    tenant_id: str,
+    embedding_model: str,
+    embedding_provider: str | None = None,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """
+    Start a non-destructive migration to a new embedding model.
+
+    Creates a shadow collection, re-embeds existing chunks in the background
+    while new ingestions are written to both collections, then switches the
+    tenant over once the shadow has caught up. Search keeps serving the
+    current vectors throughout.
+    """
+    service = _get_migration_service(db)
+    provider, model, dimensions = await service.resolve_embedding_target(
+        embedding_model, embedding_provider
+    )
+
+    migrator = _get_online_migrator()
+    try:
+        state = await migrator.start(tenant_id, provider, model, dimensions)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
+
+    task_id = await service.task_dispatcher.dispatch(
+        "src.workers.tasks.migrate_tenant_embeddings", args=[tenant_id]
+    )
+    return ResponseSchema(data={**state, "task_id": task_id}, message="Online migration started")
+
+
+@router.get("/online-migrations", response_model=ResponseSchema[Any])
+async def get_online_migration(tenant_id: str):
+    """Progress of the tenant's online embedding migration."""
+    state = await _get_online_migrator().get_state(tenant_id)
+    if not state:
+        return ResponseSchema(data={"status": "idle"}, message="No online migration")
+
+    total = state.get("total_chunks") or 0
+    progress = 100 if not total else min(100, int(state.get("migrated_chunks", 0) * 100 / total))
+    return ResponseSchema(data={**state, "progress": progress}, message="Status retrieved")
+
+
+@router.post("/online-migrations/cutover", response_model=ResponseSchema[Any])
+async def cutover_online_migration(tenant_id: str, db: AsyncSession = Depends(get_db_session)):
+    """Catch up and switch the tenant to the shadow collection (runs in the background)."""
+    state = await _get_online_migrator().get_state(tenant_id)
+    if not state:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No online migration")
+
+    service = _get_migration_service(db)
+    task_id = await service.task_dispatcher.dispatch(
+        "src.workers.tasks.migrate_tenant_embeddings", args=[tenant_id, True]
+    )
+    return ResponseSchema(data={"task_id": task_id}, message="Cutover queued")
+
+
+@router.delete("/online-migrations", response_model=ResponseSchema[Any])
+async def abort_online_migration(tenant_id: str):
+    """Abort the migration and drop its shadow collection. Search is unaffected."""
+    aborted = await _get_online_migrator().abort(tenant_id)
+    if not aborted:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No online migration")
+    return ResponseSchema(data={"aborted": True}, message="Online migration aborted")
@@ -12,7 +12,7 @@ import os
 from datetime import UTC, datetime
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from pydantic import BaseModel, Field
 
 from src.api.deps import get_current_tenant_id, verify_admin
@@ -53,6 +53,8 @@ class CacheStats(BaseModel):
     hit_rate: float | None = None
     miss_rate: float | None = None
     evictions: int = 0
+    # Application cache counters of this API process, by key namespace
+    namespaces: dict[str, Any] = Field(default_factory=dict)
 
 
 class VectorStoreStats(BaseModel):
@@ -100,121 +102,29 @@ class MaintenanceResult(BaseModel):
 
 
 @router.get("/metrics/queries", response_model=list[Any])
-async def get_query_metrics(limit: int = 100, tenant_id: str | None = None):
+async def get_query_metrics(
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000),
+    tenant_id: str | None = None,
+    operation: str | None = None,
+    cursor: str | None = None,
+):
     """
     Get recent query metrics for debugging.
 
-    Returns detailed logs of recent queries including latency, tokens, cost, and errors.
+    Returns detailed logs of recent queries, ingestions and extractions including
+    latency, tokens, cost, and errors, newest first. When more rows exist the
+    ``X-Next-Cursor`` response header holds the cursor for the next page.
     """
     try:
-        from sqlalchemy import desc, func, select
+        from src.core.admin_ops.application.metrics.store import get_metrics_store
 
-        from src.api.config import settings
-        from src.core.admin_ops.application.metrics.collector import MetricsCollector, QueryMetrics
-        from src.core.admin_ops.domain.usage import UsageLog
-        from src.core.database.session import async_session_maker
-
-        # 1. Fetch real-time query metrics from Redis
-        redis_metrics = []
-        collector = MetricsCollector(redis_url=settings.db.redis_url)
-        try:
-            redis_metrics = await collector.get_recent(tenant_id=tenant_id, limit=limit)
-        finally:
-            await collector.close()
-
-        # 2. Fetch aggregated ingestion logs from Postgres
-        # Group by document_id (from metadata) for 'embedding' operations
-        ingestion_metrics = []
-
-        async with async_session_maker() as session:
-            # We want: document_id, sum(cost), sum(total_tokens), max(created_at)
-            # metadata_json->>'document_id' syntax depends on dialect, assuming Postgres
-
-            # Using text() for JSON operator to ensure compatibility
-            doc_id_expr = func.json_extract_path_text(UsageLog.metadata_json, "document_id")
-
-            stmt = (
-                select(
-                    doc_id_expr.label("document_id"),
-                    func.sum(UsageLog.cost).label("total_cost"),
-                    func.sum(UsageLog.total_tokens).label("total_tokens"),
-                    func.max(UsageLog.created_at).label("latest_at"),
-                    func.max(UsageLog.model).label("model"),
-                    func.max(UsageLog.provider).label("provider"),
-                )
-                .where(UsageLog.operation == "embedding")
-                .group_by(doc_id_expr)
-                .order_by(desc("latest_at"))
-                .limit(limit)
-            )
-
-            if tenant_id:
-                stmt = stmt.where(UsageLog.tenant_id == tenant_id)
-
-            result = await session.execute(stmt)
-            rows = result.all()
-
-            # Resolution of Document Names
-            # We fetch the filenames to show "Ingestion: filename.pdf" instead of "Ingestion: doc_123"
-            from src.core.ingestion.domain.document import Document
-
-            doc_ids = [row.document_id for row in rows if row.document_id]
-            doc_map = {}
-
-            if doc_ids:
-                try:
-                    stmt_docs = select(Document.id, Document.filename).where(
-                        Document.id.in_(doc_ids)
-                    )
-                    res_docs = await session.execute(stmt_docs)
-                    doc_map = {d.id: d.filename for d in res_docs.all()}
-                except Exception as e:
-                    logger.warning(f"Failed to resolve document names: {e}")
-
-            for row in rows:
-                if not row.document_id:
-                    continue
-
-                doc_name = doc_map.get(row.document_id, row.document_id)
-
-                # Create a synthetic QueryMetrics object for the ingestion event
-                metric = QueryMetrics(
-                    query_id=f"ingest_{row.document_id}",
-                    tenant_id=tenant_id
-                    or "unknown",  # Row doesn't have tenant_id in group by, but we filter by it or it's mixed
-                    query=f"Ingestion: {doc_name}",  # improved by frontend later
-                    timestamp=row.latest_at,
-                    operation="ingestion",
-                    response="Document Embedding",
-                    tokens_used=int(row.total_tokens or 0),
-                    cost_estimate=float(row.total_cost or 0),
-                    model=row.model,
-                    provider=row.provider,
-                    success=True,
-                    # Store minimal metadata to help frontend display
-                    conversation_id=doc_name,
-                )
-                ingestion_metrics.append(metric)
-
-        # 3. Merge and Sort
-        # Convert dataclasses to dicts if needed, or keep as objects.
-        # The endpoint response_model is list[Any], so Pydantic will serialize dataclasses fine.
-
-        all_metrics = redis_metrics + ingestion_metrics
-        # Sort by timestamp descending
-        # Helper to ensure timezone-aware comparison
-        def _get_sort_key(m):
-            ts = m.timestamp
-            if ts is None:
-                return datetime.min.replace(tzinfo=UTC)
-            if ts.tzinfo is None:
-                return ts.replace(tzinfo=UTC)
-            return ts
-
-        # Sort by timestamp descending
-        all_metrics.sort(key=_get_sort_key, reverse=True)
-
-        return all_metrics[:limit]
+        page = await get_metrics_store().list_recent(
+            tenant_id=tenant_id, limit=limit, cursor=cursor, operation=operation
+        )
+        if page.next_cursor:
+            response.headers["X-Next-Cursor"] = page.next_cursor
+        return page.items
 
     except Exception as e:
         logger.error(f"Failed to get query metrics: {e}")
@@ -226,12 +136,12 @@ async def get_system_stats(tenant_id: str = Depends(get_current_tenant_id)):
     """
     Get comprehensive system statistics.
 
-    Returns counts and metrics from database, cache, and vector store.
+    Document, chunk, vector and graph counts come from the tenant's maintained
+    counters (see tenant_stats); cache metrics are read from Redis.
     """
     try:
-        db_stats = await _get_database_stats(tenant_id)
+        db_stats, vector_stats = await _get_tenant_stats(tenant_id)
         cache_stats = await _get_cache_stats(tenant_id)
-        vector_stats = await _get_vector_store_stats(tenant_id)
 
         return SystemStats(
             database=db_stats,
@@ -294,54 +204,90 @@ async def clear_cache(pattern: str | None = None):
         raise HTTPException(status_code=500, detail=f"Failed to clear cache: {str(e)}") from e
 
 
+# Progress of the running (or last) orphan pruning, per tenant
+_prune_progress: dict[str, dict[str, Any]] = {}
+
+
 @router.post("/prune/orphans", response_model=MaintenanceResult)
-async def prune_orphans():
+async def prune_orphans(
+    tenant_id: str | None = None, batch_size: int = Query(2000, ge=100, le=50000)
+):
     """
     Remove orphan nodes from the graph.
 
-    Finds and removes:
+    Per tenant (all tenants when ``tenant_id`` is omitted), finds and removes:
     - Documents in Graph not in Postgres
     - Chunks in Graph not in Postgres
-    - Entities not connected to anything
+    - Entities no longer mentioned by any chunk
+    - Communities without member entities or child communities
+
+    Work is done in batches of ``batch_size`` nodes; poll
+    ``/prune/orphans/status`` for progress.
     """
     import time
+    from functools import partial
 
     from sqlalchemy.future import select
 
     from src.amber_platform.composition_root import platform
     from src.core.database.session import async_session_maker
-    from src.core.ingestion.domain.chunk import Chunk
-    from src.core.ingestion.domain.document import Document
+    from src.core.graph.application.garbage_collector import (
+        GCProgress,
+        GraphGarbageCollector,
+        paginate,
+    )
+    from src.core.ingestion.infrastructure.repositories.postgres_document_repository import (
+        PostgresDocumentRepository,
+    )
+    from src.core.tenants.domain.tenant import Tenant
 
     start = time.time()
 
-    try:
-        # 1. Fetch valid IDs from Postgres
-        async with async_session_maker() as session:
-            # We fetch all IDs.
-            # NOTE: Ideally this should be batched or streamed for massive datasets.
-            # But for maintenance tool it's acceptable to hold ID lists in memory for now (IDs are small).
-            # If > 100k docs, we should paginate.
-
-            # Fetch valid Doc IDs
-            result_docs = await session.execute(select(Document.id))
-            valid_doc_ids = result_docs.scalars().all()
+    def record_progress(progress: GCProgress) -> None:
+        _prune_progress[progress.tenant_id] = {
+            "status": "running",
+            "phase": progress.phase,
+            "scanned": progress.scanned,
+            "deleted": progress.deleted,
+            "elapsed_seconds": progress.elapsed_seconds,
+        }
 
-            # Fetch valid Chunk IDs
-            result_chunks = await session.execute(select(Chunk.id))
-            valid_chunk_ids = result_chunks.scalars().all()
+    gc = GraphGarbageCollector(
+        platform.neo4j_client, batch_size=batch_size, on_progress=record_progress
+    )
 
-        # 2. Call Neo4j Pruning
-        # Convert UUIDs to strings just in case
-        valid_doc_ids = [str(uid) for uid in valid_doc_ids]
-        valid_chunk_ids = [str(uid) for uid in valid_chunk_ids]
+    try:
+        counts = {"documents": 0, "chunks": 0, "entities": 0, "communities": 0}
+        async with async_session_maker() as session:
+            if tenant_id:
+                tenant_ids = [tenant_id]
+            else:
+                # Graph tenants missing from Postgres are pruned entirely
+                result = await session.execute(select(Tenant.id))
+                tenant_ids = sorted(
+                    set(result.scalars().all()) | set(await gc.graph_tenant_ids())
+                )
 
-        counts = await platform.neo4j_client.prune_orphans(valid_doc_ids, valid_chunk_ids)
+            repository = PostgresDocumentRepository(session)
+            for tid in tenant_ids:
+                report = await gc.collect(
+                    tid,
+                    valid_document_ids=paginate(partial(repository.list_ids, tid), batch_size),
+                    valid_chunk_ids=paginate(partial(repository.list_chunk_ids, tid), batch_size),
+                )
+                _prune_progress[tid] = {
+                    "status": "completed",
+                    "deleted": report.deleted,
+                    "scanned": report.scanned,
+                    "elapsed_seconds": report.duration_seconds,
+                }
+                for key, value in report.deleted.items():
+                    counts[key] += value
 
         orphans_removed = sum(counts.values())
         duration = time.time() - start
 
-        message = f"Removed orphans: {counts}"
+        message = f"Removed orphans across {len(tenant_ids)} tenant(s): {counts}"
         logger.info(f"Orphan pruning completed: {message}")
 
         return MaintenanceResult(
@@ -357,6 +303,14 @@ async def prune_orphans():
         raise HTTPException(status_code=500, detail=f"Failed to prune orphans: {str(e)}") from e
 
 
+@router.get("/prune/orphans/status")
+async def get_prune_orphans_status(tenant_id: str | None = None) -> dict[str, Any]:
+    """Progress of the current or last orphan pruning, per tenant."""
+    if tenant_id:
+        return {tenant_id: _prune_progress.get(tenant_id, {"status": "idle"})}
+    return dict(_prune_progress)
+
+
 @router.post("/prune/stale-communities", response_model=MaintenanceResult)
 async def prune_stale_communities(max_age_days: int = 30):
     """
@@ -621,153 +575,47 @@ async def delete_vector_collection(collection_name: str):
 # =============================================================================
 
 
-async def _get_database_stats(tenant_id: str) -> DatabaseStats:
-    """Get PostgreSQL/Neo4j statistics with optimized queries and caching."""
-    try:
-        from src.core.cache.decorators import get_from_cache, set_cache
-
-        # Check cache first
-        cache_key = f"admin:stats:database:{tenant_id}"
-        cached = await get_from_cache(cache_key)
-        if cached:
-            return DatabaseStats(**cached)
-
-        from sqlalchemy import case, func
-        from sqlalchemy.future import select
-
-        from src.core.database.session import async_session_maker
-        from src.core.ingestion.domain.chunk import Chunk
-        from src.core.ingestion.domain.document import Document
-        from src.core.state.machine import DocumentStatus
-
-        async with async_session_maker() as session:
-            # OPTIMIZED: Single query for all document counts using CASE
-            count_query = select(
-                func.count(Document.id).label("total"),
-                func.sum(case((Document.status == DocumentStatus.READY, 1), else_=0)).label(
-                    "ready"
-                ),
-                func.sum(
-                    case(
-                        (
-                            Document.status.in_(
-                                [
-                                    DocumentStatus.EXTRACTING,
-                                    DocumentStatus.CLASSIFYING,
-                                    DocumentStatus.CHUNKING,
-                                ]
-                            ),
-                            1,
-                        ),
-                        else_=0,
-                    )
-                ).label("processing"),
-                func.sum(case((Document.status == DocumentStatus.FAILED, 1), else_=0)).label(
-                    "failed"
-                ),
-            ).where(Document.tenant_id == tenant_id)
-
-            result = await session.execute(count_query)
-            row = result.one()
-
-            # Chunk count (separate query as it's a different table)
-            # Need to join with Document if Chunk doesn't have tenant_id, OR check schema.
-            # Assuming Chunk has tenant_id based on typical multi-tenant design.
-            # If not, join: select(func.count(Chunk.id)).join(Document).where(Document.tenant_id == tenant_id)
-            # Let's check schema assumption. Assuming yes for now, but safer to join if unsure.
-            # Based on folders.py usage: select(Document).where... -> so Chunks likely child.
-            # In use_cases_documents.py: request.tenant_id is used.
-            # Let's use the explicit filter on Chunk if available, or Join.
-            # Given previous context, Chunks usually have tenant_id. Let's try simple filter.
-            chunk_query = select(func.count(Chunk.id)).where(Chunk.tenant_id == tenant_id)
-            chunk_count = await session.scalar(chunk_query)
-
-            # OPTIMIZED: Get all Neo4j counts in a single query
-            neo4j_stats = await _get_neo4j_stats_consolidated(tenant_id)
-
-            stats = DatabaseStats(
-                documents_total=row.total or 0,
-                documents_ready=row.ready or 0,
-                documents_processing=row.processing or 0,
-                documents_failed=row.failed or 0,
-                chunks_total=chunk_count or 0,
-                **neo4j_stats,
-            )
-
-            # Cache for 60 seconds
-            await set_cache(cache_key, stats.dict(), ttl=60)
-            return stats
-
-    except Exception as e:
-        logger.warning(f"Failed to get database stats: {e}")
-        return DatabaseStats()
+async def _get_tenant_stats(tenant_id: str) -> tuple[DatabaseStats, VectorStoreStats]:
+    """
+    Read the tenant's maintained counters (one primary-key lookup).
 
+    Schedules a low-priority recount when the counters were never reconciled
+    or the last recount is older than the reconcile interval.
+    """
+    from src.core.admin_ops.application.tenant_stats import (
+        TenantStatsService,
+        needs_reconcile,
+        schedule_stats_reconcile,
+    )
 
-async def _get_neo4j_stats_consolidated(tenant_id: str) -> dict:
-    """Get all Neo4j counts in a single optimized query."""
     try:
-        from src.amber_platform.composition_root import platform
-
-        # OPTIMIZED: Single query returning all counts at once
-        cypher = """
-        MATCH (e:Entity {tenant_id: $tenant_id})
-        WHERE (e)<-[:MENTIONS]-()  // Count only entities mentioned by at least one active chunk
-        WITH count(e) as entity_count
-
-        MATCH (c:Community {tenant_id: $tenant_id})
-        WHERE EXISTS { (:Entity)-[:BELONGS_TO|IN_COMMUNITY]->(c) } // Count only non-empty communities
-        WITH entity_count, count(c) as community_count
-
-        // Count relationships connected to valid entities
-        MATCH (a:Entity {tenant_id: $tenant_id})-[r]->(b:Entity {tenant_id: $tenant_id})
-        WHERE (a)<-[:MENTIONS]-() AND (b)<-[:MENTIONS]-()
-        RETURN entity_count, count(r) as rel_count, community_count
-        """
-
-        result = await platform.neo4j_client.execute_read(cypher, {"tenant_id": tenant_id})
-        if result and len(result) > 0:
-            row = result[0]
-            return {
-                "entities_total": row.get("entity_count", 0),
-                "relationships_total": row.get("rel_count", 0),
-                "communities_total": row.get("community_count", 0),
-            }
-        return {"entities_total": 0, "relationships_total": 0, "communities_total": 0}
-
+        stats = await TenantStatsService().get(tenant_id)
     except Exception as e:
-        logger.debug(f"Failed to get Neo4j stats: {e}")
-        return {"entities_total": 0, "relationships_total": 0, "communities_total": 0}
-
+        logger.warning(f"Failed to get tenant stats: {e}")
+        return DatabaseStats(), VectorStoreStats()
 
-# Legacy functions kept for backwards compatibility (now call consolidated function)
-async def _get_neo4j_entity_count() -> int:
-    """Get entity count from Neo4j. (Deprecated - use _get_neo4j_stats_consolidated)"""
-    stats = await _get_neo4j_stats_consolidated()
-    return stats.get("entities_total", 0)
-
-
-async def _get_neo4j_relationship_count() -> int:
-    """Get relationship count from Neo4j. (Deprecated - use _get_neo4j_stats_consolidated)"""
-    stats = await _get_neo4j_stats_consolidated()
-    return stats.get("relationships_total", 0)
+    if needs_reconcile(stats):
+        try:
+            from src.infrastructure.adapters.celery_dispatcher import CeleryTaskDispatcher
 
+            await schedule_stats_reconcile(CeleryTaskDispatcher(), tenant_id)
+        except Exception as e:
+            logger.warning(f"Failed to schedule stats reconciliation for {tenant_id}: {e}")
 
-async def _get_neo4j_community_count() -> int:
-    """Get community count from Neo4j. (Deprecated - use _get_neo4j_stats_consolidated)"""
-    stats = await _get_neo4j_stats_consolidated()
-    return stats.get("communities_total", 0)
+    database = DatabaseStats(**{name: stats[name] for name in DatabaseStats.model_fields})
+    vector_store = await _get_vector_store_stats(stats["vectors_total"])
+    return database, vector_store
 
 
 async def _get_cache_stats(tenant_id: str) -> CacheStats:
     """Get Redis cache statistics."""
-    try:
-        import redis
+    from src.core.cache.decorators import get_cache_client, get_cache_metrics
 
-        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-        r = redis.from_url(redis_url)
+    try:
+        r = get_cache_client()
 
-        info = r.info("memory")
-        stats = r.info("stats")
+        info = await r.info("memory")
+        stats = await r.info("stats")
 
         used = info.get("used_memory", 0)
         max_mem = info.get("maxmemory", 0) or used * 2  # Estimate if not set
@@ -780,86 +628,57 @@ async def _get_cache_stats(tenant_id: str) -> CacheStats:
             memory_used_bytes=used,
             memory_max_bytes=max_mem,
             memory_usage_percent=round((used / max_mem) * 100, 2) if max_mem > 0 else 0,
-            keys_total=r.dbsize(),
+            keys_total=await r.dbsize(),
             hit_rate=round((hits / total) * 100, 2) if total > 0 else None,
             miss_rate=round((misses / total) * 100, 2) if total > 0 else None,
             evictions=stats.get("evicted_keys", 0),
+            namespaces=get_cache_metrics(),
         )
     except Exception as e:
         logger.warning(f"Failed to get cache stats: {e}")
-        return CacheStats()
+        return CacheStats(namespaces=get_cache_metrics())
 
 
-async def _get_vector_store_stats(tenant_id: str) -> VectorStoreStats:
-    """Get Milvus vector store statistics with caching (optimized - no col.load())."""
-    try:
-        from src.core.cache.decorators import get_from_cache, set_cache
+async def _get_vector_store_stats(vectors_total: int) -> VectorStoreStats:
+    """Vector stats from the tenant's counter plus the (cached) Milvus collection count."""
+    from src.api.config import settings
 
-        # Check cache first
-        cache_key = f"admin:stats:vectors:{tenant_id}"
-        cached = await get_from_cache(cache_key)
-        if cached:
-            return VectorStoreStats(**cached)
+    dimensions = settings.embedding_dimensions or 1536
+    return VectorStoreStats(
+        collections_count=await _get_vector_collections_count(),
+        vectors_total=vectors_total,
+        # float32 components plus per-row overhead
+        index_size_bytes=vectors_total * (dimensions * 4 + 100),
+    )
 
-        import os
 
-        from pymilvus import Collection, connections, utility
-
-        # Connect to Milvus
-        milvus_host = os.getenv("MILVUS_HOST", "localhost")
-        milvus_port = int(os.getenv("MILVUS_PORT", "19530"))
-
-        # Check if already connected, if not connect
-        try:
-            connections.connect(alias="default", host=milvus_host, port=milvus_port)
-        except Exception:
-            pass  # May already be connected
-
-        # Get all collections
-        collections = utility.list_collections()
-        collections_count = len(collections)
+async def _get_vector_collections_count() -> int:
+    """Number of Milvus collections, from collection metadata, cached for 5 minutes."""
+    try:
+        from pymilvus import connections, utility
 
-        # Count total vectors across all collections
-        vectors_total = 0
-        index_size_bytes = 0
+        from src.core.cache.decorators import get_or_compute
 
-        for coll_name in collections:
+        async def _count() -> int:
             try:
-                col = Collection(coll_name)
-                # CRITICAL FIX: Use num_entities WITHOUT loading collection into memory
-                # col.num_entities queries metadata only, doesn't load vectors
-                vectors_total += col.num_entities
-
-                # Get collection stats (lightweight operation)
-                try:
-                    stats = utility.get_collection_stats(coll_name)
-                    # Try to get actual index size if available
-                    index_size_bytes += stats.get("index_file_size", 0)
-                except Exception:
-                    pass  # Stats not available, will use estimation below
+                connections.connect(
+                    alias="default",
+                    host=os.getenv("MILVUS_HOST", "localhost"),
+                    port=int(os.getenv("MILVUS_PORT", "19530")),
+                )
+            except Exception:
+                pass  # May already be connected
+            return len(utility.list_collections())
 
-            except Exception as e:
-                logger.debug(f"Failed to get stats for collection {coll_name}: {e}")
-
-        # If we couldn't get actual index size, estimate it
-        if index_size_bytes == 0 and vectors_total > 0:
-            # Rough estimate (each vector ~1536 dims * 4 bytes + overhead)
-            estimated_bytes_per_vector = 1536 * 4 + 100  # 6244 bytes approx
-            index_size_bytes = vectors_total * estimated_bytes_per_vector
-
-        stats = VectorStoreStats(
-            collections_count=collections_count,
-            vectors_total=vectors_total,
-            index_size_bytes=index_size_bytes,
+        return int(
+            await get_or_compute(
+                "admin:stats:vector_collections", _count, ttl=300, stale_ttl=3600
+            )
         )
 
-        # Cache for 60 seconds
-        await set_cache(cache_key, stats.dict(), ttl=60)
-        return stats
-
     except ImportError:
-        logger.debug("pymilvus not installed, skipping vector store stats")
-        return VectorStoreStats()
+        logger.debug("pymilvus not installed, skipping vector collection count")
+        return 0
     except Exception as e:
-        logger.warning(f"Failed to get vector store stats: {e}")
-        return VectorStoreStats()
+        logger.warning(f"Failed to count vector collections: {e}")
+        return 0
@@ -5,7 +5,10 @@ Observability Admin Routes
 Endpoints for monitoring system health and business metrics.
 """
 
-from fastapi import APIRouter
+from datetime import UTC, datetime, timedelta
+from typing import Literal
+
+from fastapi import APIRouter, Query
 from pydantic import BaseModel
 
 from src.amber_platform.composition_root import build_metrics_collector
@@ -49,6 +52,38 @@ async def get_recent_queries(tenant_id: str | None = None, limit: int = 50):
         await collector.close()
 
 
+@router.get(
+    "/metrics/rollups",
+    summary="Get Metric Rollups",
+    description="Query counts, tokens, cost and latency per time bucket, stage and model.",
+)
+async def get_metric_rollups(
+    tenant_id: str | None = None,
+    period_hours: int = Query(24, ge=1, le=24 * 400),
+    granularity: Literal["hour", "day", "week", "month"] = "hour",
+):
+    from src.core.admin_ops.application.metrics.store import get_metrics_store
+
+    since = datetime.now(UTC) - timedelta(hours=period_hours)
+    return await get_metrics_store().rollups(
+        since=since, tenant_id=tenant_id, granularity=granularity
+    )
+
+
+@router.get(
+    "/llm-capacity",
+    summary="Get LLM Capacity",
+    description=(
+        "Adaptive concurrency limits, in-flight and queued calls per LLM endpoint "
+        "and work class, shared by all API and worker processes."
+    ),
+)
+async def get_llm_capacity():
+    from src.shared.llm_capacity import capacity_snapshot
+
+    return {"endpoints": await capacity_snapshot()}
+
+
 @router.get(
     "/health/deep",
     summary="Deep Health Check",
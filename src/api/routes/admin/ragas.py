@@ -444,6 +444,41 @@ async def run_benchmark(
     )
 
 
+@router.post("/runs/{run_id}/resume", response_model=RunBenchmarkResponse)
+async def resume_benchmark_run(run_id: str, session: AsyncSession = Depends(get_db_session)):
+    """
+    Resume a failed benchmark run.
+
+    Samples already checkpointed on the run are kept; only the rest are evaluated.
+    """
+    result = await session.execute(select(BenchmarkRun).where(BenchmarkRun.id == run_id))
+    benchmark = result.scalars().first()
+
+    if not benchmark:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Benchmark run {run_id} not found"
+        )
+    if benchmark.status != BenchmarkStatus.FAILED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Only failed runs can be resumed (status: {benchmark.status.value})",
+        )
+
+    benchmark.status = BenchmarkStatus.PENDING
+    benchmark.completed_at = None
+    await session.commit()
+
+    task = run_ragas_benchmark.apply_async(args=[run_id, benchmark.tenant_id], countdown=1)
+    done = len(benchmark.details or [])
+
+    return RunBenchmarkResponse(
+        benchmark_run_id=run_id,
+        task_id=task.id,
+        status="pending",
+        message=f"Benchmark run resumed ({done} samples already evaluated)",
+    )
+
+
 @router.delete("/runs/{run_id}")
 async def delete_benchmark_run(run_id: str, session: AsyncSession = Depends(get_db_session)):
     """
@@ -28,6 +28,9 @@ from src.shared.context import get_current_tenant
 router = APIRouter(prefix="/connectors", tags=["connectors"])
 logger = logging.getLogger(__name__)
 
+# Key in ConnectorState.sync_cursor holding item_id -> upstream version (ETag/revision)
+ITEM_VERSIONS_KEY = "item_versions"
+
 
 # --- Request/Response Models ---
 
@@ -150,47 +153,16 @@ async def authenticate_connector(
 
     tenant_id = get_current_tenant() or "default"
 
-    # Get connector class and instantiate
-    ConnectorClass = CONNECTOR_REGISTRY[connector_type]
+    required = _ENDPOINT_FIELDS.get(connector_type)
+    if required and not request.credentials.get(required[0]):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{required[1]} requires '{required[0]}' in credentials",
+        )
 
     try:
-        if connector_type == "zendesk":
-            subdomain = request.credentials.get("subdomain")
-            if not subdomain:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Zendesk requires 'subdomain' in credentials",
-                )
-            connector = ConnectorClass(subdomain=subdomain)
-        elif connector_type == "confluence":
-            base_url = request.credentials.get("base_url")
-            if not base_url:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Confluence requires 'base_url' in credentials",
-                )
-            connector = ConnectorClass(base_url=base_url)
-        elif connector_type == "carbonio":
-            host = request.credentials.get("host")
-            if not host:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Carbonio requires 'host' in credentials",
-                )
-            connector = ConnectorClass(host=host)
-        elif connector_type == "jira":
-            base_url = request.credentials.get("base_url")
-            if not base_url:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Jira requires 'base_url' in credentials",
-                )
-            connector = ConnectorClass(base_url=base_url)
-        else:
-            connector = ConnectorClass()
-
-        # Attempt authentication
-        success = await connector.authenticate(request.credentials)
+        async with _build_connector(connector_type, request.credentials) as connector:
+            success = await connector.authenticate(request.credentials)
 
         if not success:
             raise HTTPException(
@@ -208,7 +180,8 @@ async def authenticate_connector(
         state.error_message = None
         # Store config (Store credentials for MVP to enable background sync)
         # TODO: Move to secure vault in production
-        state.sync_cursor = request.credentials
+        # Merged so the item versions of earlier syncs survive re-authentication
+        state.sync_cursor = {**(state.sync_cursor or {}), **request.credentials}
         await db.commit()
         await db.refresh(state)
 
@@ -267,9 +240,10 @@ async def trigger_sync(
 
     job_id = f"sync_{uuid4().hex[:12]}"
 
-    # TODO: In production, this would dispatch a Celery task
-    # For now, we just return the job ID
-    # background_tasks.add_task(run_sync, connector_type, tenant_id, job_id, request.full_sync)
+    # Items are fetched here; processing is handed off to the Celery ingestion queue
+    background_tasks.add_task(
+        run_connector_sync, connector_type, tenant_id, state.id, None, request.full_sync
+    )
 
     logger.info(f"Sync triggered for {connector_type} tenant {tenant_id}, job {job_id}")
 
@@ -323,8 +297,6 @@ async def list_connector_items(
     state = await get_or_create_connector_state(db, tenant_id, connector_type)
 
     # 2. Instantiate Connector
-    ConnectorClass = CONNECTOR_REGISTRY[connector_type]
-
     # We need credentials to browse. Ideally these are encrypted in state.
     # For MVP/Phase 1, we might rely on the user re-authenticating or
     # (unsafe) storing tokens in state.sync_cursor or similar.
@@ -377,42 +349,13 @@ async def list_connector_items(
             detail="Connector not configured or credentials missing. Please re-authenticate.",
         )
 
-    auth_params = {}
-    if connector_type == "zendesk":
-        connector = ConnectorClass(subdomain=config.get("subdomain", ""))
-        auth_params = {
-            "email": config.get("email"),
-            "api_token": config.get("api_token"),
-            # "subdomain" is in init
-        }
-    elif connector_type == "confluence":
-        connector = ConnectorClass(base_url=config.get("base_url", ""))
-        auth_params = {
-            "email": config.get("email"),
-            "api_token": config.get("api_token"),
-            "base_url": config.get("base_url"),
-        }
-    elif connector_type == "carbonio":
-        connector = ConnectorClass(host=config.get("host", ""))
-        auth_params = {
-            "email": config.get("email"),
-            "password": config.get("password"),
-            "host": config.get("host"),
-        }
-    elif connector_type == "jira":
-        connector = ConnectorClass(base_url=config.get("base_url", ""))
-        auth_params = {
-            "email": config.get("email"),
-            "api_token": config.get("api_token"),
-            "base_url": config.get("base_url"),
-        }
-
-    auth_success = await connector.authenticate(auth_params)
-
-    if not auth_success:
-        raise HTTPException(status_code=401, detail="Stored credentials invalid.")
-
-    items, has_more = await connector.list_items(page=page, page_size=page_size, search=search)
+    async with _build_connector(connector_type, config) as connector:
+        if not await connector.authenticate(config):
+            raise HTTPException(status_code=401, detail="Stored credentials invalid.")
+
+        items, has_more = await connector.list_items(
+            page=page, page_size=page_size, search=search
+        )
 
     return ResponseSchema(
         data={
@@ -434,15 +377,49 @@ async def list_connector_items(
     )
 
 
-async def run_selective_ingestion(
-    connector_type: str, tenant_id: str, item_ids: list[str], state_id: str
+# Credential naming the connector's endpoint, with the label used in errors
+_ENDPOINT_FIELDS = {
+    "zendesk": ("subdomain", "Zendesk"),
+    "confluence": ("base_url", "Confluence"),
+    "carbonio": ("host", "Carbonio"),
+    "jira": ("base_url", "Jira"),
+}
+
+
+def _build_connector(connector_type: str, config: dict[str, Any]):
+    """Instantiate a connector from its stored configuration."""
+    ConnectorClass = CONNECTOR_REGISTRY[connector_type]
+
+    if connector_type == "zendesk":
+        return ConnectorClass(subdomain=config.get("subdomain", ""))
+    if connector_type in ("confluence", "jira"):
+        return ConnectorClass(base_url=config.get("base_url", ""))
+    if connector_type == "carbonio":
+        return ConnectorClass(host=config.get("host", ""))
+    return ConnectorClass()
+
+
+async def run_connector_sync(
+    connector_type: str,
+    tenant_id: str,
+    state_id: str,
+    item_ids: list[str] | None = None,
+    full_sync: bool = False,
 ):
-    """Background task for selective ingestion."""
+    """
+    Background task for connector ingestion.
+
+    Fetches items with bounded concurrency, skips items whose version is
+    unchanged since the last sync, and hands processing to the Celery
+    ingestion queue. Syncs every item from ``fetch_items`` when ``item_ids``
+    is None.
+    """
     # Create new session
     # We need to manually manage the session here
     from src.api.deps import _get_async_session_maker
+    from src.core.ingestion.application.connector_sync import ConnectorSyncEngine
 
-    logger.info(f"Starting selective ingestion for {connector_type} items: {item_ids}")
+    logger.info(f"Starting {connector_type} sync for tenant {tenant_id} (items: {item_ids or 'all'})")
 
     async with _get_async_session_maker()() as session:
         # 1. Setup Connector
@@ -453,19 +430,10 @@ async def run_selective_ingestion(
             logger.error(f"Connector state {state_id} not found in background task")
             return
 
-        config = state.sync_cursor
-        ConnectorClass = CONNECTOR_REGISTRY[connector_type]
-
-        if connector_type == "zendesk":
-            connector = ConnectorClass(subdomain=config.get("subdomain", ""))
-        elif connector_type == "confluence":
-            connector = ConnectorClass(base_url=config.get("base_url", ""))
-        elif connector_type == "carbonio":
-            connector = ConnectorClass(host=config.get("host", ""))
-
-        await connector.authenticate(config)
+        config = dict(state.sync_cursor or {})
+        known_versions = {} if full_sync else dict(config.get(ITEM_VERSIONS_KEY) or {})
+        since = None if full_sync else state.last_sync_at
 
-        # 2. Setup Ingestion Service
         # 2. Setup Ingestion Service
         from src.amber_platform.composition_root import build_vector_store_factory, platform
         from src.core.events.dispatcher import EventDispatcher
@@ -476,73 +444,70 @@ async def run_selective_ingestion(
         from src.core.tenants.infrastructure.repositories.postgres_tenant_repository import (
             PostgresTenantRepository,
         )
+        from src.infrastructure.adapters.celery_dispatcher import CeleryTaskDispatcher
         from src.infrastructure.adapters.redis_state_publisher import RedisStatePublisher
 
-        vector_store_factory = build_vector_store_factory()
-        event_dispatcher = EventDispatcher(RedisStatePublisher())
-
+        unit_of_work = PostgresUnitOfWork(session)
         ingestion_service = IngestionService(
             document_repository=PostgresDocumentRepository(session),
             tenant_repository=PostgresTenantRepository(session),
-            unit_of_work=PostgresUnitOfWork(session),
+            unit_of_work=unit_of_work,
             storage_client=platform.minio_client,
             neo4j_client=platform.neo4j_client,
             vector_store=None,
-            event_dispatcher=event_dispatcher,
-            vector_store_factory=vector_store_factory,
+            event_dispatcher=EventDispatcher(RedisStatePublisher()),
+            vector_store_factory=build_vector_store_factory(),
         )
 
         # 3. Process Items
-        success_count = 0
         state.status = "syncing"
         await session.commit()
 
+        connector = _build_connector(connector_type, config)
         try:
-            for item_id in item_ids:
-                try:
-                    # Fetch content
-                    content = await connector.get_item_content(item_id)
-
-                    # We need a filename. Let's try to get title if possible, or just ID.
-                    # Ideally we would have cached the list_items info, but we don't have it here.
-                    # We'll use ID.html
-                    if connector_type == "zendesk":
-                        filename = f"zendesk_{item_id}.html"
-                    elif connector_type == "confluence":
-                        filename = f"confluence_{item_id}.html"
-                    elif connector_type == "carbonio":
-                        filename = f"carbonio_{item_id}.html"
-                    else:
-                        filename = f"doc_{item_id}.html"
-
-                    # Register
-                    doc = await ingestion_service.register_document(
-                        tenant_id=tenant_id,
-                        filename=filename,
-                        file_content=content,
-                        content_type="text/html",
-                    )
-
-                    # Trigger Processing
-                    await ingestion_service.process_document(doc.id)
-                    success_count += 1
-
-                except Exception as e:
-                    logger.error(f"Failed to ingest item {item_id}: {e}")
+            if not await connector.authenticate(config):
+                raise RuntimeError("Stored credentials invalid.")
+
+            if item_ids is None:
+                source = (item.id async for item in connector.fetch_items(since=since))
+            else:
+                source = item_ids
+
+            engine = ConnectorSyncEngine(
+                connector=connector,
+                registrar=ingestion_service,
+                unit_of_work=unit_of_work,
+                task_dispatcher=CeleryTaskDispatcher(),
+            )
+            sync_result = await engine.run(tenant_id, source, known_versions=known_versions)
 
+            state.sync_cursor = {**config, ITEM_VERSIONS_KEY: sync_result.versions}
             state.status = "idle"
-            # Maybe update last_sync_at?
             state.last_sync_at = datetime.now()
-            logger.info(f"Ingested {success_count}/{len(item_ids)} items")
+            state.error_message = (
+                f"{sync_result.failed} items failed" if sync_result.failed else None
+            )
+            logger.info(
+                f"Synced {connector_type}: {sync_result.dispatched} queued for processing, "
+                f"{sync_result.unchanged} unchanged, {sync_result.failed} failed"
+            )
 
         except Exception as e:
             state.status = "error"
             state.error_message = str(e)
             logger.error(f"Ingestion job failed: {e}")
         finally:
+            await connector.aclose()
             await session.commit()
 
 
+async def run_selective_ingestion(
+    connector_type: str, tenant_id: str, item_ids: list[str], state_id: str
+):
+    """Background task for selective ingestion."""
+    await run_connector_sync(connector_type, tenant_id, state_id, item_ids=item_ids)
+
+
 @router.post("/{connector_type}/ingest", response_model=ResponseSchema[SyncJobResponse])
 async def ingest_selected_items(
     connector_type: str,
@@ -12,23 +12,49 @@ import logging
 from datetime import datetime
 from typing import Any
 
-import redis.asyncio as redis
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile, status
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 from sse_starlette.sse import EventSourceResponse
 
-from src.amber_platform.composition_root import build_vector_store_factory, platform
+from src.amber_platform.composition_root import build_bulk_document_operations, platform
 from src.api.config import settings
 from src.api.deps import get_db_session as get_db_session
+from src.core.ingestion.application.file_delivery import (
+    PagePreviewService,
+    RangeNotSatisfiableError,
+    if_none_match,
+    if_range_matches,
+    iter_stream,
+    parse_range,
+    preview_width,
+    strong_etag,
+)
 from src.core.ingestion.domain.document import Document
+from src.core.ingestion.infrastructure.storage.page_preview import HAS_PYMUPDF, render_pdf_page
+from src.infrastructure.adapters.redis_event_hub import get_event_hub, is_terminal_event
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 
+# Idle interval after which SSE streams send a keepalive comment
+SSE_KEEPALIVE_SECONDS = 15.0
+
 
 def _get_content_type(document: Document) -> str | None:
     """
@@ -179,6 +205,47 @@ async def upload_document(
     )
 
 
+@router.get(
+    "/events",
+    summary="Tenant Document Events",
+    description="""
+    Server-Sent Events (SSE) endpoint streaming status updates for all documents of
+    the current tenant over a single connection.
+
+    Optionally restrict the stream with repeated `document_id` query parameters.
+    Progress updates are coalesced per document; status transitions are always sent.
+    The stream stays open after individual documents reach a terminal state.
+    """,
+)
+async def tenant_document_events(
+    http_request: Request,
+    document_id: list[str] | None = Query(default=None),
+):
+    """Stream status events for every document of the tenant via SSE."""
+    tenant_id = _get_tenant_id(http_request)
+    document_ids = set(document_id) if document_id else None
+
+    async def event_generator():
+        try:
+            async with get_event_hub().subscribe(
+                tenant_id=tenant_id, document_ids=document_ids
+            ) as subscription:
+                yield {"event": "connected", "data": json.dumps({"tenant_id": tenant_id})}
+
+                while True:
+                    event_data = await subscription.get(timeout=SSE_KEEPALIVE_SECONDS)
+                    if event_data is None:
+                        yield {"comment": "keepalive"}
+                        continue
+                    yield {"event": "status", "data": json.dumps(event_data)}
+
+        except Exception as e:
+            logger.error(f"SSE error for tenant {tenant_id} document stream: {e}")
+            yield {"event": "error", "data": json.dumps({"error": str(e)})}
+
+    return EventSourceResponse(event_generator())
+
+
 @router.get(
     "/{document_id}/events",
     summary="Document Processing Events",
@@ -218,75 +285,43 @@ async def document_events(
         )
 
     async def event_generator():
-        """Generate SSE events from Redis pub/sub."""
-        redis_client = None
-        pubsub = None
-
+        """Generate SSE events from the process-wide document event hub."""
         try:
-            # Connect to Redis
-            redis_client = redis.from_url(settings.db.redis_url, decode_responses=True)
-            pubsub = redis_client.pubsub()
-
-            # Subscribe to document status channel
-            channel = f"document:{document_id}:status"
-            await pubsub.subscribe(channel)
-
-            logger.info(f"SSE client connected for document {document_id}")
-
-            # Send initial status
-            yield {
-                "event": "status",
-                "data": json.dumps(
-                    {
-                        "document_id": document_id,
-                        "status": document.status.value,
-                        "message": f"Monitoring document {document_id}",
-                    }
-                ),
-            }
-
-            # Listen for Redis pub/sub messages
-            while True:
-                try:
-                    # Use timeout to allow periodic checks
-                    message = await asyncio.wait_for(
-                        pubsub.get_message(ignore_subscribe_messages=True), timeout=1.0
-                    )
-
-                    if message and message["type"] == "message":
-                        # Forward the Redis message as SSE event
-                        data = message["data"]
-
-                        # Parse and re-serialize to ensure valid JSON
-                        if isinstance(data, str):
-                            event_data = json.loads(data)
-                        else:
-                            event_data = data
-
-                        yield {"event": "status", "data": json.dumps(event_data)}
-
-                        # Close connection if document reached terminal state
-                        if event_data.get("status") in ["ready", "failed", "completed"]:
-                            logger.info(
-                                f"Document {document_id} reached terminal state: {event_data.get('status')}"
-                            )
-                            break
-
-                except TimeoutError:
-                    # Send keepalive comment to prevent connection timeout
-                    yield {"comment": "keepalive"}
-                    continue
+            async with get_event_hub().subscribe(document_ids={document_id}) as subscription:
+                logger.info(f"SSE client connected for document {document_id}")
+
+                # Send initial status
+                yield {
+                    "event": "status",
+                    "data": json.dumps(
+                        {
+                            "document_id": document_id,
+                            "status": document.status.value,
+                            "message": f"Monitoring document {document_id}",
+                        }
+                    ),
+                }
+
+                while True:
+                    event_data = await subscription.get(timeout=SSE_KEEPALIVE_SECONDS)
+                    if event_data is None:
+                        # Send keepalive comment to prevent connection timeout
+                        yield {"comment": "keepalive"}
+                        continue
+
+                    yield {"event": "status", "data": json.dumps(event_data)}
+
+                    # Close connection if document reached terminal state
+                    if is_terminal_event(event_data):
+                        logger.info(
+                            f"Document {document_id} reached terminal state: {event_data.get('status')}"
+                        )
+                        break
 
         except Exception as e:
             logger.error(f"SSE error for document {document_id}: {e}")
             yield {"event": "error", "data": json.dumps({"error": str(e)})}
         finally:
-            # Cleanup
-            if pubsub:
-                await pubsub.unsubscribe(channel)
-                await pubsub.close()
-            if redis_client:
-                await redis_client.close()
             logger.info(f"SSE client disconnected for document {document_id}")
 
     return EventSourceResponse(event_generator())
@@ -313,7 +348,9 @@ async def list_documents(
 
     from sqlalchemy.orm import selectinload
 
-    query = select(Document).options(selectinload(Document.folder))
+    query = select(Document).options(selectinload(Document.folder)).where(
+        Document.deleted_at.is_(None)
+    )
 
     if is_super_admin:
         # Super Admin: Show all if no tenant specified
@@ -540,10 +577,47 @@ async def get_document_communities(
         return []
 
 
+async def _get_file_document(
+    document_id: str, http_request: Request, session: AsyncSession
+) -> Document:
+    """Load the columns needed to serve a document's file, scoped to the caller's tenant."""
+    permissions = getattr(http_request.state, "permissions", [])
+    is_super_admin = "super_admin" in permissions
+
+    query = (
+        select(Document)
+        .options(
+            load_only(
+                Document.id,
+                Document.tenant_id,
+                Document.filename,
+                Document.storage_path,
+                Document.content_hash,
+                Document.metadata_,
+            )
+        )
+        .where(Document.id == document_id, Document.deleted_at.is_(None))
+    )
+    if not is_super_admin:
+        tenant_id = _get_tenant_id(http_request)
+        query = query.where(Document.tenant_id == tenant_id)
+    result = await session.execute(query)
+    document = result.scalars().first()
+
+    if not document:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Document {document_id} not found"
+        )
+    return document
+
+
 @router.get(
     "/{document_id}/file",
     summary="Get Document File",
-    description="Download the original document file from storage.",
+    description=(
+        "Download the original document file from storage. Supports single byte ranges "
+        "(Range / If-Range) and conditional requests (If-None-Match)."
+    ),
 )
 async def get_document_file(
     document_id: str,
@@ -553,51 +627,137 @@ async def get_document_file(
     """
     Retrieve the original document file from MinIO storage.
 
-    Returns a streaming response with the file content and appropriate content-type header.
+    Range requests are served from MinIO with a ranged read, so viewers can
+    seek in large PDFs without the whole object leaving storage.
     """
-    # Get document metadata
-    permissions = getattr(http_request.state, "permissions", [])
-    is_super_admin = "super_admin" in permissions
+    document = await _get_file_document(document_id, http_request, session)
+
+    etag = strong_etag(document.content_hash)
+    headers = {
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+        # The ETag is stable; revalidate so tenant permission changes still apply
+        "Cache-Control": "private, no-cache",
+        "X-Content-Type-Options": "nosniff",
+    }
+    if if_none_match(http_request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    storage = platform.minio_client
+    try:
+        stat = await asyncio.to_thread(storage.stat_file, document.storage_path)
+    except Exception as e:
+        logger.error(f"Failed to stat file for document {document_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve file: {str(e)}",
+        ) from e
+    if stat is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"File for document {document_id} not found in storage",
+        )
+    size = stat["size"]
 
-    query = select(Document).where(Document.id == document_id)
+    byte_range = None
+    if if_range_matches(http_request.headers.get("if-range"), etag):
+        try:
+            byte_range = parse_range(http_request.headers.get("range"), size)
+        except RangeNotSatisfiableError:
+            # 416 Range Not Satisfiable; the status constant was renamed in Starlette
+            return Response(
+                status_code=416,
+                headers={**headers, "Content-Range": f"bytes */{size}"},
+            )
 
-    if not is_super_admin:
-        tenant_id = _get_tenant_id(http_request)
-        query = query.where(Document.tenant_id == tenant_id)
-    result = await session.execute(query)
-    document = result.scalars().first()
+    headers["Content-Disposition"] = f'attachment; filename="{document.filename}"'
+    try:
+        if byte_range is None:
+            file_stream = await asyncio.to_thread(storage.get_file_stream, document.storage_path)
+            status_code = status.HTTP_200_OK
+            headers["Content-Length"] = str(size)
+        else:
+            file_stream = await asyncio.to_thread(
+                storage.get_file_stream,
+                document.storage_path,
+                byte_range.start,
+                byte_range.length,
+            )
+            status_code = status.HTTP_206_PARTIAL_CONTENT
+            headers["Content-Length"] = str(byte_range.length)
+            headers["Content-Range"] = byte_range.content_range(size)
+    except Exception as e:
+        logger.error(f"Failed to retrieve file for document {document_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve file: {str(e)}",
+        ) from e
 
-    if not document:
+    return StreamingResponse(
+        iter_stream(file_stream),
+        status_code=status_code,
+        media_type=_get_content_type(document),
+        headers=headers,
+    )
+
+
+_preview_service: PagePreviewService | None = None
+
+
+def _get_preview_service() -> PagePreviewService:
+    global _preview_service
+    if _preview_service is None:
+        _preview_service = PagePreviewService(platform.minio_client, render_pdf_page)
+    return _preview_service
+
+
+@router.get(
+    "/{document_id}/pages/{page}/preview",
+    summary="Get Page Preview",
+    description=(
+        "PNG preview of one page of a PDF document. Widths are rounded up to a fixed set "
+        "of sizes; each preview is rendered once and then served from storage."
+    ),
+    responses={200: {"content": {"image/png": {}}}},
+)
+async def get_page_preview(
+    document_id: str,
+    http_request: Request,
+    page: int = Path(..., ge=1, description="One-based page number"),
+    width: int | None = Query(None, ge=1, le=4096, description="Requested width in pixels"),
+    session: AsyncSession = Depends(get_db_session),
+):
+    document = await _get_file_document(document_id, http_request, session)
+    if _get_content_type(document) != "application/pdf":
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail=f"Document {document_id} not found"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Page previews are only available for PDF documents",
+        )
+    if not HAS_PYMUPDF:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Page previews are not available on this server",
         )
 
-    # Get file from MinIO
+    bucket = preview_width(width)
+    etag = strong_etag(f"{document.content_hash}-p{page}-w{bucket}")
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if if_none_match(http_request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
     try:
-        storage = platform.minio_client
-        # Get the raw stream from MinIO (urllib3 response)
-        file_stream = storage.get_file_stream(document.storage_path)
-
-        # Determine content type
-        content_type = _get_content_type(document)
-
-        # Stream the file back to the client
-        # We pass the stream directly to StreamingResponse
-        return StreamingResponse(
-            file_stream,
-            media_type=content_type,
-            headers={
-                "Content-Disposition": f'attachment; filename="{document.filename}"',
-                "X-Content-Type-Options": "nosniff",
-            },
+        png = await _get_preview_service().get_preview(
+            document.tenant_id, document.id, document.storage_path, page, bucket
         )
-
+    except IndexError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
     except Exception as e:
-        logger.error(f"Failed to retrieve file for document {document_id}: {e}")
+        logger.error(f"Failed to render page {page} of document {document_id}: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve file: {str(e)}",
+            detail=f"Failed to render preview: {str(e)}",
         ) from e
+    return Response(content=png, media_type="image/png", headers=headers)
 
 
 class DocumentUpdate(BaseModel):
@@ -673,7 +833,10 @@ async def update_document(
     "/{document_id}",
     status_code=status.HTTP_204_NO_CONTENT,
     summary="Delete Document",
-    description="Delete a document from the knowledge base.",
+    description=(
+        "Delete a document from the knowledge base. The document disappears from listings "
+        "and retrieval immediately; its stored data is removed in the background."
+    ),
 )
 async def delete_document(
     document_id: str,
@@ -703,20 +866,9 @@ async def delete_document(
         tenant_id = "super_admin_context"
 
     # 2. Build Dependencies
-    # 2. Build Dependencies
+    from src.infrastructure.adapters.celery_dispatcher import CeleryTaskDispatcher
 
-    vector_store_factory = build_vector_store_factory()
-    dimensions = settings.embedding_dimensions or 1536
-
-    def make_vector_store(tid: str):
-        return vector_store_factory(dimensions, collection_name=f"amber_{tid}")
-
-    use_case = DeleteDocumentUseCase(
-        session=session,
-        storage=platform.minio_client,
-        graph_client=platform.neo4j_client,
-        vector_store_factory=make_vector_store,
-    )
+    use_case = DeleteDocumentUseCase(session=session, task_dispatcher=CeleryTaskDispatcher())
 
     # 3. Execute
     try:
@@ -729,15 +881,90 @@ async def delete_document(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
     except Exception as e:
         logger.error(f"Error deleting document {document_id}: {e}")
-        # In case of other errors, we might still want to return 500 or just generic error
-        # Use case swallows non-critical errors (graph/milvus cleanup failure),
-        # so this catches unexpected ones.
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Internal server error during deletion",
         ) from e
 
-    logger.info(f"Document {document_id} deleted")
+    logger.info(f"Document {document_id} marked for deletion")
+
+
+MAX_BULK_DOCUMENTS = 10_000
+
+
+class BulkDocumentsRequest(BaseModel):
+    """Documents selected for a bulk operation."""
+
+    document_ids: list[str] = Field(..., min_length=1, max_length=MAX_BULK_DOCUMENTS)
+
+
+class BulkMoveRequest(BulkDocumentsRequest):
+    """Documents to file into a folder (None unfiles them)."""
+
+    folder_id: str | None = None
+
+
+class BulkOperationResponse(BaseModel):
+    """Result of a bulk document operation."""
+
+    operation_id: str
+    operation: str
+    documents: int
+    folder_deleted: bool = False
+    cleanup_operation_id: str | None = None
+    events_url: str
+
+
+def bulk_operation_response(result) -> BulkOperationResponse:
+    """Response for a ``BulkOperationResult``; progress streams on the tenant events URL."""
+    followed = result.cleanup_operation_id or result.operation_id
+    return BulkOperationResponse(
+        **{k: v for k, v in result.to_dict().items() if k != "tenant_id"},
+        events_url=f"/v1/documents/events?document_id={followed}",
+    )
+
+
+@router.post(
+    "/bulk/delete",
+    response_model=BulkOperationResponse,
+    summary="Delete Documents",
+    description=(
+        "Delete many documents in one transaction. They disappear from listings and "
+        "retrieval immediately; stored data is removed by a batched background cleanup "
+        "whose progress streams as `cleanup_operation_id` on the tenant event stream."
+    ),
+)
+async def bulk_delete_documents(
+    request: BulkDocumentsRequest,
+    http_request: Request,
+    session: AsyncSession = Depends(get_db_session),
+) -> BulkOperationResponse:
+    tenant_id = _get_tenant_id(http_request)
+    result = await build_bulk_document_operations(session).delete(
+        tenant_id, document_ids=request.document_ids
+    )
+    return bulk_operation_response(result)
+
+
+@router.post(
+    "/bulk/move",
+    response_model=BulkOperationResponse,
+    summary="Move Documents",
+    description="File many documents into a folder (or unfile them) with one update.",
+)
+async def bulk_move_documents(
+    request: BulkMoveRequest,
+    http_request: Request,
+    session: AsyncSession = Depends(get_db_session),
+) -> BulkOperationResponse:
+    tenant_id = _get_tenant_id(http_request)
+    try:
+        result = await build_bulk_document_operations(session).move(
+            tenant_id, request.folder_id, document_ids=request.document_ids
+        )
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    return bulk_operation_response(result)
 
 
 @router.get(
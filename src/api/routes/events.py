@@ -5,7 +5,6 @@ Server-Sent Events (SSE) for Document Status
 Real-time status streaming for document processing.
 """
 
-import asyncio
 import json
 import logging
 from collections.abc import AsyncGenerator
@@ -14,14 +13,12 @@ from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 
 try:
-    import redis.asyncio as redis
+    from src.infrastructure.adapters.redis_event_hub import get_event_hub, is_terminal_event
 
     HAS_REDIS = True
 except ImportError:
     HAS_REDIS = False
 
-from src.api.config import settings
-
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/documents", tags=["Events"])
@@ -32,8 +29,8 @@ async def stream_document_events(document_id: str) -> StreamingResponse:
     """
     Stream document processing events via SSE.
 
-    Subscribes to Redis Pub/Sub channel for the document and streams
-    status updates to the client.
+    Subscribes to the shared document event hub and streams status
+    updates for the document to the client.
 
     Args:
         document_id: ID of the document to monitor.
@@ -57,7 +54,7 @@ async def stream_document_events(document_id: str) -> StreamingResponse:
 
 async def event_generator(document_id: str) -> AsyncGenerator[str, None]:
     """
-    Generate SSE events from Redis Pub/Sub.
+    Generate SSE events from the process-wide document event hub.
 
     Args:
         document_id: Document to monitor.
@@ -65,55 +62,36 @@ async def event_generator(document_id: str) -> AsyncGenerator[str, None]:
     Yields:
         str: Formatted SSE event strings.
     """
-    channel = f"document:{document_id}:status"
-
     try:
-        r = redis.Redis.from_url(settings.db.redis_url)
-        pubsub = r.pubsub()
-        await pubsub.subscribe(channel)
-
-        # Send initial connection event
-        yield f"event: connected\ndata: {json.dumps({'document_id': document_id})}\n\n"
+        async with get_event_hub().subscribe(document_ids={document_id}) as subscription:
+            # Send initial connection event
+            yield f"event: connected\ndata: {json.dumps({'document_id': document_id})}\n\n"
 
-        # Stream events
-        timeout_count = 0
-        max_timeouts = 60  # ~5 minutes with 5s timeout
+            # Stream events
+            timeout_count = 0
+            max_timeouts = 60  # ~5 minutes with 5s timeout
 
-        while timeout_count < max_timeouts:
-            message = await asyncio.wait_for(
-                pubsub.get_message(ignore_subscribe_messages=True), timeout=5.0
-            )
+            while timeout_count < max_timeouts:
+                event = await subscription.get(timeout=5.0)
 
-            if message and message.get("type") == "message":
-                data = message.get("data")
-                if isinstance(data, bytes):
-                    data = data.decode("utf-8")
+                if event is None:
+                    timeout_count += 1
+                    # Send keepalive
+                    yield ": keepalive\n\n"
+                    continue
 
+                data = json.dumps(event)
                 yield f"event: status\ndata: {data}\n\n"
 
                 # Check if terminal status
-                try:
-                    parsed = json.loads(data)
-                    if parsed.get("status") in ["ready", "failed", "READY", "FAILED"]:
-                        yield f"event: complete\ndata: {data}\n\n"
-                        break
-                except json.JSONDecodeError:
-                    pass
+                if is_terminal_event(event):
+                    yield f"event: complete\ndata: {data}\n\n"
+                    break
 
                 timeout_count = 0  # Reset on activity
             else:
-                timeout_count += 1
-                # Send keepalive
-                yield ": keepalive\n\n"
+                yield f"event: timeout\ndata: {json.dumps({'document_id': document_id})}\n\n"
 
-    except TimeoutError:
-        yield f"event: timeout\ndata: {json.dumps({'document_id': document_id})}\n\n"
     except Exception as e:
         logger.error(f"SSE error for {document_id}: {e}")
         yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
-    finally:
-        try:
-            await pubsub.unsubscribe(channel)
-            await r.aclose()
-        except Exception:
-            pass
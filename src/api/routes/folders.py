@@ -6,9 +6,10 @@ from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.amber_platform.composition_root import build_bulk_document_operations
 from src.api.deps import get_current_tenant_id
 from src.api.deps import get_db_session as get_db_session
-from src.core.ingestion.domain.document import Document
+from src.api.routes.documents import BulkOperationResponse, bulk_operation_response
 from src.core.ingestion.domain.folder import Folder
 
 router = APIRouter()
@@ -23,6 +24,11 @@ class FolderUpdate(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
 
 
+class FolderMove(BaseModel):
+    target_folder_id: str | None = None
+    delete_folder: bool = False
+
+
 class FolderResponse(BaseModel):
     id: str
     tenant_id: str
@@ -74,66 +80,37 @@ async def delete_folder(
     Delete a folder.
     If delete_contents is True, all documents in the folder are permanently deleted.
     Otherwise, documents are unfiled.
+    Either way the documents and the folder change in one transaction.
     """
-    # Explicitly check tenant_id in query
-    query = select(Folder).where(Folder.id == folder_id, Folder.tenant_id == tenant_id)
-    result = await session.execute(query)
-    folder = result.scalar_one_or_none()
-
-    if not folder:
-        raise HTTPException(status_code=404, detail="Folder not found")
-
-    if delete_contents:
-        # Recursive deletion
-        from src.amber_platform.composition_root import build_vector_store_factory, platform
-        from src.api.config import settings
-        from src.core.ingestion.application.use_cases_documents import (
-            DeleteDocumentRequest,
-            DeleteDocumentUseCase,
-        )
-
-        # 1. Get all documents in the folder
-        doc_query = select(Document).where(
-            Document.folder_id == folder_id, Document.tenant_id == tenant_id
-        )
-        doc_result = await session.execute(doc_query)
-        documents = doc_result.scalars().all()
-
-        # 2. Setup Delete Use Case
-        vector_store_factory = build_vector_store_factory()
-        dimensions = settings.embedding_dimensions or 1536
-
-        def make_vector_store(tid: str):
-            return vector_store_factory(dimensions, collection_name=f"amber_{tid}")
-
-        use_case = DeleteDocumentUseCase(
-            session=session,
-            storage=platform.minio_client,
-            graph_client=platform.neo4j_client,
-            vector_store_factory=make_vector_store,
+    operations = build_bulk_document_operations(session)
+    try:
+        if delete_contents:
+            # Tombstone all documents; cleanup runs in batches in the background
+            await operations.delete(tenant_id, folder_id=folder_id, delete_folder=True)
+        else:
+            await operations.move(tenant_id, None, folder_id=folder_id, delete_folder=True)
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail="Folder not found") from e
+
+
+@router.post("/{folder_id}/move", response_model=BulkOperationResponse)
+async def move_folder_contents(
+    folder_id: str,
+    move: FolderMove,
+    session: AsyncSession = Depends(get_db_session),
+    tenant_id: str = Depends(get_current_tenant_id),
+):
+    """
+    Move every document of a folder into another folder (or unfile them),
+    optionally deleting the emptied folder in the same transaction.
+    """
+    try:
+        result = await build_bulk_document_operations(session).move(
+            tenant_id,
+            move.target_folder_id,
+            folder_id=folder_id,
+            delete_folder=move.delete_folder,
         )
-
-        # 3. Delete each document
-        for doc in documents:
-            try:
-                await use_case.execute(
-                    DeleteDocumentRequest(
-                        document_id=doc.id, tenant_id=tenant_id, is_super_admin=False
-                    )
-                )
-            except Exception:
-                # Log error but continue deleting others/folder?
-                # Or abort? Ideally we want best effort cleanup.
-                # logger variable is not available in this scope, let's just print or ignore for now as use_case logs internally
-                pass
-
-    else:
-        # Default behavior: Unfile documents
-        from sqlalchemy import update
-
-        stmt = update(Document).where(Document.folder_id == folder_id).values(folder_id=None)
-        await session.execute(stmt)
-
-    # Now delete the folder
-    await session.delete(folder)
-    await session.commit()
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    return bulk_operation_response(result)
@@ -6,6 +6,13 @@ from pydantic import BaseModel
 # from src.api.dependencies.auth import get_current_user_tenant_id # Removed invalid import
 from src.amber_platform.composition_root import build_vector_store_factory, platform
 from src.api.config import settings
+from src.core.graph.application.explorer import (
+    DELETE_EDGE_QUERY,
+    DELETE_ENTITY_QUERY,
+    get_graph_explorer,
+    mark_graph_changed,
+    refresh_entity_degrees,
+)
 from src.core.retrieval.application.embeddings_service import EmbeddingService
 
 router = APIRouter(prefix="/graph/editor", tags=["Graph Editor"])
@@ -71,7 +78,7 @@ class GraphData(BaseModel):
 @router.get("/top", response_model=list[GraphNode])
 async def get_top_nodes(limit: int = 15, tenant_id: str = Depends(get_current_user_tenant_id)):
     """Get top connected nodes for initial view."""
-    nodes = await platform.neo4j_client.get_top_nodes(tenant_id, limit)
+    nodes = await get_graph_explorer().top_nodes(platform.neo4j_client, tenant_id, limit)
     return [GraphNode(**n) for n in nodes]
 
 
@@ -82,7 +89,7 @@ async def search_nodes(
     """Search nodes by name or description."""
     if not q:
         return []
-    nodes = await platform.neo4j_client.search_nodes(q, tenant_id, limit)
+    nodes = await get_graph_explorer().search_nodes(platform.neo4j_client, tenant_id, q, limit)
     return [GraphNode(**n) for n in nodes]
 
 
@@ -204,6 +211,7 @@ async def merge_nodes(request: MergeRequest, tenant_id: str = Depends(get_curren
         raise HTTPException(
             status_code=500, detail="Merge failed (check logs or APOC availability)"
         )
+    await mark_graph_changed(tenant_id)
     return {"status": "merged"}
 
 
@@ -227,28 +235,29 @@ async def create_edge(request: EdgeRequest, tenant_id: str = Depends(get_current
             "tenant_id": tenant_id,
         },
     )
+    await refresh_entity_degrees(
+        platform.neo4j_client, tenant_id, [request.source, request.target]
+    )
+    await mark_graph_changed(tenant_id)
     return {"status": "created"}
 
 
 @router.delete("/edge")
 async def delete_edge(request: EdgeRequest, tenant_id: str = Depends(get_current_user_tenant_id)):
     """Delete a relationship."""
-    query = """
-    MATCH (s:Entity {name: $source, tenant_id: $tenant_id})-[r]->(t:Entity {name: $target, tenant_id: $tenant_id})
-    DELETE r
-    """
     await platform.neo4j_client.execute_write(
-        query, {"source": request.source, "target": request.target, "tenant_id": tenant_id}
+        DELETE_EDGE_QUERY,
+        {"source": request.source, "target": request.target, "tenant_id": tenant_id},
     )
+    await mark_graph_changed(tenant_id)
     return {"status": "deleted"}
 
 
 @router.delete("/node/{node_id}")
 async def delete_node(node_id: str, tenant_id: str = Depends(get_current_user_tenant_id)):
     """Delete a node and its relationships."""
-    query = """
-    MATCH (n:Entity {name: $node_id, tenant_id: $tenant_id})
-    DETACH DELETE n
-    """
-    await platform.neo4j_client.execute_write(query, {"node_id": node_id, "tenant_id": tenant_id})
+    await platform.neo4j_client.execute_write(
+        DELETE_ENTITY_QUERY, {"node_id": node_id, "tenant_id": tenant_id}
+    )
+    await mark_graph_changed(tenant_id)
     return {"status": "deleted"}
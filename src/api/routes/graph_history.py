@@ -17,6 +17,13 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.deps import get_current_tenant_id, get_db_session
+from src.core.graph.application.explorer import (
+    DELETE_EDGE_QUERY,
+    DELETE_ENTITY_QUERY,
+    mark_graph_changed,
+    refresh_entity_degrees,
+    refresh_neighborhood_degrees,
+)
 
 router = APIRouter(prefix="/graph/history", tags=["Graph History"])
 logger = logging.getLogger(__name__)
@@ -222,6 +229,9 @@ async def apply_pending_edit(
                     "tenant_id": tenant_id,
                 },
             )
+            await refresh_entity_degrees(
+                platform.neo4j_client, tenant_id, [payload["source"], payload["target"]]
+            )
 
         elif action_type == "merge":
             success = await platform.neo4j_client.merge_nodes(
@@ -231,41 +241,25 @@ async def apply_pending_edit(
                 raise Exception("Merge failed")
 
         elif action_type == "delete_edge":
-            query = """
-            MATCH (s:Entity {name: $source, tenant_id: $tenant_id})-[r]->(t:Entity {name: $target, tenant_id: $tenant_id})
-            DELETE r
-            """
             await platform.neo4j_client.execute_write(
-                query,
+                DELETE_EDGE_QUERY,
                 {"source": payload["source"], "target": payload["target"], "tenant_id": tenant_id},
             )
 
         elif action_type == "delete_node":
-            query = """
-            MATCH (n:Entity {name: $node_id, tenant_id: $tenant_id})
-            DETACH DELETE n
-            """
             await platform.neo4j_client.execute_write(
-                query, {"node_id": payload["node_id"], "tenant_id": tenant_id}
+                DELETE_ENTITY_QUERY, {"node_id": payload["node_id"], "tenant_id": tenant_id}
             )
 
         elif action_type == "prune":
             # Prune is typically delete_node or delete_edge depending on payload
             if "node_id" in payload:
-                query = """
-                MATCH (n:Entity {name: $node_id, tenant_id: $tenant_id})
-                DETACH DELETE n
-                """
                 await platform.neo4j_client.execute_write(
-                    query, {"node_id": payload["node_id"], "tenant_id": tenant_id}
+                    DELETE_ENTITY_QUERY, {"node_id": payload["node_id"], "tenant_id": tenant_id}
                 )
             elif "source" in payload and "target" in payload:
-                query = """
-                MATCH (s:Entity {name: $source, tenant_id: $tenant_id})-[r]->(t:Entity {name: $target, tenant_id: $tenant_id})
-                DELETE r
-                """
                 await platform.neo4j_client.execute_write(
-                    query,
+                    DELETE_EDGE_QUERY,
                     {
                         "source": payload["source"],
                         "target": payload["target"],
@@ -273,6 +267,8 @@ async def apply_pending_edit(
                     },
                 )
 
+        await mark_graph_changed(tenant_id)
+
         # Update status to applied
         await session.execute(
             text(
@@ -345,12 +341,8 @@ async def undo_applied_edit(
         # Reverse the action
         if action_type == "connect":
             # Delete the edge that was created
-            query = """
-            MATCH (s:Entity {name: $source, tenant_id: $tenant_id})-[r]->(t:Entity {name: $target, tenant_id: $tenant_id})
-            DELETE r
-            """
             await platform.neo4j_client.execute_write(
-                query,
+                DELETE_EDGE_QUERY,
                 {"source": payload["source"], "target": payload["target"], "tenant_id": tenant_id},
             )
 
@@ -375,6 +367,9 @@ async def undo_applied_edit(
                         "tenant_id": tenant_id,
                     },
                 )
+                await refresh_entity_degrees(
+                    platform.neo4j_client, tenant_id, [edge["source"], edge["target"]]
+                )
             else:
                 raise HTTPException(status_code=400, detail="No snapshot available for undo")
 
@@ -387,7 +382,8 @@ async def undo_applied_edit(
                     name: $name,
                     tenant_id: $tenant_id,
                     type: $type,
-                    description: $description
+                    description: $description,
+                    degree: 0
                 })
                 """
                 await platform.neo4j_client.execute_write(
@@ -417,6 +413,7 @@ async def undo_applied_edit(
                                 "tenant_id": tenant_id,
                             },
                         )
+                await refresh_neighborhood_degrees(platform.neo4j_client, tenant_id, node["name"])
             else:
                 raise HTTPException(status_code=400, detail="No snapshot available for undo")
 
@@ -442,7 +439,8 @@ async def undo_applied_edit(
                     name: $name,
                     tenant_id: $tenant_id,
                     type: $type,
-                    description: $description
+                    description: $description,
+                    degree: 0
                 })
                 """
                 await platform.neo4j_client.execute_write(
@@ -455,6 +453,8 @@ async def undo_applied_edit(
                     },
                 )
 
+        await mark_graph_changed(tenant_id)
+
         # Update status
         await session.execute(
             text("UPDATE graph_edit_history SET status = 'undone' WHERE id = :id"), {"id": edit_id}
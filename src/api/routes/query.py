@@ -8,7 +8,6 @@ Phase 2: Baseline RAG implementation with vector retrieval and LLM generation.
 
 import json
 import logging
-import re
 import time
 from datetime import UTC, datetime
 from typing import Any
@@ -339,10 +338,11 @@ async def _query_stream_impl(
                             tool_map[tool["name"]] = tool["func"]
                             tool_schemas.append(tool["schema"])
                     else:
-                        from src.core.tools.graph import GRAPH_TOOLS, query_graph
+                        from src.core.tools.graph import create_graph_tool
 
-                        tool_map["query_graph"] = query_graph
-                        tool_schemas.extend(GRAPH_TOOLS)
+                        graph_tool_def = create_graph_tool(tenant_id)
+                        tool_map[graph_tool_def["name"]] = graph_tool_def["func"]
+                        tool_schemas.append(graph_tool_def["schema"])
 
                     agent = AgentOrchestrator(
                         generation_service=generation_service,
@@ -350,13 +350,28 @@ async def _query_stream_impl(
                         tool_schemas=tool_schemas,
                         system_prompt=AGENT_SYSTEM_PROMPT,
                     )
-                    agent_response = await agent.run(
+                    # Forward tool steps and answer tokens as the loop runs
+                    agent_result: dict = {}
+                    async for agent_event in agent.run_stream(
                         query=request.query,
                         conversation_id=agent_conversation_id,
-                    )
-                    agent_sources = getattr(agent_response, "sources", []) or []
-
-                    full_answer = agent_response.answer
+                        tenant_id=tenant_id,
+                        user_id=http_request.headers.get("X-User-ID", "default_user"),
+                    ):
+                        kind = agent_event["event"]
+                        if kind == "token":
+                            yield f"event: token\ndata: {json.dumps(agent_event['data'])}\n\n"
+                        elif kind == "tool_call":
+                            step_label = f"Calling {agent_event['data']['name']}..."
+                            yield f"event: thinking\ndata: {json.dumps(step_label)}\n\n"
+                            yield f"event: agent_step\ndata: {json.dumps(agent_event)}\n\n"
+                        elif kind == "tool_result":
+                            yield f"event: agent_step\ndata: {json.dumps(agent_event)}\n\n"
+                        elif kind == "done":
+                            agent_result = agent_event["data"]
+                    agent_sources: list = []
+
+                    full_answer = agent_result.get("answer") or ""
                     summary_text = (
                         full_answer[:200] + "..." if len(full_answer) > 200 else full_answer
                     )
@@ -440,13 +455,9 @@ async def _query_stream_impl(
                             await session.commit()
                             logger.info(f"Saved AGENT conversation history: {new_summary.id}")
 
-                    # Stream the result as tokens (AgentOrchestrator returns full answer currently)
-                    # Preserve whitespace to keep formatting intact.
-                    answer_text = agent_response.answer or ""
-                    for chunk in re.findall(r"\S+|\s+", answer_text):
-                        yield f"event: token\ndata: {json.dumps(chunk)}\n\n"
-                    # Preserve compatibility for clients expecting a full message event.
-                    yield f"event: message\ndata: {json.dumps(answer_text)}\n\n"
+                    # Tokens were streamed above; the full message also replaces any text the
+                    # agent wrote before calling tools with the final answer.
+                    yield f"event: message\ndata: {json.dumps(full_answer)}\n\n"
 
                     yield f"event: done\ndata: {json.dumps('[DONE]')}\n\n"
                     return
@@ -470,15 +481,18 @@ async def _query_stream_impl(
             from src.core.generation.infrastructure.providers.openai import OpenAILLMProvider
             from src.shared.kernel.runtime import get_settings
 
+            # Tenant config snapshot, resolved once for clamping, retrieval and generation
+            tenant_config = await TuningService(_get_async_session_maker()).get_tenant_snapshot(
+                tenant_id
+            )
+
             try:
                 # 1. Check explicit override
                 effective_model = request.options.model if request.options else None
 
-                # 2. If no override, fetch Tenant Config
+                # 2. If no override, use Tenant Config
                 if not effective_model:
                     settings = get_settings()
-                    tuning_service = TuningService(_get_async_session_maker())
-                    tenant_config = await tuning_service.get_tenant_config(tenant_id)
                     effective_model, _ = resolve_tenant_llm_model(
                         tenant_config,
                         settings,
@@ -511,6 +525,7 @@ async def _query_stream_impl(
                         tenant_id=tenant_id,
                         document_ids=document_ids,
                         top_k=max_chunks,
+                        tenant_config=tenant_config,
                     ),
                     timeout=60.0,
                 )
@@ -562,6 +577,7 @@ async def _query_stream_impl(
                     "user_id": user_id,
                     "tenant_id": tenant_id,
                     "model": request.options.model if request.options else None,
+                    "tenant_config": tenant_config,
                 },
             ):
                 event = event_dict.get("event", "message")
@@ -702,7 +718,6 @@ async def _query_stream_impl(
 
             # RECORD METRICS for streaming queries
             try:
-                from src.api.config import settings
                 from src.core.admin_ops.application.metrics.collector import (
                     MetricsCollector,
                     QueryMetrics,
@@ -763,9 +778,7 @@ async def _query_stream_impl(
                     answer_length=len(full_answer),
                 )
 
-                collector = MetricsCollector(redis_url=settings.db.redis_url)
-                await collector.record(metrics_obj)
-                await collector.close()
+                await MetricsCollector().record(metrics_obj)
                 logger.debug(f"Recorded streaming metrics for query {query_id}")
             except Exception as e:
                 logger.warning(f"Failed to record streaming metrics: {e}")
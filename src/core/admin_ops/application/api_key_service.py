@@ -5,12 +5,17 @@ ApiKey Service
 Service for managing API keys with database persistence.
 """
 
-from datetime import UTC, datetime
 from typing import Any
 
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.admin_ops.application.auth_principal_cache import (
+    AuthPrincipal,
+    TenantLink,
+    get_usage_recorder,
+    invalidate_principals,
+)
 from src.core.admin_ops.domain.api_key import ApiKey, ApiKeyTenant
 from src.core.tenants.application.active_vector_collection import (
     ensure_active_vector_collection_config,
@@ -90,6 +95,13 @@ class ApiKeyService:
         Returns the ApiKey record if valid and active, else None.
         Updates last_used_at timestamp.
         """
+        key_record = await self._find_active_key(key)
+        if key_record:
+            # last_used_at is written in batches by the usage recorder
+            get_usage_recorder().record(key_record.id)
+        return key_record
+
+    async def _find_active_key(self, key: str) -> ApiKey | None:
         if not key:
             return None
 
@@ -106,16 +118,35 @@ class ApiKeyService:
             .options(selectinload(ApiKey.tenants))
         )
         result = await self.session.execute(query)
-        key_record = result.scalars().first()
+        return result.scalars().first()
 
-        if key_record:
-            # Update last used asynchronously?
-            # For now, we update synchronously in the transaction
-            key_record.last_used_at = datetime.now(UTC)
-            await self.session.commit()
-            return key_record
+    async def resolve_principal(self, key: str) -> AuthPrincipal | None:
+        """
+        Validate a raw API key and snapshot it with its tenant roles.
 
-        return None
+        Uses a single session and no write transaction. Usage is not recorded:
+        the caller records it per request, whether or not the principal was
+        cached.
+        """
+        key_record = await self._find_active_key(key)
+        if not key_record:
+            return None
+
+        result = await self.session.execute(
+            select(ApiKeyTenant.tenant_id, ApiKeyTenant.role).where(
+                ApiKeyTenant.api_key_id == key_record.id
+            )
+        )
+        roles = dict(result.all())
+
+        return AuthPrincipal(
+            id=key_record.id,
+            name=key_record.name,
+            scopes=tuple(key_record.scopes or ()),
+            tenants=tuple(
+                TenantLink(id=t.id, role=roles.get(t.id, "user")) for t in key_record.tenants
+            ),
+        )
 
     async def list_keys(self) -> list[ApiKey]:
         """
@@ -132,6 +163,7 @@ class ApiKeyService:
         query = update(ApiKey).where(ApiKey.id == key_id).values(is_active=False)
         result = await self.session.execute(query)
         await self.session.commit()
+        await invalidate_principals(key_id)
         return result.rowcount > 0
 
     async def update_key(
@@ -154,6 +186,7 @@ class ApiKeyService:
 
         await self.session.commit()
         await self.session.refresh(key_record)
+        await invalidate_principals(key_id)
         return key_record
 
     async def ensure_bootstrap_key(self, raw_key: str, name: str = "Bootstrap Key"):
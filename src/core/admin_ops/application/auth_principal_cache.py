@@ -0,0 +1,255 @@
+"""
+Auth Principal Cache
+====================
+
+Per-process cache of resolved API key principals.
+
+Authenticating a request used to cost two DB sessions, three queries and a
+write transaction (``last_used_at``). Principals are now cached by key hash
+for a short TTL, invalidated across processes via Redis pub/sub when a key
+or its tenant links change, and ``last_used_at`` is written in periodic
+batches instead of on every request.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from sqlalchemy import update
+
+from src.core.admin_ops.domain.api_key import ApiKey
+from src.core.cache.invalidation import InvalidationListener, publish_invalidation
+
+logger = logging.getLogger(__name__)
+
+PRINCIPAL_INVALIDATION_CHANNEL = "auth:principals:invalidate"
+INVALIDATE_ALL = "*"
+
+
+@dataclass(frozen=True)
+class TenantLink:
+    """Tenant an API key is linked to."""
+
+    id: str
+    role: str = "user"
+
+
+@dataclass(frozen=True)
+class AuthPrincipal:
+    """
+    Immutable snapshot of an authenticated API key.
+
+    Mirrors the ``ApiKey`` attributes the auth middleware reads (``id``,
+    ``name``, ``scopes``, ``tenants``) plus the per-tenant roles.
+    """
+
+    id: str
+    name: str
+    scopes: tuple[str, ...] = ()
+    tenants: tuple[TenantLink, ...] = ()
+    loaded_at: float = field(default_factory=time.monotonic, compare=False)
+
+    @property
+    def allowed_tenants(self) -> set[str]:
+        return {t.id for t in self.tenants}
+
+    def role_for(self, tenant_id: str, default: str = "user") -> str:
+        for tenant in self.tenants:
+            if tenant.id == tenant_id:
+                return tenant.role or default
+        return default
+
+
+class AuthPrincipalCache:
+    """
+    TTL cache of principals keyed by API key hash.
+
+    Concurrent misses for the same key share a single loader call.
+    """
+
+    def __init__(self, ttl_seconds: float = 30.0, max_entries: int = 10_000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: dict[str, AuthPrincipal] = {}
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._listener: InvalidationListener | None = None
+
+    def get(self, hashed_key: str) -> AuthPrincipal | None:
+        principal = self._entries.get(hashed_key)
+        if principal is None:
+            return None
+        if time.monotonic() - principal.loaded_at > self.ttl_seconds:
+            self._entries.pop(hashed_key, None)
+            return None
+        return principal
+
+    def put(self, hashed_key: str, principal: AuthPrincipal) -> None:
+        if len(self._entries) >= self.max_entries:
+            # Drop the oldest entry (dicts keep insertion order)
+            self._entries.pop(next(iter(self._entries)), None)
+        self._entries[hashed_key] = principal
+
+    async def resolve(
+        self,
+        hashed_key: str,
+        loader: Callable[[], Awaitable[AuthPrincipal | None]],
+    ) -> AuthPrincipal | None:
+        """Return the cached principal or load it (misses are not cached)."""
+        principal = self.get(hashed_key)
+        if principal is not None:
+            return principal
+
+        pending = self._inflight.get(hashed_key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[hashed_key] = future
+        try:
+            principal = await loader()
+            if principal is not None:
+                self.put(hashed_key, principal)
+            future.set_result(principal)
+            return principal
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited future does not log a warning
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(hashed_key, None)
+
+    def invalidate(self, key_id: str | None = None) -> None:
+        """Drop one key's principal (by key id) or, with no id, every principal."""
+        if key_id is None or key_id == INVALIDATE_ALL:
+            self._entries.clear()
+            return
+        for hashed_key, principal in list(self._entries.items()):
+            if principal.id == key_id:
+                self._entries.pop(hashed_key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    # --- Cross-process invalidation ---
+
+    def ensure_listener(self, redis_url: str | None = None) -> None:
+        """Start the Redis invalidation listener for this process (idempotent)."""
+        if self._listener is None:
+            self._listener = InvalidationListener(
+                PRINCIPAL_INVALIDATION_CHANNEL,
+                on_message=lambda key_id: self.invalidate(key_id or None),
+                # Entries may have missed invalidations while disconnected
+                on_disconnect=self.clear,
+            )
+        self._listener.ensure_started(redis_url)
+
+    async def stop_listener(self) -> None:
+        if self._listener is not None:
+            await self._listener.stop()
+
+
+class LastUsedRecorder:
+    """
+    Collects API key usage and writes ``last_used_at`` in periodic batches.
+
+    Each flush issues one bulk UPDATE for every key used since the previous
+    flush, instead of one commit per request.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], object] | None = None,
+        flush_interval: float = 30.0,
+    ):
+        self._session_factory = session_factory
+        self.flush_interval = flush_interval
+        self._pending: dict[str, datetime] = {}
+        self._flush_task: asyncio.Task | None = None
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def record(self, key_id: str, used_at: datetime | None = None) -> None:
+        self._pending[key_id] = used_at or datetime.now(UTC)
+        if self._flush_task is None or self._flush_task.done():
+            try:
+                self._flush_task = asyncio.get_running_loop().create_task(self._flush_later())
+            except RuntimeError:
+                # No running loop: flushed by the next recorder call or at shutdown
+                pass
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+    async def flush(self) -> int:
+        """Write pending timestamps; returns the number of keys updated."""
+        if not self._pending:
+            return 0
+
+        pending, self._pending = self._pending, {}
+        session_factory = self._session_factory
+        if session_factory is None:
+            from src.core.database.session import get_session_maker
+
+            session_factory = get_session_maker()
+
+        try:
+            async with session_factory() as session:
+                await session.execute(
+                    update(ApiKey),
+                    [{"id": key_id, "last_used_at": used_at} for key_id, used_at in pending.items()],
+                )
+                await session.commit()
+        except Exception as e:
+            logger.warning(f"Failed to flush API key usage for {len(pending)} keys: {e}")
+            # Keep the newest timestamps for the next attempt
+            for key_id, used_at in pending.items():
+                self._pending.setdefault(key_id, used_at)
+            return 0
+
+        return len(pending)
+
+    async def close(self) -> None:
+        task, self._flush_task = self._flush_task, None
+        if task and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        await self.flush()
+
+
+_principal_cache = AuthPrincipalCache()
+_usage_recorder = LastUsedRecorder()
+
+
+def get_principal_cache() -> AuthPrincipalCache:
+    return _principal_cache
+
+
+def get_usage_recorder() -> LastUsedRecorder:
+    return _usage_recorder
+
+
+async def invalidate_principals(key_id: str | None = None) -> None:
+    """
+    Invalidate cached principals in this process and, via Redis, in all others.
+
+    Args:
+        key_id: API key whose principal changed; None invalidates every key.
+    """
+    _principal_cache.invalidate(key_id)
+    await publish_invalidation(PRINCIPAL_INVALIDATION_CHANNEL, key_id or INVALIDATE_ALL)
+
+
+async def shutdown_auth_cache() -> None:
+    """Flush pending usage and stop the invalidation listener."""
+    await _usage_recorder.close()
+    await _principal_cache.stop_listener()
@@ -0,0 +1,187 @@
+"""
+Backup Archive Format
+=====================
+
+Streaming primitives shared by BackupService and RestoreService.
+
+Archive layout (format version 2.0):
+- ingestion/chunks.jsonl: one chunk row per line
+- vectors/part-NNNNN.npy: float32 embedding matrix for one shard
+- vectors/part-NNNNN.jsonl: row index for the shard (same order as the matrix)
+- graph/graph.jsonl: one node/relationship per line
+
+Version 1.0 archives (ingestion/chunks.json, vectors/vectors.jsonl) are still
+readable by RestoreService.
+"""
+
+import json
+import queue
+import threading
+from collections.abc import Iterator
+from typing import IO, Any
+
+import numpy as np
+
+BACKUP_FORMAT_VERSION = "2.0"
+
+CHUNKS_SECTION = "ingestion/chunks.jsonl"
+LEGACY_CHUNKS_SECTION = "ingestion/chunks.json"
+VECTORS_PREFIX = "vectors/part-"
+LEGACY_VECTORS_SECTION = "vectors/vectors.jsonl"
+GRAPH_SECTION = "graph/graph.jsonl"
+
+# Rows per vector shard: 4096 x 1536 float32 is ~25 MB in memory.
+VECTOR_SHARD_ROWS = 4096
+
+VECTOR_FIELD = "vector"
+
+
+class BoundedPipe:
+    """
+    Write-side file object that hands bytes to a reader thread via a bounded queue.
+
+    ZipFile writes into the pipe from the event loop while the storage client
+    reads from it in a worker thread, so at most ``max_chunks * chunk_size``
+    bytes are buffered regardless of archive size. The pipe is deliberately
+    not seekable: ZipFile then emits data descriptors instead of seeking back.
+    """
+
+    def __init__(self, chunk_size: int = 1024 * 1024, max_chunks: int = 8):
+        self._chunk_size = chunk_size
+        self._queue: queue.Queue[bytes | BaseException | None] = queue.Queue(maxsize=max_chunks)
+        self._pending = bytearray()
+        self._read_buffer = b""
+        self._eof = False
+        self._reader_done = threading.Event()
+        self.bytes_written = 0
+
+    # --- Writer side (ZipFile) ---
+
+    def write(self, data: bytes) -> int:
+        self._pending += data
+        self.bytes_written += len(data)
+        while len(self._pending) >= self._chunk_size:
+            self._put(bytes(self._pending[: self._chunk_size]))
+            del self._pending[: self._chunk_size]
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        """Signal end of stream after draining buffered bytes."""
+        if self._pending:
+            self._put(bytes(self._pending))
+            self._pending.clear()
+        self._put(None)
+
+    def abort(self, error: BaseException) -> None:
+        """Fail the reader so a partial upload is never completed."""
+        self._pending.clear()
+        try:
+            self._put(error)
+        except RuntimeError:
+            pass
+
+    def _put(self, item: bytes | BaseException | None) -> None:
+        while True:
+            if self._reader_done.is_set():
+                raise RuntimeError("Upload stream closed before the backup was complete")
+            try:
+                self._queue.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    # --- Reader side (storage client thread) ---
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            parts = [self._read_buffer]
+            self._read_buffer = b""
+            while not self._eof:
+                parts.append(self._next_chunk())
+            return b"".join(parts)
+
+        while not self._read_buffer and not self._eof:
+            self._read_buffer = self._next_chunk()
+
+        data, self._read_buffer = self._read_buffer[:size], self._read_buffer[size:]
+        return data
+
+    def reader_finished(self) -> None:
+        """Called once the reader stops consuming, successfully or not."""
+        self._reader_done.set()
+
+    def _next_chunk(self) -> bytes:
+        item = self._queue.get()
+        if item is None:
+            self._eof = True
+            return b""
+        if isinstance(item, BaseException):
+            self._eof = True
+            raise RuntimeError("Backup stream aborted by writer") from item
+        return item
+
+
+class VectorShardWriter:
+    """Accumulates exported vectors and writes them as fixed-size .npy shards."""
+
+    def __init__(self, open_entry, shard_rows: int = VECTOR_SHARD_ROWS):
+        self._open_entry = open_entry
+        self._shard_rows = shard_rows
+        self._vectors: list[Any] = []
+        self._rows: list[dict] = []
+        self.shards = 0
+        self.count = 0
+
+    def add(self, record: dict) -> None:
+        row = dict(record)
+        self._vectors.append(row.pop(VECTOR_FIELD))
+        self._rows.append(row)
+        if len(self._rows) >= self._shard_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._rows:
+            return
+
+        name = f"{VECTORS_PREFIX}{self.shards:05d}"
+        matrix = np.asarray(self._vectors, dtype=np.float32)
+        with self._open_entry(f"{name}.npy") as f:
+            np.lib.format.write_array(f, matrix, allow_pickle=False)
+        with self._open_entry(f"{name}.jsonl") as f:
+            for row in self._rows:
+                f.write(dumps_line(row))
+
+        self.count += len(self._rows)
+        self.shards += 1
+        self._vectors = []
+        self._rows = []
+
+
+def dumps_line(item: Any) -> bytes:
+    """Serialize one JSONL row compactly."""
+    return (json.dumps(item, separators=(",", ":"), default=str) + "\n").encode("utf-8")
+
+
+def iter_jsonl(fp: IO[bytes]) -> Iterator[dict]:
+    """Yield rows from a JSONL stream without loading it into memory."""
+    for line in fp:
+        if line.strip():
+            yield json.loads(line)
+
+
+def vector_shard_names(names: list[str]) -> list[str]:
+    """Return shard base names (without extension) present in an archive, in order."""
+    return sorted(
+        n[: -len(".npy")] for n in names if n.startswith(VECTORS_PREFIX) and n.endswith(".npy")
+    )
+
+
+def iter_vector_shard(matrix_fp: IO[bytes], rows_fp: IO[bytes]) -> Iterator[dict]:
+    """Join one shard's embedding matrix with its row index."""
+    matrix = np.lib.format.read_array(matrix_fp, allow_pickle=False)
+    for i, row in enumerate(iter_jsonl(rows_fp)):
+        row[VECTOR_FIELD] = matrix[i].tolist()
+        yield row
@@ -8,10 +8,11 @@ Supports two scopes:
 - FULL_SYSTEM: Above + vector metadata, graph entities, configs, rules
 """
 
-import io
+import asyncio
 import json
 import logging
 import os
+import shutil
 import subprocess
 import zipfile
 from collections.abc import Callable
@@ -20,6 +21,14 @@ from datetime import UTC, datetime
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.admin_ops.application.backup_format import (
+    BACKUP_FORMAT_VERSION,
+    CHUNKS_SECTION,
+    GRAPH_SECTION,
+    BoundedPipe,
+    VectorShardWriter,
+    dumps_line,
+)
 from src.core.admin_ops.domain.backup_job import BackupSchedule, BackupScope
 from src.core.admin_ops.domain.global_rule import GlobalRule
 from src.core.generation.domain.memory_models import ConversationSummary, UserFact
@@ -31,6 +40,11 @@ from src.core.ingestion.domain.ports.vector_store import VectorStoreFactory
 
 logger = logging.getLogger(__name__)
 
+# Multipart part size for the archive upload (S3 minimum is 5 MiB)
+UPLOAD_PART_SIZE = 16 * 1024 * 1024
+COPY_BUFFER_SIZE = 1024 * 1024
+CHUNK_EXPORT_BATCH_SIZE = 2000
+
 
 class BackupService:
     """
@@ -70,100 +84,124 @@ class BackupService:
         """
         logger.info(f"Creating backup for tenant {tenant_id}, scope={scope}, job={job_id}")
 
-        zip_buffer = io.BytesIO()
-
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-            total_steps = 9 if scope == BackupScope.USER_DATA else 13
-            current_step = 0
-
-            def update_progress():
-                nonlocal current_step
-                current_step += 1
-                if progress_callback:
-                    progress_callback(int(current_step / total_steps * 100))
-
-            # ===== USER_DATA scope =====
+        storage_path = f"backups/{tenant_id}/{job_id}/backup.zip"
 
-            # 1. Documents metadata
-            await self._add_documents_metadata(zf, tenant_id)
-            update_progress()
+        # The archive is streamed into a multipart upload through a bounded pipe,
+        # so worker memory stays flat no matter how large the tenant is.
+        pipe = BoundedPipe()
+        loop = asyncio.get_running_loop()
+        upload = loop.run_in_executor(None, self._upload_archive, storage_path, pipe)
 
-            # 2. Folders structure
-            await self._add_folders(zf, tenant_id)
-            update_progress()
+        try:
+            with zipfile.ZipFile(pipe, "w", zipfile.ZIP_DEFLATED) as zf:
+                await self._write_sections(zf, tenant_id, job_id, scope, progress_callback)
+            pipe.close()
+        except BaseException as e:
+            pipe.abort(e)
+            await asyncio.gather(upload, return_exceptions=True)
+            raise
 
-            # 3. Original document files
-            await self._add_document_files(zf, tenant_id)
-            update_progress()
+        await upload
+        file_size = pipe.bytes_written
 
-            # 4. Conversations
-            await self._add_conversations(zf, tenant_id)
-            update_progress()
+        logger.info(f"Uploaded backup to {storage_path}, size: {file_size} bytes")
+        return storage_path, file_size
 
-            # 5. User Facts (memory)
-            await self._add_user_facts(zf, tenant_id)
-            update_progress()
+    def _upload_archive(self, storage_path: str, pipe: BoundedPipe) -> None:
+        """Consume the archive pipe into storage (runs in a worker thread)."""
+        try:
+            self.storage.upload_stream(
+                object_name=storage_path,
+                data=pipe,
+                content_type="application/zip",
+                part_size=UPLOAD_PART_SIZE,
+            )
+        finally:
+            pipe.reader_finished()
 
-            # 6. Conversation Summaries (memory)
-            await self._add_conversation_summaries(zf, tenant_id)
+    async def _write_sections(
+        self,
+        zf: zipfile.ZipFile,
+        tenant_id: str,
+        job_id: str,
+        scope: BackupScope,
+        progress_callback: Callable[[int], None] | None,
+    ) -> None:
+        """Write every backup section for the given scope into the archive."""
+        total_steps = 9 if scope == BackupScope.USER_DATA else 13
+        current_step = 0
+
+        def update_progress():
+            nonlocal current_step
+            current_step += 1
+            if progress_callback:
+                progress_callback(int(current_step / total_steps * 100))
+
+        # ===== USER_DATA scope =====
+
+        # 1. Documents metadata
+        await self._add_documents_metadata(zf, tenant_id)
+        update_progress()
+
+        # 2. Folders structure
+        await self._add_folders(zf, tenant_id)
+        update_progress()
+
+        # 3. Original document files
+        await self._add_document_files(zf, tenant_id)
+        update_progress()
+
+        # 4. Conversations
+        await self._add_conversations(zf, tenant_id)
+        update_progress()
+
+        # 5. User Facts (memory)
+        await self._add_user_facts(zf, tenant_id)
+        update_progress()
+
+        # 6. Conversation Summaries (memory)
+        await self._add_conversation_summaries(zf, tenant_id)
+        update_progress()
+
+        # 7. Chunks Table (Critical for re-indexing)
+        await self._add_chunks_table(zf, tenant_id)
+        update_progress()
+
+        # 8. Vectors (Milvus)
+        await self._add_vectors(zf, tenant_id)
+        update_progress()
+
+        # 9. Graph (Neo4j)
+        await self._add_graph(zf, tenant_id)
+        update_progress()
+
+        # ===== FULL_SYSTEM scope (additional) =====
+        if scope == BackupScope.FULL_SYSTEM:
+            # 10. Global rules
+            await self._add_global_rules(zf, tenant_id)
             update_progress()
 
-            # ===== FULL_SYSTEM scope (additional) =====
-            # 7. Chunks Table (Critical for re-indexing)
-            await self._add_chunks_table(zf, tenant_id)
+            # 11. Tenant configuration
+            await self._add_tenant_config(zf, tenant_id)
             update_progress()
 
-            # 8. Vectors (Milvus)
-            await self._add_vectors(zf, tenant_id)
+            # 12. Backup Schedules
+            await self._add_backup_schedules(zf, tenant_id)
             update_progress()
 
-            # 9. Graph (Neo4j)
-            await self._add_graph(zf, tenant_id)
+            # 13. Full Postgres Dump
+            await self._add_postgres_dump(zf)
             update_progress()
 
-            # ===== FULL_SYSTEM scope (additional) =====
-            if scope == BackupScope.FULL_SYSTEM:
-                # 10. Global rules
-                await self._add_global_rules(zf, tenant_id)
-                update_progress()
-
-                # 11. Tenant configuration
-                await self._add_tenant_config(zf, tenant_id)
-                update_progress()
-
-                # 12. Backup Schedules
-                await self._add_backup_schedules(zf, tenant_id)
-                update_progress()
-
-                # 13. Full Postgres Dump
-                await self._add_postgres_dump(zf)
-                update_progress()
-
-            # Create manifest
-            manifest = {
-                "version": "1.0",
-                "created_at": datetime.now(UTC).isoformat(),
-                "tenant_id": tenant_id,
-                "scope": scope.value,
-                "job_id": job_id,
-            }
-            zf.writestr("manifest.json", json.dumps(manifest, indent=2))
-
-        zip_buffer.seek(0)
-        content = zip_buffer.getvalue()
-        file_size = len(content)
-
-        # Upload to MinIO
-        storage_path = f"backups/{tenant_id}/{job_id}/backup.zip"
-        self.storage.upload_file(
-            object_name=storage_path,
-            data=io.BytesIO(content),
-            length=file_size,
-            content_type="application/zip",
-        )
-
-        logger.info(f"Uploaded backup to {storage_path}, size: {file_size} bytes")
-        return storage_path, file_size
+        # Create manifest
+        manifest = {
+            "version": BACKUP_FORMAT_VERSION,
+            "created_at": datetime.now(UTC).isoformat(),
+            "tenant_id": tenant_id,
+            "scope": scope.value,
+            "job_id": job_id,
+        }
+        zf.writestr("manifest.json", json.dumps(manifest, indent=2))
 
     async def _add_documents_metadata(self, zf: zipfile.ZipFile, tenant_id: str) -> None:
         """Export documents metadata as JSON."""
@@ -216,11 +254,17 @@ class BackupService:
         for doc in documents:
             if not doc.storage_path:
                 continue
+            # Preserve folder structure: documents/files/{folder_id or root}/{filename}
+            folder_path = doc.folder_id if doc.folder_id else "root"
             try:
-                file_bytes = self.storage.get_file(doc.storage_path)
-                # Preserve folder structure: documents/files/{folder_id or root}/{filename}
-                folder_path = doc.folder_id if doc.folder_id else "root"
-                zf.writestr(f"documents/files/{folder_path}/{doc.filename}", file_bytes)
+                stream = self.storage.get_file_stream(doc.storage_path)
+                try:
+                    with zf.open(
+                        f"documents/files/{folder_path}/{doc.filename}", "w", force_zip64=True
+                    ) as dest:
+                        shutil.copyfileobj(stream, dest, COPY_BUFFER_SIZE)
+                finally:
+                    stream.close()
             except Exception as e:
                 logger.warning(f"Could not retrieve file for document {doc.id}: {e}")
                 zf.writestr(
@@ -425,33 +469,40 @@ class BackupService:
         return True
 
     async def _add_chunks_table(self, zf: zipfile.ZipFile, tenant_id: str) -> None:
-        """Export chunks table as JSON."""
+        """Export chunks table as JSONL, streamed from the database."""
         from src.core.ingestion.domain.chunk import Chunk
 
-        result = await self.session.execute(select(Chunk).where(Chunk.tenant_id == tenant_id))
-        chunks = result.scalars().all()
+        stmt = (
+            select(Chunk)
+            .where(Chunk.tenant_id == tenant_id)
+            .execution_options(yield_per=CHUNK_EXPORT_BATCH_SIZE)
+        )
 
-        data = []
-        for chunk in chunks:
-            data.append(
-                {
-                    "id": chunk.id,
-                    "document_id": chunk.document_id,
-                    "index": chunk.index,
-                    "tokens": chunk.tokens,
-                    "content": chunk.content,
-                    "metadata": chunk.metadata_ or {},
-                    "embedding_status": chunk.embedding_status.value
-                    if hasattr(chunk.embedding_status, "value")
-                    else str(chunk.embedding_status),
-                }
-            )
+        count = 0
+        with zf.open(CHUNKS_SECTION, "w", force_zip64=True) as f:
+            result = await self.session.stream_scalars(stmt)
+            async for chunk in result:
+                f.write(
+                    dumps_line(
+                        {
+                            "id": chunk.id,
+                            "document_id": chunk.document_id,
+                            "index": chunk.index,
+                            "tokens": chunk.tokens,
+                            "content": chunk.content,
+                            "metadata": chunk.metadata_ or {},
+                            "embedding_status": chunk.embedding_status.value
+                            if hasattr(chunk.embedding_status, "value")
+                            else str(chunk.embedding_status),
+                        }
+                    )
+                )
+                count += 1
 
-        zf.writestr("ingestion/chunks.json", json.dumps(data, indent=2))
-        logger.info(f"Added {len(data)} chunks to backup")
+        logger.info(f"Added {count} chunks to backup")
 
     async def _add_vectors(self, zf: zipfile.ZipFile, tenant_id: str) -> None:
-        """Export Milvus vectors to JSONL."""
+        """Export Milvus vectors as float32 .npy shards with JSONL row indexes."""
         from src.core.tenants.application.active_vector_collection import (
             resolve_active_vector_collection,
         )
@@ -463,7 +514,6 @@ class BackupService:
         t_config = tenant_obj.config if tenant_obj else {}
         collection_name = resolve_active_vector_collection(tenant_id, t_config)
 
-        # Build ephemeral store
         # Build ephemeral store
         # Use default dimension (1536) if not specified in tenant config
         dims = int(t_config.get("embedding_dimensions") or 1536)
@@ -471,47 +521,26 @@ class BackupService:
         vector_store = self.vector_store_factory(dims, collection_name=collection_name)
         logger.info(f"Exporting vectors for tenant {tenant_id} from collection {collection_name}")
 
-        tmp_path = f"/tmp/vectors_{tenant_id}_{datetime.now(UTC).timestamp()}.jsonl"
+        shards = VectorShardWriter(lambda name: zf.open(name, "w", force_zip64=True))
         try:
-            count = 0
-            with open(tmp_path, "w") as f:
-                async for vec in vector_store.export_vectors(tenant_id):
-                    f.write(json.dumps(vec) + "\n")
-                    count += 1
-
-            if count > 0:
-                zf.write(tmp_path, arcname="vectors/vectors.jsonl")
-            else:
-                zf.writestr("vectors/vectors.jsonl", "")
+            async for vec in vector_store.export_vectors(tenant_id):
+                shards.add(vec)
+            shards.flush()
 
-            logger.info(f"Added {count} vectors to backup")
+            logger.info(f"Added {shards.count} vectors to backup in {shards.shards} shards")
 
         finally:
             await vector_store.close()
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
 
     async def _add_graph(self, zf: zipfile.ZipFile, tenant_id: str) -> None:
         """Export Neo4j graph data to JSONL."""
+        count = 0
+        with zf.open(GRAPH_SECTION, "w", force_zip64=True) as f:
+            async for item in self.graph_client.export_graph(tenant_id):
+                f.write(dumps_line(item))
+                count += 1
 
-        tmp_path = f"/tmp/graph_{tenant_id}_{datetime.now(UTC).timestamp()}.jsonl"
-        try:
-            count = 0
-            with open(tmp_path, "w") as f:
-                async for item in self.graph_client.export_graph(tenant_id):
-                    f.write(json.dumps(item) + "\n")
-                    count += 1
-
-            if count > 0:
-                zf.write(tmp_path, arcname="graph/graph.jsonl")
-            else:
-                zf.writestr("graph/graph.jsonl", "")
-
-            logger.info(f"Added {count} graph entities to backup")
-
-        finally:
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
+        logger.info(f"Added {count} graph entities to backup")
 
     async def _add_postgres_dump(self, zf: zipfile.ZipFile) -> None:
         """
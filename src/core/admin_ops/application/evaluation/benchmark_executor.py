@@ -0,0 +1,327 @@
+"""
+Benchmark Executor
+==================
+
+Runs a RAGAS benchmark dataset through retrieval, generation and evaluation.
+
+Samples flow through the three stages concurrently, each stage bounded by its
+own semaphore so a slow stage (usually evaluation) cannot flood the others.
+Completed samples are handed to a checkpoint callback as they finish, which
+lets a crashed run resume from the rows already stored on ``BenchmarkRun``.
+Retrieval results are cached by (query, tenant config hash) so runs that only
+change generation settings reuse the previous retrievals.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+NO_CONTEXT_ANSWER = "I couldn't find any relevant information."
+
+
+def _get_redis():
+    """Get redis module with lazy loading."""
+    try:
+        import redis.asyncio as redis
+
+        return redis
+    except ImportError as e:
+        raise ImportError(
+            "redis package is required. Install with: pip install redis>=5.0.0"
+        ) from e
+
+
+def clean_score(score: Any) -> float | None:
+    """Drop NaN/inf scores so details stay JSON-serializable."""
+    if score is None:
+        return None
+    if isinstance(score, float) and (math.isnan(score) or math.isinf(score)):
+        return None
+    return score
+
+
+# Tenant config keys that only affect answer generation; changing them must not
+# invalidate cached retrievals.
+GENERATION_ONLY_KEYS = frozenset(
+    {"rag_system_prompt", "rag_user_prompt", "generation_model", "temperature", "seed"}
+)
+
+
+def config_hash(tenant_config: Mapping[str, Any] | None) -> str:
+    """Stable hash of the retrieval-relevant part of a tenant config."""
+    relevant = {k: v for k, v in (tenant_config or {}).items() if k not in GENERATION_ONLY_KEYS}
+    serialized = json.dumps(relevant, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode()).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class BenchmarkLimits:
+    """Per-stage concurrency limits."""
+
+    retrieval: int = 8
+    generation: int = 4
+    evaluation: int = 4
+
+    @classmethod
+    def from_capacity(cls, capacity: Any, retrieval: int = 8) -> "BenchmarkLimits":
+        """
+        Size LLM stages to the capacity a background job may use.
+
+        Benchmarks run as ingestion-class work, so they never get the slots
+        reserved for chat. Queuing more LLM calls than that just makes workers
+        poll the limiter.
+        """
+        if not getattr(capacity, "enabled", False):
+            return cls(retrieval=retrieval)
+        shared = max(1, capacity.total - capacity.reserved_chat)
+        return cls(retrieval=retrieval, generation=shared, evaluation=shared)
+
+
+class BenchmarkRetrievalCache:
+    """
+    Retrieval results for benchmark queries.
+
+    Stored in Redis when available (so later runs reuse them) and always in
+    process memory for the current run.
+    """
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        ttl_seconds: int = 86400,
+        key_prefix: str = "benchmark_retrieval",
+    ):
+        self.redis_url = redis_url
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+        self._local: dict[str, list[dict[str, Any]]] = {}
+        self._client = None
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, tenant_id: str, query: str, top_k: int, cfg_hash: str) -> str:
+        digest = hashlib.sha256(f"{query.strip()}\x00{top_k}".encode()).hexdigest()[:32]
+        return f"{self.key_prefix}:{tenant_id}:{cfg_hash}:{digest}"
+
+    async def _get_client(self):
+        if self._client is None and self.redis_url:
+            try:
+                self._client = _get_redis().from_url(self.redis_url, decode_responses=True)
+            except Exception as e:
+                logger.warning(f"Benchmark retrieval cache using memory only: {e}")
+                self.redis_url = None
+        return self._client
+
+    async def get(self, key: str) -> list[dict[str, Any]] | None:
+        if key in self._local:
+            self.hits += 1
+            return self._local[key]
+
+        client = await self._get_client()
+        if client is not None:
+            try:
+                raw = await client.get(key)
+                if raw:
+                    chunks = json.loads(raw)
+                    self._local[key] = chunks
+                    self.hits += 1
+                    return chunks
+            except Exception as e:
+                logger.warning(f"Benchmark retrieval cache read failed: {e}")
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, chunks: list[dict[str, Any]]) -> None:
+        self._local[key] = chunks
+        client = await self._get_client()
+        if client is None:
+            return
+        try:
+            await client.set(key, json.dumps(chunks, default=str), ex=self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Benchmark retrieval cache write failed: {e}")
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+
+class BenchmarkExecutor:
+    """
+    Pipelines benchmark samples through retrieval, generation and evaluation.
+
+    Usage:
+        executor = BenchmarkExecutor(retrieval_service, generation_service, ragas_service)
+        details = await executor.run(dataset, tenant_id, completed=benchmark.details,
+                                     on_sample=checkpoint)
+    """
+
+    def __init__(
+        self,
+        retrieval_service: Any,
+        generation_service: Any,
+        ragas_service: Any,
+        limits: BenchmarkLimits | None = None,
+        retrieval_cache: BenchmarkRetrievalCache | None = None,
+        top_k: int = 5,
+    ):
+        self.retrieval_service = retrieval_service
+        self.generation_service = generation_service
+        self.ragas_service = ragas_service
+        self.limits = limits or BenchmarkLimits()
+        self.retrieval_cache = retrieval_cache or BenchmarkRetrievalCache()
+        self.top_k = top_k
+
+        self._retrieval_sem = asyncio.Semaphore(self.limits.retrieval)
+        self._generation_sem = asyncio.Semaphore(self.limits.generation)
+        self._evaluation_sem = asyncio.Semaphore(self.limits.evaluation)
+
+    @staticmethod
+    def sample_query(sample: Mapping[str, Any]) -> str:
+        return sample.get("query", sample.get("question", ""))
+
+    @classmethod
+    def pending_indices(
+        cls, samples: list[Mapping[str, Any]], completed: list[dict[str, Any]] | None
+    ) -> list[int]:
+        """
+        Indices of samples without a completed detail row.
+
+        Rows are matched by ``index``; rows written before indices were
+        recorded fall back to matching by query.
+        """
+        done_indices = {d["index"] for d in completed or [] if d.get("index") is not None}
+        done_queries = [d.get("query") for d in completed or [] if d.get("index") is None]
+        pending = []
+        for i, sample in enumerate(samples):
+            if i in done_indices:
+                continue
+            query = cls.sample_query(sample)
+            if query in done_queries:
+                done_queries.remove(query)
+                continue
+            pending.append(i)
+        return pending
+
+    async def _retrieve(
+        self, query: str, tenant_id: str, tenant_config: Mapping[str, Any] | None, cfg_hash: str
+    ) -> list[dict[str, Any]]:
+        key = self.retrieval_cache.make_key(tenant_id, query, self.top_k, cfg_hash)
+        cached = await self.retrieval_cache.get(key)
+        if cached is not None:
+            return cached
+
+        async with self._retrieval_sem:
+            result = await self.retrieval_service.retrieve(
+                query=query, tenant_id=tenant_id, top_k=self.top_k, tenant_config=tenant_config
+            )
+        chunks = list(result.chunks or [])
+        await self.retrieval_cache.set(key, chunks)
+        return chunks
+
+    async def _process(
+        self,
+        index: int,
+        sample: Mapping[str, Any],
+        tenant_id: str,
+        tenant_config: Mapping[str, Any] | None,
+        cfg_hash: str,
+    ) -> dict[str, Any]:
+        query = self.sample_query(sample)
+        chunks = await self._retrieve(query, tenant_id, tenant_config, cfg_hash)
+
+        if chunks:
+            async with self._generation_sem:
+                gen_result = await self.generation_service.generate(
+                    query=query,
+                    candidates=chunks,
+                    options={"tenant_id": tenant_id, "tenant_config": tenant_config},
+                )
+            answer = gen_result.answer
+            contexts = [c.get("content", "") for c in chunks]
+        else:
+            answer = NO_CONTEXT_ANSWER
+            contexts = []
+
+        async with self._evaluation_sem:
+            eval_result = await self.ragas_service.evaluate_sample(
+                query=query, context=contexts, response=answer
+            )
+
+        return {
+            "index": index,
+            "query": query,
+            "faithfulness": clean_score(eval_result.faithfulness),
+            "response_relevancy": clean_score(eval_result.response_relevancy),
+            "context_precision": clean_score(eval_result.context_precision),
+            "context_recall": clean_score(eval_result.context_recall),
+        }
+
+    async def run(
+        self,
+        samples: list[Mapping[str, Any]],
+        tenant_id: str,
+        tenant_config: Mapping[str, Any] | None = None,
+        completed: list[dict[str, Any]] | None = None,
+        on_sample: Callable[[dict[str, Any], int, int], Awaitable[None]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Evaluate every sample not already in ``completed``.
+
+        ``on_sample(detail, done, total)`` is awaited (one call at a time) as
+        each sample finishes. Returns all detail rows, ``completed`` included,
+        in dataset order. The first sample failure cancels the rest and is
+        re-raised; rows already checkpointed survive for the next attempt.
+        """
+        details = [dict(d) for d in completed or []]
+        pending = self.pending_indices(samples, details)
+        total = len(samples)
+        cfg_hash = config_hash(tenant_config)
+        checkpoint_lock = asyncio.Lock()
+
+        if len(pending) < total:
+            logger.info(f"Resuming benchmark: {total - len(pending)}/{total} samples already done")
+
+        async def run_one(index: int) -> None:
+            detail = await self._process(index, samples[index], tenant_id, tenant_config, cfg_hash)
+            async with checkpoint_lock:
+                details.append(detail)
+                if on_sample is not None:
+                    await on_sample(detail, len(details), total)
+
+        tasks = [asyncio.create_task(run_one(i)) for i in pending]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        logger.info(
+            f"Benchmark retrieval cache: {self.retrieval_cache.hits} hits, "
+            f"{self.retrieval_cache.misses} misses"
+        )
+        return sorted(details, key=lambda d: (d.get("index") is None, d.get("index") or 0))
+
+    @staticmethod
+    def aggregate(details: list[dict[str, Any]]) -> dict[str, Any]:
+        """Mean scores over the samples that produced them."""
+        faith_scores = [d["faithfulness"] for d in details if d.get("faithfulness") is not None]
+        rel_scores = [
+            d["response_relevancy"] for d in details if d.get("response_relevancy") is not None
+        ]
+        return {
+            "faithfulness": sum(faith_scores) / len(faith_scores) if faith_scores else 0.0,
+            "response_relevancy": sum(rel_scores) / len(rel_scores) if rel_scores else 0.0,
+            "samples_evaluated": len(details),
+        }
@@ -6,6 +6,7 @@ Wraps the official Ragas library for systematic RAG evaluation.
 Falls back to custom JudgeService if Ragas is not installed.
 """
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from typing import Any
@@ -172,8 +173,11 @@ class RagasService:
         Returns:
             RagasEvaluationResult with all available scores
         """
-        faithfulness = await self.evaluate_faithfulness(query, context, response)
-        relevancy = await self.evaluate_response_relevancy(query, response)
+        # The metrics are independent LLM calls; run them side by side.
+        faithfulness, relevancy = await asyncio.gather(
+            self.evaluate_faithfulness(query, context, response),
+            self.evaluate_response_relevancy(query, response),
+        )
 
         return RagasEvaluationResult(
             faithfulness=faithfulness,
@@ -181,25 +185,30 @@ class RagasService:
             metadata={"ragas_available": self.is_available, "model": self.model_name},
         )
 
-    async def evaluate_batch(self, samples: list[dict[str, str]]) -> list[RagasEvaluationResult]:
+    async def evaluate_batch(
+        self, samples: list[dict[str, str]], max_concurrency: int = 4
+    ) -> list[RagasEvaluationResult]:
         """
-        Evaluate a batch of samples.
+        Evaluate a batch of samples concurrently.
 
         Args:
             samples: List of dicts with keys: query, context, response
+            max_concurrency: Maximum number of samples evaluated at once
 
         Returns:
-            List of RagasEvaluationResult
+            List of RagasEvaluationResult, in input order
         """
-        results = []
-        for sample in samples:
-            result = await self.evaluate_sample(
-                query=sample["query"],
-                context=sample.get("context", ""),
-                response=sample.get("response", ""),
-            )
-            results.append(result)
-        return results
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def evaluate(sample: dict[str, str]) -> RagasEvaluationResult:
+            async with semaphore:
+                return await self.evaluate_sample(
+                    query=sample["query"],
+                    context=sample.get("context", ""),
+                    response=sample.get("response", ""),
+                )
+
+        return list(await asyncio.gather(*(evaluate(sample) for sample in samples)))
 
     async def _fallback_faithfulness(self, query: str, context: str, response: str) -> float:
         """Use JudgeService as fallback for faithfulness."""
@@ -6,5 +6,6 @@ Instrumentation and metrics collection for RAG pipeline.
 """
 
 from src.core.admin_ops.application.metrics.collector import MetricsCollector, QueryMetrics
+from src.core.admin_ops.application.metrics.store import MetricsStore, get_metrics_store
 
-__all__ = ["MetricsCollector", "QueryMetrics"]
+__all__ = ["MetricsCollector", "MetricsStore", "QueryMetrics", "get_metrics_store"]
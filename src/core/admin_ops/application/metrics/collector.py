@@ -3,13 +3,14 @@ Metrics Collector
 =================
 
 Centralized metrics collection for RAG pipeline monitoring and evaluation.
+Completed metrics are persisted through the shared MetricsStore (Postgres).
 """
 
 import logging
 import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 logger = logging.getLogger(__name__)
 
@@ -89,6 +90,19 @@ class QueryMetrics:
             "answer_length": self.answer_length,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "QueryMetrics":
+        """Rebuild metrics from ``to_dict`` output or a stored row."""
+        timestamp = data.get("timestamp")
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp)
+        fields = {
+            name: data[name]
+            for name in cls.__dataclass_fields__
+            if name != "timestamp" and data.get(name) is not None
+        }
+        return cls(**fields, timestamp=timestamp or datetime.now(UTC))
+
 
 @dataclass
 class AggregatedMetrics:
@@ -123,10 +137,10 @@ class MetricsCollector:
     Supports:
     - Per-query metrics recording
     - Aggregation for dashboards
-    - Export to various backends (Redis, Prometheus, etc.)
+    - Persistence to Postgres via the batched MetricsStore
 
     Usage:
-        collector = MetricsCollector(redis_url="redis://localhost:6379/0")
+        collector = MetricsCollector()
 
         async with collector.track_query("q_123", "tenant_1", "What is X?") as metrics:
             # Perform query...
@@ -136,32 +150,23 @@ class MetricsCollector:
 
     def __init__(
         self,
-        redis_url: str | None = None,
         enable_persistence: bool = True,
-        retention_days: int = 30,
+        store: "MetricsStore | None" = None,
     ):
-        self.redis_url = redis_url
         self.enable_persistence = enable_persistence
-        self.retention_days = retention_days
-        self._client = None
+        self._store = store
 
-        # In-memory buffer for recent metrics
+        # In-memory buffer for recent metrics (fallback when the store is unavailable)
         self._buffer: list[QueryMetrics] = []
         self._buffer_size = 1000
 
-    async def _get_client(self):
-        """Get or create Redis client."""
-        if self._client is None and self.redis_url:
-            try:
-                import redis.asyncio as redis
+    @property
+    def store(self) -> "MetricsStore":
+        if self._store is None:
+            from src.core.admin_ops.application.metrics.store import get_metrics_store
 
-                self._client = redis.from_url(
-                    self.redis_url,
-                    decode_responses=True,
-                )
-            except ImportError:
-                logger.warning("Redis not available for metrics persistence")
-        return self._client
+            self._store = get_metrics_store()
+        return self._store
 
     class QueryTracker:
         """Context manager for tracking query metrics."""
@@ -201,44 +206,25 @@ class MetricsCollector:
         return self.QueryTracker(self, metrics)
 
     async def record(self, metrics: QueryMetrics) -> None:
-        """Record completed query metrics."""
+        """Record completed query metrics (queued for a batched insert)."""
         # Add to buffer
         self._buffer.append(metrics)
         if len(self._buffer) > self._buffer_size:
             self._buffer = self._buffer[-self._buffer_size :]
 
-        # Persist to Redis if enabled
         if self.enable_persistence:
-            await self._persist(metrics)
+            self.store.enqueue(metrics)
 
         logger.debug(
             f"Recorded metrics for query {metrics.query_id}: "
             f"{metrics.total_latency_ms:.0f}ms, {metrics.tokens_used} tokens"
         )
 
-    async def _persist(self, metrics: QueryMetrics) -> None:
-        """Persist metrics to Redis."""
-        import json
-
-        client = await self._get_client()
-        if not client:
-            return
-
-        try:
-            key = f"metrics:query:{metrics.query_id}"
-            await client.setex(
-                key,
-                self.retention_days * 86400,
-                json.dumps(metrics.to_dict()),
-            )
-
-            # Add to time-series list for aggregation
-            list_key = f"metrics:queries:{metrics.tenant_id}"
-            await client.lpush(list_key, metrics.query_id)
-            await client.ltrim(list_key, 0, 9999)  # Keep last 10k query IDs
-
-        except Exception as e:
-            logger.warning(f"Failed to persist metrics: {e}")
+    def _recent_from_buffer(self, tenant_id: str | None, limit: int) -> list[QueryMetrics]:
+        relevant = [
+            m for m in reversed(self._buffer) if tenant_id is None or m.tenant_id == tenant_id
+        ]
+        return relevant[:limit]
 
     async def get_aggregated(
         self,
@@ -246,6 +232,12 @@ class MetricsCollector:
         period_hours: int = 24,
     ) -> AggregatedMetrics:
         """Get aggregated metrics for a time period."""
+        if self.enable_persistence:
+            try:
+                return await self.store.aggregate(tenant_id, period_hours)
+            except Exception as e:
+                logger.error(f"Failed to aggregate metrics from store: {e}")
+
         from datetime import timedelta
 
         now = datetime.now(UTC)
@@ -285,93 +277,23 @@ class MetricsCollector:
         self,
         tenant_id: str | None = None,
         limit: int = 100,
+        cursor: str | None = None,
     ) -> list[QueryMetrics]:
+        """Most recent metrics, newest first (use MetricsStore.list_recent for paging)."""
         if not self.enable_persistence:
-            # Fallback to buffer if persistence disabled
-            relevant = [
-                m for m in reversed(self._buffer) if tenant_id is None or m.tenant_id == tenant_id
-            ]
-            return relevant[:limit]
-
-        # Fetch from Redis
-        client = await self._get_client()
-        if not client:
-            # Fallback if Redis fails
-            relevant = [
-                m for m in reversed(self._buffer) if tenant_id is None or m.tenant_id == tenant_id
-            ]
-            return relevant[:limit]
+            return self._recent_from_buffer(tenant_id, limit)
 
         try:
-            # Use tenant-specific list if provided
-            list_key = f"metrics:queries:{tenant_id}" if tenant_id else "metrics:queries:default"
-
-            # Fetch most recent query IDs
-            query_ids = await client.lrange(list_key, 0, limit - 1)
-
-            if not query_ids:
-                return []
-
-            # Fetch details for each query
-            metrics_keys = [f"metrics:query:{qid}" for qid in query_ids]
-            raw_data = await client.mget(metrics_keys)
-
-            results = []
-            import json
-
-            for data in raw_data:
-                if data:
-                    try:
-                        d = json.loads(data)
-                        # Reconstruct QueryMetrics from dict
-                        # We need to parse nested dicts manually or update constructor
-                        # For simplicity, we assume robust parsing or simple reconstruction here
-                        # Ideally, QueryMetrics should have a `from_dict` method.
-
-                        m = QueryMetrics(
-                            query_id=d["query_id"],
-                            tenant_id=d["tenant_id"],
-                            query=d["query"],
-                            timestamp=datetime.fromisoformat(d["timestamp"]),
-                            operation=d.get("operation", "rag_query"),
-                            response=d.get("response", ""),
-                            embedding_latency_ms=d.get("embedding_latency_ms", 0),
-                            retrieval_latency_ms=d.get("retrieval_latency_ms", 0),
-                            reranking_latency_ms=d.get("reranking_latency_ms", 0),
-                            generation_latency_ms=d.get("generation_latency_ms", 0),
-                            total_latency_ms=d.get("total_latency_ms", 0),
-                            chunks_retrieved=d.get("chunks_retrieved", 0),
-                            chunks_used=d.get("chunks_used", 0),
-                            cache_hit=d.get("cache_hit", False),
-                            tokens_used=d.get("tokens_used", 0),
-                            input_tokens=d.get("input_tokens", 0),
-                            output_tokens=d.get("output_tokens", 0),
-                            cost_estimate=d.get("cost_estimate", 0.0),
-                            model=d.get("model", ""),
-                            provider=d.get("provider", ""),
-                            success=d.get("success", True),
-                            error_message=d.get("error_message"),
-                            conversation_id=d.get("conversation_id"),
-                            sources_cited=d.get("sources_cited", 0),
-                            answer_length=d.get("answer_length", 0),
-                        )
-                        results.append(m)
-                    except Exception as e:
-                        logger.warning(f"Failed to parse metric: {e}")
-                        continue
-
-            return results
-
+            page = await self.store.list_recent(tenant_id=tenant_id, limit=limit, cursor=cursor)
+            return page.items
         except Exception as e:
-            logger.error(f"Failed to get recent metrics from Redis: {e}")
-            # Fallback to buffer
-            relevant = [
-                m for m in reversed(self._buffer) if tenant_id is None or m.tenant_id == tenant_id
-            ]
-            return relevant[:limit]
+            logger.error(f"Failed to get recent metrics from store: {e}")
+            return self._recent_from_buffer(tenant_id, limit)
 
     async def close(self) -> None:
-        """Close connections."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        """Release resources. The shared store is flushed at application shutdown."""
+        return None
+
+
+if TYPE_CHECKING:
+    from src.core.admin_ops.application.metrics.store import MetricsStore
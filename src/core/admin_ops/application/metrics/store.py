@@ -0,0 +1,468 @@
+"""
+Metrics Store
+=============
+
+Postgres persistence for per-query metrics.
+
+``enqueue`` only buffers; a background task inserts rows in batches and, in
+the same transaction, adds them to hourly rollups per tenant, operation and
+model. Reads page through the indexed table with keyset cursors, join by
+conversation in SQL and aggregate from rollups, so nothing loads "recent"
+lists into memory. Rows older than ``retention_days`` (rollups older than
+``rollup_retention_days``) are deleted in bounded batches.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, desc, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from src.core.admin_ops.application.metrics.collector import AggregatedMetrics, QueryMetrics
+from src.core.admin_ops.domain.query_metric import QueryMetricRecord, QueryMetricRollup
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_KEYS = ("tenant_id", "bucket_start", "operation", "model")
+# Rollup columns summed from raw rows
+ROLLUP_SUMS = (
+    "tokens_used",
+    "input_tokens",
+    "output_tokens",
+    "cost_estimate",
+    "sources_cited",
+    "answer_length",
+)
+ROLLUP_COUNTERS = ("query_count", "error_count", "cache_hits", "total_latency_ms", *ROLLUP_SUMS)
+
+
+def bucket_start(timestamp: datetime) -> datetime:
+    """Start of the hourly rollup bucket containing ``timestamp`` (UTC)."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+    return timestamp.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+
+
+def metrics_to_row(metrics: QueryMetrics) -> dict[str, Any]:
+    row = metrics.to_dict()
+    row["timestamp"] = metrics.timestamp
+    row["model"] = row["model"] or ""
+    row["provider"] = row["provider"] or ""
+    return row
+
+
+def rollup_rows(rows: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Collapse raw rows into one increment per rollup key."""
+    buckets: dict[tuple, dict[str, Any]] = {}
+    for row in rows:
+        key = (row["tenant_id"], bucket_start(row["timestamp"]), row["operation"], row["model"])
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = dict(zip(ROLLUP_KEYS, key, strict=True))
+            bucket.update(dict.fromkeys(ROLLUP_COUNTERS, 0))
+            bucket["max_latency_ms"] = 0.0
+            buckets[key] = bucket
+        bucket["query_count"] += 1
+        bucket["error_count"] += 0 if row["success"] else 1
+        bucket["cache_hits"] += 1 if row["cache_hit"] else 0
+        latency = row["total_latency_ms"] or 0.0
+        bucket["total_latency_ms"] += latency
+        bucket["max_latency_ms"] = max(bucket["max_latency_ms"], latency)
+        for column in ROLLUP_SUMS:
+            bucket[column] += row[column] or 0
+    return list(buckets.values())
+
+
+def encode_cursor(metrics: QueryMetrics) -> str:
+    return f"{metrics.timestamp.isoformat()}|{metrics.query_id}"
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    timestamp, _, query_id = cursor.partition("|")
+    return datetime.fromisoformat(timestamp), query_id
+
+
+@dataclass
+class MetricsPage:
+    """One page of query metrics, newest first."""
+
+    items: list[QueryMetrics]
+    next_cursor: str | None = None
+
+
+@dataclass
+class MetricsStoreStats:
+    enqueued: int = 0
+    written: int = 0
+    dropped: int = 0
+    failed_flushes: int = 0
+    purged: int = 0
+
+
+class MetricsStore:
+    """Batched writer and indexed reader for the query_metrics tables."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any] | None = None,
+        batch_size: int = 500,
+        flush_interval: float = 2.0,
+        max_pending: int = 20_000,
+        retention_days: int = 30,
+        rollup_retention_days: int = 400,
+        purge_interval: float = 3600.0,
+        purge_batch_size: int = 5000,
+    ):
+        self._session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.retention_days = retention_days
+        self.rollup_retention_days = rollup_retention_days
+        self.purge_interval = purge_interval
+        self.purge_batch_size = purge_batch_size
+        self.stats = MetricsStoreStats()
+        self._pending: deque[QueryMetrics] = deque()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._flusher: asyncio.Task | None = None
+        self._flush_lock: asyncio.Lock | None = None
+        self._last_purge = 0.0
+
+    def _session(self):
+        if self._session_factory is None:
+            from src.core.database.session import get_session_maker
+
+            return get_session_maker()()
+        return self._session_factory()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def enqueue(self, metrics: QueryMetrics) -> bool:
+        """Buffer metrics for the next batch; False if the buffer is full."""
+        if len(self._pending) >= self.max_pending:
+            self.stats.dropped += 1
+            if self.stats.dropped == 1 or self.stats.dropped % 1000 == 0:
+                logger.warning(
+                    f"Metrics buffer full; dropped {self.stats.dropped} query metrics so far"
+                )
+            return False
+
+        self._pending.append(metrics)
+        self.stats.enqueued += 1
+        self._ensure_flusher()
+        if len(self._pending) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+        return True
+
+    def _bind_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        if loop is not self._loop:
+            # Worker tasks run each job on a fresh loop; loop-bound state can't be reused
+            self._loop = loop
+            self._flusher = None
+            self._flush_lock = None
+
+    def _ensure_flusher(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No running loop: flushed by the next call or at shutdown
+            return
+        self._bind_loop(loop)
+        if self._flusher is not None and not self._flusher.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._flusher = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        while self._pending:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+            if time.monotonic() - self._last_purge >= self.purge_interval:
+                self._last_purge = time.monotonic()
+                try:
+                    await self.purge_expired()
+                except Exception as e:
+                    logger.warning(f"Query metrics retention purge failed: {e}")
+
+    async def flush(self) -> int:
+        """Insert buffered metrics in batches; returns the number written."""
+        self._bind_loop(asyncio.get_running_loop())
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        written = 0
+        async with self._flush_lock:
+            while self._pending:
+                batch = [
+                    self._pending.popleft()
+                    for _ in range(min(self.batch_size, len(self._pending)))
+                ]
+                try:
+                    await self._write_batch(batch)
+                except asyncio.CancelledError:
+                    self._pending.extendleft(reversed(batch))
+                    raise
+                except Exception as e:
+                    self.stats.failed_flushes += 1
+                    self.stats.dropped += len(batch)
+                    logger.warning(f"Dropped {len(batch)} query metrics after a failed write: {e}")
+                    break
+                written += len(batch)
+        return written
+
+    async def _write_batch(self, batch: list[QueryMetrics]) -> None:
+        rows = [metrics_to_row(m) for m in batch]
+        async with self._session() as session:
+            try:
+                inserted = set(
+                    (
+                        await session.execute(
+                            pg_insert(QueryMetricRecord)
+                            .values(rows)
+                            .on_conflict_do_nothing(index_elements=["query_id"])
+                            .returning(QueryMetricRecord.query_id)
+                        )
+                    ).scalars()
+                )
+                # Only rows actually inserted count towards rollups (re-recorded ids don't)
+                increments = rollup_rows([r for r in rows if r["query_id"] in inserted])
+                if increments:
+                    stmt = pg_insert(QueryMetricRollup).values(increments)
+                    table = QueryMetricRollup.__table__.c
+                    updates = {c: table[c] + stmt.excluded[c] for c in ROLLUP_COUNTERS}
+                    updates["max_latency_ms"] = func.greatest(
+                        table.max_latency_ms, stmt.excluded.max_latency_ms
+                    )
+                    await session.execute(
+                        stmt.on_conflict_do_update(index_elements=list(ROLLUP_KEYS), set_=updates)
+                    )
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+        self.stats.written += len(inserted)
+
+    async def purge_expired(self, now: datetime | None = None) -> int:
+        """Apply retention: delete old rows in bounded batches, then old rollups."""
+        now = now or datetime.now(UTC)
+        cutoff = now - timedelta(days=self.retention_days)
+        purged = 0
+        while True:
+            async with self._session() as session:
+                doomed = (
+                    select(QueryMetricRecord.query_id)
+                    .where(QueryMetricRecord.timestamp < cutoff)
+                    .limit(self.purge_batch_size)
+                    .scalar_subquery()
+                )
+                result = await session.execute(
+                    delete(QueryMetricRecord).where(QueryMetricRecord.query_id.in_(doomed))
+                )
+                await session.commit()
+            purged += result.rowcount or 0
+            if (result.rowcount or 0) < self.purge_batch_size:
+                break
+
+        rollup_cutoff = now - timedelta(days=self.rollup_retention_days)
+        async with self._session() as session:
+            await session.execute(
+                delete(QueryMetricRollup).where(QueryMetricRollup.bucket_start < rollup_cutoff)
+            )
+            await session.commit()
+
+        self.stats.purged += purged
+        if purged:
+            logger.info(f"Purged {purged} query metrics older than {self.retention_days} days")
+        return purged
+
+    async def close(self) -> None:
+        """Stop the flusher and write whatever is still buffered."""
+        task, self._flusher = self._flusher, None
+        if task and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        await self.flush()
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    async def list_recent(
+        self,
+        tenant_id: str | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+        operation: str | None = None,
+    ) -> MetricsPage:
+        """Newest metrics first; pass ``next_cursor`` back to get the following page."""
+        stmt = select(QueryMetricRecord)
+        if tenant_id:
+            stmt = stmt.where(QueryMetricRecord.tenant_id == tenant_id)
+        if operation:
+            stmt = stmt.where(QueryMetricRecord.operation == operation)
+        if cursor:
+            timestamp, query_id = decode_cursor(cursor)
+            stmt = stmt.where(
+                tuple_(QueryMetricRecord.timestamp, QueryMetricRecord.query_id)
+                < tuple_(timestamp, query_id)
+            )
+        stmt = stmt.order_by(
+            desc(QueryMetricRecord.timestamp), desc(QueryMetricRecord.query_id)
+        ).limit(limit + 1)
+
+        async with self._session() as session:
+            rows = (await session.execute(stmt)).scalars().all()
+
+        items = [record_to_metrics(row) for row in rows[:limit]]
+        next_cursor = encode_cursor(items[-1]) if len(rows) > limit else None
+        return MetricsPage(items=items, next_cursor=next_cursor)
+
+    async def get(self, query_id: str) -> QueryMetrics | None:
+        async with self._session() as session:
+            row = await session.get(QueryMetricRecord, query_id)
+        return record_to_metrics(row) if row else None
+
+    async def totals_by_conversation(
+        self, conversation_ids: Sequence[str], tenant_id: str | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Token, cost, model and provider totals for each conversation."""
+        if not conversation_ids:
+            return {}
+        stmt = (
+            select(
+                QueryMetricRecord.conversation_id,
+                func.sum(QueryMetricRecord.tokens_used).label("total_tokens"),
+                func.sum(QueryMetricRecord.cost_estimate).label("cost"),
+                func.max(QueryMetricRecord.model).label("model"),
+                func.max(QueryMetricRecord.provider).label("provider"),
+            )
+            .where(QueryMetricRecord.conversation_id.in_(list(conversation_ids)))
+            .group_by(QueryMetricRecord.conversation_id)
+        )
+        if tenant_id:
+            stmt = stmt.where(QueryMetricRecord.tenant_id == tenant_id)
+
+        async with self._session() as session:
+            rows = (await session.execute(stmt)).all()
+        return {
+            row.conversation_id: {
+                "total_tokens": int(row.total_tokens or 0),
+                "cost": float(row.cost or 0.0),
+                "model": row.model,
+                "provider": row.provider,
+            }
+            for row in rows
+        }
+
+    async def rollups(
+        self,
+        since: datetime,
+        until: datetime | None = None,
+        tenant_id: str | None = None,
+        granularity: str = "hour",
+        group_by: Sequence[str] = ("operation", "model"),
+    ) -> list[dict[str, Any]]:
+        """Totals per time bucket (hour, day, ...) and the requested dimensions."""
+        columns = QueryMetricRollup.__table__.c
+        bucket = func.date_trunc(granularity, columns.bucket_start).label("bucket")
+        dimensions = [columns[name] for name in group_by]
+        stmt = (
+            select(
+                bucket,
+                *dimensions,
+                *(func.sum(columns[c]).label(c) for c in ROLLUP_COUNTERS),
+                func.max(columns.max_latency_ms).label("max_latency_ms"),
+            )
+            .where(columns.bucket_start >= bucket_start(since))
+            .group_by(bucket, *dimensions)
+            .order_by(bucket)
+        )
+        if until:
+            stmt = stmt.where(columns.bucket_start < until)
+        if tenant_id:
+            stmt = stmt.where(columns.tenant_id == tenant_id)
+
+        async with self._session() as session:
+            rows = (await session.execute(stmt)).mappings().all()
+        return [dict(row) for row in rows]
+
+    async def aggregate(self, tenant_id: str | None, period_hours: int) -> AggregatedMetrics:
+        """Dashboard aggregates: totals from rollups, latency percentiles in SQL."""
+        now = datetime.now(UTC)
+        start = now - timedelta(hours=period_hours)
+        columns = QueryMetricRollup.__table__.c
+        totals_stmt = select(
+            *(func.coalesce(func.sum(columns[c]), 0).label(c) for c in ROLLUP_COUNTERS)
+        ).where(columns.bucket_start >= bucket_start(start))
+        latency = QueryMetricRecord.total_latency_ms
+        percentiles_stmt = select(
+            func.percentile_cont(0.5).within_group(latency).label("p50"),
+            func.percentile_cont(0.95).within_group(latency).label("p95"),
+            func.percentile_cont(0.99).within_group(latency).label("p99"),
+        ).where(QueryMetricRecord.timestamp >= start)
+        if tenant_id:
+            totals_stmt = totals_stmt.where(columns.tenant_id == tenant_id)
+            percentiles_stmt = percentiles_stmt.where(QueryMetricRecord.tenant_id == tenant_id)
+
+        async with self._session() as session:
+            totals = (await session.execute(totals_stmt)).mappings().one()
+            percentiles = (await session.execute(percentiles_stmt)).mappings().one()
+
+        count = int(totals["query_count"])
+        if not count:
+            return AggregatedMetrics(period_start=start, period_end=now)
+        return AggregatedMetrics(
+            period_start=start,
+            period_end=now,
+            query_count=count,
+            p50_latency_ms=float(percentiles["p50"] or 0),
+            p95_latency_ms=float(percentiles["p95"] or 0),
+            p99_latency_ms=float(percentiles["p99"] or 0),
+            avg_latency_ms=float(totals["total_latency_ms"]) / count,
+            cache_hit_rate=int(totals["cache_hits"]) / count,
+            total_cost=float(totals["cost_estimate"]),
+            avg_cost_per_query=float(totals["cost_estimate"]) / count,
+            avg_sources_per_query=int(totals["sources_cited"]) / count,
+            avg_answer_length=int(totals["answer_length"]) / count,
+        )
+
+
+def record_to_metrics(record: QueryMetricRecord) -> QueryMetrics:
+    return QueryMetrics.from_dict(
+        {column.name: getattr(record, column.name) for column in record.__table__.columns}
+    )
+
+
+_metrics_store: MetricsStore | None = None
+
+
+def get_metrics_store() -> MetricsStore:
+    """Process-wide store shared by all MetricsCollector instances."""
+    global _metrics_store
+    if _metrics_store is None:
+        _metrics_store = MetricsStore()
+    return _metrics_store
+
+
+async def shutdown_metrics_store() -> None:
+    """Flush buffered metrics before the database engine is disposed."""
+    if _metrics_store is not None:
+        await _metrics_store.close()
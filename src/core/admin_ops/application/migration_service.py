@@ -3,6 +3,9 @@ Embedding Migration Service
 ===========================
 
 Handles the detection of embedding model mismatches and orchestrates the migration process.
+
+``migrate_tenant`` is the destructive path (drop vectors and graph, re-ingest);
+see ``online_migration`` for the non-destructive shadow collection migration.
 """
 
 import logging
@@ -18,6 +21,7 @@ from src.core.ingestion.domain.document import Document
 from src.core.ingestion.domain.ports.dispatcher import TaskDispatcher
 from src.core.retrieval.domain.ports.vector_store_admin_port import VectorStoreAdminPort
 from src.core.state.machine import DocumentStatus
+from src.core.tenants.application.tenant_config_cache import invalidate_tenant_config
 from src.core.tenants.domain.tenant import Tenant
 from src.shared.model_registry import (
     EMBEDDING_MODELS,
@@ -312,6 +316,7 @@ class EmbeddingMigrationService:
         docs_reset = result.rowcount
 
         await self.session.commit()
+        await invalidate_tenant_config(tenant_id)
 
         # 5. Kick off re-ingestion (Optional: automated or rely on poller)
         # If we have a poller, it will pick up INGESTED docs.
@@ -336,6 +341,23 @@ class EmbeddingMigrationService:
             "new_model": new_config["embedding_model"],
         }
 
+    async def resolve_embedding_target(
+        self, embedding_model: str, embedding_provider: str | None = None
+    ) -> tuple[str, str, int]:
+        """Resolve (provider, model, dimensions) for an online migration target."""
+        if not embedding_provider:
+            model_providers = {
+                model: provider
+                for provider, models in EMBEDDING_MODELS.items()
+                for model in models.keys()
+            }
+            model_providers.update(LEGACY_EMBEDDING_PROVIDERS)
+            embedding_provider = (
+                model_providers.get(embedding_model) or self.settings.default_embedding_provider
+            )
+        dimensions = await self._resolve_dimensions(embedding_provider, embedding_model)
+        return embedding_provider, embedding_model, dimensions
+
     async def _resolve_dimensions(self, provider: str, model: str) -> int:
         """
         Determine embedding dimensions for a given model.
@@ -0,0 +1,416 @@
+"""
+Online Embedding Migration
+==========================
+
+Non-destructive embedding model migration for a tenant.
+
+Instead of dropping the tenant's vectors and re-ingesting every document,
+the migration:
+
+1. Creates a shadow collection sized for the new model.
+2. Re-embeds the chunk text already stored in Postgres, streaming it in
+   keyset-paginated batches (the graph, extraction and chunking are untouched).
+3. While it runs, ingestion dual-writes new chunks to both collections and
+   document deletes remove vectors from both (see
+   ``resolve_shadow_vector_collection``).
+4. Once the shadow has caught up, swaps the tenant's active collection and
+   embedding model in a single config update, so search flips from the old
+   vectors to the new ones without an empty window.
+
+Progress (including the keyset cursor) is persisted in the tenant config under
+``embedding_migration``, so an interrupted backfill resumes where it stopped.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import func, select
+
+from src.core.ingestion.domain.chunk import Chunk
+from src.core.retrieval.domain.ports.vector_store_admin_port import VectorStoreAdminPort
+from src.core.tenants.application.active_vector_collection import (
+    EMBEDDING_MIGRATION_KEY,
+    resolve_active_vector_collection,
+    resolve_shadow_vector_collection,
+)
+from src.core.tenants.application.tenant_config_cache import invalidate_tenant_config
+from src.core.tenants.domain.tenant import Tenant
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+def shadow_collection_name(tenant_id: str, dimensions: int) -> str:
+    """Name for a tenant's shadow collection (Milvus allows [A-Za-z0-9_])."""
+    return f"amber_{tenant_id.replace('-', '_')}_{dimensions}d_{int(time.time())}"
+
+
+def build_embedding_service(
+    settings: Any,
+    provider: str,
+    model: str,
+    dimensions: int | None,
+    ollama_base_url: str | None = None,
+):
+    """Embedding service for a specific provider/model (the migration target)."""
+    from src.core.generation.domain.ports.provider_factory import (
+        build_provider_factory,
+        get_provider_factory,
+    )
+    from src.core.retrieval.application.embeddings_service import EmbeddingService
+
+    try:
+        factory = build_provider_factory(
+            openai_api_key=settings.openai_api_key,
+            ollama_base_url=ollama_base_url or settings.ollama_base_url,
+            default_embedding_provider=provider,
+            default_embedding_model=model,
+        )
+    except RuntimeError:
+        factory = get_provider_factory()
+
+    return EmbeddingService(
+        provider=factory.get_embedding_provider(provider_name=provider, model=model),
+        model=model,
+        dimensions=dimensions,
+        # Reduce batch size for Ollama to prevent runner crashes on large inputs
+        max_tokens_per_batch=2048 if provider == "ollama" else None,
+    )
+
+
+class OnlineEmbeddingMigrator:
+    """
+    Drives an online embedding migration: start, backfill, cutover, abort.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any],
+        settings: Any,
+        vector_store_factory: Callable[[int, str | None], VectorStoreAdminPort],
+        embedding_service_factory: Callable[[dict[str, Any]], Any] | None = None,
+        sparse_service: Any | None = None,
+        batch_size: int = 1000,
+        checkpoint_every: int = 10,
+    ):
+        self.session_factory = session_factory
+        self.settings = settings
+        self.vector_store_factory = vector_store_factory
+        self.embedding_service_factory = embedding_service_factory or (
+            lambda migration: build_embedding_service(
+                self.settings,
+                migration["embedding_provider"],
+                migration["embedding_model"],
+                migration["embedding_dimensions"],
+                migration.get("ollama_base_url"),
+            )
+        )
+        self._sparse_service = sparse_service
+        self.batch_size = batch_size
+        # Persist the cursor every N batches (and always at the end)
+        self.checkpoint_every = checkpoint_every
+
+    # --- State ---
+
+    async def get_state(self, tenant_id: str) -> dict[str, Any] | None:
+        config = await self._load_config(tenant_id)
+        return (config or {}).get(EMBEDDING_MIGRATION_KEY)
+
+    async def _load_config(self, tenant_id: str) -> dict[str, Any] | None:
+        """Tenant config, or None if the tenant does not exist."""
+        async with self.session_factory() as session:
+            result = await session.execute(select(Tenant).where(Tenant.id == tenant_id))
+            tenant = result.scalar_one_or_none()
+        return dict(tenant.config or {}) if tenant else None
+
+    async def _count_chunks(self, tenant_id: str) -> int:
+        async with self.session_factory() as session:
+            query = select(func.count(Chunk.id)).where(Chunk.tenant_id == tenant_id)
+            return (await session.execute(query)).scalar() or 0
+
+    async def _update_config(
+        self, tenant_id: str, mutate: Callable[[dict[str, Any]], None]
+    ) -> dict[str, Any]:
+        """Apply ``mutate`` to the tenant config under a row lock and commit."""
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(Tenant).where(Tenant.id == tenant_id).with_for_update()
+            )
+            tenant = result.scalar_one_or_none()
+            if not tenant:
+                raise ValueError("Tenant not found")
+            config = dict(tenant.config or {})
+            mutate(config)
+            # Re-assign to trigger JSON change tracking
+            tenant.config = config
+            await session.commit()
+        return config
+
+    async def _save_state(self, tenant_id: str, **changes: Any) -> dict[str, Any]:
+        def mutate(config: dict[str, Any]) -> None:
+            state = dict(config.get(EMBEDDING_MIGRATION_KEY) or {})
+            state.update(changes)
+            state["updated_at"] = datetime.now(UTC).isoformat()
+            config[EMBEDDING_MIGRATION_KEY] = state
+
+        config = await self._update_config(tenant_id, mutate)
+        return config[EMBEDDING_MIGRATION_KEY]
+
+    # --- Lifecycle ---
+
+    async def start(
+        self,
+        tenant_id: str,
+        embedding_provider: str,
+        embedding_model: str,
+        embedding_dimensions: int,
+    ) -> dict[str, Any]:
+        """
+        Create the shadow collection and start dual-writing.
+
+        Raises:
+            ValueError: Tenant not found or a migration is already running.
+        """
+        config = await self._load_config(tenant_id)
+        if config is None:
+            raise ValueError("Tenant not found")
+        if resolve_shadow_vector_collection(config):
+            raise ValueError(f"An embedding migration is already running for {tenant_id}")
+
+        target = shadow_collection_name(tenant_id, embedding_dimensions)
+        store = self.vector_store_factory(embedding_dimensions, collection_name=target)
+        # Creates the collection with the new dimensions
+        await store.connect()
+
+        now = datetime.now(UTC).isoformat()
+        state = {
+            "status": "backfilling",
+            "source_collection": resolve_active_vector_collection(tenant_id, config),
+            "target_collection": target,
+            "embedding_provider": embedding_provider,
+            "embedding_model": embedding_model,
+            "embedding_dimensions": embedding_dimensions,
+            "ollama_base_url": config.get("ollama_base_url"),
+            "total_chunks": await self._count_chunks(tenant_id),
+            "migrated_chunks": 0,
+            "cursor": None,
+            "error": None,
+            "started_at": now,
+        }
+        state = await self._save_state(tenant_id, **state)
+        # Ingestion and deletes must see the migration before backfill starts
+        await invalidate_tenant_config(tenant_id)
+        logger.info(
+            f"Started online embedding migration for {tenant_id}: "
+            f"{state['source_collection']} -> {target} ({embedding_model}, {embedding_dimensions}d)"
+        )
+        return state
+
+    async def backfill(
+        self, tenant_id: str, progress_callback: ProgressCallback | None = None
+    ) -> dict[str, Any]:
+        """
+        Re-embed the tenant's chunks into the shadow collection.
+
+        Resumes from the persisted cursor. Chunks are read in primary key order
+        so new chunks inserted behind the cursor are covered by dual-writes and
+        those ahead of it by the backfill itself.
+        """
+        state = await self.get_state(tenant_id)
+        if not resolve_shadow_vector_collection({EMBEDDING_MIGRATION_KEY: state}):
+            raise ValueError(f"No embedding migration running for {tenant_id}")
+
+        embedding_service = self.embedding_service_factory(state)
+        store = self.vector_store_factory(
+            state["embedding_dimensions"], collection_name=state["target_collection"]
+        )
+        cursor = state.get("cursor")
+        migrated = state.get("migrated_chunks", 0)
+        batches = 0
+
+        try:
+            if state.get("status") != "backfilling":
+                state = await self._save_state(tenant_id, status="backfilling", error=None)
+
+            while True:
+                chunks = await self._read_batch(tenant_id, cursor)
+                if not chunks:
+                    break
+
+                await self._write_batch(tenant_id, chunks, embedding_service, store)
+                cursor = chunks[-1]["id"]
+                migrated += len(chunks)
+                batches += 1
+
+                if batches % self.checkpoint_every == 0:
+                    state = await self._save_state(
+                        tenant_id, cursor=cursor, migrated_chunks=migrated
+                    )
+                    if progress_callback:
+                        await progress_callback(state)
+
+            if batches:
+                await store.flush()
+            state = await self._save_state(
+                tenant_id, status="ready", cursor=cursor, migrated_chunks=migrated
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Embedding backfill failed for {tenant_id} after {migrated} chunks: {e}")
+            await self._save_state(
+                tenant_id, status="failed", cursor=cursor, migrated_chunks=migrated, error=str(e)
+            )
+            raise
+
+        if progress_callback:
+            await progress_callback(state)
+        logger.info(f"Embedding backfill for {tenant_id} complete: {migrated} chunks")
+        return state
+
+    async def _read_batch(self, tenant_id: str, cursor: str | None) -> list[dict[str, Any]]:
+        query = (
+            select(Chunk.id, Chunk.document_id, Chunk.content, Chunk.metadata_)
+            .where(Chunk.tenant_id == tenant_id)
+            .order_by(Chunk.id)
+            .limit(self.batch_size)
+        )
+        if cursor is not None:
+            query = query.where(Chunk.id > cursor)
+        async with self.session_factory() as session:
+            rows = (await session.execute(query)).all()
+        return [
+            {"id": r.id, "document_id": r.document_id, "content": r.content, "metadata": r.metadata_}
+            for r in rows
+        ]
+
+    async def _write_batch(
+        self,
+        tenant_id: str,
+        chunks: list[dict[str, Any]],
+        embedding_service: Any,
+        store: VectorStoreAdminPort,
+    ) -> None:
+        texts = [c["content"] for c in chunks]
+        embeddings, _ = await embedding_service.embed_texts(texts)
+
+        sparse = self._get_sparse_service()
+        try:
+            # CPU-bound model inference; keep the event loop responsive
+            sparse_embeddings = await asyncio.to_thread(sparse.embed_batch, texts)
+        except Exception as e:
+            logger.warning(f"Failed to generate sparse embeddings: {e}")
+            sparse_embeddings = [{} for _ in chunks]
+
+        rows = []
+        for chunk, emb, sparse_emb in zip(chunks, embeddings, sparse_embeddings, strict=False):
+            data = {
+                "chunk_id": chunk["id"],
+                "document_id": chunk["document_id"],
+                "tenant_id": tenant_id,
+                "content": chunk["content"][:65530],
+                "embedding": emb,
+            }
+            if sparse_emb is not None:
+                data["sparse_vector"] = sparse_emb
+            if chunk["metadata"]:
+                data.update(chunk["metadata"])
+            rows.append(data)
+
+        await store.upsert_chunks(rows, flush=False)
+
+    def _get_sparse_service(self):
+        if self._sparse_service is None:
+            from src.core.retrieval.application.sparse_embeddings_service import (
+                SparseEmbeddingService,
+            )
+
+            self._sparse_service = SparseEmbeddingService()
+        return self._sparse_service
+
+    async def cutover(self, tenant_id: str, max_lag: int = 0) -> dict[str, Any]:
+        """
+        Point the tenant at the shadow collection and new embedding model.
+
+        Runs a final catch-up pass first, then refuses to swap while the shadow
+        holds fewer vectors than Postgres has chunks (minus ``max_lag``).
+
+        Raises:
+            ValueError: No migration ready, or the shadow is still behind.
+        """
+        state = await self.get_state(tenant_id)
+        if not state or state.get("status") not in ("ready", "backfilling"):
+            raise ValueError(f"No embedding migration ready for cutover for {tenant_id}")
+
+        # Catch up on chunks inserted ahead of the cursor since the last pass
+        state = await self.backfill(tenant_id)
+
+        store = self.vector_store_factory(
+            state["embedding_dimensions"], collection_name=state["target_collection"]
+        )
+        stats = await store.get_stats()
+        expected = await self._count_chunks(tenant_id)
+        indexed = int(stats.get("num_entities") or 0)
+        if indexed + max_lag < expected:
+            raise ValueError(
+                f"Shadow collection {state['target_collection']} has {indexed} vectors "
+                f"but {expected} chunks exist; not switching"
+            )
+
+        def swap(config: dict[str, Any]) -> None:
+            current = config.get(EMBEDDING_MIGRATION_KEY) or {}
+            if current.get("target_collection") != state["target_collection"]:
+                raise ValueError("Embedding migration changed during cutover")
+            config["previous_vector_collection"] = resolve_active_vector_collection(
+                tenant_id, config
+            )
+            config["active_vector_collection"] = state["target_collection"]
+            config["embedding_provider"] = state["embedding_provider"]
+            config["embedding_model"] = state["embedding_model"]
+            config["embedding_dimensions"] = state["embedding_dimensions"]
+            config["migrated_at"] = datetime.now(UTC).isoformat()
+            config.pop(EMBEDDING_MIGRATION_KEY, None)
+
+        # Collection and model change together, in one committed config update
+        config = await self._update_config(tenant_id, swap)
+        await invalidate_tenant_config(tenant_id)
+        logger.info(
+            f"Embedding migration cutover for {tenant_id}: now serving "
+            f"{config['active_vector_collection']} (previous: {config['previous_vector_collection']})"
+        )
+        return {
+            "status": "complete",
+            "active_collection": config["active_vector_collection"],
+            "previous_collection": config["previous_vector_collection"],
+            "embedding_model": config["embedding_model"],
+            "vectors": indexed,
+        }
+
+    async def abort(self, tenant_id: str, drop_shadow: bool = True) -> bool:
+        """Stop dual-writing and (by default) drop the shadow collection."""
+        state = await self.get_state(tenant_id)
+        if not state:
+            return False
+
+        await self._update_config(tenant_id, lambda c: c.pop(EMBEDDING_MIGRATION_KEY, None))
+        await invalidate_tenant_config(tenant_id)
+
+        if drop_shadow and state.get("target_collection"):
+            store = self.vector_store_factory(
+                state["embedding_dimensions"], collection_name=state["target_collection"]
+            )
+            await store.drop_collection()
+        logger.warning(f"Aborted embedding migration for {tenant_id}")
+        return True
+
+    async def run(
+        self, tenant_id: str, progress_callback: ProgressCallback | None = None
+    ) -> dict[str, Any]:
+        """Backfill, then cut over (the background job entry point)."""
+        await self.backfill(tenant_id, progress_callback=progress_callback)
+        return await self.cutover(tenant_id)
@@ -8,18 +8,30 @@ Supports two modes:
 - REPLACE: Wipe existing data, restore from backup
 """
 
-import io
 import json
 import logging
 import os
+import shutil
 import subprocess
+import tempfile
 import zipfile
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
 
 from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.admin_ops.application.backup_format import (
+    CHUNKS_SECTION,
+    GRAPH_SECTION,
+    LEGACY_CHUNKS_SECTION,
+    LEGACY_VECTORS_SECTION,
+    iter_jsonl,
+    iter_vector_shard,
+    vector_shard_names,
+)
 from src.core.admin_ops.domain.backup_job import BackupSchedule, BackupScope, RestoreMode
 from src.core.admin_ops.domain.global_rule import GlobalRule
 from src.core.generation.domain.memory_models import ConversationSummary, UserFact
@@ -29,10 +41,16 @@ from src.core.ingestion.domain.document import Document
 from src.core.ingestion.domain.folder import Folder
 from src.core.ingestion.domain.ports.storage import StoragePort
 from src.core.ingestion.domain.ports.vector_store import VectorStoreFactory
+from src.core.tenants.application.tenant_config_cache import invalidate_tenant_config
 from src.core.tenants.domain.tenant import Tenant
 
 logger = logging.getLogger(__name__)
 
+# Rows per bulk INSERT / Milvus upsert during restore
+CHUNK_RESTORE_BATCH_SIZE = 5000
+VECTOR_RESTORE_BATCH_SIZE = 2000
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+
 
 class BackupManifest:
     """Parsed backup manifest."""
@@ -97,10 +115,7 @@ class RestoreService:
             ValueError: If backup is invalid
         """
         try:
-            file_bytes = self.storage.get_file(backup_path)
-            zip_buffer = io.BytesIO(file_bytes)
-
-            with zipfile.ZipFile(zip_buffer, "r") as zf:
+            with self._open_archive(backup_path) as zf:
                 # Check for manifest
                 if "manifest.json" not in zf.namelist():
                     raise ValueError("Invalid backup: manifest.json not found")
@@ -144,10 +159,7 @@ class RestoreService:
         result = RestoreResult()
 
         try:
-            file_bytes = self.storage.get_file(backup_path)
-            zip_buffer = io.BytesIO(file_bytes)
-
-            with zipfile.ZipFile(zip_buffer, "r") as zf:
+            with self._open_archive(backup_path) as zf:
                 # Determine restore strategy
                 has_dump = (
                     "database/postgres_dump.sql" in zf.namelist() and mode == RestoreMode.REPLACE
@@ -239,6 +251,7 @@ class RestoreService:
                 update_progress()
 
                 await self.session.commit()
+                await invalidate_tenant_config(target_tenant_id)
 
         except Exception as e:
             logger.error(f"Restore failed: {e}")
@@ -248,6 +261,25 @@ class RestoreService:
         logger.info(f"Restore complete: {result.total_items} items restored")
         return result
 
+    @contextmanager
+    def _open_archive(self, backup_path: str) -> Iterator[zipfile.ZipFile]:
+        """
+        Download the backup into a temporary file and open it as a ZIP.
+
+        The archive is spooled to disk instead of memory; sections are then
+        read as streams from the local file.
+        """
+        with tempfile.TemporaryFile(prefix="amber_restore_") as tmp:
+            stream = self.storage.get_file_stream(backup_path)
+            try:
+                shutil.copyfileobj(stream, tmp, DOWNLOAD_BUFFER_SIZE)
+            finally:
+                stream.close()
+            tmp.seek(0)
+
+            with zipfile.ZipFile(tmp, "r") as zf:
+                yield zf
+
     async def _clear_tenant_data(self, tenant_id: str) -> None:
         """Clear all tenant data for REPLACE mode."""
         # Delete in order to respect foreign keys
@@ -362,14 +394,14 @@ class RestoreService:
 
                     if doc and doc.storage_path:
                         # Upload file to storage
-                        file_bytes = zf.read(file_path)
-                        self.storage.upload_file(
-                            object_name=doc.storage_path,
-                            data=io.BytesIO(file_bytes),
-                            length=len(file_bytes),
-                            content_type=doc.metadata_.get("mime_type")
-                            or "application/octet-stream",
-                        )
+                        with zf.open(file_path) as file_stream:
+                            self.storage.upload_file(
+                                object_name=doc.storage_path,
+                                data=file_stream,
+                                length=zf.getinfo(file_path).file_size,
+                                content_type=doc.metadata_.get("mime_type")
+                                or "application/octet-stream",
+                            )
 
                 except Exception as e:
                     logger.warning(f"Error restoring file {file_path}: {e}")
@@ -536,34 +568,63 @@ class RestoreService:
             logger.info(f"Restored configuration for tenant {tenant_id}")
 
     async def _restore_chunks(self, zf: zipfile.ZipFile, tenant_id: str, mode: RestoreMode) -> None:
-        """Restore chunks table."""
-        if "ingestion/chunks.json" not in zf.namelist():
+        """Restore chunks table with batched bulk inserts."""
+        names = zf.namelist()
+        if CHUNKS_SECTION in names:
+            section = CHUNKS_SECTION
+        elif LEGACY_CHUNKS_SECTION in names:
+            section = LEGACY_CHUNKS_SECTION
+        else:
             return
 
-        data = json.loads(zf.read("ingestion/chunks.json"))
+        stmt = pg_insert(Chunk)
+        if mode == RestoreMode.MERGE:
+            stmt = stmt.on_conflict_do_nothing(index_elements=[Chunk.id])
 
-        for chunk_data in data:
-            chunk_id = chunk_data.get("id")
-
-            if mode == RestoreMode.MERGE:
-                result = await self.session.execute(select(Chunk).where(Chunk.id == chunk_id))
-                if result.scalar_one_or_none():
-                    continue
+        count = 0
+        batch: list[dict] = []
+        with zf.open(section) as f:
+            rows = iter_jsonl(f) if section == CHUNKS_SECTION else iter(json.load(f))
+
+            for chunk_data in rows:
+                batch.append(
+                    {
+                        "id": chunk_data.get("id"),
+                        "tenant_id": tenant_id,
+                        "document_id": chunk_data.get("document_id"),
+                        "index": chunk_data.get("index", 0),
+                        "tokens": chunk_data.get("tokens", 0),
+                        "content": chunk_data.get("content"),
+                        "metadata_": chunk_data.get("metadata", {}),
+                        "embedding_status": EmbeddingStatus(
+                            chunk_data.get("embedding_status", "pending")
+                        ),
+                    }
+                )
+                if len(batch) >= CHUNK_RESTORE_BATCH_SIZE:
+                    await self.session.execute(stmt, batch)
+                    count += len(batch)
+                    batch = []
 
-            chunk = Chunk(
-                id=chunk_id,
-                tenant_id=tenant_id,
-                document_id=chunk_data.get("document_id"),
-                index=chunk_data.get("index", 0),
-                tokens=chunk_data.get("tokens", 0),
-                content=chunk_data.get("content"),
-                metadata_=chunk_data.get("metadata", {}),
-                embedding_status=EmbeddingStatus(chunk_data.get("embedding_status", "pending")),
-            )
-            self.session.add(chunk)
+        if batch:
+            await self.session.execute(stmt, batch)
+            count += len(batch)
 
         await self.session.flush()
-        logger.info(f"Restored {len(data)} chunks")
+        logger.info(f"Restored {count} chunks")
+
+    def _iter_vectors(self, zf: zipfile.ZipFile) -> Iterator[dict]:
+        """Stream vector rows from .npy shards, or from a legacy JSONL section."""
+        names = zf.namelist()
+        shards = vector_shard_names(names)
+
+        if shards:
+            for shard in shards:
+                with zf.open(f"{shard}.npy") as matrix_fp, zf.open(f"{shard}.jsonl") as rows_fp:
+                    yield from iter_vector_shard(matrix_fp, rows_fp)
+        elif LEGACY_VECTORS_SECTION in names:
+            with zf.open(LEGACY_VECTORS_SECTION) as f:
+                yield from iter_jsonl(f)
 
     async def _restore_vectors(
         self, zf: zipfile.ZipFile, tenant_id: str, mode: RestoreMode
@@ -574,7 +635,8 @@ class RestoreService:
         )
         from src.core.tenants.domain.tenant import Tenant
 
-        if "vectors/vectors.jsonl" not in zf.namelist():
+        names = zf.namelist()
+        if not vector_shard_names(names) and LEGACY_VECTORS_SECTION not in names:
             return
 
         # Resolve collection
@@ -591,32 +653,21 @@ class RestoreService:
         logger.info(f"Restoring vectors for tenant {tenant_id} to collection {collection_name}")
 
         try:
-            with zf.open("vectors/vectors.jsonl") as f:
-
-                def vector_gen():
-                    for line in f:
-                        if line.strip():
-                            yield json.loads(line)
-
-                count = await vector_store.import_vectors(vector_gen())
-                logger.info(f"Restored {count} vectors")
+            count = await vector_store.import_vectors(
+                self._iter_vectors(zf), batch_size=VECTOR_RESTORE_BATCH_SIZE
+            )
+            logger.info(f"Restored {count} vectors")
         finally:
             await vector_store.close()
 
     async def _restore_graph(self, zf: zipfile.ZipFile, tenant_id: str, mode: RestoreMode) -> None:
         """Restore graph to Neo4j."""
 
-        if "graph/graph.jsonl" not in zf.namelist():
+        if GRAPH_SECTION not in zf.namelist():
             return
 
-        with zf.open("graph/graph.jsonl") as f:
-
-            def graph_gen():
-                for line in f:
-                    if line.strip():
-                        yield json.loads(line)
-
-            stats = await self.graph_client.import_graph(graph_gen(), mode=mode.value.lower())
+        with zf.open(GRAPH_SECTION) as f:
+            stats = await self.graph_client.import_graph(iter_jsonl(f), mode=mode.value.lower())
             logger.info(f"Restored graph: {stats}")
 
     async def _restore_postgres_dump(self, zf: zipfile.ZipFile) -> None:
@@ -628,8 +679,8 @@ class RestoreService:
         settings = get_settings()
         try:
             tmp_path = f"/tmp/restore_dump_{datetime.now().timestamp()}.sql"
-            with open(tmp_path, "wb") as f:
-                f.write(zf.read("database/postgres_dump.sql"))
+            with open(tmp_path, "wb") as f, zf.open("database/postgres_dump.sql") as dump:
+                shutil.copyfileobj(dump, f, DOWNLOAD_BUFFER_SIZE)
 
             url = make_url(settings.db.database_url)
             env = os.environ.copy()
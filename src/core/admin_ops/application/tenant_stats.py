@@ -0,0 +1,383 @@
+"""
+Tenant Statistics
+=================
+
+Per-tenant counters behind the admin stats endpoint, read with one primary
+key lookup.
+
+Document, chunk and vector counters follow the Postgres rows through
+statement-level triggers. Neo4j has no triggers, so the code that changes
+the graph reports deltas with ``record_graph_delta``: the graph writer
+(entities and relationships created), document cleanup (entities,
+relationships and communities removed) and community detection (recount).
+Deltas are buffered in-process and added with one UPDATE per tenant.
+
+``TenantStatsService.reconcile`` recounts everything from the stores and
+overwrites the row. Reads schedule it on the low-priority queue when the row
+is missing or its last recount is older than ``RECONCILE_INTERVAL``.
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import case, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from src.core.admin_ops.domain.tenant_stats import COUNTERS, GRAPH_COUNTERS, TenantStats
+from src.core.cache.decorators import get_cache_client
+from src.core.ingestion.domain.chunk import Chunk, EmbeddingStatus
+from src.core.ingestion.domain.document import Document
+from src.core.state.machine import DocumentStatus
+
+logger = logging.getLogger(__name__)
+
+RECONCILE_TASK = "src.workers.tasks.reconcile_tenant_stats"
+RECONCILE_INTERVAL = timedelta(hours=1)
+RECONCILE_PENDING_KEY = "tenant_stats:reconcile:{tenant_id}"
+# Reads within this window don't schedule another recount
+RECONCILE_PENDING_TTL_SECONDS = 15 * 60
+
+PROCESSING_STATUSES = (
+    DocumentStatus.EXTRACTING,
+    DocumentStatus.CLASSIFYING,
+    DocumentStatus.CHUNKING,
+    DocumentStatus.EMBEDDING,
+    DocumentStatus.GRAPH_SYNC,
+)
+
+# Each count is its own subquery so an empty label doesn't zero the others
+GRAPH_COUNTS_QUERY = """
+CALL { MATCH (e:Entity {tenant_id: $tenant_id}) RETURN count(e) AS entities }
+CALL {
+    MATCH (:Entity {tenant_id: $tenant_id})-[r]->(:Entity {tenant_id: $tenant_id})
+    RETURN count(r) AS relationships
+}
+CALL { MATCH (c:Community {tenant_id: $tenant_id}) RETURN count(c) AS communities }
+RETURN entities, relationships, communities
+"""
+
+COMMUNITY_COUNT_QUERY = """
+MATCH (c:Community {tenant_id: $tenant_id})
+RETURN count(c) AS communities
+"""
+
+
+def _session_maker():
+    from src.core.database.session import get_session_maker
+
+    return get_session_maker()
+
+
+# -----------------------------------------------------------------------------
+# Graph deltas
+# -----------------------------------------------------------------------------
+
+
+class TenantStatsRecorder:
+    """
+    Buffers graph counter deltas and adds them to ``tenant_stats`` in the
+    background, one UPDATE per tenant per flush.
+
+    Counters are clamped at zero; drift from lost deltas (a crash before the
+    flush, a failed write) is repaired by the next reconciliation.
+    """
+
+    def __init__(
+        self, session_factory: Callable[[], Any] | None = None, flush_interval: float = 2.0
+    ):
+        self._session_factory = session_factory
+        self.flush_interval = flush_interval
+        self._pending: dict[str, dict[str, int]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._flusher: asyncio.Task | None = None
+        self._flush_lock: asyncio.Lock | None = None
+
+    def _session(self):
+        if self._session_factory is None:
+            return _session_maker()()
+        return self._session_factory()
+
+    def add(self, tenant_id: str, **deltas: int) -> None:
+        """Buffer deltas, e.g. ``add("t1", entities_total=3)``."""
+        unknown = set(deltas) - set(GRAPH_COUNTERS)
+        if unknown:
+            raise ValueError(f"Not graph counters: {sorted(unknown)}")
+        if any(deltas.values()):
+            self._merge(tenant_id, deltas)
+            self._ensure_flusher()
+
+    def _merge(self, tenant_id: str, deltas: dict[str, int]) -> None:
+        pending = self._pending.setdefault(tenant_id, {})
+        for name, value in deltas.items():
+            if value:
+                pending[name] = pending.get(name, 0) + value
+
+    def _bind_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        if loop is not self._loop:
+            # Worker tasks run each job on a fresh loop; loop-bound state can't be reused
+            self._loop = loop
+            self._flusher = None
+            self._flush_lock = None
+
+    def _ensure_flusher(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No running loop: flushed by the next call or at shutdown
+            return
+        self._bind_loop(loop)
+        if self._flusher is None or self._flusher.done():
+            self._flusher = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while self._pending:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Write buffered deltas; returns the number of tenants updated."""
+        self._bind_loop(asyncio.get_running_loop())
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        async with self._flush_lock:
+            pending, self._pending = self._pending, {}
+            if not pending:
+                return 0
+            try:
+                await self._write(pending)
+            except asyncio.CancelledError:
+                for tenant_id, deltas in pending.items():
+                    self._merge(tenant_id, deltas)
+                raise
+            except Exception as e:
+                logger.warning(f"Dropped graph stats deltas of {len(pending)} tenants: {e}")
+                return 0
+        return len(pending)
+
+    async def _write(self, pending: dict[str, dict[str, int]]) -> None:
+        async with self._session() as session:
+            try:
+                await session.execute(
+                    pg_insert(TenantStats)
+                    .values([{"tenant_id": tenant_id} for tenant_id in pending])
+                    .on_conflict_do_nothing(index_elements=["tenant_id"])
+                )
+                columns = TenantStats.__table__.c
+                for tenant_id, deltas in pending.items():
+                    await session.execute(
+                        update(TenantStats)
+                        .where(TenantStats.tenant_id == tenant_id)
+                        .values(
+                            {
+                                **{
+                                    name: func.greatest(columns[name] + value, 0)
+                                    for name, value in deltas.items()
+                                },
+                                "updated_at": func.now(),
+                            }
+                        )
+                    )
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    async def close(self) -> None:
+        """Stop the flusher and write whatever is still buffered."""
+        task, self._flusher = self._flusher, None
+        if task and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        await self.flush()
+
+
+_recorder: TenantStatsRecorder | None = None
+
+
+def get_tenant_stats_recorder() -> TenantStatsRecorder:
+    global _recorder
+    if _recorder is None:
+        _recorder = TenantStatsRecorder()
+    return _recorder
+
+
+def record_graph_delta(tenant_id: str, **deltas: int) -> None:
+    """Report graph changes of a tenant; never raises into the caller."""
+    try:
+        get_tenant_stats_recorder().add(tenant_id, **deltas)
+    except Exception as e:
+        logger.warning(f"Failed to record graph stats for tenant {tenant_id}: {e}")
+
+
+async def shutdown_tenant_stats() -> None:
+    """Flush buffered deltas before the database engine is disposed."""
+    if _recorder is not None:
+        await _recorder.close()
+
+
+# -----------------------------------------------------------------------------
+# Reads and reconciliation
+# -----------------------------------------------------------------------------
+
+
+def stats_to_dict(row: TenantStats | None) -> dict[str, Any]:
+    if row is None:
+        return dict.fromkeys(COUNTERS, 0) | {"reconciled_at": None}
+    return {name: int(getattr(row, name) or 0) for name in COUNTERS} | {
+        "reconciled_at": row.reconciled_at
+    }
+
+
+def needs_reconcile(stats: dict[str, Any], now: datetime | None = None) -> bool:
+    reconciled_at = stats.get("reconciled_at")
+    if reconciled_at is None:
+        return True
+    return (now or datetime.now(UTC)) - reconciled_at >= RECONCILE_INTERVAL
+
+
+class TenantStatsService:
+    """
+    Reads and recounts the ``tenant_stats`` row of a tenant.
+
+    Usage:
+        service = TenantStatsService(session_maker)
+        stats = await service.get("default")
+        await service.reconcile("default", graph_client)
+    """
+
+    def __init__(self, session_factory: Callable[[], Any] | None = None):
+        self._session_factory = session_factory or _session_maker()
+
+    async def get(self, tenant_id: str) -> dict[str, Any]:
+        """Current counters (zeros if the tenant has no row yet)."""
+        async with self._session_factory() as session:
+            return stats_to_dict(await session.get(TenantStats, tenant_id))
+
+    async def reconcile(self, tenant_id: str, graph_client: Any) -> dict[str, Any]:
+        """
+        Recount the tenant from Postgres and Neo4j and overwrite its row.
+
+        The row is locked before the Postgres counts, so trigger updates of
+        concurrent transactions either land in the count or wait and apply on
+        top of it. Graph deltas recorded while the Neo4j count runs may be
+        counted twice until the next reconciliation.
+        """
+        rows = await graph_client.execute_read(GRAPH_COUNTS_QUERY, {"tenant_id": tenant_id})
+        graph = rows[0] if rows else {}
+        counts: dict[str, Any] = {
+            "entities_total": int(graph.get("entities") or 0),
+            "relationships_total": int(graph.get("relationships") or 0),
+            "communities_total": int(graph.get("communities") or 0),
+        }
+
+        async with self._session_factory() as session:
+            try:
+                await session.execute(
+                    pg_insert(TenantStats)
+                    .values(tenant_id=tenant_id)
+                    .on_conflict_do_nothing(index_elements=["tenant_id"])
+                )
+                await session.execute(
+                    select(TenantStats.tenant_id)
+                    .where(TenantStats.tenant_id == tenant_id)
+                    .with_for_update()
+                )
+                counts.update(await self._count_documents(session, tenant_id))
+                counts.update(await self._count_chunks(session, tenant_id))
+                now = datetime.now(UTC)
+                await session.execute(
+                    update(TenantStats)
+                    .where(TenantStats.tenant_id == tenant_id)
+                    .values(**counts, reconciled_at=now, updated_at=now)
+                )
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+        logger.info(f"Reconciled stats for tenant {tenant_id}: {counts}")
+        return counts | {"reconciled_at": now}
+
+    @staticmethod
+    async def _count_documents(session, tenant_id: str) -> dict[str, int]:
+        def _count_status(condition):
+            return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+        result = await session.execute(
+            select(
+                func.count(Document.id).label("total"),
+                _count_status(Document.status == DocumentStatus.READY).label("ready"),
+                _count_status(Document.status.in_(PROCESSING_STATUSES)).label("processing"),
+                _count_status(Document.status == DocumentStatus.FAILED).label("failed"),
+            ).where(Document.tenant_id == tenant_id, Document.deleted_at.is_(None))
+        )
+        row = result.one()
+        return {
+            "documents_total": int(row.total),
+            "documents_ready": int(row.ready),
+            "documents_processing": int(row.processing),
+            "documents_failed": int(row.failed),
+        }
+
+    @staticmethod
+    async def _count_chunks(session, tenant_id: str) -> dict[str, int]:
+        result = await session.execute(
+            select(
+                func.count(Chunk.id).label("total"),
+                func.count(Chunk.id)
+                .filter(Chunk.embedding_status == EmbeddingStatus.COMPLETED)
+                .label("vectors"),
+            ).where(Chunk.tenant_id == tenant_id)
+        )
+        row = result.one()
+        return {"chunks_total": int(row.total), "vectors_total": int(row.vectors)}
+
+
+async def recount_communities(graph_client: Any, tenant_id: str) -> int:
+    """
+    Set the community counter after detection rewrote the hierarchy.
+
+    Detection creates and replaces communities wholesale, so a count of the
+    tenant's Community nodes is cheaper than tracking each one.
+    """
+    rows = await graph_client.execute_read(COMMUNITY_COUNT_QUERY, {"tenant_id": tenant_id})
+    communities = int(rows[0].get("communities") or 0) if rows else 0
+    async with _session_maker()() as session:
+        stmt = pg_insert(TenantStats).values(tenant_id=tenant_id, communities_total=communities)
+        await session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["tenant_id"],
+                set_={"communities_total": communities, "updated_at": func.now()},
+            )
+        )
+        await session.commit()
+    return communities
+
+
+# -----------------------------------------------------------------------------
+# Scheduling
+# -----------------------------------------------------------------------------
+
+
+async def schedule_stats_reconcile(dispatcher: Any, tenant_id: str) -> str | None:
+    """
+    Enqueue a recount of the tenant unless one was scheduled recently.
+
+    Returns:
+        The task ID, or None when a recount is already scheduled.
+    """
+    key = RECONCILE_PENDING_KEY.format(tenant_id=tenant_id)
+    try:
+        first = await get_cache_client().set(key, "1", nx=True, ex=RECONCILE_PENDING_TTL_SECONDS)
+    except Exception as e:
+        # Without Redis, a stale row would schedule a recount on every read
+        logger.debug(f"Stats reconcile scheduling unavailable: {e}")
+        return None
+
+    if not first:
+        return None
+    return await dispatcher.dispatch(RECONCILE_TASK, args=[tenant_id])
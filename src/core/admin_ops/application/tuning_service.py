@@ -13,6 +13,12 @@ from sqlalchemy.future import select
 
 from src.core.admin_ops.domain.audit import AuditLog
 from src.core.generation.domain.provider_models import ProviderTier
+from src.core.tenants.application.tenant_config_cache import (
+    TenantConfigCache,
+    TenantConfigSnapshot,
+    get_tenant_config_cache,
+    invalidate_tenant_config,
+)
 from src.core.tenants.domain.tenant import Tenant
 
 logger = logging.getLogger(__name__)
@@ -23,30 +29,27 @@ class TuningService:
     Manages per-tenant retrieval settings and dynamic optimization.
     """
 
-    def __init__(self, session_factory: Any):
+    def __init__(self, session_factory: Any, config_cache: TenantConfigCache | None = None):
         self.session_factory = session_factory
-        # In-memory cache for configs for performance
-        self._config_cache: dict[str, dict[str, Any]] = {}
+        # Process-wide snapshot cache, invalidated across processes via Redis
+        self.config_cache = config_cache or get_tenant_config_cache()
 
-    async def get_tenant_config(self, tenant_id: str) -> dict[str, Any]:
+    async def get_tenant_snapshot(self, tenant_id: str) -> TenantConfigSnapshot:
         """
-        Retrieves the configuration for a given tenant.
+        Retrieves the cached configuration snapshot for a given tenant.
         """
-        if tenant_id in self._config_cache:
-            return self._config_cache[tenant_id]
-
         try:
-            async with self.session_factory() as session:
-                result = await session.execute(select(Tenant).where(Tenant.id == tenant_id))
-                tenant = result.scalar_one_or_none()
-                if tenant:
-                    config = tenant.config or {}
-                    self._config_cache[tenant_id] = config
-                    return config
+            return await self.config_cache.get(tenant_id)
         except Exception as e:
             logger.error(f"Failed to fetch tenant config for {tenant_id}: {e}")
+            return TenantConfigSnapshot(tenant_id, {})
 
-        return {}
+    async def get_tenant_config(self, tenant_id: str) -> dict[str, Any]:
+        """
+        Retrieves the configuration for a given tenant (mutable copy).
+        """
+        snapshot = await self.get_tenant_snapshot(tenant_id)
+        return snapshot.to_dict()
 
     async def update_tenant_weights(self, tenant_id: str, weights: dict[str, float]):
         """
@@ -78,8 +81,7 @@ class TuningService:
                     )
 
                     # Invalidate cache
-                    if tenant_id in self._config_cache:
-                        del self._config_cache[tenant_id]
+                    await invalidate_tenant_config(tenant_id)
         except Exception as e:
             logger.error(f"Failed to update tenant weights for {tenant_id}: {e}")
 
@@ -208,6 +210,5 @@ class TuningService:
             logger.error(f"Failed to run smart tuning analysis: {e}")
 
     def invalidate_cache(self, tenant_id: str):
-        """Clear cached config for a tenant."""
-        if tenant_id in self._config_cache:
-            del self._config_cache[tenant_id]
+        """Clear this process's cached config for a tenant."""
+        self.config_cache.invalidate(tenant_id)
@@ -0,0 +1,106 @@
+"""
+Query Metric Models
+===================
+
+Per-query pipeline metrics and their hourly rollups.
+
+Rows are written in batches by the MetricsStore; rollups are maintained
+incrementally on insert so dashboards never scan raw rows.
+"""
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    String,
+    Text,
+)
+
+from src.shared.kernel.models.base import Base
+
+
+class QueryMetricRecord(Base):
+    """
+    Metrics of a single query or LLM operation (see QueryMetrics).
+    """
+
+    __tablename__ = "query_metrics"
+    __table_args__ = (
+        # Keyset pagination of recent queries, per tenant and overall
+        Index("ix_query_metrics_tenant_ts", "tenant_id", "timestamp", "query_id"),
+        Index("ix_query_metrics_ts", "timestamp", "query_id"),
+        Index("ix_query_metrics_conversation", "conversation_id", "tenant_id"),
+    )
+
+    query_id = Column(String, primary_key=True)
+    tenant_id = Column(String, nullable=False)
+    conversation_id = Column(String, nullable=True)
+    timestamp = Column(DateTime(timezone=True), nullable=False)
+    operation = Column(String, nullable=False, default="rag_query")
+
+    query = Column(Text, nullable=False, default="")
+    response = Column(Text, nullable=False, default="")
+
+    # Latency breakdown (ms)
+    embedding_latency_ms = Column(Float, default=0.0)
+    retrieval_latency_ms = Column(Float, default=0.0)
+    reranking_latency_ms = Column(Float, default=0.0)
+    generation_latency_ms = Column(Float, default=0.0)
+    total_latency_ms = Column(Float, default=0.0)
+
+    # Retrieval stats
+    chunks_retrieved = Column(Integer, default=0)
+    chunks_used = Column(Integer, default=0)
+    cache_hit = Column(Boolean, default=False)
+
+    # Generation stats
+    tokens_used = Column(Integer, default=0)
+    input_tokens = Column(Integer, default=0)
+    output_tokens = Column(Integer, default=0)
+    cost_estimate = Column(Float, default=0.0)
+    model = Column(String, nullable=False, default="")
+    provider = Column(String, nullable=False, default="")
+    success = Column(Boolean, default=True)
+    error_message = Column(Text, nullable=True)
+
+    # Quality signals
+    sources_cited = Column(Integer, default=0)
+    answer_length = Column(Integer, default=0)
+
+    def __repr__(self) -> str:
+        return f"<QueryMetricRecord(query_id={self.query_id}, operation={self.operation})>"
+
+
+class QueryMetricRollup(Base):
+    """
+    Hourly totals per tenant, operation (pipeline stage) and model.
+    """
+
+    __tablename__ = "query_metric_rollups"
+    __table_args__ = (Index("ix_query_metric_rollups_bucket", "bucket_start"),)
+
+    tenant_id = Column(String, primary_key=True)
+    bucket_start = Column(DateTime(timezone=True), primary_key=True)
+    operation = Column(String, primary_key=True)
+    model = Column(String, primary_key=True)
+
+    query_count = Column(Integer, nullable=False, default=0)
+    error_count = Column(Integer, nullable=False, default=0)
+    cache_hits = Column(Integer, nullable=False, default=0)
+    tokens_used = Column(Integer, nullable=False, default=0)
+    input_tokens = Column(Integer, nullable=False, default=0)
+    output_tokens = Column(Integer, nullable=False, default=0)
+    cost_estimate = Column(Float, nullable=False, default=0.0)
+    total_latency_ms = Column(Float, nullable=False, default=0.0)
+    max_latency_ms = Column(Float, nullable=False, default=0.0)
+    sources_cited = Column(Integer, nullable=False, default=0)
+    answer_length = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<QueryMetricRollup(tenant_id={self.tenant_id}, bucket={self.bucket_start}, "
+            f"operation={self.operation}, model={self.model})>"
+        )
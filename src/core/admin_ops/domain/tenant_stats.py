@@ -0,0 +1,60 @@
+"""
+Tenant Statistics Model
+=======================
+
+Per-tenant counters read by the admin stats endpoint.
+
+Document, chunk and vector counters are maintained by Postgres triggers on
+the documents and chunks tables (see migration 20261018_1300); graph counters
+are adjusted by the graph writer, document cleanup and community detection.
+A low-priority job periodically recounts everything and overwrites the row.
+"""
+
+from sqlalchemy import BigInteger, Column, DateTime, String, func
+
+from src.shared.kernel.models.base import Base
+
+# Counters adjusted by postgres triggers
+DOCUMENT_COUNTERS = (
+    "documents_total",
+    "documents_ready",
+    "documents_processing",
+    "documents_failed",
+    "chunks_total",
+    "vectors_total",
+)
+# Counters adjusted by the application (Neo4j has no triggers)
+GRAPH_COUNTERS = ("entities_total", "relationships_total", "communities_total")
+COUNTERS = DOCUMENT_COUNTERS + GRAPH_COUNTERS
+
+
+class TenantStats(Base):
+    """
+    Live counters of one tenant's documents, chunks, vectors and graph.
+    """
+
+    __tablename__ = "tenant_stats"
+
+    tenant_id = Column(String, primary_key=True)
+
+    documents_total = Column(BigInteger, nullable=False, default=0)
+    documents_ready = Column(BigInteger, nullable=False, default=0)
+    documents_processing = Column(BigInteger, nullable=False, default=0)
+    documents_failed = Column(BigInteger, nullable=False, default=0)
+    chunks_total = Column(BigInteger, nullable=False, default=0)
+    # Chunks whose embedding is stored in the active vector collection
+    vectors_total = Column(BigInteger, nullable=False, default=0)
+
+    entities_total = Column(BigInteger, nullable=False, default=0)
+    relationships_total = Column(BigInteger, nullable=False, default=0)
+    communities_total = Column(BigInteger, nullable=False, default=0)
+
+    # Last full recount; NULL until the first reconciliation
+    reconciled_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+    def __repr__(self) -> str:
+        return (
+            f"<TenantStats(tenant_id={self.tenant_id}, documents={self.documents_total}, "
+            f"entities={self.entities_total})>"
+        )
@@ -2,17 +2,61 @@
 Cache Decorators
 ================
 
-Simple caching utilities for API endpoints using Redis.
+Caching utilities for API endpoints using Redis.
+
+All helpers share one pooled client per event loop. ``get_or_compute`` (and
+the ``@cached`` decorator built on it) adds:
+
+- Single-flight: concurrent misses of a key share one computation, within a
+  process through an in-flight future and across processes through a short
+  Redis lock; processes that lose the lock wait for the winner's value.
+- Stale-while-revalidate: with ``stale_ttl`` an expired value is still served
+  for that long while one background task recomputes it.
+- Binary values: a 9-byte header (format tag, fresh-until timestamp) followed
+  by msgpack when installed, JSON otherwise. Plain JSON written by older
+  versions is still read.
+- Hit, stale-hit, miss and refresh counters, see ``get_cache_metrics``.
 """
 
+import asyncio
 import functools
 import json
 import logging
+import math
 import os
-from collections.abc import Callable
+import struct
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+FORMAT_MSGPACK = b"M"
+FORMAT_JSON = b"J"
+# Format tag and the unix time until which the value is fresh
+HEADER = struct.Struct(">cd")
+
+LOCK_PREFIX = "cache:lock:"
+LOCK_POLL_SECONDS = 0.05
+MAX_CONNECTIONS = int(os.getenv("CACHE_REDIS_MAX_CONNECTIONS", "50"))
+# Result of a background refresh that found another process refreshing
+_DEFERRED = object()
+
+# Deletes the lock only if this caller still holds it
+RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
 
 def _get_redis():
     """Get redis module with lazy loading."""
@@ -26,56 +70,174 @@ def _get_redis():
         ) from e
 
 
-async def get_from_cache(key: str) -> dict | None:
-    """
-    Get value from Redis cache.
+# =============================================================================
+# Pooled client
+# =============================================================================
 
-    Args:
-        key: Cache key
+_client: Any = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+# Per-loop single-flight state: cache key -> future of the running computation
+_inflight: dict[str, asyncio.Future] = {}
+_background: set[asyncio.Task] = set()
 
-    Returns:
-        Parsed JSON dict or None if not found
-    """
-    try:
+
+def get_cache_client():
+    """Shared Redis client of the running event loop (one connection pool)."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        # Worker tasks run each job on a fresh loop; connections can't cross loops
         redis = _get_redis()
         redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-        r = await redis.from_url(redis_url, decode_responses=True)
+        _client = redis.from_url(redis_url, max_connections=MAX_CONNECTIONS)
+        _client_loop = loop
+        _inflight.clear()
+    return _client
+
+
+async def close_cache_client() -> None:
+    """Close the shared client (application shutdown)."""
+    global _client, _client_loop
+    client, _client = _client, None
+    loop, _client_loop = _client_loop, None
+    if client is not None and loop is asyncio.get_running_loop():
+        await client.aclose()
+
+
+# =============================================================================
+# Serialization
+# =============================================================================
+
+
+def encode_value(value: Any, fresh_until: float) -> bytes:
+    if msgpack is not None:
+        payload = msgpack.packb(value, use_bin_type=True, default=str)
+        return HEADER.pack(FORMAT_MSGPACK, fresh_until) + payload
+    payload = json.dumps(value, default=str, separators=(",", ":")).encode()
+    return HEADER.pack(FORMAT_JSON, fresh_until) + payload
+
+
+def decode_value(raw: bytes | str) -> tuple[Any, float]:
+    """Returns (value, fresh_until); legacy JSON entries never go stale."""
+    if isinstance(raw, str):
+        raw = raw.encode()
+    tag = raw[:1]
+    if tag in (FORMAT_MSGPACK, FORMAT_JSON) and len(raw) >= HEADER.size:
+        _, fresh_until = HEADER.unpack_from(raw)
+        payload = raw[HEADER.size :]
+        if tag == FORMAT_MSGPACK:
+            if msgpack is None:
+                raise ValueError("msgpack cache entry but msgpack is not installed")
+            return msgpack.unpackb(payload, raw=False), fresh_until
+        return json.loads(payload), fresh_until
+    return json.loads(raw), math.inf
+
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
 
-        value = await r.get(key)
-        await r.aclose()
+@dataclass
+class CacheMetrics:
+    """Counters of one cache namespace (key prefix)."""
 
-        if value:
-            logger.debug(f"Cache HIT: {key}")
-            return json.loads(value)
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    refreshes: int = 0
+    refresh_failures: int = 0
+    errors: int = 0
 
-        logger.debug(f"Cache MISS: {key}")
+    def to_dict(self) -> dict[str, Any]:
+        lookups = self.hits + self.stale_hits + self.misses
+        return asdict(self) | {
+            "hit_rate": round((self.hits + self.stale_hits) / lookups, 4) if lookups else None
+        }
+
+
+_metrics: dict[str, CacheMetrics] = {}
+
+
+def _metrics_for(key: str, name: str | None) -> CacheMetrics:
+    name = name or key.split(":", 1)[0]
+    metrics = _metrics.get(name)
+    if metrics is None:
+        metrics = _metrics[name] = CacheMetrics()
+    return metrics
+
+
+def get_cache_metrics() -> dict[str, dict[str, Any]]:
+    """Counters of this process, by namespace."""
+    return {name: metrics.to_dict() for name, metrics in sorted(_metrics.items())}
+
+
+def reset_cache_metrics() -> None:
+    _metrics.clear()
+
+
+# =============================================================================
+# Basic operations
+# =============================================================================
+
+
+async def _read(key: str) -> tuple[Any, float] | None:
+    raw = await get_cache_client().get(key)
+    if raw is None:
         return None
+    return decode_value(raw)
+
+
+async def _write(key: str, value: Any, ttl: int, stale_ttl: int = 0) -> None:
+    fresh_until = time.time() + ttl
+    await get_cache_client().set(key, encode_value(value, fresh_until), ex=ttl + stale_ttl)
+
+
+async def get_from_cache(key: str, metrics_name: str | None = None) -> Any | None:
+    """
+    Get a fresh value from Redis cache.
+
+    Args:
+        key: Cache key
+        metrics_name: Namespace to count the lookup under (default: first key segment)
 
+    Returns:
+        The cached value, or None if missing or stale
+    """
+    metrics = _metrics_for(key, metrics_name)
+    try:
+        entry = await _read(key)
     except Exception as e:
+        metrics.errors += 1
         logger.warning(f"Cache read failed for key '{key}': {e}")
         return None
 
+    if entry is not None and time.time() < entry[1]:
+        metrics.hits += 1
+        logger.debug(f"Cache HIT: {key}")
+        return entry[0]
+
+    metrics.misses += 1
+    logger.debug(f"Cache MISS: {key}")
+    return None
 
-async def set_cache(key: str, value: dict, ttl: int = 60) -> bool:
+
+async def set_cache(key: str, value: Any, ttl: int = 60, stale_ttl: int = 0) -> bool:
     """
     Set value in Redis cache with TTL.
 
     Args:
         key: Cache key
-        value: Dict to cache (will be JSON serialized)
-        ttl: Time to live in seconds (default: 60)
+        value: msgpack/JSON-compatible value
+        ttl: Seconds the value is fresh (default: 60)
+        stale_ttl: Further seconds ``get_or_compute`` may serve it while refreshing
 
     Returns:
         True if cached successfully
     """
     try:
-        redis = _get_redis()
-        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-        r = await redis.from_url(redis_url, decode_responses=True)
-
-        await r.setex(key, ttl, json.dumps(value))
-        await r.aclose()
-
+        await _write(key, value, ttl, stale_ttl)
         logger.debug(f"Cache SET: {key} (TTL: {ttl}s)")
         return True
 
@@ -95,13 +257,7 @@ async def delete_cache(key: str) -> bool:
         True if deleted successfully
     """
     try:
-        redis = _get_redis()
-        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-        r = await redis.from_url(redis_url, decode_responses=True)
-
-        await r.delete(key)
-        await r.aclose()
-
+        await get_cache_client().delete(key)
         logger.debug(f"Cache DELETE: {key}")
         return True
 
@@ -110,16 +266,218 @@ async def delete_cache(key: str) -> bool:
         return False
 
 
-def cached(ttl: int = 60, key_prefix: str = ""):
+# =============================================================================
+# Single-flight computation
+# =============================================================================
+
+
+async def _acquire_lock(key: str, token: str, lock_ttl: float) -> bool:
+    try:
+        return bool(
+            await get_cache_client().set(
+                LOCK_PREFIX + key, token, nx=True, px=max(1, int(lock_ttl * 1000))
+            )
+        )
+    except Exception as e:
+        # Without Redis every process computes for itself
+        logger.debug(f"Cache lock unavailable for '{key}': {e}")
+        return True
+
+
+async def _release_lock(key: str, token: str) -> None:
+    try:
+        await get_cache_client().eval(RELEASE_LOCK_SCRIPT, 1, LOCK_PREFIX + key, token)
+    except Exception as e:
+        logger.debug(f"Cache lock release failed for '{key}': {e}")
+
+
+async def _wait_for_peer(key: str, lock_ttl: float) -> tuple[Any, float] | None:
+    """Wait for the process holding the lock to store the value."""
+    deadline = time.monotonic() + lock_ttl
+    client = get_cache_client()
+    while time.monotonic() < deadline:
+        await asyncio.sleep(LOCK_POLL_SECONDS)
+        try:
+            entry = await _read(key)
+            if entry is not None and time.time() < entry[1]:
+                return entry
+            if not await client.exists(LOCK_PREFIX + key):
+                return None
+        except Exception:
+            return None
+    return None
+
+
+async def _compute(
+    key: str,
+    loader: Callable[[], Awaitable[Any]],
+    ttl: int,
+    stale_ttl: int,
+    lock_ttl: float,
+    metrics: CacheMetrics,
+    refresh: bool,
+) -> Any:
+    token = uuid.uuid4().hex
+    if not await _acquire_lock(key, token, lock_ttl):
+        if refresh:
+            # Another process is refreshing; the stale value stays in place
+            return _DEFERRED
+        entry = await _wait_for_peer(key, lock_ttl)
+        if entry is not None:
+            metrics.coalesced += 1
+            return entry[0]
+        # The holder failed or is too slow: compute without the lock
+        token = None
+
+    try:
+        value = await loader()
+        try:
+            await _write(key, value, ttl, stale_ttl)
+        except Exception as e:
+            metrics.errors += 1
+            logger.warning(f"Cache write failed for key '{key}': {e}")
+        return value
+    finally:
+        if token is not None:
+            await _release_lock(key, token)
+
+
+async def _single_flight(key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+    """Run ``factory`` once per key at a time in this process; others await its result."""
+    future = _inflight.get(key)
+    if future is not None:
+        return await asyncio.shield(future)
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        result = await factory()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # Mark retrieved so an exception nobody else awaited isn't logged
+        future.exception()
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        if _inflight.get(key) is future:
+            del _inflight[key]
+
+
+def _refresh_in_background(
+    key: str,
+    loader: Callable[[], Awaitable[Any]],
+    ttl: int,
+    stale_ttl: int,
+    lock_ttl: float,
+    metrics: CacheMetrics,
+) -> None:
+    if key in _inflight:
+        return
+
+    async def _refresh() -> None:
+        try:
+            await _single_flight(
+                key, lambda: _compute(key, loader, ttl, stale_ttl, lock_ttl, metrics, True)
+            )
+            metrics.refreshes += 1
+        except Exception as e:
+            metrics.refresh_failures += 1
+            logger.warning(f"Background cache refresh failed for key '{key}': {e}")
+
+    task = asyncio.get_running_loop().create_task(_refresh())
+    _background.add(task)
+    task.add_done_callback(_background.discard)
+
+
+async def get_or_compute(
+    key: str,
+    loader: Callable[[], Awaitable[Any]],
+    ttl: int = 60,
+    stale_ttl: int = 0,
+    lock_ttl: float = 10.0,
+    metrics_name: str | None = None,
+) -> Any:
+    """
+    Return the cached value of ``key``, computing it with ``loader`` on a miss.
+
+    Args:
+        key: Cache key
+        loader: Coroutine function producing a msgpack/JSON-compatible value
+        ttl: Seconds the value is fresh
+        stale_ttl: Further seconds a stale value is served while it is refreshed
+            in the background (0 disables stale serving)
+        lock_ttl: Expiry of the cross-process lock, and how long a process
+            waits for another one's computation
+        metrics_name: Namespace to count the lookup under (default: first key segment)
+    """
+    metrics = _metrics_for(key, metrics_name)
+    try:
+        entry = await _read(key)
+    except Exception as e:
+        metrics.errors += 1
+        logger.warning(f"Cache read failed for key '{key}': {e}")
+        entry = None
+
+    if entry is not None:
+        value, fresh_until = entry
+        if time.time() < fresh_until:
+            metrics.hits += 1
+            return value
+        if stale_ttl > 0:
+            metrics.stale_hits += 1
+            _refresh_in_background(key, loader, ttl, stale_ttl, lock_ttl, metrics)
+            return value
+
+    metrics.misses += 1
+    if key in _inflight:
+        metrics.coalesced += 1
+    value = await _single_flight(
+        key, lambda: _compute(key, loader, ttl, stale_ttl, lock_ttl, metrics, False)
+    )
+    if value is _DEFERRED:
+        # Joined a background refresh that left the work to another process
+        value = await _compute(key, loader, ttl, stale_ttl, lock_ttl, metrics, False)
+    return value
+
+
+# =============================================================================
+# Decorator
+# =============================================================================
+
+
+def _to_cacheable(result: Any) -> Any:
+    if hasattr(result, "dict"):
+        # Pydantic model
+        return result.dict()
+    if hasattr(result, "__dict__"):
+        # Regular object
+        return result.__dict__
+    if isinstance(result, dict):
+        return result
+    # Primitive type or unknown - wrap it
+    return {"value": result}
+
+
+def cached(ttl: int = 60, key_prefix: str = "", stale_ttl: int = 0):
     """
     Decorator to cache async function results in Redis.
 
+    Results are stored (and returned, hit or miss) in their cacheable form:
+    models and objects as dicts, other values as ``{"value": ...}``.
+
     Args:
         ttl: Time to live in seconds (default: 60)
         key_prefix: Prefix for cache key
+        stale_ttl: Seconds an expired result is still served while it is
+            recomputed in the background
 
     Usage:
-        @cached(ttl=60, key_prefix="admin:stats")
+        @cached(ttl=60, key_prefix="admin:stats", stale_ttl=300)
         async def get_stats():
             return expensive_computation()
 
@@ -131,6 +489,8 @@ def cached(ttl: int = 60, key_prefix: str = ""):
     """
 
     def decorator(func: Callable):
+        metrics_name = key_prefix or func.__name__
+
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
             # Build cache key from function name + args
@@ -146,31 +506,12 @@ def cached(ttl: int = 60, key_prefix: str = ""):
 
             cache_key = ":".join(key_parts)
 
-            # Try to get from cache
-            cached_value = await get_from_cache(cache_key)
-            if cached_value is not None:
-                return cached_value
-
-            # Cache miss - execute function
-            result = await func(*args, **kwargs)
-
-            # Store in cache (convert to dict if needed)
-            if hasattr(result, "dict"):
-                # Pydantic model
-                cache_data = result.dict()
-            elif hasattr(result, "__dict__"):
-                # Regular object
-                cache_data = result.__dict__
-            elif isinstance(result, dict):
-                # Already a dict
-                cache_data = result
-            else:
-                # Primitive type or unknown - wrap it
-                cache_data = {"value": result}
-
-            await set_cache(cache_key, cache_data, ttl=ttl)
-
-            return result
+            async def _load():
+                return _to_cacheable(await func(*args, **kwargs))
+
+            return await get_or_compute(
+                cache_key, _load, ttl=ttl, stale_ttl=stale_ttl, metrics_name=metrics_name
+            )
 
         return wrapper
 
@@ -0,0 +1,93 @@
+"""
+Cache Invalidation Bus
+======================
+
+Redis pub/sub helpers for invalidating per-process caches across API and
+worker processes.
+"""
+
+import asyncio
+import logging
+from collections.abc import Callable
+
+from src.core.cache.decorators import get_cache_client
+
+logger = logging.getLogger(__name__)
+
+
+def _default_redis_url() -> str:
+    from src.shared.kernel.runtime import get_settings
+
+    return get_settings().db.redis_url
+
+
+async def publish_invalidation(channel: str, message: str) -> None:
+    """Broadcast an invalidation message (best effort)."""
+    try:
+        await get_cache_client().publish(channel, message)
+    except Exception as e:
+        logger.warning(f"Failed to broadcast invalidation on {channel}: {e}")
+
+
+class InvalidationListener:
+    """
+    Background subscriber that forwards invalidation messages to a handler.
+
+    Reconnects with backoff. ``on_disconnect`` is called when the connection
+    drops, since messages published meanwhile are lost.
+    """
+
+    def __init__(
+        self,
+        channel: str,
+        on_message: Callable[[str], None],
+        on_disconnect: Callable[[], None] | None = None,
+    ):
+        self.channel = channel
+        self.on_message = on_message
+        self.on_disconnect = on_disconnect
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def ensure_started(self, redis_url: str | None = None) -> None:
+        """Start listening in the running event loop (idempotent)."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run(redis_url or _default_redis_url()))
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def _run(self, redis_url: str) -> None:
+        import redis.asyncio as redis
+
+        backoff = 1.0
+        while True:
+            client = redis.from_url(redis_url, decode_responses=True)
+            pubsub = client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                backoff = 1.0
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self.on_message(message.get("data") or "")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Invalidation listener for {self.channel} disconnected: {e}")
+                if self.on_disconnect:
+                    self.on_disconnect()
+            finally:
+                try:
+                    await pubsub.aclose()
+                    await client.aclose()
+                except Exception:
+                    pass
+
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
@@ -6,6 +6,7 @@ Simple event dispatching for state changes.
 """
 
 import logging
+import time
 from dataclasses import dataclass
 from typing import Any
 
@@ -14,6 +15,11 @@ from src.core.state.machine import DocumentStatus
 
 logger = logging.getLogger(__name__)
 
+# Statuses after which a document emits no more progress ticks
+TERMINAL_STATUSES = frozenset(
+    {DocumentStatus.READY, DocumentStatus.FAILED, DocumentStatus.NEEDS_REVIEW}
+)
+
 
 @dataclass
 class StateChangeEvent:
@@ -28,10 +34,32 @@ class EventDispatcher:
     """
     Handles emission of system events.
     Logs events and publishes via the configured publisher.
+
+    Progress ticks (events that keep the same status) are coalesced to at most
+    one per ``progress_interval`` seconds per document; status transitions are
+    always emitted.
     """
 
-    def __init__(self, publisher: StateChangePublisher | None = None) -> None:
+    def __init__(
+        self, publisher: StateChangePublisher | None = None, progress_interval: float = 0.5
+    ) -> None:
         self.publisher = publisher
+        self.progress_interval = progress_interval
+        self._last_progress_at: dict[str, float] = {}
+
+    def _should_coalesce(self, event: StateChangeEvent) -> bool:
+        now = time.monotonic()
+        if event.new_status in TERMINAL_STATUSES:
+            # Nothing left to coalesce; keeps the map bounded by in-flight documents
+            self._last_progress_at.pop(event.document_id, None)
+            return False
+        if event.old_status != event.new_status:
+            self._last_progress_at[event.document_id] = now
+            return False
+        if now - self._last_progress_at.get(event.document_id, 0.0) < self.progress_interval:
+            return True
+        self._last_progress_at[event.document_id] = now
+        return False
 
     async def emit_state_change(self, event: StateChangeEvent) -> None:
         """
@@ -40,6 +68,9 @@ class EventDispatcher:
         Args:
             event: The state change event payload
         """
+        if self._should_coalesce(event):
+            return
+
         old_status_val = event.old_status.value if event.old_status else "None"
         logger.info(
             f"State Change [Doc: {event.document_id}] {old_status_val} -> {event.new_status.value}"
@@ -65,3 +96,36 @@ class EventDispatcher:
             await self.publisher.publish(payload)
         except Exception as e:
             logger.warning(f"Failed to publish event: {e}")
+
+
+async def publish_operation_progress(
+    publisher: StateChangePublisher | None,
+    operation_id: str,
+    tenant_id: str,
+    operation: str,
+    status: str,
+    progress: int,
+    **details: Any,
+) -> None:
+    """
+    Report progress of a multi-document operation on the document status channel.
+
+    The operation ID takes the place of the document ID, so clients follow an
+    operation on the tenant event stream like a document. ``status`` is
+    "processing" until the terminal "completed" or "failed".
+    """
+    if publisher is None:
+        return
+    message = {
+        "document_id": operation_id,
+        "operation": operation,
+        "status": status,
+        "progress": progress,
+        "tenant_id": tenant_id,
+        "details": details,
+    }
+    try:
+        await publisher.publish({"channel": f"document:{operation_id}:status", "message": message})
+    except Exception as e:
+        logger.warning(f"Failed to publish progress of operation {operation_id}: {e}")
+
@@ -4,22 +4,35 @@ Agent Orchestrator
 
 A generic ReAct (Reasoning + Acting) agent that executes a loop:
 1. Think (Call LLM)
-2. Act (Execute Tool)
-3. Observe (Add Tool Output to History)
+2. Act (Execute Tools, concurrently when the LLM requests several)
+3. Observe (Add budgeted Tool Output to History)
 4. Repeat until Answer
+
+``run_stream`` yields events while the loop runs (tool calls and results,
+answer tokens); ``run`` consumes it and returns a QueryResponse.
 """
 
-import json
 import logging
-from collections.abc import Callable
+import time
+import uuid
+from collections.abc import AsyncIterator, Callable
 from typing import Any
 
+from src.core.generation.application.agent.tool_runtime import (
+    ToolBudgets,
+    ToolCall,
+    ToolExecutor,
+    ToolResultCache,
+    get_tool_result_cache,
+)
 from src.core.generation.application.generation_service import GenerationService
 from src.shared.kernel.models.query import QueryResponse, TimingInfo
 from src.shared.kernel.observability import trace_span
 
 logger = logging.getLogger(__name__)
 
+MAX_STEPS_ANSWER = "I reached the maximum number of steps without finding a definitive answer."
+
 
 class AgentOrchestrator:
     """
@@ -33,12 +46,24 @@ class AgentOrchestrator:
         tool_schemas: list[dict[str, Any]],
         system_prompt: str,
         max_steps: int = 10,
+        tool_output_tokens: int = 1500,
+        tool_output_budgets: dict[str, int] | None = None,
+        max_parallel_tools: int = 4,
+        tool_cache: ToolResultCache | None = None,
+        uncached_tools: set[str] | None = None,
     ):
         self.gen = generation_service
         self.tools = tools
         self.tool_schemas = tool_schemas
         self.system_prompt = system_prompt
         self.max_steps = max_steps
+        self.executor = ToolExecutor(
+            tools,
+            budgets=ToolBudgets(tool_output_tokens, dict(tool_output_budgets or {})),
+            cache=tool_cache if tool_cache is not None else get_tool_result_cache(),
+            max_parallel=max_parallel_tools,
+            uncached_tools=uncached_tools,
+        )
 
     @trace_span("AgentOrchestrator.run")
     async def run(
@@ -46,6 +71,8 @@ class AgentOrchestrator:
         query: str,
         conversation_id: str | None = None,
         conversation_history: list[dict] | None = None,
+        tenant_id: str | None = None,
+        user_id: str | None = None,
     ) -> QueryResponse:
         """
         Execute the agent loop for a given query.
@@ -54,8 +81,54 @@ class AgentOrchestrator:
             query: The user's current query
             conversation_id: Optional ID for threading
             conversation_history: Optional list of previous messages [{"role": "user/assistant", "content": "..."}]
+            tenant_id: Tenant the tools are bound to (scopes memoized tool output)
+            user_id: Caller (scopes memoized tool output)
+        """
+        result: dict[str, Any] = {}
+        async for event in self.run_stream(
+            query, conversation_id, conversation_history, tenant_id=tenant_id, user_id=user_id
+        ):
+            if event["event"] == "done":
+                result = event["data"]
+
+        response = QueryResponse(
+            answer=result.get("answer") or "",
+            sources=[],  # TODO: Extract sources from tool outputs
+            timing=TimingInfo(
+                total_ms=result.get("total_ms", 0),
+                retrieval_ms=result.get("tool_ms", 0),
+                generation_ms=result.get("llm_ms", 0),
+            ),
+            conversation_id=conversation_id,
+            trace=result.get("trace", []),
+        )
+        logger.info(f"Agent finished. Result: {response.answer[:50]}...")
+        return response
+
+    async def run_stream(
+        self,
+        query: str,
+        conversation_id: str | None = None,
+        conversation_history: list[dict] | None = None,
+        tenant_id: str | None = None,
+        user_id: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
         """
-        messages = [
+        Execute the agent loop, yielding events as it progresses.
+
+        Events:
+            tool_call:   {"step", "id", "name", "arguments"} when a tool starts
+            tool_result: {"step", "id", "name", "output", "cached", "truncated",
+                          "error", "elapsed_ms"} as each tool finishes
+            token:       answer text as the LLM produces it
+            done:        {"answer", "steps", "trace", "total_ms", "llm_ms", "tool_ms",
+                          "max_steps_reached"}
+
+        Text the LLM writes before deciding to call tools is streamed as tokens
+        too; the ``answer`` in the done event is the final step's text only.
+        """
+        start = time.perf_counter()
+        messages: list[Any] = [
             {"role": "system", "content": self.system_prompt},
         ]
 
@@ -69,73 +142,167 @@ class AgentOrchestrator:
         # Add current user query
         messages.append({"role": "user", "content": query})
 
-        trace = []
-        steps_taken = 0
+        # Memoized tool output is shared across the turns of a conversation. The
+        # conversation ID comes from the client and the tools are bound to the
+        # tenant, so the scope includes both tenant and user
+        conversation_scope = conversation_id or f"run:{uuid.uuid4()}"
+        cache_scope = f"{tenant_id or '-'}:{user_id or '-'}:{conversation_scope}"
+        trace: list[dict[str, Any]] = []
+        llm_ms = tool_ms = 0.0
 
-        while steps_taken < self.max_steps:
+        for step in range(1, self.max_steps + 1):
             # 1. Think
-            tool_defs = self._get_tool_definitions() if self.tools else None
-            response = await self.gen.chat_completion(messages=messages, tools=tool_defs)
-
-            # OpenAI ChatCompletion object
-            message = response.choices[0].message
-            messages.append(message)
+            llm_start = time.perf_counter()
+            content_parts: list[str] = []
+            tool_calls: list[ToolCall] = []
+            async for kind, value in self._think(messages):
+                if kind == "token":
+                    content_parts.append(value)
+                    yield {"event": "token", "data": value}
+                else:
+                    tool_calls = value
+            llm_ms += (time.perf_counter() - llm_start) * 1000
+            content = "".join(content_parts)
 
             # 2. Check for Tool Calls
-            if not message.tool_calls:
+            if not tool_calls:
                 # Agent is done, returned a final answer
-                result = QueryResponse(
-                    answer=message.content,
-                    sources=[],  # TODO: Extract sources from tool outputs
-                    timing=TimingInfo(
-                        total_ms=0, retrieval_ms=0, generation_ms=0
-                    ),  # TODO: Track timing
-                    conversation_id=conversation_id,
-                    trace=trace,
-                )
-                logger.info(f"Agent finished with answer. Result: {result.answer[:50]}...")
-                return result
+                yield {
+                    "event": "done",
+                    "data": {
+                        "answer": content,
+                        "steps": step,
+                        "trace": trace,
+                        "total_ms": (time.perf_counter() - start) * 1000,
+                        "llm_ms": llm_ms,
+                        "tool_ms": tool_ms,
+                        "max_steps_reached": False,
+                    },
+                }
+                return
+
+            messages.append(
+                {
+                    "role": "assistant",
+                    "content": content or None,
+                    "tool_calls": [
+                        {
+                            "id": call.id,
+                            "type": "function",
+                            "function": {"name": call.name, "arguments": call.arguments},
+                        }
+                        for call in tool_calls
+                    ],
+                }
+            )
 
             # 3. Act (Execute Tools)
-            for tool_call in message.tool_calls:
-                func_name = tool_call.function.name
-                args_str = tool_call.function.arguments
-                call_id = tool_call.id
-
-                try:
-                    args = json.loads(args_str)
-                    if func_name in self.tools:
-                        logger.info(f"Agent calling tool: {func_name} args={args}")
-                        result = await self.tools[func_name](**args)
-                        output = str(result)
-                    else:
-                        output = f"Error: Tool '{func_name}' not found."
-                except Exception as e:
-                    output = f"Error executing '{func_name}': {str(e)}"
-
-                # 4. Observe
-                messages.append({"role": "tool", "tool_call_id": call_id, "content": output})
+            for call in tool_calls:
+                yield {
+                    "event": "tool_call",
+                    "data": {
+                        "step": step,
+                        "id": call.id,
+                        "name": call.name,
+                        "arguments": call.arguments,
+                    },
+                }
 
+            tools_start = time.perf_counter()
+            outputs: dict[str, str] = {}
+            async for result in self.executor.execute(tool_calls, cache_scope):
+                outputs[result.call.id] = result.output
+                yield {
+                    "event": "tool_result",
+                    "data": {
+                        "step": step,
+                        "id": result.call.id,
+                        "name": result.call.name,
+                        "output": result.output[:500],
+                        "cached": result.cached,
+                        "truncated": result.truncated,
+                        "error": result.error,
+                        "elapsed_ms": round(result.elapsed_ms, 2),
+                    },
+                }
                 trace.append(
                     {
-                        "step": f"tool_call:{func_name}",
+                        "step": f"tool_call:{result.call.name}",
+                        "duration_ms": round(result.elapsed_ms, 2),
                         "details": {
-                            "args": args_str,
-                            "output": output[:500] + "...",  # Truncate for trace
+                            "args": result.call.arguments,
+                            "output": result.output[:500] + "...",  # Truncate for trace
+                            "cached": result.cached,
                         },
                     }
                 )
+            tool_ms += (time.perf_counter() - tools_start) * 1000
+
+            # 4. Observe (in the order the LLM requested the calls)
+            for call in tool_calls:
+                messages.append(
+                    {"role": "tool", "tool_call_id": call.id, "content": outputs[call.id]}
+                )
 
-            steps_taken += 1
+        logger.info(f"Agent reached max steps ({self.max_steps})")
+        yield {"event": "token", "data": MAX_STEPS_ANSWER}
+        yield {
+            "event": "done",
+            "data": {
+                "answer": MAX_STEPS_ANSWER,
+                "steps": self.max_steps,
+                "trace": trace,
+                "total_ms": (time.perf_counter() - start) * 1000,
+                "llm_ms": llm_ms,
+                "tool_ms": tool_ms,
+                "max_steps_reached": True,
+            },
+        }
 
-        result = QueryResponse(
-            answer="I reached the maximum number of steps without finding a definitive answer.",
-            conversation_id=conversation_id,
-            trace=trace,
-            timing=TimingInfo(total_ms=0, retrieval_ms=0, generation_ms=0),
-        )
-        logger.info(f"Agent finished max steps. Result: {result.answer[:50]}...")
-        return result
+    async def _think(self, messages: list[Any]) -> AsyncIterator[tuple[str, Any]]:
+        """
+        One streamed LLM call.
+
+        Yields ("token", text) for content deltas and, at the end,
+        ("tool_calls", [ToolCall, ...]) assembled from the tool call deltas.
+        """
+        tool_defs = self._get_tool_definitions() if self.tools else None
+        response = await self.gen.chat_completion(messages=messages, tools=tool_defs, stream=True)
+
+        if hasattr(response, "choices"):
+            # Provider returned a complete response instead of a stream
+            message = response.choices[0].message
+            if message.content:
+                yield "token", message.content
+            yield "tool_calls", [
+                ToolCall(id=tc.id, name=tc.function.name, arguments=tc.function.arguments or "")
+                for tc in message.tool_calls or []
+            ]
+            return
+
+        partial: dict[int, dict[str, str]] = {}
+        async for chunk in response:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if delta.content:
+                yield "token", delta.content
+            for tc in delta.tool_calls or []:
+                entry = partial.setdefault(tc.index, {"id": "", "name": "", "arguments": ""})
+                if tc.id:
+                    entry["id"] = tc.id
+                if tc.function is not None:
+                    entry["name"] += tc.function.name or ""
+                    entry["arguments"] += tc.function.arguments or ""
+
+        yield "tool_calls", [
+            ToolCall(
+                id=entry["id"] or f"call_{index}",
+                name=entry["name"],
+                arguments=entry["arguments"],
+            )
+            for index, entry in sorted(partial.items())
+        ]
 
     def _get_tool_definitions(self) -> list[dict]:
         """Return the tool schemas for the LLM."""
@@ -0,0 +1,207 @@
+"""
+Agent Tool Runtime
+==================
+
+Executes the tool calls of one agent step.
+
+Calls from the same step run concurrently (bounded), their output is cut to a
+per-tool token budget before it re-enters the prompt, and identical
+invocations within a conversation are served from a memo cache.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.core.utils.tokenizer import Tokenizer
+
+logger = logging.getLogger(__name__)
+
+# Share of the budget kept from the start of an over-long output; the rest is its tail
+HEAD_SHARE = 0.8
+
+
+@dataclass
+class ToolCall:
+    """A tool invocation requested by the LLM."""
+
+    id: str
+    name: str
+    arguments: str
+
+
+@dataclass
+class ToolResult:
+    call: ToolCall
+    output: str
+    cached: bool = False
+    truncated: bool = False
+    error: bool = False
+    elapsed_ms: float = 0.0
+
+
+@dataclass
+class ToolBudgets:
+    """Token budget of tool output re-entering the context, optionally per tool."""
+
+    default_tokens: int = 1500
+    per_tool: dict[str, int] = field(default_factory=dict)
+
+    def for_tool(self, name: str) -> int:
+        return self.per_tool.get(name, self.default_tokens)
+
+
+def budget_tool_output(text: str, max_tokens: int) -> tuple[str, bool]:
+    """
+    Fit tool output into max_tokens, keeping its head and tail.
+
+    Returns the (possibly) shortened text and whether it was truncated.
+    """
+    if max_tokens <= 0:
+        return text, False
+    total = Tokenizer.count_tokens(text)
+    if total <= max_tokens:
+        return text, False
+
+    head_tokens = int(max_tokens * HEAD_SHARE)
+    tail_tokens = max_tokens - head_tokens
+    head = Tokenizer.truncate_to_budget(text, head_tokens)
+    tail = Tokenizer.truncate_to_budget(text, tail_tokens, from_start=False) if tail_tokens else ""
+    marker = f"\n[... {total - max_tokens} tokens of tool output omitted ...]\n"
+    return head + marker + tail, True
+
+
+def invocation_key(name: str, arguments: dict[str, Any]) -> str:
+    """Canonical key of a tool invocation (argument order does not matter)."""
+    return f"{name}:{json.dumps(arguments, sort_keys=True, default=str)}"
+
+
+class ToolResultCache:
+    """
+    Memoized tool output per conversation.
+
+    LRU over conversations and over the invocations within each, with a TTL so
+    a long-lived conversation eventually sees fresh data.
+    """
+
+    def __init__(
+        self,
+        max_conversations: int = 512,
+        max_entries_per_conversation: int = 64,
+        ttl_seconds: float = 900.0,
+    ):
+        self.max_conversations = max_conversations
+        self.max_entries_per_conversation = max_entries_per_conversation
+        self.ttl_seconds = ttl_seconds
+        self._scopes: OrderedDict[str, OrderedDict[str, tuple[float, str]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, scope: str, key: str) -> str | None:
+        entries = self._scopes.get(scope)
+        entry = entries.get(key) if entries else None
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del entries[key]
+            self.misses += 1
+            return None
+        self._scopes.move_to_end(scope)
+        entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, scope: str, key: str, output: str) -> None:
+        entries = self._scopes.get(scope)
+        if entries is None:
+            entries = self._scopes[scope] = OrderedDict()
+        self._scopes.move_to_end(scope)
+        entries[key] = (time.monotonic() + self.ttl_seconds, output)
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries_per_conversation:
+            entries.popitem(last=False)
+        while len(self._scopes) > self.max_conversations:
+            self._scopes.popitem(last=False)
+
+
+class ToolExecutor:
+    """Runs one step's tool calls and yields results as they complete."""
+
+    def __init__(
+        self,
+        tools: dict[str, Callable],
+        budgets: ToolBudgets | None = None,
+        cache: ToolResultCache | None = None,
+        max_parallel: int = 4,
+        uncached_tools: set[str] | None = None,
+    ):
+        self.tools = tools
+        self.budgets = budgets or ToolBudgets()
+        self.cache = cache
+        self.max_parallel = max(1, max_parallel)
+        self.uncached_tools = uncached_tools or set()
+
+    async def execute(self, calls: list[ToolCall], scope: str) -> AsyncIterator[ToolResult]:
+        semaphore = asyncio.Semaphore(self.max_parallel)
+
+        async def _bounded(call: ToolCall) -> ToolResult:
+            async with semaphore:
+                return await self._execute_one(call, scope)
+
+        for next_done in asyncio.as_completed([_bounded(call) for call in calls]):
+            yield await next_done
+
+    async def _execute_one(self, call: ToolCall, scope: str) -> ToolResult:
+        start = time.perf_counter()
+        try:
+            args = json.loads(call.arguments or "{}")
+        except json.JSONDecodeError as e:
+            return ToolResult(call, f"Error: invalid arguments for '{call.name}': {e}", error=True)
+
+        func = self.tools.get(call.name)
+        if func is None:
+            return ToolResult(call, f"Error: Tool '{call.name}' not found.", error=True)
+
+        memoize = self.cache is not None and call.name not in self.uncached_tools
+        key = invocation_key(call.name, args)
+        if memoize:
+            cached = self.cache.get(scope, key)
+            if cached is not None:
+                logger.info(f"Agent tool cache hit: {call.name} args={args}")
+                return ToolResult(call, cached, cached=True)
+
+        try:
+            logger.info(f"Agent calling tool: {call.name} args={args}")
+            output = str(await func(**args))
+        except Exception as e:
+            return ToolResult(
+                call,
+                f"Error executing '{call.name}': {str(e)}",
+                error=True,
+                elapsed_ms=(time.perf_counter() - start) * 1000,
+            )
+
+        output, truncated = budget_tool_output(output, self.budgets.for_tool(call.name))
+        if memoize:
+            self.cache.set(scope, key, output)
+        return ToolResult(
+            call,
+            output,
+            truncated=truncated,
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+        )
+
+
+_tool_result_cache: ToolResultCache | None = None
+
+
+def get_tool_result_cache() -> ToolResultCache:
+    """Process-wide memo cache, shared by the per-request orchestrators."""
+    global _tool_result_cache
+    if _tool_result_cache is None:
+        _tool_result_cache = ToolResultCache()
+    return _tool_result_cache
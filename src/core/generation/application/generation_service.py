@@ -10,7 +10,7 @@ import re
 import time
 
 import structlog
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Mapping
 from dataclasses import dataclass, field, replace
 from typing import Any
 
@@ -24,6 +24,7 @@ from src.core.generation.domain.ports.providers import LLMProviderPort
 from src.core.generation.domain.provider_models import ProviderTier
 from src.core.ingestion.domain.ports.document_repository import DocumentRepository
 from src.core.security.source_verifier import SourceVerifier
+from src.core.tenants.application.tenant_config_cache import derive_from_config
 from src.core.tenants.domain.ports.tenant_repository import TenantRepository
 from src.shared.kernel.observability import trace_span
 
@@ -77,6 +78,7 @@ class GenerationConfig:
     seed: int | None = None
     max_tokens: int = 12000
     max_context_tokens: int = 8000  # Default to 8k context budget
+    max_memory_tokens: int = 600  # Budget for recalled user facts and summaries
     enable_follow_up: bool = True
     prompt_version: str = "latest"
 
@@ -134,33 +136,58 @@ class GenerationService:
 
         self.verifier = SourceVerifier()
 
-    def _resolve_provider_factory(self, tenant_config: dict[str, Any] | None):
+    async def _load_tenant_config(
+        self, tenant_id: str | None, options: Any | None = None
+    ) -> Mapping[str, Any]:
+        """
+        Tenant config for this request.
+
+        Prefers the snapshot the caller resolved (``options["tenant_config"]``)
+        and only reads the tenant row when none was passed down.
+        """
+        passed = options.get("tenant_config") if options else None
+        if passed is not None:
+            return passed
+
+        if tenant_id and self.tenant_repository:
+            try:
+                tenant_obj = await self.tenant_repository.get(tenant_id)
+                if tenant_obj and tenant_obj.config:
+                    return tenant_obj.config
+            except Exception as e:
+                logger.warning(f"Failed to load tenant config for {tenant_id}: {e}")
+        return {}
+
+    def _resolve_provider_factory(self, tenant_config: Mapping[str, Any] | None):
         """
         Resolve a provider factory, potentially scoped to tenant configuration
         if it overrides global settings (like ollama_base_url).
         """
         if not self.factory:
             return None
-            
+
         if not tenant_config:
             return self.factory
-            
+
         t_ollama_url = tenant_config.get("ollama_base_url")
         if not t_ollama_url:
             return self.factory
-            
-        # Tenant overrides URL - create scoped factory
-        from src.core.generation.domain.ports.provider_factory import build_provider_factory
+
+        # Tenant overrides URL - scoped factory, memoized on the config snapshot
         from src.shared.kernel.runtime import get_settings
-        
+
         settings = get_settings()
-        
-        return build_provider_factory(
-            openai_api_key=settings.openai_api_key,
-            anthropic_api_key=settings.anthropic_api_key,
-            ollama_base_url=t_ollama_url,
-            default_llm_provider=settings.default_llm_provider,
-            default_llm_model=settings.default_llm_model,
+
+        return derive_from_config(
+            tenant_config,
+            ("provider_factory", t_ollama_url),
+            lambda: build_provider_factory(
+                openai_api_key=settings.openai_api_key,
+                anthropic_api_key=settings.anthropic_api_key,
+                ollama_base_url=t_ollama_url,
+                default_llm_provider=settings.default_llm_provider,
+                default_llm_model=settings.default_llm_model,
+            ),
         )
 
     def _normalize_citations(self, text: str) -> str:
@@ -168,6 +195,23 @@ class GenerationService:
             return text
         return CITATION_NORMALIZE_PATTERN.sub(r"[[Source: \1]]", text)
 
+    async def _recall_memory(self, tenant_id: str, user_id: str, query: str) -> str:
+        """User facts and past conversations relevant to the query, as prompt text."""
+        from src.core.generation.application.memory.manager import memory_manager
+        from src.core.generation.application.memory.ranking import RankingConfig
+
+        memory = await memory_manager.get_relevant_memory(
+            tenant_id,
+            user_id,
+            query,
+            RankingConfig(token_budget=self.config.max_memory_tokens),
+        )
+        logger.debug(
+            f"Generation - Recalled {len(memory.facts)} facts and "
+            f"{len(memory.summaries)} summaries for user {user_id}"
+        )
+        return memory.to_prompt()
+
     @trace_span("GenerationService.generate")
     async def generate(
         self,
@@ -224,26 +268,7 @@ class GenerationService:
 
         if user_id:
             try:
-                # Parallel fetch for facts and summaries
-                # For MVP, we do it sequentially or just use gather if we were fully async optimized here
-                # But simple sequential await is fine for now
-                from src.core.generation.application.memory.manager import memory_manager
-
-                # 1. Facts
-                facts = await memory_manager.get_user_facts(tenant_id, user_id, limit=5)
-                formatted_facts = "\n".join([f"- {f.content}" for f in facts])
-
-                # 2. Summaries
-                summaries = await memory_manager.get_recent_summaries(tenant_id, user_id, limit=3)
-                formatted_summaries = "\n".join([f"- {s.title}: {s.summary}" for s in summaries])
-
-                parts = []
-                if formatted_facts:
-                    parts.append(f"USER FACTS:\n{formatted_facts}")
-                if formatted_summaries:
-                    parts.append(f"PAST CONVERSATIONS:\n{formatted_summaries}")
-
-                memory_context = "\n\n".join(parts)
+                memory_context = await self._recall_memory(tenant_id, user_id, query)
             except Exception as e:
                 logger.warning(f"Failed to retrieve memory: {e}")
 
@@ -252,25 +277,14 @@ class GenerationService:
         user_prompt_template = self.registry.get_prompt("rag_user", self.config.prompt_version)
 
         # Apply Tenant Overrides
-        tenant_config: dict[str, Any] = {}
+        tenant_config = await self._load_tenant_config(tenant_id, options)
+        if tenant_config.get("rag_system_prompt"):
+            system_prompt = tenant_config.get("rag_system_prompt")
+            logger.debug(f"Applied tenant system prompt override for {tenant_id}")
 
-        if tenant_id and self.tenant_repository:
-            try:
-                tenant_obj = await self.tenant_repository.get(tenant_id)
-                if tenant_obj and tenant_obj.config:
-                    t_conf = tenant_obj.config
-                    tenant_config = t_conf
-
-                    if t_conf.get("rag_system_prompt"):
-                        system_prompt = t_conf.get("rag_system_prompt")
-                        logger.debug(f"Applied tenant system prompt override for {tenant_id}")
-
-                    if t_conf.get("rag_user_prompt"):
-                        user_prompt_template = t_conf.get("rag_user_prompt")
-                        logger.debug(f"Applied tenant user prompt override for {tenant_id}")
-
-            except Exception as e:
-                logger.warning(f"Failed to load tenant config for prompt override: {e}")
+        if tenant_config.get("rag_user_prompt"):
+            user_prompt_template = tenant_config.get("rag_user_prompt")
+            logger.debug(f"Applied tenant user prompt override for {tenant_id}")
 
         # Inject memory_context if not empty
         try:
@@ -482,28 +496,7 @@ class GenerationService:
 
         if user_id:
             try:
-                from src.core.generation.application.memory.manager import memory_manager
-
-                # Retrieve facts and summaries
-                facts = await memory_manager.get_user_facts(tenant_id, user_id, limit=5)
-                logger.debug(f"Generation - Retrieved {len(facts)} facts for user {user_id}")
-
-                summaries = await memory_manager.get_recent_summaries(tenant_id, user_id, limit=3)
-                logger.debug(
-                    f"Generation - Retrieved {len(summaries)} summaries for user {user_id}"
-                )
-
-                parts = []
-                if facts:
-                    formatted_facts = "\n".join([f"- {f.content}" for f in facts])
-                    parts.append(f"USER FACTS:\n{formatted_facts}")
-                if summaries:
-                    formatted_summaries = "\n".join(
-                        [f"- {s.title}: {s.summary}" for s in summaries]
-                    )
-                    parts.append(f"PAST CONVERSATIONS:\n{formatted_summaries}")
-
-                memory_context = "\n\n".join(parts)
+                memory_context = await self._recall_memory(tenant_id, user_id, query)
                 if memory_context:
                     logger.debug(f"Generation - Memory Context Injected:\n{memory_context}")
                     # Signal Source Type to Frontend
@@ -548,20 +541,11 @@ class GenerationService:
         user_prompt_template = self.registry.get_prompt("rag_user", self.config.prompt_version)
 
         # Apply Tenant Overrides (Stream)
-        tenant_config: dict[str, Any] = {}
-
-        if tenant_id and self.tenant_repository:
-            try:
-                tenant_obj = await self.tenant_repository.get(tenant_id)
-                if tenant_obj and tenant_obj.config:
-                    t_conf = tenant_obj.config
-                    tenant_config = t_conf
-                    if t_conf.get("rag_system_prompt"):
-                        system_prompt = t_conf.get("rag_system_prompt")
-                    if t_conf.get("rag_user_prompt"):
-                        user_prompt_template = t_conf.get("rag_user_prompt")
-            except Exception as e:
-                logger.warning(f"Failed to load tenant config for stream prompt override: {e}")
+        tenant_config = await self._load_tenant_config(tenant_id, options)
+        if tenant_config.get("rag_system_prompt"):
+            system_prompt = tenant_config.get("rag_system_prompt")
+        if tenant_config.get("rag_user_prompt"):
+            user_prompt_template = tenant_config.get("rag_user_prompt")
 
         try:
             user_prompt = user_prompt_template.format(
@@ -669,25 +653,20 @@ class GenerationService:
         messages: list[dict[str, Any]],
         tools: list[dict[str, Any]] | None = None,
         tool_choice: Any | None = "auto",
+        stream: bool = False,
     ) -> Any:
         """
         Direct chat completion with tool support (Agentic Mode).
-        Exposes the raw provider response object (e.g. ChatCompletion).
+        Exposes the raw provider response object (e.g. ChatCompletion),
+        or its chunk stream when ``stream`` is set.
         """
         from src.core.generation.application.llm_steps import resolve_llm_step_config
         from src.shared.context import get_current_tenant
         from src.shared.kernel.runtime import get_settings
 
         settings = get_settings()
-        tenant_config: dict[str, Any] = {}
         tenant_id = get_current_tenant()
-        if tenant_id and self.tenant_repository:
-            try:
-                tenant_obj = await self.tenant_repository.get(str(tenant_id))
-                if tenant_obj and tenant_obj.config:
-                    tenant_config = tenant_obj.config
-            except Exception as e:
-                logger.warning(f"Failed to load tenant config for agent completion: {e}")
+        tenant_config = await self._load_tenant_config(str(tenant_id) if tenant_id else None)
 
         llm_cfg = resolve_llm_step_config(
             tenant_config=tenant_config,
@@ -726,6 +705,8 @@ class GenerationService:
             kwargs["seed"] = seed
         if llm_cfg.model is not None:
             kwargs["model"] = llm_cfg.model
+        if stream:
+            kwargs["stream"] = True
 
         return await provider.chat(**kwargs)
 
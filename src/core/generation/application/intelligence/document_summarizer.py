@@ -4,17 +4,28 @@ Document Summarizer
 
 LLM-based document summarization, type classification, and hashtag extraction.
 Ported from reference Amber project.
+
+The LLM sees representative chunks from across the whole document (see
+summary_input), not just its opening pages.
 """
 
+import asyncio
 import logging
 import re
 from typing import Any
 
+from src.core.generation.application.intelligence.summary_input import (
+    SummaryInputConfig,
+    build_summary_input,
+    plan_map_groups,
+    select_chunks,
+)
 from src.core.generation.domain.ports.provider_factory import (
     build_provider_factory,
     get_provider_factory,
 )
 from src.core.generation.domain.provider_models import ProviderTier
+from src.core.utils.tokenizer import Tokenizer
 
 logger = logging.getLogger(__name__)
 
@@ -164,9 +175,10 @@ class DocumentSummarizer:
     - hashtags: 5-8 relevant hashtags
     """
 
-    def __init__(self):
+    def __init__(self, input_config: SummaryInputConfig | None = None):
         """Initialize the document summarizer with LLM provider."""
         self._llm = None  # Lazy init
+        self.input_config = input_config or SummaryInputConfig()
 
     def _get_llm(
         self,
@@ -208,14 +220,18 @@ class DocumentSummarizer:
         document_title: str = "",
         max_summary_length: int = 1000,
         tenant_config: dict[str, Any] | None = None,
+        embeddings: list[list[float]] | None = None,
     ) -> dict[str, Any]:
         """
         Extract summary, document type, and hashtags from document chunks.
 
         Args:
-            chunks: List of chunk content strings
+            chunks: List of chunk content strings, in document order
             document_title: Document filename for context
             max_summary_length: Maximum length of summary
+            tenant_config: Tenant overrides (LLM step config, ``summary_map_reduce``)
+            embeddings: Chunk embeddings aligned with ``chunks``, used to pick
+                representative chunks; positional sampling is used without them
 
         Returns:
             Dictionary containing:
@@ -228,32 +244,12 @@ class DocumentSummarizer:
                 logger.warning("No chunks provided for summary extraction")
                 return self._empty_result()
 
-            # Combine chunks (limit to first 10 for efficiency)
-            chunks_to_use = chunks[:10]
-            full_content = "\n\n".join(chunks_to_use)
-
-            # Truncate to ~12000 chars for LLM context limits
-            if len(full_content) > 12000:
-                full_content = full_content[:12000]
-                # Try to end at a sentence boundary
-                last_period = full_content.rfind(".")
-                if last_period > 10000:
-                    full_content = full_content[: last_period + 1]
-
-            # Create LLM prompts
-            system_prompt = self._build_system_prompt(max_summary_length)
-            user_prompt = self._build_user_prompt(full_content, document_title, max_summary_length)
-
-            # Generate response with metrics tracking
+            from src.core.generation.application.llm_steps import resolve_llm_step_config
             from src.shared.kernel.runtime import get_settings
 
             settings = get_settings()
-            from src.core.admin_ops.application.metrics.collector import MetricsCollector
-            from src.core.generation.application.llm_steps import resolve_llm_step_config
-            from src.shared.identifiers import generate_query_id
-
             tenant_config = tenant_config or {}
-            
+
             # Resolve Ollama URL from Tenant Config
             res_ollama_url = tenant_config.get("ollama_base_url")
 
@@ -268,27 +264,36 @@ class DocumentSummarizer:
                 model=llm_cfg.model,
                 ollama_base_url=res_ollama_url,
             )
-            query_id = generate_query_id()
-            collector = MetricsCollector(redis_url=settings.db.redis_url)
-
-            async with collector.track_query(
-                query_id, "system", f"Summarize: {document_title}"
-            ) as qm:
-                qm.operation = "summarization"
-                result = await llm.generate(
-                    prompt=user_prompt,
-                    system_prompt=system_prompt,
-                    temperature=llm_cfg.temperature,
-                    max_tokens=800,
-                    seed=llm_cfg.seed,
+
+            config = self.input_config
+            total_tokens = sum(Tokenizer.count_tokens(chunk) for chunk in chunks)
+            if (
+                tenant_config.get("summary_map_reduce")
+                and total_tokens > config.map_reduce_min_tokens
+            ):
+                full_content = await self._map_sections(
+                    llm, llm_cfg, chunks, embeddings, document_title
+                )
+            else:
+                selected = select_chunks(chunks, embeddings, config)
+                full_content = build_summary_input(chunks, selected, config)
+                logger.debug(
+                    f"Summarizing {document_title}: {len(selected)}/{len(chunks)} chunks "
+                    f"selected from {total_tokens} tokens"
                 )
-                qm.tokens_used = result.usage.total_tokens if hasattr(result, "usage") else 0
-                qm.input_tokens = result.usage.input_tokens if hasattr(result, "usage") else 0
-                qm.output_tokens = result.usage.output_tokens if hasattr(result, "usage") else 0
-                qm.cost_estimate = result.cost_estimate if hasattr(result, "cost_estimate") else 0.0
-                qm.model = result.model if hasattr(result, "model") else ""
-                qm.provider = result.provider if hasattr(result, "provider") else ""
-                qm.response = result.text[:500] if len(result.text) > 500 else result.text
+
+            # Create LLM prompts
+            system_prompt = self._build_system_prompt(max_summary_length)
+            user_prompt = self._build_user_prompt(full_content, document_title, max_summary_length)
+
+            result = await self._generate(
+                llm,
+                llm_cfg,
+                label=f"Summarize: {document_title}",
+                prompt=user_prompt,
+                system_prompt=system_prompt,
+                max_tokens=800,
+            )
 
             # Parse JSON response
             parsed = self._parse_response(result.text)
@@ -322,6 +327,80 @@ class DocumentSummarizer:
             logger.error(f"Failed to extract document summary: {e}")
             return self._empty_result()
 
+    async def _map_sections(
+        self,
+        llm,
+        llm_cfg,
+        chunks: list[str],
+        embeddings: list[list[float]] | None,
+        document_title: str,
+    ) -> str:
+        """Summarize each topical group of a long document; the notes become the input."""
+        config = self.input_config
+        groups = plan_map_groups(chunks, embeddings, config)
+        notes = await asyncio.gather(
+            *(
+                self._generate(
+                    llm,
+                    llm_cfg,
+                    label=f"Summarize section {number}/{len(groups)}: {document_title}",
+                    prompt=self._build_map_prompt(
+                        build_summary_input(chunks, group, config), document_title
+                    ),
+                    max_tokens=config.map_output_tokens,
+                )
+                for number, group in enumerate(groups, start=1)
+            )
+        )
+        logger.debug(f"Summarizing {document_title}: mapped {len(groups)} sections")
+        return "\n\n".join(
+            f"Section {number} notes:\n{note.text.strip()}"
+            for number, note in enumerate(notes, start=1)
+        )
+
+    async def _generate(
+        self,
+        llm,
+        llm_cfg,
+        label: str,
+        prompt: str,
+        max_tokens: int,
+        system_prompt: str | None = None,
+    ):
+        """Run one LLM call with metrics tracking."""
+        from src.core.admin_ops.application.metrics.collector import MetricsCollector
+        from src.shared.identifiers import generate_query_id
+
+        collector = MetricsCollector()
+        async with collector.track_query(generate_query_id(), "system", label) as qm:
+            qm.operation = "summarization"
+            result = await llm.generate(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                temperature=llm_cfg.temperature,
+                max_tokens=max_tokens,
+                seed=llm_cfg.seed,
+            )
+            qm.tokens_used = result.usage.total_tokens if hasattr(result, "usage") else 0
+            qm.input_tokens = result.usage.input_tokens if hasattr(result, "usage") else 0
+            qm.output_tokens = result.usage.output_tokens if hasattr(result, "usage") else 0
+            qm.cost_estimate = result.cost_estimate if hasattr(result, "cost_estimate") else 0.0
+            qm.model = result.model if hasattr(result, "model") else ""
+            qm.provider = result.provider if hasattr(result, "provider") else ""
+            qm.response = result.text[:500] if len(result.text) > 500 else result.text
+        return result
+
+    def _build_map_prompt(self, content: str, title: str) -> str:
+        """Build the per-section prompt for map-reduce summarization."""
+        return f"""Document: {title}
+
+Excerpts from one part of the document:
+
+{content}
+
+Write concise bullet-point notes of the key facts, names, dates, amounts and topics \
+in these excerpts."""
+
     def _build_system_prompt(self, max_length: int) -> str:
         """Build system prompt for LLM."""
         doc_types_sample = ", ".join(DOCUMENT_TYPES[:30]) + "..."
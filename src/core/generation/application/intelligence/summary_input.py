@@ -0,0 +1,192 @@
+"""
+Summary Input Selection
+=======================
+
+Chooses which chunks of a document the summarizer sends to the LLM.
+
+Instead of the opening chunks, the chunk embeddings computed during ingestion
+are clustered and the chunks nearest each cluster centroid are taken in turn
+until the token budget is spent, so the summary covers every topic of the
+document. Without embeddings the document is split into positional segments
+and sampled the same way.
+"""
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.core.utils.tokenizer import Tokenizer
+
+# Marks skipped parts of the document between two selected excerpts
+GAP_MARKER = "[...]"
+
+
+@dataclass
+class SummaryInputConfig:
+    """Budget for the text sent to the summarization LLM."""
+
+    # Roughly the previous 12,000 character cap
+    token_budget: int = 3000
+    max_clusters: int = 8
+    # Longest excerpt taken from a single chunk
+    chunk_token_cap: int = 600
+    # Map-reduce: documents above this many tokens are summarized per cluster
+    # group first (only when enabled for the tenant), in at most max_map_groups calls
+    map_reduce_min_tokens: int = 30000
+    max_map_groups: int = 4
+    map_output_tokens: int = 300
+
+
+def kmeans(
+    vectors: np.ndarray, k: int, iterations: int = 25, seed: int = 0
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Spherical k-means (cosine) with k-means++ seeding.
+
+    Returns (labels, centroids). Deterministic for a given seed so re-ingesting
+    a document yields the same selection.
+    """
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    points = vectors / norms
+    k = max(1, min(k, len(points)))
+
+    rng = np.random.default_rng(seed)
+    centroids = [points[rng.integers(len(points))]]
+    for _ in range(1, k):
+        distance = 1.0 - np.max(points @ np.asarray(centroids).T, axis=1)
+        distance = np.clip(distance, 0.0, None)
+        total = distance.sum()
+        if total <= 0:
+            break
+        centroids.append(points[rng.choice(len(points), p=distance / total)])
+    centers = np.asarray(centroids)
+
+    labels = np.zeros(len(points), dtype=int)
+    for iteration in range(iterations):
+        new_labels = np.argmax(points @ centers.T, axis=1)
+        if iteration and np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+        for cluster in range(len(centers)):
+            members = points[labels == cluster]
+            if len(members):
+                mean = members.mean(axis=0)
+                centers[cluster] = mean / (np.linalg.norm(mean) or 1.0)
+    return labels, centers
+
+
+def cluster_order(embeddings: Sequence[Sequence[float]], k: int) -> list[list[int]]:
+    """
+    Chunk indices grouped by cluster, nearest to the centroid first.
+
+    Larger clusters come first, so they are sampled first when the budget is tight.
+    """
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    labels, centers = kmeans(vectors, k)
+    norms = np.linalg.norm(vectors, axis=1)
+    norms[norms == 0] = 1.0
+    clusters = []
+    for cluster in range(len(centers)):
+        members = np.flatnonzero(labels == cluster)
+        if not len(members):
+            continue
+        similarity = (vectors[members] @ centers[cluster]) / norms[members]
+        clusters.append([int(i) for i in members[np.argsort(-similarity, kind="stable")]])
+    clusters.sort(key=lambda members: (-len(members), min(members)))
+    return clusters
+
+
+def segment_order(count: int, segments: int) -> list[list[int]]:
+    """Positional fallback: contiguous segments of the document, in order."""
+    bounds = np.linspace(0, count, num=max(1, min(segments, count)) + 1).astype(int)
+    return [
+        list(range(start, end))
+        for start, end in zip(bounds, bounds[1:], strict=False)
+        if end > start
+    ]
+
+
+def _usable_embeddings(embeddings: Sequence[Sequence[float]] | None, count: int) -> bool:
+    if not embeddings or len(embeddings) != count:
+        return False
+    dimensions = {len(vector) for vector in embeddings}
+    return len(dimensions) == 1 and 0 not in dimensions
+
+
+def select_chunks(
+    chunks: Sequence[str],
+    embeddings: Sequence[Sequence[float]] | None,
+    config: SummaryInputConfig,
+    count_tokens: Callable[[str], int] = Tokenizer.count_tokens,
+    candidates: Sequence[int] | None = None,
+) -> list[int]:
+    """
+    Indices (in document order) of the chunks to summarize within the budget.
+
+    Clusters are visited round-robin, each contributing its next most central
+    chunk, so every cluster is represented before any gets a second excerpt.
+    """
+    indices = list(candidates) if candidates is not None else list(range(len(chunks)))
+    costs = {i: min(count_tokens(chunks[i]), config.chunk_token_cap) for i in indices}
+    if sum(costs.values()) <= config.token_budget:
+        return indices
+
+    typical = int(np.median(list(costs.values()))) or 1
+    k = max(1, min(config.max_clusters, len(indices), config.token_budget // typical))
+    if _usable_embeddings(embeddings, len(chunks)):
+        groups = cluster_order([embeddings[i] for i in indices], k)
+    else:
+        groups = segment_order(len(indices), k)
+    groups = [[indices[i] for i in group] for group in groups]
+
+    selected: list[int] = []
+    remaining = config.token_budget
+    for rank in range(max(len(group) for group in groups)):
+        for group in groups:
+            if rank < len(group) and costs[group[rank]] <= remaining:
+                selected.append(group[rank])
+                remaining -= costs[group[rank]]
+        if remaining <= 0:
+            break
+
+    if not selected:
+        # Every chunk is over budget: truncate the most central one
+        selected.append(groups[0][0])
+    return sorted(selected)
+
+
+def build_summary_input(
+    chunks: Sequence[str], selected: Sequence[int], config: SummaryInputConfig
+) -> str:
+    """Join selected chunks in document order, marking the gaps between them."""
+    cap = min(config.chunk_token_cap, config.token_budget)
+    parts: list[str] = []
+    previous = -1
+    for index in selected:
+        if parts and index != previous + 1:
+            parts.append(GAP_MARKER)
+        parts.append(Tokenizer.truncate_to_budget(chunks[index], cap))
+        previous = index
+    return "\n\n".join(parts)
+
+
+def plan_map_groups(
+    chunks: Sequence[str],
+    embeddings: Sequence[Sequence[float]] | None,
+    config: SummaryInputConfig,
+    count_tokens: Callable[[str], int] = Tokenizer.count_tokens,
+) -> list[list[int]]:
+    """
+    Split a long document into at most ``max_map_groups`` topical groups and
+    select each group's representative chunks under the per-call budget.
+    """
+    if _usable_embeddings(embeddings, len(chunks)):
+        groups = cluster_order(embeddings, config.max_map_groups)
+    else:
+        groups = segment_order(len(chunks), config.max_map_groups)
+    return [
+        select_chunks(chunks, embeddings, config, count_tokens, candidates=sorted(group))
+        for group in groups
+    ]
@@ -121,14 +121,12 @@ class MemoryExtractor:
                 logger.warning(f"Failed to parse fact extraction JSON: {result}")
                 return []
 
-            # 4. Save valid facts
-            saved_facts = []
-            for fact in facts:
-                if isinstance(fact, str) and len(fact) > 5:
-                    await memory_manager.add_user_fact(
-                        tenant_id=tenant_id, user_id=user_id, content=fact, metadata=metadata
-                    )
-                    saved_facts.append(fact)
+            # 4. Save valid facts (one transaction, near-duplicates skipped)
+            valid = [fact for fact in facts if isinstance(fact, str) and len(fact) > 5]
+            saved = await memory_manager.add_user_facts(
+                tenant_id=tenant_id, user_id=user_id, contents=valid, metadata=metadata
+            )
+            saved_facts = [fact.content for fact in saved]
 
             if saved_facts:
                 logger.info(f"Extracted {len(saved_facts)} facts for user {user_id}: {saved_facts}")
@@ -5,8 +5,14 @@ Conversation Memory Manager
 Ports the Layered Memory System from the Reference codebase.
 Manages persistent user facts and conversation summaries for context-aware retrieval.
 Enforces strict Tenant Isolation.
+
+Facts and summaries are embedded with the tenant's embedding model when
+saved. At query time the memories most similar to the query (with recency
+decay) are selected under a token budget instead of injecting the most recent
+ones. Memories without a comparable embedding are embedded in the background.
 """
 
+import asyncio
 import logging
 from typing import Any
 from uuid import uuid4
@@ -14,7 +20,27 @@ from uuid import uuid4
 from sqlalchemy import desc, select
 
 from src.core.database import get_session_maker
+from src.core.generation.application.memory.ranking import (
+    RankingConfig,
+    RelevantMemory,
+    cosine_similarities,
+    fit_budget,
+    normalize_fact,
+    select_memories,
+    summary_text,
+)
 from src.core.generation.domain.memory_models import ConversationSummary, UserFact
+from src.core.generation.domain.ports.provider_factory import (
+    build_provider_factory,
+    get_embedding_provider,
+    get_provider_factory,
+)
+from src.core.generation.domain.ports.providers import EmbeddingProviderPort
+from src.core.tenants.application.tenant_config_cache import (
+    derive_from_config,
+    get_tenant_config_snapshot,
+)
+from src.core.utils.tokenizer import Tokenizer
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +54,43 @@ class ConversationMemoryManager:
     2. Conversation Summaries: Summarized history of past interactions.
     """
 
+    # Most recent memories considered for ranking and duplicate checks
+    FACT_CANDIDATES = 500
+    SUMMARY_CANDIDATES = 100
+    # Memories embedded per provider call when backfilling
+    BACKFILL_BATCH = 64
+
+    def __init__(self, ranking: RankingConfig | None = None):
+        self.ranking = ranking or RankingConfig()
+        self._backfilling: set[tuple[str, str]] = set()
+        self._background: set[asyncio.Task] = set()
+
+    async def _embedding_provider(self, tenant_id: str) -> EmbeddingProviderPort:
+        """The tenant's embedding provider (memoized on its config snapshot)."""
+        snapshot = await get_tenant_config_snapshot(tenant_id)
+        provider_name = snapshot.get("embedding_provider")
+        model = snapshot.get("embedding_model")
+        ollama_url = snapshot.get("ollama_base_url")
+        if not (provider_name or model or ollama_url):
+            return get_embedding_provider()
+        return derive_from_config(
+            snapshot,
+            ("memory_embedding_provider", provider_name, model, ollama_url),
+            lambda: _build_embedding_provider(provider_name, model, ollama_url),
+        )
+
+    async def _embed(
+        self, texts: list[str], tenant_id: str
+    ) -> tuple[list[list[float]], str] | None:
+        """Embed texts in one provider call; None when embeddings are unavailable."""
+        try:
+            provider = await self._embedding_provider(tenant_id)
+            result = await provider.embed(texts)
+        except Exception as e:
+            logger.warning(f"Memory embeddings unavailable for tenant {tenant_id}: {e}")
+            return None
+        return result.embeddings, result.model
+
     async def add_user_fact(
         self,
         tenant_id: str,
@@ -40,6 +103,7 @@ class ConversationMemoryManager:
         Add a new permanent fact about the user.
         """
         fact_id = f"fact_{uuid4().hex[:12]}"
+        embedded = await self._embed([content], tenant_id)
 
         async with get_session_maker()() as session:
             try:
@@ -50,6 +114,8 @@ class ConversationMemoryManager:
                     content=content,
                     importance=importance,
                     metadata_=metadata or {},
+                    embedding=embedded[0][0] if embedded else None,
+                    embedding_model=embedded[1] if embedded else None,
                 )
                 session.add(fact)
                 await session.commit()
@@ -61,6 +127,216 @@ class ConversationMemoryManager:
                 await session.rollback()
                 raise
 
+    async def add_user_facts(
+        self,
+        tenant_id: str,
+        user_id: str,
+        contents: list[str],
+        importance: float = 0.5,
+        metadata: dict[str, Any] | None = None,
+    ) -> list[UserFact]:
+        """
+        Add several facts in one transaction, skipping near-duplicates.
+
+        A fact is skipped when its normalized text matches, or its embedding is
+        at least ``duplicate_threshold`` similar to, an existing fact of the
+        user or an earlier fact of the same call.
+        """
+        candidates: dict[str, str] = {}
+        for content in contents:
+            key = normalize_fact(content)
+            if key and key not in candidates:
+                candidates[key] = content.strip()
+        if not candidates:
+            return []
+
+        texts = list(candidates.values())
+        embedded = await self._embed(texts, tenant_id)
+        model = embedded[1] if embedded else None
+
+        async with get_session_maker()() as session:
+            try:
+                result = await session.execute(
+                    select(UserFact.content, UserFact.embedding, UserFact.embedding_model)
+                    .where(UserFact.tenant_id == tenant_id)
+                    .where(UserFact.user_id == user_id)
+                    .order_by(desc(UserFact.created_at))
+                    .limit(self.FACT_CANDIDATES)
+                )
+                existing = result.all()
+                seen = {normalize_fact(row.content) for row in existing}
+                known = [
+                    row.embedding
+                    for row in existing
+                    if model and row.embedding and row.embedding_model == model
+                ]
+
+                facts: list[UserFact] = []
+                for index, content in enumerate(texts):
+                    key = normalize_fact(content)
+                    vector = embedded[0][index] if embedded else None
+                    if key in seen or (
+                        vector is not None
+                        and known
+                        and cosine_similarities(vector, known).max()
+                        >= self.ranking.duplicate_threshold
+                    ):
+                        logger.debug(f"Skipping duplicate fact for user {user_id}: {content}")
+                        continue
+
+                    fact = UserFact(
+                        id=f"fact_{uuid4().hex[:12]}",
+                        tenant_id=tenant_id,
+                        user_id=user_id,
+                        content=content,
+                        importance=importance,
+                        metadata_=metadata or {},
+                        embedding=vector,
+                        embedding_model=model if vector is not None else None,
+                    )
+                    session.add(fact)
+                    facts.append(fact)
+                    seen.add(key)
+                    if vector is not None:
+                        known.append(vector)
+
+                if facts:
+                    await session.commit()
+                    logger.info(
+                        f"Added {len(facts)} user facts for user {user_id} (tenant {tenant_id})"
+                    )
+                return facts
+            except Exception as e:
+                logger.error(f"Failed to add user facts: {e}")
+                await session.rollback()
+                raise
+
+    async def get_relevant_memory(
+        self,
+        tenant_id: str,
+        user_id: str,
+        query: str,
+        config: RankingConfig | None = None,
+    ) -> RelevantMemory:
+        """
+        Facts and summaries most relevant to ``query``, within the token budget.
+
+        Only the query is embedded inline. Memories saved before embeddings
+        existed, or embedded with another model, are left out of the ranking
+        and embedded in the background for later recalls. Without an embedding
+        provider, or with nothing comparable yet, falls back to the most
+        important and most recent memories.
+        """
+        config = config or self.ranking
+        async with get_session_maker()() as session:
+            facts = list(
+                (
+                    await session.execute(
+                        select(UserFact)
+                        .where(UserFact.tenant_id == tenant_id)
+                        .where(UserFact.user_id == user_id)
+                        .order_by(desc(UserFact.created_at))
+                        .limit(self.FACT_CANDIDATES)
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            summaries = list(
+                (
+                    await session.execute(
+                        select(ConversationSummary)
+                        .where(ConversationSummary.tenant_id == tenant_id)
+                        .where(ConversationSummary.user_id == user_id)
+                        .order_by(desc(ConversationSummary.created_at))
+                        .limit(self.SUMMARY_CANDIDATES)
+                    )
+                )
+                .scalars()
+                .all()
+            )
+        if not facts and not summaries:
+            return RelevantMemory()
+
+        embedded = await self._embed([query], tenant_id)
+        if embedded is None:
+            return _recent_memory(facts, summaries, config)
+
+        vectors, model = embedded
+        query_vector = vectors[0]
+
+        def comparable(memory: UserFact | ConversationSummary) -> bool:
+            return (
+                bool(memory.embedding)
+                and memory.embedding_model == model
+                and len(memory.embedding) == len(query_vector)
+            )
+
+        pending = [m for m in (*facts, *summaries) if not comparable(m)]
+        if pending:
+            self._schedule_backfill(tenant_id, user_id, pending)
+
+        ranked_facts = [(f, f.embedding) for f in facts if comparable(f)]
+        ranked_summaries = [(s, s.embedding) for s in summaries if comparable(s)]
+        if not ranked_facts and not ranked_summaries:
+            return _recent_memory(facts, summaries, config)
+        return select_memories(
+            query_vector, ranked_facts, ranked_summaries, Tokenizer.count_tokens, config
+        )
+
+    def _schedule_backfill(
+        self, tenant_id: str, user_id: str, memories: list[UserFact | ConversationSummary]
+    ) -> None:
+        """Embed the memories off the request path (one run per user at a time)."""
+        key = (tenant_id, user_id)
+        if key in self._backfilling:
+            return
+        self._backfilling.add(key)
+        fact_ids = [m.id for m in memories if isinstance(m, UserFact)]
+        summary_ids = [m.id for m in memories if isinstance(m, ConversationSummary)]
+        task = asyncio.create_task(self._backfill_embeddings(tenant_id, fact_ids, summary_ids))
+        self._background.add(task)
+
+        def _done(done: asyncio.Task) -> None:
+            self._background.discard(done)
+            self._backfilling.discard(key)
+
+        task.add_done_callback(_done)
+
+    async def _backfill_embeddings(
+        self, tenant_id: str, fact_ids: list[str], summary_ids: list[str]
+    ) -> None:
+        try:
+            async with get_session_maker()() as session:
+                memories: list[UserFact | ConversationSummary] = []
+                if fact_ids:
+                    result = await session.execute(
+                        select(UserFact)
+                        .where(UserFact.tenant_id == tenant_id)
+                        .where(UserFact.id.in_(fact_ids))
+                    )
+                    memories += result.scalars().all()
+                if summary_ids:
+                    result = await session.execute(
+                        select(ConversationSummary)
+                        .where(ConversationSummary.tenant_id == tenant_id)
+                        .where(ConversationSummary.id.in_(summary_ids))
+                    )
+                    memories += result.scalars().all()
+
+                for start in range(0, len(memories), self.BACKFILL_BATCH):
+                    batch = memories[start : start + self.BACKFILL_BATCH]
+                    embedded = await self._embed([_memory_text(m) for m in batch], tenant_id)
+                    if embedded is None:
+                        break
+                    for memory, vector in zip(batch, embedded[0], strict=True):
+                        memory.embedding, memory.embedding_model = vector, embedded[1]
+                    # Commit per batch so a later failure keeps the earlier ones
+                    await session.commit()
+            logger.info(f"Backfilled embeddings of {len(memories)} memories (tenant {tenant_id})")
+        except Exception as e:
+            logger.warning(f"Failed to backfill memory embeddings for tenant {tenant_id}: {e}")
+
     async def get_user_facts(self, tenant_id: str, user_id: str, limit: int = 20) -> list[UserFact]:
         """
         Retrieve top user facts, strictly filtered by tenant_id.
@@ -88,6 +364,8 @@ class ConversationMemoryManager:
         """
         Persist a summary of a completed conversation.
         """
+        embedded = await self._embed([summary_text(title, summary)], tenant_id)
+
         async with get_session_maker()() as session:
             try:
                 # Upsert logic could be added here, but for now we assume unique ID or new entry
@@ -98,6 +376,8 @@ class ConversationMemoryManager:
                     title=title,
                     summary=summary,
                     metadata_=metadata or {},
+                    embedding=embedded[0][0] if embedded else None,
+                    embedding_model=embedded[1] if embedded else None,
                 )
                 session.add(conv_summary)
                 await session.commit()
@@ -173,5 +453,45 @@ class ConversationMemoryManager:
                 raise
 
 
+def _build_embedding_provider(
+    provider_name: str | None, model: str | None, ollama_url: str | None
+) -> EmbeddingProviderPort:
+    from src.shared.kernel.runtime import get_settings
+
+    settings = get_settings()
+    try:
+        factory = build_provider_factory(
+            openai_api_key=settings.openai_api_key,
+            anthropic_api_key=settings.anthropic_api_key,
+            ollama_base_url=ollama_url or settings.ollama_base_url,
+        )
+    except RuntimeError:
+        factory = get_provider_factory()
+    return factory.get_embedding_provider(
+        provider_name=provider_name or settings.default_embedding_provider,
+        model=model or settings.default_embedding_model,
+    )
+
+
+def _recent_memory(
+    facts: list[UserFact], summaries: list[ConversationSummary], config: RankingConfig
+) -> RelevantMemory:
+    """The most important and most recent memories, within the token budget."""
+    facts = sorted(facts, key=lambda f: (f.importance or 0, f.created_at), reverse=True)
+    return fit_budget(
+        RelevantMemory(
+            facts=facts[: config.fact_limit], summaries=summaries[: config.summary_limit]
+        ),
+        Tokenizer.count_tokens,
+        config.token_budget,
+    )
+
+
+def _memory_text(memory: UserFact | ConversationSummary) -> str:
+    if isinstance(memory, UserFact):
+        return memory.content
+    return summary_text(memory.title, memory.summary)
+
+
 # Global Instance
 memory_manager = ConversationMemoryManager()
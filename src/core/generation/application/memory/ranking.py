@@ -0,0 +1,158 @@
+"""
+Memory Ranking
+==============
+
+Selects the user memories worth spending prompt tokens on: cosine similarity
+to the current query, decayed by age, cut off by a similarity floor, per-kind
+limits and a shared token budget.
+"""
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+import numpy as np
+
+from src.core.generation.domain.memory_models import ConversationSummary, UserFact
+
+
+@dataclass
+class RankingConfig:
+    """Knobs for relevance-ranked memory recall."""
+
+    fact_limit: int = 5
+    summary_limit: int = 3
+    token_budget: int = 600
+    # Below this cosine similarity a memory is treated as unrelated to the query
+    min_similarity: float = 0.3
+    # Age at which the recency weight halves, and the weight never decays below
+    half_life_days: float = 30.0
+    recency_floor: float = 0.5
+    # Cosine similarity at or above which a new fact repeats an existing one
+    duplicate_threshold: float = 0.92
+
+
+@dataclass
+class RelevantMemory:
+    """Memories selected for one prompt, best first within each kind."""
+
+    facts: list[UserFact] = field(default_factory=list)
+    summaries: list[ConversationSummary] = field(default_factory=list)
+
+    def to_prompt(self) -> str:
+        parts = []
+        if self.facts:
+            parts.append("USER FACTS:\n" + "\n".join(fact_line(f) for f in self.facts))
+        if self.summaries:
+            parts.append(
+                "PAST CONVERSATIONS:\n" + "\n".join(summary_line(s) for s in self.summaries)
+            )
+        return "\n\n".join(parts)
+
+
+def fact_line(fact: UserFact) -> str:
+    return f"- {fact.content}"
+
+
+def summary_line(summary: ConversationSummary) -> str:
+    return f"- {summary.title}: {summary.summary}"
+
+
+def summary_text(title: str, summary: str) -> str:
+    """Text embedded for a conversation summary."""
+    return f"{title}: {summary}"
+
+
+def normalize_fact(content: str) -> str:
+    return " ".join(content.lower().split()).rstrip(".")
+
+
+def cosine_similarities(query: Sequence[float], vectors: Sequence[Sequence[float]]) -> np.ndarray:
+    """Cosine similarity of ``query`` to each row of ``vectors``."""
+    if not len(vectors):
+        return np.zeros(0)
+    matrix = np.asarray(vectors, dtype=np.float32)
+    q = np.asarray(query, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1) * (np.linalg.norm(q) or 1.0)
+    norms[norms == 0] = 1.0
+    return (matrix @ q) / norms
+
+
+def recency_weight(
+    created_at: datetime | None, now: datetime, half_life_days: float, floor: float
+) -> float:
+    if created_at is None or half_life_days <= 0:
+        return 1.0
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=UTC)
+    age_days = max(0.0, (now - created_at).total_seconds() / 86400)
+    return max(floor, 0.5 ** (age_days / half_life_days))
+
+
+def select_memories(
+    query_embedding: Sequence[float],
+    facts: Sequence[tuple[UserFact, Sequence[float]]],
+    summaries: Sequence[tuple[ConversationSummary, Sequence[float]]],
+    count_tokens: Callable[[str], int],
+    config: RankingConfig,
+    now: datetime | None = None,
+) -> RelevantMemory:
+    """
+    Pick the highest scoring facts and summaries that fit the token budget.
+
+    Score is similarity times recency weight. Candidates are taken in score
+    order across both kinds; one that does not fit the remaining budget is
+    skipped so a shorter, lower scoring memory can still be used.
+    """
+    now = now or datetime.now(UTC)
+    scored: list[tuple[float, str, UserFact | ConversationSummary]] = []
+    for kind, items in (("fact", facts), ("summary", summaries)):
+        if not items:
+            continue
+        similarities = cosine_similarities(query_embedding, [vector for _, vector in items])
+        for (item, _), similarity in zip(items, similarities, strict=True):
+            if similarity < config.min_similarity:
+                continue
+            weight = recency_weight(
+                item.created_at, now, config.half_life_days, config.recency_floor
+            )
+            scored.append((float(similarity) * weight, kind, item))
+
+    scored.sort(key=lambda entry: entry[0], reverse=True)
+    selected = RelevantMemory()
+    remaining = config.token_budget
+    for _, kind, item in scored:
+        if kind == "fact":
+            if len(selected.facts) >= config.fact_limit:
+                continue
+            cost = count_tokens(fact_line(item))
+            if cost <= remaining:
+                selected.facts.append(item)
+                remaining -= cost
+        else:
+            if len(selected.summaries) >= config.summary_limit:
+                continue
+            cost = count_tokens(summary_line(item))
+            if cost <= remaining:
+                selected.summaries.append(item)
+                remaining -= cost
+    return selected
+
+
+def fit_budget(
+    memory: RelevantMemory, count_tokens: Callable[[str], int], token_budget: int
+) -> RelevantMemory:
+    """Trim an already ordered selection to the token budget (facts first)."""
+    fitted = RelevantMemory()
+    remaining = token_budget
+    for fact in memory.facts:
+        cost = count_tokens(fact_line(fact))
+        if cost <= remaining:
+            fitted.facts.append(fact)
+            remaining -= cost
+    for summary in memory.summaries:
+        cost = count_tokens(summary_line(summary))
+        if cost <= remaining:
+            fitted.summaries.append(summary)
+            remaining -= cost
+    return fitted
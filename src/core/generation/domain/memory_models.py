@@ -8,7 +8,7 @@ Database models for the Layered Memory System (User Facts and Conversation Summa
 from typing import Any
 
 from sqlalchemy import Float, Index, String, Text
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.shared.kernel.models.base import Base, TimestampMixin
@@ -38,6 +38,10 @@ class UserFact(Base, TimestampMixin):
         "metadata", JSONB, server_default="{}", nullable=False
     )
 
+    # Content embedding computed at save time for relevance-ranked recall
+    embedding: Mapped[list[float] | None] = mapped_column(ARRAY(Float), nullable=True)
+    embedding_model: Mapped[str | None] = mapped_column(String, nullable=True)
+
     # Index for retrieval by user within a tenant
     __table_args__ = (Index("ix_user_facts_tenant_user", "tenant_id", "user_id"),)
 
@@ -67,6 +71,10 @@ class ConversationSummary(Base, TimestampMixin):
         "metadata", JSONB, server_default="{}", nullable=False
     )
 
+    # Title + summary embedding computed at save time for relevance-ranked recall
+    embedding: Mapped[list[float] | None] = mapped_column(ARRAY(Float), nullable=True)
+    embedding_model: Mapped[str | None] = mapped_column(String, nullable=True)
+
     __table_args__ = (
         Index("ix_conv_summaries_tenant_user_date", "tenant_id", "user_id", "created_at"),
     )
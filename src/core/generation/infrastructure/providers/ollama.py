@@ -134,7 +134,7 @@ class OllamaLLMProvider(BaseLLMProvider):
         start_time = time.perf_counter()
 
         work_class = kwargs.pop("work_class", "ingestion")
-        limiter = get_ollama_capacity_limiter()
+        limiter = get_ollama_capacity_limiter(self.config.base_url)
 
         # Build messages
         messages: list[dict[str, Any]] = []
@@ -175,7 +175,7 @@ class OllamaLLMProvider(BaseLLMProvider):
                     provider=self.provider_name,
                     model=model,
                     retry_after=1.0,
-                )
+                ) from e
 
             elapsed_ms = (time.perf_counter() - start_time) * 1000
 
@@ -271,11 +271,11 @@ class OllamaLLMProvider(BaseLLMProvider):
         tool_choice: Any | None = "auto",
         **kwargs: Any,
     ) -> Any:
-        """Direct chat completion with tool support."""
-        model = self.default_model
+        """Direct chat completion with tool support (``stream=True`` returns the chunks)."""
+        model = kwargs.pop("model", None) or self.default_model
 
         work_class = kwargs.pop("work_class", "chat")
-        limiter = get_ollama_capacity_limiter()
+        limiter = get_ollama_capacity_limiter(self.config.base_url)
 
         # Ollama options via extra_body
         extra_body = kwargs.pop("extra_body", {}) or {}
@@ -289,6 +289,19 @@ class OllamaLLMProvider(BaseLLMProvider):
             except Exception:
                 extra_body["options"]["num_ctx"] = 32768
 
+        if kwargs.get("stream"):
+            # Hold capacity until the stream is consumed, not just until it opens
+            return self._chat_stream(
+                limiter,
+                work_class,
+                model=model,
+                messages=messages,
+                tools=tools,
+                tool_choice=tool_choice,
+                extra_body=extra_body,
+                **kwargs,
+            )
+
         try:
             try:
                 async with limiter.hold(work_class=work_class):
@@ -307,13 +320,33 @@ class OllamaLLMProvider(BaseLLMProvider):
                     provider=self.provider_name,
                     model=model,
                     retry_after=1.0,
-                )
+                ) from e
 
         except RateLimitError:
             raise
         except Exception as e:
             self._handle_error(e, model)
 
+    async def _chat_stream(self, limiter, work_class: str, model: str, **kwargs: Any):
+        try:
+            try:
+                async with limiter.hold(work_class=work_class, kind="stream") as lease:
+                    stream = await self.client.chat.completions.create(model=model, **kwargs)
+                    lease.responded()
+                    async for chunk in stream:
+                        yield chunk
+            except TimeoutError as e:
+                raise RateLimitError(
+                    str(e),
+                    provider=self.provider_name,
+                    model=model,
+                    retry_after=1.0,
+                ) from e
+
+        except RateLimitError:
+            raise
+        except Exception as e:
+            self._handle_error(e, model)
 
     async def generate_stream(
         self,
@@ -329,7 +362,7 @@ class OllamaLLMProvider(BaseLLMProvider):
         model = model or self.default_model
 
         work_class = kwargs.pop("work_class", "chat")
-        limiter = get_ollama_capacity_limiter()
+        limiter = get_ollama_capacity_limiter(self.config.base_url)
 
         messages: list[dict[str, Any]] = []
         if system_prompt:
@@ -353,7 +386,7 @@ class OllamaLLMProvider(BaseLLMProvider):
 
         try:
             try:
-                async with limiter.hold(work_class=work_class):
+                async with limiter.hold(work_class=work_class, kind="stream") as lease:
                     stream = await self.client.chat.completions.create(
                         model=model,
                         messages=messages,
@@ -364,6 +397,7 @@ class OllamaLLMProvider(BaseLLMProvider):
                         extra_body=extra_body,
                         **kwargs,
                     )
+                    lease.responded()
 
                     token_count = 0
                     async for chunk in stream:
@@ -382,7 +416,7 @@ class OllamaLLMProvider(BaseLLMProvider):
                     provider=self.provider_name,
                     model=model,
                     retry_after=1.0,
-                )
+                ) from e
 
         except RateLimitError:
             raise
@@ -485,11 +519,11 @@ class OllamaEmbeddingProvider(BaseEmbeddingProvider):
         start_time = time.perf_counter()
 
         work_class = kwargs.pop("work_class", "ingestion")
-        limiter = get_ollama_capacity_limiter()
+        limiter = get_ollama_capacity_limiter(self.config.base_url)
 
         try:
             try:
-                async with limiter.hold(work_class=work_class):
+                async with limiter.hold(work_class=work_class, kind="embed"):
                     response = await self.client.embeddings.create(
                         model=model,
                         input=texts,
@@ -500,7 +534,7 @@ class OllamaEmbeddingProvider(BaseEmbeddingProvider):
                     provider=self.provider_name,
                     model=model,
                     retry_after=1.0,
-                )
+                ) from e
 
             elapsed_ms = (time.perf_counter() - start_time) * 1000
 
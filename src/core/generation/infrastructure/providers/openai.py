@@ -224,8 +224,12 @@ class OpenAILLMProvider(BaseLLMProvider):
     ) -> Any:
         """
         Direct chat completion with tool support.
+
+        With ``stream=True`` the raw chunk stream is returned.
         """
-        model = self.default_model
+        model = kwargs.pop("model", None) or self.default_model
+        # Internal-only metadata, never sent to provider.
+        kwargs.pop("work_class", None)
 
         try:
             response = await self.client.chat.completions.create(
@@ -4,6 +4,7 @@ from typing import Any
 import igraph as ig
 import leidenalg
 
+from src.core.graph.application.explorer import mark_graph_changed
 from src.core.graph.domain.ports.graph_client import GraphClientPort
 from src.shared.identifiers import generate_community_id
 
@@ -48,6 +49,8 @@ class CommunityDetector:
 
         # 3. Persist
         await self._persist_communities(tenant_id, hierarchy)
+        # Explorer payloads carry community ids
+        await mark_graph_changed(tenant_id)
 
         count = len(hierarchy)
         logger.info(
@@ -11,6 +11,7 @@ from src.core.generation.application.prompts.community_summary import (
 from src.core.generation.domain.ports.provider_factory import ProviderFactoryPort
 from src.core.generation.domain.provider_models import ProviderTier
 from src.core.graph.domain.ports.graph_client import GraphClientPort
+from src.shared.llm_capacity import RedisLLMCapacityLimiter, capacity_limiter_for
 from src.shared.provider_models import RateLimitError
 
 logger = logging.getLogger(__name__)
@@ -130,6 +131,10 @@ class CommunitySummarizer:
         If the LLM provider rate-limits (HTTP 429 surfaced as RateLimitError), we:
         - retry those communities in the next batch
         - optionally reduce concurrency by 1 when rate limiting is significant
+
+        When the provider endpoint has a cluster-wide capacity limiter, each batch
+        runs at its current adaptive limit for community work instead, which
+        already backs off on those 429s for every worker.
         """
         # 1. Fetch ALL candidate IDs
         # For 15k communities, fetching just IDs is fine (~1MB RAM).
@@ -145,6 +150,7 @@ class CommunitySummarizer:
         community_ids = [r["id"] for r in results]
         total = len(community_ids)
         current_concurrency = max(1, int(concurrency))
+        capacity = self._capacity_limiter(tenant_config or {})
         logger.info(
             f"Found {total} communities needing summarization for tenant {tenant_id}. "
             f"Concurrency: {current_concurrency}"
@@ -185,6 +191,9 @@ class CommunitySummarizer:
             if not batch_ids:
                 break
 
+            if capacity is not None:
+                current_concurrency = await capacity.current_limit("communities")
+
             logger.info(
                 f"Processing batch {batch_num}: {len(batch_ids)} communities "
                 f"(cursor={cursor}/{total}, carry_over={len(carry_over)}, concurrency={current_concurrency})"
@@ -225,7 +234,8 @@ class CommunitySummarizer:
             rl_ratio = rl_count / max(1, len(batch_ids))
 
             if (
-                current_concurrency > 1
+                capacity is None
+                and current_concurrency > 1
                 and rl_count >= rate_limit_reduce_min
                 and rl_ratio >= rate_limit_reduce_ratio
             ):
@@ -235,6 +245,23 @@ class CommunitySummarizer:
                     f"Reducing concurrency to {current_concurrency} for next batch"
                 )
 
+    def _capacity_limiter(self, tenant_config: dict[str, Any]) -> RedisLLMCapacityLimiter | None:
+        try:
+            from src.core.generation.application.llm_steps import resolve_llm_step_config
+            from src.shared.kernel.runtime import get_settings
+
+            llm_cfg = resolve_llm_step_config(
+                tenant_config=tenant_config,
+                step_id="graph.community_summary",
+                settings=get_settings(),
+            )
+            return capacity_limiter_for(
+                llm_cfg.provider, getattr(self.factory, "ollama_base_url", None)
+            )
+        except Exception as e:
+            logger.debug(f"No capacity limiter for community summaries: {e}")
+            return None
+
     async def _fetch_community_data(self, community_id: str, tenant_id: str) -> dict[str, Any]:
         """
         Fetches entities, relationships, child community summaries, and exemplar text units.
@@ -4,9 +4,19 @@ Context Graph Writer
 
 Persists conversation traces and feedback to Neo4j for decision lineage.
 This enables querying "why" an answer was given and how feedback influences future decisions.
+
+Traces are buffered in process and written by a single background flusher:
+one transaction per flush covers every buffered turn with all its retrieved
+sources, and every buffered feedback. Lineage logging therefore never waits on
+Neo4j in the chat path and holds at most one Neo4j session at a time. When the
+buffer is full, new traces are dropped and counted rather than blocking.
 """
 
+import asyncio
 import logging
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any
 
@@ -15,6 +25,87 @@ from src.core.graph.domain.schema import NodeLabel, RelationshipType
 
 logger = logging.getLogger(__name__)
 
+CONTEXT_GRAPH_CONSTRAINTS = [
+    f"CREATE CONSTRAINT conversation_id_unique IF NOT EXISTS "
+    f"FOR (c:{NodeLabel.Conversation.value}) REQUIRE c.id IS UNIQUE",
+    f"CREATE CONSTRAINT turn_id_unique IF NOT EXISTS "
+    f"FOR (t:{NodeLabel.Turn.value}) REQUIRE t.id IS UNIQUE",
+    f"CREATE CONSTRAINT user_feedback_id_unique IF NOT EXISTS "
+    f"FOR (f:{NodeLabel.UserFeedback.value}) REQUIRE f.id IS UNIQUE",
+]
+
+# MERGE on ids keeps a retried flush idempotent
+WRITE_TURNS_QUERY = f"""
+UNWIND $turns AS turn
+MERGE (c:{NodeLabel.Conversation.value} {{id: turn.conversation_id}})
+ON CREATE SET c.tenant_id = turn.tenant_id, c.created_at = turn.created_at
+ON MATCH SET c.updated_at = turn.created_at
+MERGE (t:{NodeLabel.Turn.value} {{id: turn.id}})
+ON CREATE SET
+    t.conversation_id = turn.conversation_id,
+    t.tenant_id = turn.tenant_id,
+    t.query = turn.query,
+    t.answer = turn.answer,
+    t.model = turn.model,
+    t.latency_ms = turn.latency_ms,
+    t.created_at = turn.created_at
+MERGE (c)-[:{RelationshipType.HAS_TURN.value}]->(t)
+WITH t, turn
+UNWIND turn.sources AS source
+MATCH (ch:{NodeLabel.Chunk.value} {{id: source.chunk_id}})
+MERGE (t)-[r:{RelationshipType.RETRIEVED.value}]->(ch)
+SET r.score = source.score
+"""
+
+WRITE_FEEDBACK_QUERY = f"""
+UNWIND $feedback AS fb
+MERGE (f:{NodeLabel.UserFeedback.value} {{id: fb.id}})
+ON CREATE SET
+    f.tenant_id = fb.tenant_id,
+    f.is_positive = fb.is_positive,
+    f.comment = fb.comment,
+    f.created_at = fb.created_at
+"""
+
+LINK_FEEDBACK_TO_TURN_QUERY = f"""
+UNWIND $feedback AS fb
+MATCH (f:{NodeLabel.UserFeedback.value} {{id: fb.id}})
+MATCH (t:{NodeLabel.Turn.value} {{id: fb.turn_id}})
+MERGE (f)-[:{RelationshipType.RATES.value}]->(t)
+"""
+
+# Without a turn id, feedback rates the most recent turn of the conversation
+LINK_FEEDBACK_TO_LATEST_TURN_QUERY = f"""
+UNWIND $feedback AS fb
+MATCH (f:{NodeLabel.UserFeedback.value} {{id: fb.id}})
+CALL {{
+    WITH fb
+    MATCH (:{NodeLabel.Conversation.value} {{id: fb.conversation_id}})
+          -[:{RelationshipType.HAS_TURN.value}]->(t:{NodeLabel.Turn.value})
+    RETURN t ORDER BY t.created_at DESC LIMIT 1
+}}
+MERGE (f)-[:{RelationshipType.RATES.value}]->(t)
+"""
+
+
+@dataclass
+class _Trace:
+    kind: str  # "turn" | "feedback"
+    payload: dict[str, Any]
+    attempts: int = 0
+
+
+@dataclass
+class ContextWriterStats:
+    """Counters for buffered lineage writes."""
+
+    enqueued: int = 0
+    written: int = 0
+    dropped: int = 0
+    failed_flushes: int = 0
+    flushes: int = 0
+    dropped_by_kind: dict[str, int] = field(default_factory=lambda: {"turn": 0, "feedback": 0})
+
 
 class ContextGraphWriter:
     """
@@ -25,8 +116,33 @@ class ContextGraphWriter:
     - Turn nodes: Individual query/answer pairs with metadata
     - RETRIEVED relationships: Links turns to the chunks that were used
     - UserFeedback nodes: User ratings linked to turns
+
+    ``log_turn`` and ``log_feedback`` only enqueue; a background task flushes
+    every ``flush_interval`` seconds or as soon as ``batch_size`` traces are
+    pending. At most ``max_pending`` traces are buffered.
     """
 
+    def __init__(
+        self,
+        batch_size: int = 200,
+        flush_interval: float = 2.0,
+        max_pending: int = 10_000,
+        max_attempts: int = 3,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+        self.stats = ContextWriterStats()
+        self._pending: deque[_Trace] = deque()
+        self._wakeup: asyncio.Event | None = None
+        self._flusher: asyncio.Task | None = None
+        self._flush_lock: asyncio.Lock | None = None
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
     async def log_turn(
         self,
         conversation_id: str,
@@ -39,7 +155,7 @@ class ContextGraphWriter:
         latency_ms: float | None = None,
     ) -> str | None:
         """
-        Log a conversation turn to the Context Graph.
+        Queue a conversation turn for the Context Graph.
 
         Args:
             conversation_id: Unique ID for the conversation thread
@@ -52,88 +168,25 @@ class ContextGraphWriter:
             latency_ms: Total latency
 
         Returns:
-            Turn node ID if successful, None otherwise
+            Turn node ID if queued, None if the buffer is full
         """
-        import uuid
-
         turn_id = str(uuid.uuid4())
-        timestamp = datetime.now(UTC).isoformat()
-
-        try:
-            graph_client = get_graph_client()
-            await graph_client.connect()
-
-            # 1. Create or merge Conversation node
-            await graph_client.execute_write(
-                f"""
-                MERGE (c:{NodeLabel.Conversation.value} {{id: $conv_id}})
-                ON CREATE SET c.tenant_id = $tenant_id, c.created_at = $ts
-                ON MATCH SET c.updated_at = $ts
-                """,
-                {"conv_id": conversation_id, "tenant_id": tenant_id, "ts": timestamp},
-            )
-
-            # 2. Create Turn node
-            await graph_client.execute_write(
-                f"""
-                CREATE (t:{NodeLabel.Turn.value} {{
-                    id: $turn_id,
-                    conversation_id: $conv_id,
-                    tenant_id: $tenant_id,
-                    query: $query,
-                    answer: $answer,
-                    model: $model,
-                    latency_ms: $latency,
-                    created_at: $ts
-                }})
-                """,
-                {
-                    "turn_id": turn_id,
-                    "conv_id": conversation_id,
-                    "tenant_id": tenant_id,
-                    "query": query[:500],
-                    "answer": answer[:1000],
-                    "model": model or "unknown",
-                    "latency": latency_ms or 0,
-                    "ts": timestamp,
-                },
-            )
-
-            # 3. Link Conversation -> Turn
-            await graph_client.execute_write(
-                f"""
-                MATCH (c:{NodeLabel.Conversation.value} {{id: $conv_id}})
-                MATCH (t:{NodeLabel.Turn.value} {{id: $turn_id}})
-                MERGE (c)-[:{RelationshipType.HAS_TURN.value}]->(t)
-                """,
-                {"conv_id": conversation_id, "turn_id": turn_id},
-            )
-
-            # 4. Link Turn -> Retrieved Chunks (Decision Trace)
-            if sources:
-                for source in sources:
-                    chunk_id = source.get("chunk_id")
-                    if chunk_id:
-                        await graph_client.execute_write(
-                            f"""
-                            MATCH (t:{NodeLabel.Turn.value} {{id: $turn_id}})
-                            MATCH (c:{NodeLabel.Chunk.value} {{id: $chunk_id}})
-                            MERGE (t)-[r:{RelationshipType.RETRIEVED.value}]->(c)
-                            SET r.score = $score
-                            """,
-                            {
-                                "turn_id": turn_id,
-                                "chunk_id": chunk_id,
-                                "score": source.get("score", 0.0),
-                            },
-                        )
-
-            logger.debug(f"Logged turn {turn_id} to Context Graph")
-            return turn_id
-
-        except Exception as e:
-            logger.warning(f"Failed to log turn to Context Graph: {e}")
-            return None
+        payload = {
+            "id": turn_id,
+            "conversation_id": conversation_id,
+            "tenant_id": tenant_id,
+            "query": query[:500],
+            "answer": answer[:1000],
+            "model": model or "unknown",
+            "latency_ms": latency_ms or 0,
+            "created_at": datetime.now(UTC).isoformat(),
+            "sources": [
+                {"chunk_id": s["chunk_id"], "score": s.get("score", 0.0)}
+                for s in sources or []
+                if s.get("chunk_id")
+            ],
+        }
+        return turn_id if self._enqueue(_Trace("turn", payload)) else None
 
     async def log_feedback(
         self,
@@ -145,7 +198,7 @@ class ContextGraphWriter:
         feedback_id: str | None = None,
     ) -> str | None:
         """
-        Log user feedback to the Context Graph.
+        Queue user feedback for the Context Graph.
 
         Links feedback to the specific turn if turn_id is provided,
         otherwise links to the most recent turn in the conversation.
@@ -159,65 +212,145 @@ class ContextGraphWriter:
             feedback_id: Optional existing feedback ID from Postgres
 
         Returns:
-            Feedback node ID if successful, None otherwise
+            Feedback node ID if queued, None if the buffer is full
         """
-        import uuid
-
         fb_id = feedback_id or str(uuid.uuid4())
-        timestamp = datetime.now(UTC).isoformat()
+        payload = {
+            "id": fb_id,
+            "conversation_id": conversation_id,
+            "turn_id": turn_id,
+            "tenant_id": tenant_id,
+            "is_positive": is_positive,
+            "comment": comment or "",
+            "created_at": datetime.now(UTC).isoformat(),
+        }
+        return fb_id if self._enqueue(_Trace("feedback", payload)) else None
+
+    def _enqueue(self, trace: _Trace) -> bool:
+        if len(self._pending) >= self.max_pending:
+            self._drop([trace])
+            return False
+
+        self._pending.append(trace)
+        self.stats.enqueued += 1
+        self._ensure_flusher()
+        if len(self._pending) >= self.batch_size and self._wakeup is not None:
+            self._wakeup.set()
+        return True
+
+    def _drop(self, traces: list[_Trace]) -> None:
+        self.stats.dropped += len(traces)
+        for trace in traces:
+            self.stats.dropped_by_kind[trace.kind] += 1
+        # Log the first drop and then every 1000th to avoid flooding
+        if self.stats.dropped == len(traces) or self.stats.dropped % 1000 < len(traces):
+            logger.warning(
+                f"Context Graph buffer full or unavailable; dropped {self.stats.dropped} "
+                f"traces so far"
+            )
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is not None and not self._flusher.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No running loop: flushed by the next call or at shutdown
+            return
+        self._wakeup = asyncio.Event()
+        self._flusher = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        while self._pending:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Write buffered traces in batches; returns the number written."""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        written = 0
+        async with self._flush_lock:
+            while self._pending:
+                batch = [
+                    self._pending.popleft()
+                    for _ in range(min(self.batch_size, len(self._pending)))
+                ]
+                try:
+                    ok = await self._write_batch(batch)
+                except asyncio.CancelledError:
+                    self._pending.extendleft(reversed(batch))
+                    raise
+                if not ok:
+                    self._requeue(batch)
+                    break
+                written += len(batch)
+        return written
+
+    async def _write_batch(self, batch: list[_Trace]) -> bool:
+        turns = [t.payload for t in batch if t.kind == "turn"]
+        feedback = [t.payload for t in batch if t.kind == "feedback"]
+
+        # Turns first so feedback can rate turns from the same batch
+        statements: list[tuple[str, dict[str, Any] | None]] = []
+        if turns:
+            statements.append((WRITE_TURNS_QUERY, {"turns": turns}))
+        if feedback:
+            statements.append((WRITE_FEEDBACK_QUERY, {"feedback": feedback}))
+            by_turn = [f for f in feedback if f["turn_id"]]
+            latest = [f for f in feedback if not f["turn_id"]]
+            if by_turn:
+                statements.append((LINK_FEEDBACK_TO_TURN_QUERY, {"feedback": by_turn}))
+            if latest:
+                statements.append((LINK_FEEDBACK_TO_LATEST_TURN_QUERY, {"feedback": latest}))
 
         try:
             graph_client = get_graph_client()
             await graph_client.connect()
-
-            # Create UserFeedback node
-            await graph_client.execute_write(
-                f"""
-                CREATE (f:{NodeLabel.UserFeedback.value} {{
-                    id: $fb_id,
-                    tenant_id: $tenant_id,
-                    is_positive: $is_positive,
-                    comment: $comment,
-                    created_at: $ts
-                }})
-                """,
-                {
-                    "fb_id": fb_id,
-                    "tenant_id": tenant_id,
-                    "is_positive": is_positive,
-                    "comment": comment or "",
-                    "ts": timestamp,
-                },
-            )
-
-            # Link Feedback -> Turn
-            if turn_id:
-                await graph_client.execute_write(
-                    f"""
-                    MATCH (f:{NodeLabel.UserFeedback.value} {{id: $fb_id}})
-                    MATCH (t:{NodeLabel.Turn.value} {{id: $turn_id}})
-                    MERGE (f)-[:{RelationshipType.RATES.value}]->(t)
-                    """,
-                    {"fb_id": fb_id, "turn_id": turn_id},
-                )
+            if hasattr(graph_client, "execute_write_batch"):
+                await graph_client.execute_write_batch(statements)
             else:
-                # Find most recent turn in conversation and link
-                await graph_client.execute_write(
-                    f"""
-                    MATCH (f:{NodeLabel.UserFeedback.value} {{id: $fb_id}})
-                    MATCH (c:{NodeLabel.Conversation.value} {{id: $conv_id}})-[:{RelationshipType.HAS_TURN.value}]->(t:{NodeLabel.Turn.value})
-                    WITH f, t ORDER BY t.created_at DESC LIMIT 1
-                    MERGE (f)-[:{RelationshipType.RATES.value}]->(t)
-                    """,
-                    {"fb_id": fb_id, "conv_id": conversation_id},
-                )
-
-            logger.debug(f"Logged feedback {fb_id} to Context Graph")
-            return fb_id
-
+                for query, params in statements:
+                    await graph_client.execute_write(query, params)
         except Exception as e:
-            logger.warning(f"Failed to log feedback to Context Graph: {e}")
-            return None
+            self.stats.failed_flushes += 1
+            logger.warning(f"Failed to flush {len(batch)} traces to Context Graph: {e}")
+            return False
+
+        self.stats.flushes += 1
+        self.stats.written += len(batch)
+        logger.debug(
+            f"Flushed {len(turns)} turns and {len(feedback)} feedback to Context Graph"
+        )
+        return True
+
+    def _requeue(self, batch: list[_Trace]) -> None:
+        retry: list[_Trace] = []
+        expired: list[_Trace] = []
+        for trace in batch:
+            trace.attempts += 1
+            (retry if trace.attempts < self.max_attempts else expired).append(trace)
+
+        room = max(0, self.max_pending - len(self._pending))
+        expired.extend(retry[room:])
+        # Back to the front, keeping their original order
+        self._pending.extendleft(reversed(retry[:room]))
+        if expired:
+            self._drop(expired)
+
+    async def close(self) -> None:
+        """Stop the flusher and write whatever is still buffered."""
+        task, self._flusher = self._flusher, None
+        if task and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        await self.flush()
 
     async def get_chunk_feedback_stats(self, chunk_id: str) -> dict[str, Any]:
         """
@@ -261,3 +394,8 @@ class ContextGraphWriter:
 
 # Singleton instance
 context_graph_writer = ContextGraphWriter()
+
+
+async def shutdown_context_graph_writer() -> None:
+    """Flush buffered decision traces before the graph client closes."""
+    await context_graph_writer.close()
@@ -0,0 +1,367 @@
+"""
+Cypher Guard
+============
+
+Safe execution of LLM-written Cypher (the agent's ``query_graph`` tool).
+
+A statement is checked statically (one read-only statement, procedures and
+namespaced functions from allowlists only), scoped to the tenant by adding a ``tenant_id`` property to
+its node patterns and capped with a hard LIMIT. ``EXPLAIN`` then confirms that
+Neo4j plans it as a read with a bounded estimated cardinality before it runs
+with a transaction timeout. Results are serialized compactly under a byte
+budget and cached per (normalized query, tenant, graph version).
+
+Tenant scoping relies on relationships never crossing tenants, which holds for
+everything the graph writers create: nodes reached from a scoped node are the
+tenant's own.
+"""
+
+import json
+import logging
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from src.core.graph.application.explorer import read_graph_version
+from src.core.graph.domain.ports.graph_client import GraphClientPort, get_graph_client
+
+logger = logging.getLogger(__name__)
+
+TENANT_PARAM = "guard_tenant_id"
+
+# Read-only procedures the agent may call
+ALLOWED_PROCEDURES = frozenset({"db.labels", "db.relationshiptypes", "db.propertykeys"})
+# Namespaced functions the agent may call (built-in temporal and spatial helpers)
+ALLOWED_FUNCTIONS = frozenset(
+    {
+        "date.truncate",
+        "datetime.truncate",
+        "localdatetime.truncate",
+        "time.truncate",
+        "localtime.truncate",
+        "duration.between",
+        "duration.inmonths",
+        "duration.indays",
+        "duration.inseconds",
+        "point.distance",
+        "point.withinbbox",
+    }
+)
+
+_LEXEMES = re.compile(
+    r"(?P<string>'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\")"
+    r"|(?P<ident>`[^`]*`)"
+    r"|(?P<comment>//[^\n]*|/\*.*?\*/)",
+    re.S,
+)
+_PLACEHOLDER = re.compile(r"__lit(\d+)__")
+_FORBIDDEN = re.compile(
+    r"(?<![.\w$:])(CREATE|MERGE|DELETE|DETACH|SET|REMOVE|DROP|FOREACH|LOAD|USE|GRANT|DENY"
+    r"|REVOKE|ALTER|RENAME|SHOW|TERMINATE|START|STOP|ENABLE|DISABLE)(?!\w)",
+    re.I,
+)
+_PROCEDURE = re.compile(r"\bCALL\s+([A-Za-z_][\w.]*)", re.I)
+# Namespaced function call, e.g. apoc.cypher.runFirstColumnMany(...), whose
+# string arguments can run queries the tenant scoping never sees
+_NAMESPACED_FUNCTION = re.compile(r"\b([A-Za-z_]\w*(?:\s*\.\s*[A-Za-z_]\w*)+)\s*\(")
+_NODE_PATTERN = re.compile(
+    r"\(\s*(?P<var>[A-Za-z_]\w*)?\s*"
+    r"(?P<labels>(?::\s*[A-Za-z_]\w*\s*)*)"
+    r"(?P<props>\{[^{}]*\})?\s*\)"
+)
+# Opening of something that can only be a node pattern (label, property map or
+# inline WHERE); any such opening _NODE_PATTERN did not rewrite is rejected
+_NODE_OPENING = re.compile(
+    r"\(\s*(?:[A-Za-z_]\w*)?\s*(?::|\{|[A-Za-z_]\w*\s+WHERE\b)", re.I
+)
+# Words after which a parenthesis starts a pattern rather than a function call
+_PATTERN_KEYWORDS = frozenset(
+    {"MATCH", "WHERE", "AND", "OR", "XOR", "NOT", "RETURN", "WITH", "DISTINCT", "WHEN", "THEN"}
+    | {"ELSE"}
+)
+_TRAILING_LIMIT = re.compile(r"\bLIMIT\s+(\S+)\s*$", re.I)
+
+
+class CypherRejectedError(ValueError):
+    """The statement is not allowed or too expensive to run."""
+
+
+@dataclass
+class CypherGuardConfig:
+    max_rows: int = 50
+    max_estimated_rows: float = 250_000
+    timeout_seconds: float = 5.0
+    max_result_bytes: int = 12_000
+    max_string_chars: int = 300
+    max_list_items: int = 25
+    cache_ttl_seconds: float = 300.0
+    cache_max_entries: int = 256
+
+
+@dataclass
+class GuardedQuery:
+    cypher: str
+    row_limit: int
+
+
+def _mask(query: str) -> tuple[str, list[str]]:
+    """Replace literals and quoted identifiers with placeholders and drop comments."""
+    literals: list[str] = []
+
+    def _replace(match: re.Match) -> str:
+        if match.lastgroup == "comment":
+            return " "
+        literals.append(match.group(0))
+        return f"__lit{len(literals) - 1}__"
+
+    masked = _LEXEMES.sub(_replace, query)
+    return " ".join(masked.split()), literals
+
+
+def _unmask(masked: str, literals: list[str]) -> str:
+    return _PLACEHOLDER.sub(lambda m: literals[int(m.group(1))], masked)
+
+
+def _starts_pattern(masked: str, position: int) -> bool:
+    """Whether the parenthesis at position opens a pattern (not a function call)."""
+    prefix = masked[:position].rstrip()
+    if not prefix or not (prefix[-1].isalnum() or prefix[-1] == "_"):
+        return True
+    word = re.search(r"\w+$", prefix).group(0)
+    return word.upper() in _PATTERN_KEYWORDS
+
+
+def _scope_node_patterns(masked: str) -> str:
+    scoped: set[int] = set()
+    output: list[str] = []
+    last = 0
+    for match in _NODE_PATTERN.finditer(masked):
+        if not _starts_pattern(masked, match.start()):
+            continue
+        props = match.group("props")
+        tenant_entry = f"tenant_id: ${TENANT_PARAM}"
+        if props and props[1:-1].strip():
+            props = f"{{{props[1:-1].strip()}, {tenant_entry}}}"
+        else:
+            props = f"{{{tenant_entry}}}"
+        var = match.group("var") or ""
+        labels = "".join(match.group("labels").split())
+        output.append(masked[last : match.start()])
+        output.append(f"({var}{labels} {props})")
+        last = match.end()
+        scoped.add(match.start())
+    output.append(masked[last:])
+
+    for opening in _NODE_OPENING.finditer(masked):
+        if opening.start() not in scoped and _starts_pattern(masked, opening.start()):
+            raise CypherRejectedError(
+                "Unsupported node pattern (use plain labels like (n:Entity) and a WHERE clause)"
+            )
+    return "".join(output)
+
+
+def _apply_limit(masked: str, max_rows: int) -> str:
+    if re.search(r"\bUNION\b", masked, re.I):
+        return f"CALL {{ {masked} }} RETURN * LIMIT {max_rows}"
+    trailing = _TRAILING_LIMIT.search(masked)
+    if trailing is None:
+        return f"{masked} LIMIT {max_rows}"
+    if trailing.group(1).isdigit():
+        limit = min(int(trailing.group(1)), max_rows)
+        return f"{masked[: trailing.start()]}LIMIT {limit}"
+    # Parameter or expression limit: bound it from outside
+    return f"CALL {{ {masked} }} RETURN * LIMIT {max_rows}"
+
+
+def prepare_cypher(query: str, max_rows: int) -> GuardedQuery:
+    """
+    Validate an agent-written statement and rewrite it into its guarded form.
+
+    Raises:
+        CypherRejectedError: The statement writes, calls a disallowed procedure
+            or namespaced function, is not a single returning query or uses unsupported patterns.
+    """
+    masked, literals = _mask(query)
+    masked = masked.rstrip(";").strip()
+    if not masked:
+        raise CypherRejectedError("Empty query")
+    if ";" in masked:
+        raise CypherRejectedError("Only a single statement is allowed")
+
+    forbidden = _FORBIDDEN.search(masked)
+    if forbidden:
+        keyword = forbidden.group(1).upper()
+        raise CypherRejectedError(f"Read-only access: '{keyword}' is not allowed")
+    if re.search(r"\bIN\s+TRANSACTIONS\b", masked, re.I):
+        raise CypherRejectedError("Read-only access: CALL ... IN TRANSACTIONS is not allowed")
+    for procedure in _PROCEDURE.finditer(masked):
+        if procedure.group(1).lower() not in ALLOWED_PROCEDURES:
+            raise CypherRejectedError(f"Procedure '{procedure.group(1)}' is not allowed")
+    for function in _NAMESPACED_FUNCTION.finditer(_PROCEDURE.sub("CALL", masked)):
+        name = "".join(function.group(1).split())
+        if name.lower() not in ALLOWED_FUNCTIONS:
+            raise CypherRejectedError(f"Function '{name}' is not allowed")
+    if re.search(r"\btenant_id\b", masked):
+        raise CypherRejectedError("Do not filter on tenant_id; tenant scoping is applied for you")
+    if not re.search(r"\bRETURN\b", masked, re.I):
+        raise CypherRejectedError("The query must RETURN results")
+
+    guarded = _apply_limit(_scope_node_patterns(masked), max_rows)
+    return GuardedQuery(cypher=_unmask(guarded, literals), row_limit=max_rows)
+
+
+def max_estimated_rows(plan: dict[str, Any]) -> float:
+    """Largest EstimatedRows of any operator in an EXPLAIN plan."""
+    if not plan:
+        return 0.0
+    estimate = float((plan.get("args") or {}).get("EstimatedRows", 0) or 0)
+    for child in plan.get("children") or []:
+        estimate = max(estimate, max_estimated_rows(child))
+    return estimate
+
+
+def _compact(value: Any, config: CypherGuardConfig) -> Any:
+    if isinstance(value, str):
+        if len(value) > config.max_string_chars:
+            return value[: config.max_string_chars] + "…"
+        return value
+    if isinstance(value, dict):
+        return {key: _compact(item, config) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        if len(value) > config.max_list_items and all(
+            isinstance(item, int | float) for item in value
+        ):
+            # Embeddings and other vectors are noise to the LLM
+            return f"<{len(value)} numbers>"
+        items = [_compact(item, config) for item in value[: config.max_list_items]]
+        if len(value) > config.max_list_items:
+            items.append(f"... +{len(value) - config.max_list_items} more")
+        return items
+    return value
+
+
+def serialize_records(
+    records: list[dict[str, Any]], config: CypherGuardConfig, row_limit: int
+) -> str:
+    """Column header plus one JSON array per row, cut at the byte budget."""
+    if not records:
+        return "No results found."
+
+    columns = list(records[0].keys())
+    lines = [f"columns: {json.dumps(columns, ensure_ascii=False)}"]
+    used = len(lines[0].encode("utf-8"))
+    shown = 0
+    for record in records[:row_limit]:
+        row = [_compact(record.get(column), config) for column in columns]
+        line = json.dumps(row, ensure_ascii=False, separators=(",", ":"), default=str)
+        size = len(line.encode("utf-8")) + 1
+        if used + size > config.max_result_bytes and shown:
+            break
+        lines.append(line)
+        used += size
+        shown += 1
+
+    if shown < min(len(records), row_limit):
+        lines.append(f"[{min(len(records), row_limit) - shown} more rows omitted: output budget]")
+    if len(records) > row_limit:
+        lines.append(f"[row limit {row_limit} reached; narrow the query for complete results]")
+    return "\n".join(lines)
+
+
+class _ResultCache:
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple, tuple[float, str]] = OrderedDict()
+
+    def get(self, key: tuple) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: tuple, text: str) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, text)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class CypherGuard:
+    """
+    Runs agent Cypher under the guard rules.
+
+    Usage:
+        text = await get_cypher_guard().run("MATCH (e:Entity) RETURN e.name", tenant_id)
+    """
+
+    def __init__(
+        self,
+        graph_client: GraphClientPort | None = None,
+        config: CypherGuardConfig | None = None,
+        version_reader: Callable[[str], Awaitable[str | None]] = read_graph_version,
+    ):
+        self._graph_client = graph_client
+        self.config = config or CypherGuardConfig()
+        self._version_reader = version_reader
+        self._cache = _ResultCache(self.config.cache_max_entries, self.config.cache_ttl_seconds)
+
+    @property
+    def graph_client(self) -> GraphClientPort:
+        return self._graph_client or get_graph_client()
+
+    async def run(
+        self, query: str, tenant_id: str, parameters: dict[str, Any] | None = None
+    ) -> str:
+        """Validate, plan, execute and serialize; raises CypherRejectedError when refused."""
+        guarded = prepare_cypher(query, self.config.max_rows)
+        graph_client = self.graph_client
+        params = {**(parameters or {}), TENANT_PARAM: tenant_id}
+
+        version = await self._version_reader(tenant_id)
+        cache_key = (
+            tenant_id,
+            version,
+            guarded.cypher,
+            json.dumps(parameters or {}, sort_keys=True, default=str),
+        )
+        if version is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        planned = await graph_client.explain(guarded.cypher, params)
+        if planned.get("query_type") != "r":
+            raise CypherRejectedError("Read-only access: the statement is not a read query")
+        estimated = max_estimated_rows(planned.get("plan") or {})
+        if estimated > self.config.max_estimated_rows:
+            raise CypherRejectedError(
+                f"Query too broad (~{int(estimated)} rows estimated); "
+                "anchor it on specific entities or labels"
+            )
+
+        records = await graph_client.execute_bounded_read(
+            guarded.cypher,
+            params,
+            timeout=self.config.timeout_seconds,
+            max_rows=guarded.row_limit,
+        )
+        text = serialize_records(records, self.config, guarded.row_limit)
+        if version is not None:
+            self._cache.set(cache_key, text)
+        return text
+
+
+_cypher_guard: CypherGuard | None = None
+
+
+def get_cypher_guard() -> CypherGuard:
+    global _cypher_guard
+    if _cypher_guard is None:
+        _cypher_guard = CypherGuard()
+    return _cypher_guard
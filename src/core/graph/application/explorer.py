@@ -0,0 +1,328 @@
+"""
+Graph Explorer Read Models
+==========================
+
+Read-optimized views backing the interactive graph editor endpoints.
+
+- ``Entity.degree`` holds the number of relationships to other entities. It is
+  maintained incrementally by the graph writer and refreshed for the touched
+  entities by editor operations; ``reconcile_entity_degrees`` repairs drift
+  after bulk deletes. A ``(tenant_id, degree)`` index serves the top-N query.
+- A full-text index over entity name and description serves ranked,
+  prefix-aware search instead of a ``CONTAINS`` scan.
+- Top-node payloads are cached per process and tenant. Graph writes bump a
+  per-tenant version counter in Redis (``mark_graph_changed``); cached
+  payloads are re-validated against it before reuse.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.core.cache.decorators import get_cache_client
+from src.core.graph.domain.ports.graph_client import GraphClientPort
+from src.core.graph.domain.schema import NodeLabel
+
+logger = logging.getLogger(__name__)
+
+ENTITY_DEGREE_INDEX = "entity_tenant_degree"
+ENTITY_FULLTEXT_INDEX = "entity_search"
+GRAPH_VERSION_KEY = "graph_explorer:version:{tenant_id}"
+
+EXPLORER_INDEXES = [
+    f"CREATE INDEX {ENTITY_DEGREE_INDEX} IF NOT EXISTS "
+    f"FOR (e:{NodeLabel.Entity.value}) ON (e.tenant_id, e.degree)",
+    f"CREATE FULLTEXT INDEX {ENTITY_FULLTEXT_INDEX} IF NOT EXISTS "
+    f"FOR (e:{NodeLabel.Entity.value}) ON EACH [e.name, e.description, e.tenant_id]",
+]
+
+# Number of relationships between an entity and other entities
+ENTITY_DEGREE_EXPR = "COUNT { (e)--(:Entity) }"
+
+TOP_NODES_QUERY = """
+MATCH (e:Entity {tenant_id: $tenant_id})
+WHERE e.degree IS NOT NULL
+RETURN e.name as id, e.name as label, e.type as type, e.community as community_id,
+       e.degree as degree
+ORDER BY e.degree DESC
+LIMIT $limit
+"""
+
+SEARCH_NODES_QUERY = f"""
+CALL db.index.fulltext.queryNodes('{ENTITY_FULLTEXT_INDEX}', $lucene, {{limit: $candidates}})
+YIELD node, score
+WHERE node.tenant_id = $tenant_id
+RETURN node.name as id, node.name as label, node.type as type,
+       node.community as community_id, node.degree as degree
+ORDER BY score DESC, coalesce(node.degree, 0) DESC
+LIMIT $limit
+"""
+
+# Used when the full-text index has not been created yet
+SEARCH_NODES_SCAN_QUERY = """
+MATCH (e:Entity {tenant_id: $tenant_id})
+WHERE toLower(e.name) CONTAINS toLower($q)
+   OR toLower(e.description) CONTAINS toLower($q)
+RETURN e.name as id, e.name as label, e.type as type, e.community as community_id,
+       e.degree as degree
+LIMIT $limit
+"""
+
+REFRESH_DEGREES_QUERY = f"""
+UNWIND $names AS name
+MATCH (e:Entity {{name: name, tenant_id: $tenant_id}})
+SET e.degree = {ENTITY_DEGREE_EXPR}
+"""
+
+# After a merge the entity and every neighbour may have gained or lost edges
+REFRESH_NEIGHBORHOOD_DEGREES_QUERY = f"""
+MATCH (n:Entity {{name: $name, tenant_id: $tenant_id}})
+OPTIONAL MATCH (n)--(m:Entity)
+WITH n, collect(DISTINCT m) AS neighbors
+UNWIND [n] + neighbors AS e
+WITH DISTINCT e
+SET e.degree = {ENTITY_DEGREE_EXPR}
+"""
+
+# Deleting an entity changes the degree of each of its neighbours
+DELETE_ENTITY_QUERY = f"""
+MATCH (n:Entity {{name: $node_id, tenant_id: $tenant_id}})
+OPTIONAL MATCH (n)--(m:Entity)
+WHERE m <> n
+WITH n, collect(DISTINCT m) AS neighbors
+DETACH DELETE n
+WITH neighbors
+UNWIND neighbors AS e
+SET e.degree = {ENTITY_DEGREE_EXPR}
+"""
+
+DELETE_EDGE_QUERY = f"""
+MATCH (s:Entity {{name: $source, tenant_id: $tenant_id}})
+      -[r]->(t:Entity {{name: $target, tenant_id: $tenant_id}})
+DELETE r
+WITH DISTINCT s, t
+UNWIND [s, t] AS e
+WITH DISTINCT e
+SET e.degree = {ENTITY_DEGREE_EXPR}
+"""
+
+BACKFILL_DEGREES_QUERY = f"""
+MATCH (e:Entity)
+WHERE e.degree IS NULL
+WITH e LIMIT $batch_size
+SET e.degree = {ENTITY_DEGREE_EXPR}
+RETURN count(e) as updated
+"""
+
+RECONCILE_DEGREES_QUERY = f"""
+MATCH (e:Entity {{tenant_id: $tenant_id}})
+WITH e, {ENTITY_DEGREE_EXPR} AS actual
+WHERE e.degree IS NULL OR e.degree <> actual
+SET e.degree = actual
+RETURN count(e) as updated
+"""
+
+_LUCENE_SPECIAL = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+
+
+def _escape_lucene(term: str) -> str:
+    return _LUCENE_SPECIAL.sub(r"\\\1", term)
+
+
+def build_fulltext_query(text: str, tenant_id: str) -> str | None:
+    """
+    Lucene query for the entity full-text index.
+
+    Every term must match name or description, either exactly or as a prefix
+    (so results appear while typing); exact name matches rank highest.
+    Returns None when ``text`` has no searchable terms.
+    """
+    terms = [_escape_lucene(t) for t in text.lower().split()]
+    terms = [t for t in terms if t]
+    if not terms:
+        return None
+
+    clauses = [
+        f"(name:{t}^4 OR name:{t}*^2 OR description:{t} OR description:{t}*)" for t in terms
+    ]
+    # Narrows candidates to the tenant; the exact check happens in Cypher
+    tenant_clause = f'tenant_id:"{_escape_lucene(tenant_id)}"'
+    return " AND ".join([*clauses, tenant_clause])
+
+
+async def refresh_entity_degrees(
+    graph_client: GraphClientPort, tenant_id: str, names: list[str]
+) -> None:
+    """Recompute ``degree`` for the named entities after an edit."""
+    names = [n for n in dict.fromkeys(names) if n]
+    if names:
+        await graph_client.execute_write(
+            REFRESH_DEGREES_QUERY, {"names": names, "tenant_id": tenant_id}
+        )
+
+
+async def refresh_neighborhood_degrees(
+    graph_client: GraphClientPort, tenant_id: str, name: str
+) -> None:
+    """Recompute ``degree`` for an entity and all of its neighbours."""
+    await graph_client.execute_write(
+        REFRESH_NEIGHBORHOOD_DEGREES_QUERY, {"name": name, "tenant_id": tenant_id}
+    )
+
+
+async def backfill_entity_degrees(graph_client: GraphClientPort, batch_size: int = 5000) -> int:
+    """Set ``degree`` on entities written before it was maintained (all tenants)."""
+    total = 0
+    while True:
+        result = await graph_client.execute_write(
+            BACKFILL_DEGREES_QUERY, {"batch_size": batch_size}
+        )
+        updated = result[0]["updated"] if result else 0
+        total += updated
+        if updated < batch_size:
+            break
+    if total:
+        logger.info(f"Backfilled degree on {total} entities")
+    return total
+
+
+async def reconcile_entity_degrees(graph_client: GraphClientPort, tenant_id: str) -> int:
+    """Repair ``degree`` values that drifted (e.g. after bulk deletes)."""
+    result = await graph_client.execute_write(RECONCILE_DEGREES_QUERY, {"tenant_id": tenant_id})
+    updated = result[0]["updated"] if result else 0
+    if updated:
+        logger.info(f"Reconciled degree on {updated} entities for tenant {tenant_id}")
+    return updated
+
+
+@dataclass
+class _TopNodesEntry:
+    version: str | None
+    loaded_at: float = field(default_factory=time.monotonic)
+    checked_at: float = field(default_factory=time.monotonic)
+    payloads: dict[int, list[dict[str, Any]]] = field(default_factory=dict)
+
+
+class GraphExplorer:
+    """
+    Cached read side of the graph editor.
+
+    Usage:
+        explorer = get_graph_explorer()
+        nodes = await explorer.top_nodes(graph_client, tenant_id, limit=15)
+        hits = await explorer.search_nodes(graph_client, tenant_id, "kube", limit=10)
+    """
+
+    def __init__(
+        self,
+        revalidate_after: float = 2.0,
+        max_age: float = 300.0,
+    ):
+        self.revalidate_after = revalidate_after
+        self.max_age = max_age
+        self._entries: dict[str, _TopNodesEntry] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def top_nodes(
+        self, graph_client: GraphClientPort, tenant_id: str, limit: int = 15
+    ) -> list[dict[str, Any]]:
+        """Most connected entities of the tenant (cached until the graph changes)."""
+        entry = await self._valid_entry(tenant_id)
+        if entry is not None and limit in entry.payloads:
+            return entry.payloads[limit]
+
+        lock = self._locks.setdefault(tenant_id, asyncio.Lock())
+        async with lock:
+            entry = await self._valid_entry(tenant_id)
+            if entry is not None and limit in entry.payloads:
+                return entry.payloads[limit]
+
+            if entry is None:
+                # Read the version first so a concurrent write can only make us reload
+                entry = _TopNodesEntry(version=await self._read_version(tenant_id))
+                self._entries[tenant_id] = entry
+            nodes = await graph_client.execute_read(
+                TOP_NODES_QUERY, {"tenant_id": tenant_id, "limit": limit}
+            )
+            entry.payloads[limit] = nodes
+            return nodes
+
+    async def search_nodes(
+        self, graph_client: GraphClientPort, tenant_id: str, text: str, limit: int = 10
+    ) -> list[dict[str, Any]]:
+        """Ranked, prefix-aware entity search over name and description."""
+        lucene = build_fulltext_query(text, tenant_id)
+        if lucene is None:
+            return []
+        try:
+            return await graph_client.execute_read(
+                SEARCH_NODES_QUERY,
+                {
+                    "lucene": lucene,
+                    "tenant_id": tenant_id,
+                    "limit": limit,
+                    "candidates": min(limit * 20, 1000),
+                },
+            )
+        except Exception as e:
+            logger.warning(f"Full-text entity search unavailable, scanning instead: {e}")
+            return await graph_client.execute_read(
+                SEARCH_NODES_SCAN_QUERY, {"tenant_id": tenant_id, "q": text, "limit": limit}
+            )
+
+    async def _valid_entry(self, tenant_id: str) -> _TopNodesEntry | None:
+        entry = self._entries.get(tenant_id)
+        if entry is None:
+            return None
+        now = time.monotonic()
+        if now - entry.loaded_at > self.max_age:
+            self._entries.pop(tenant_id, None)
+            return None
+        if now - entry.checked_at <= self.revalidate_after:
+            return entry
+
+        current = await self._read_version(tenant_id)
+        if current is None or current != entry.version:
+            self._entries.pop(tenant_id, None)
+            return None
+        entry.checked_at = now
+        return entry
+
+    async def _read_version(self, tenant_id: str) -> str | None:
+        return await read_graph_version(tenant_id)
+
+    def invalidate(self, tenant_id: str | None = None) -> None:
+        """Drop cached payloads for one tenant or, with no id, all tenants."""
+        if tenant_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(tenant_id, None)
+
+
+async def read_graph_version(tenant_id: str) -> str | None:
+    """Current graph version of the tenant from Redis, or None if unavailable."""
+    try:
+        version = await get_cache_client().get(GRAPH_VERSION_KEY.format(tenant_id=tenant_id))
+    except Exception as e:
+        logger.debug(f"Graph version check unavailable: {e}")
+        return None
+    return version.decode() if isinstance(version, bytes) else str(version or 0)
+
+
+_graph_explorer = GraphExplorer()
+
+
+def get_graph_explorer() -> GraphExplorer:
+    return _graph_explorer
+
+
+async def mark_graph_changed(tenant_id: str) -> None:
+    """Bump the tenant's graph version so cached explorer payloads are reloaded everywhere."""
+    _graph_explorer.invalidate(tenant_id)
+    try:
+        await get_cache_client().incr(GRAPH_VERSION_KEY.format(tenant_id=tenant_id))
+    except Exception as e:
+        logger.warning(f"Failed to bump graph version for tenant {tenant_id}: {e}")
@@ -0,0 +1,367 @@
+"""
+Graph Garbage Collector
+=======================
+
+Per-tenant, bounded-batch removal of graph data that no longer has a source of
+truth in Postgres, and batched deletion of whole tenants.
+
+Orphaned documents and chunks are found by merging two ID streams sorted the
+same way: keyset-paginated IDs from Neo4j and the valid IDs from Postgres. Only
+one page of each side is held in memory at a time, and no ID list is shipped
+to Neo4j beyond the orphans of one batch. Every delete runs as its own short
+write transaction of at most ``batch_size`` nodes; this is the client-side
+equivalent of ``CALL { ... } IN TRANSACTIONS``, which cannot run inside the
+managed transactions the graph client uses.
+"""
+
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+
+from src.core.graph.application.explorer import mark_graph_changed, reconcile_entity_degrees
+from src.core.graph.domain.ports.graph_client import GraphClientPort
+from src.core.graph.domain.schema import NodeLabel
+
+logger = logging.getLogger(__name__)
+
+GC_INDEXES = [
+    f"CREATE INDEX chunk_tenant_id IF NOT EXISTS "
+    f"FOR (c:{NodeLabel.Chunk.value}) ON (c.tenant_id, c.id)",
+    f"CREATE INDEX document_tenant_id IF NOT EXISTS "
+    f"FOR (d:{NodeLabel.Document.value}) ON (d.tenant_id, d.id)",
+    f"CREATE INDEX entity_tenant_name IF NOT EXISTS "
+    f"FOR (e:{NodeLabel.Entity.value}) ON (e.tenant_id, e.name)",
+    f"CREATE INDEX community_tenant_id IF NOT EXISTS "
+    f"FOR (c:{NodeLabel.Community.value}) ON (c.tenant_id, c.id)",
+]
+
+# Delete order for tenant removal: leaves first keeps each batch's DETACH small
+TENANT_LABELS = [
+    NodeLabel.UserFeedback,
+    NodeLabel.Turn,
+    NodeLabel.Conversation,
+    NodeLabel.Chunk,
+    NodeLabel.Entity,
+    NodeLabel.Community,
+    NodeLabel.Document,
+]
+
+PAGE_IDS_QUERY = """
+MATCH (n:{label} {{tenant_id: $tenant_id}})
+WHERE n.{key} > $after
+RETURN n.{key} AS id
+ORDER BY n.{key}
+LIMIT $limit
+"""
+
+DELETE_BY_IDS_QUERY = """
+UNWIND $ids AS id
+MATCH (n:{label} {{{key}: id, tenant_id: $tenant_id}})
+DETACH DELETE n
+RETURN count(n) AS deleted
+"""
+
+# Entities are live while any chunk mentions them; the page read reports
+# candidates and the delete re-checks, so a concurrent ingestion wins.
+PAGE_ENTITIES_QUERY = """
+MATCH (e:Entity {tenant_id: $tenant_id})
+WHERE e.name > $after
+WITH e ORDER BY e.name LIMIT $limit
+RETURN e.name AS id, EXISTS { (:Chunk)-[:MENTIONS]->(e) } AS live
+"""
+
+DELETE_ORPHAN_ENTITIES_QUERY = """
+UNWIND $ids AS name
+MATCH (e:Entity {name: name, tenant_id: $tenant_id})
+WHERE NOT EXISTS { (:Chunk)-[:MENTIONS]->(e) }
+DETACH DELETE e
+RETURN count(e) AS deleted
+"""
+
+# A community is empty when it has neither member entities nor child
+# communities. Removing empty leaves can empty their parents, so passes repeat
+# until nothing is deleted (one pass per hierarchy level at most).
+PAGE_COMMUNITIES_QUERY = """
+MATCH (c:Community {tenant_id: $tenant_id})
+WHERE c.id > $after
+WITH c ORDER BY c.id LIMIT $limit
+RETURN c.id AS id,
+       EXISTS { (:Entity)-[:BELONGS_TO|IN_COMMUNITY]->(c) }
+       OR EXISTS { (c)-[:PARENT_OF]->(:Community) } AS live
+"""
+
+DELETE_EMPTY_COMMUNITIES_QUERY = """
+UNWIND $ids AS id
+MATCH (c:Community {id: id, tenant_id: $tenant_id})
+WHERE NOT EXISTS { (:Entity)-[:BELONGS_TO|IN_COMMUNITY]->(c) }
+  AND NOT EXISTS { (c)-[:PARENT_OF]->(:Community) }
+DETACH DELETE c
+RETURN count(c) AS deleted
+"""
+
+DELETE_TENANT_BATCH_QUERY = """
+MATCH (n:{label} {{tenant_id: $tenant_id}})
+WITH n LIMIT $batch_size
+DETACH DELETE n
+RETURN count(n) AS deleted
+"""
+
+GRAPH_TENANTS_QUERY = """
+MATCH (d:Document)
+RETURN DISTINCT d.tenant_id AS tenant_id
+"""
+
+
+class StreamOrderError(RuntimeError):
+    """An ID stream was not strictly ascending, so a merge-diff is unsafe."""
+
+
+@dataclass
+class GCProgress:
+    """Progress snapshot passed to ``on_progress`` after every batch."""
+
+    tenant_id: str
+    phase: str
+    scanned: int = 0
+    deleted: int = 0
+    elapsed_seconds: float = 0.0
+
+
+@dataclass
+class GCReport:
+    """Deleted node counts of one collection run."""
+
+    tenant_id: str
+    deleted: dict[str, int] = field(
+        default_factory=lambda: {"documents": 0, "chunks": 0, "entities": 0, "communities": 0}
+    )
+    scanned: dict[str, int] = field(default_factory=dict)
+    duration_seconds: float = 0.0
+
+    @property
+    def total_deleted(self) -> int:
+        return sum(self.deleted.values())
+
+
+ProgressCallback = Callable[[GCProgress], Awaitable[None] | None]
+
+
+async def diff_sorted(
+    candidates: AsyncIterator[str], valid: AsyncIterator[str]
+) -> AsyncIterator[str]:
+    """
+    Yield IDs of ``candidates`` that are absent from ``valid``.
+
+    Both streams must be strictly ascending under the same ordering. A stream
+    going backwards raises ``StreamOrderError`` instead of yielding IDs that
+    might be valid.
+    """
+    sentinel = object()
+
+    async def ordered(stream: AsyncIterator[str], name: str) -> AsyncIterator[str]:
+        previous: str | None = None
+        async for item in stream:
+            if previous is not None and item <= previous:
+                raise StreamOrderError(f"{name} IDs out of order: {item!r} after {previous!r}")
+            previous = item
+            yield item
+
+    candidates, valid = ordered(candidates, "graph"), ordered(valid, "source")
+    current_valid = await anext(valid, sentinel)
+    async for candidate in candidates:
+        while current_valid is not sentinel and current_valid < candidate:
+            current_valid = await anext(valid, sentinel)
+        if current_valid is sentinel or current_valid != candidate:
+            yield candidate
+
+
+async def paginate(
+    fetch_page: Callable[[str, int], Awaitable[list[str]]], page_size: int
+) -> AsyncIterator[str]:
+    """
+    Stream IDs from a keyset-paginated ``fetch_page(after, limit)``.
+
+    The first page is requested with ``after=""``, which sorts before any ID.
+    """
+    after = ""
+    while True:
+        page = await fetch_page(after, page_size)
+        for item in page:
+            yield item
+        if len(page) < page_size:
+            return
+        after = page[-1]
+
+
+class GraphGarbageCollector:
+    """
+    Removes graph data without a source of truth, one tenant at a time.
+
+    Usage:
+        gc = GraphGarbageCollector(graph_client, batch_size=2000)
+        report = await gc.collect(
+            tenant_id,
+            valid_document_ids=paginate(fetch_document_ids, 2000),
+            valid_chunk_ids=paginate(fetch_chunk_ids, 2000),
+        )
+    """
+
+    def __init__(
+        self,
+        graph_client: GraphClientPort,
+        batch_size: int = 2000,
+        on_progress: ProgressCallback | None = None,
+    ):
+        self.graph = graph_client
+        self.batch_size = batch_size
+        self.on_progress = on_progress
+
+    async def collect(
+        self,
+        tenant_id: str,
+        valid_document_ids: AsyncIterator[str],
+        valid_chunk_ids: AsyncIterator[str],
+    ) -> GCReport:
+        """
+        Prune a tenant's orphaned documents, chunks, entities and communities.
+
+        ``valid_*_ids`` must yield the tenant's IDs from Postgres in ascending
+        byte order (``COLLATE "C"``), which is how Neo4j orders strings for the
+        ASCII IDs we generate.
+        """
+        started = time.monotonic()
+        report = GCReport(tenant_id=tenant_id)
+
+        for phase, label, valid in (
+            ("documents", NodeLabel.Document, valid_document_ids),
+            ("chunks", NodeLabel.Chunk, valid_chunk_ids),
+        ):
+            progress = GCProgress(tenant_id=tenant_id, phase=phase)
+            graph_ids = self._graph_ids(label, tenant_id, progress)
+            delete_query = DELETE_BY_IDS_QUERY.format(label=label.value, key="id")
+            batch: list[str] = []
+            async for orphan in diff_sorted(graph_ids, valid):
+                batch.append(orphan)
+                if len(batch) >= self.batch_size:
+                    await self._delete(delete_query, tenant_id, batch, progress, started)
+                    batch = []
+            await self._delete(delete_query, tenant_id, batch, progress, started)
+            report.deleted[phase] = progress.deleted
+            report.scanned[phase] = progress.scanned
+
+        # Deleting chunks detaches their mentions; entities left unmentioned go next
+        entities = await self._prune_by_liveness(
+            "entities", PAGE_ENTITIES_QUERY, DELETE_ORPHAN_ENTITIES_QUERY, tenant_id, started
+        )
+        report.deleted["entities"], report.scanned["entities"] = entities.deleted, entities.scanned
+
+        while True:
+            communities = await self._prune_by_liveness(
+                "communities",
+                PAGE_COMMUNITIES_QUERY,
+                DELETE_EMPTY_COMMUNITIES_QUERY,
+                tenant_id,
+                started,
+            )
+            report.deleted["communities"] += communities.deleted
+            report.scanned["communities"] = communities.scanned
+            if not communities.deleted:
+                break
+
+        if report.deleted["entities"]:
+            await reconcile_entity_degrees(self.graph, tenant_id)
+        if report.total_deleted:
+            await mark_graph_changed(tenant_id)
+
+        report.duration_seconds = round(time.monotonic() - started, 3)
+        logger.info(
+            f"Graph GC for tenant {tenant_id}: deleted {report.deleted} "
+            f"in {report.duration_seconds}s"
+        )
+        return report
+
+    async def delete_tenant(self, tenant_id: str) -> int:
+        """Delete every node of a tenant, label by label, in bounded batches."""
+        started = time.monotonic()
+        total = 0
+        for label in TENANT_LABELS:
+            progress = GCProgress(tenant_id=tenant_id, phase=f"delete_{label.value.lower()}")
+            query = DELETE_TENANT_BATCH_QUERY.format(label=label.value)
+            while True:
+                result = await self.graph.execute_write(
+                    query, {"tenant_id": tenant_id, "batch_size": self.batch_size}
+                )
+                deleted = result[0]["deleted"] if result else 0
+                progress.deleted += deleted
+                progress.scanned += deleted
+                await self._report(progress, started)
+                if deleted < self.batch_size:
+                    break
+            total += progress.deleted
+
+        if total:
+            await mark_graph_changed(tenant_id)
+        logger.info(f"Deleted {total} graph nodes of tenant {tenant_id}")
+        return total
+
+    async def graph_tenant_ids(self) -> list[str]:
+        """Tenants that own documents in the graph (including ones gone from Postgres)."""
+        result = await self.graph.execute_read(GRAPH_TENANTS_QUERY)
+        return [r["tenant_id"] for r in result if r.get("tenant_id")]
+
+    async def _graph_ids(
+        self, label: NodeLabel, tenant_id: str, progress: GCProgress
+    ) -> AsyncIterator[str]:
+        query = PAGE_IDS_QUERY.format(label=label.value, key="id")
+
+        async def fetch(after: str, limit: int) -> list[str]:
+            result = await self.graph.execute_read(
+                query, {"tenant_id": tenant_id, "after": after, "limit": limit}
+            )
+            progress.scanned += len(result)
+            return [r["id"] for r in result]
+
+        async for item in paginate(fetch, self.batch_size):
+            yield item
+
+    async def _prune_by_liveness(
+        self, phase: str, page_query: str, delete_query: str, tenant_id: str, started: float
+    ) -> GCProgress:
+        progress = GCProgress(tenant_id=tenant_id, phase=phase)
+        after = ""
+        while True:
+            page = await self.graph.execute_read(
+                page_query, {"tenant_id": tenant_id, "after": after, "limit": self.batch_size}
+            )
+            progress.scanned += len(page)
+            await self._delete(
+                delete_query, tenant_id, [r["id"] for r in page if not r["live"]], progress, started
+            )
+            if len(page) < self.batch_size:
+                return progress
+            after = page[-1]["id"]
+
+    async def _delete(
+        self,
+        query: str,
+        tenant_id: str,
+        ids: list[str],
+        progress: GCProgress,
+        started: float,
+    ) -> None:
+        if ids:
+            result = await self.graph.execute_write(query, {"ids": ids, "tenant_id": tenant_id})
+            progress.deleted += result[0]["deleted"] if result else 0
+        await self._report(progress, started)
+
+    async def _report(self, progress: GCProgress, started: float) -> None:
+        progress.elapsed_seconds = round(time.monotonic() - started, 3)
+        logger.debug(
+            f"Graph GC {progress.tenant_id}/{progress.phase}: "
+            f"scanned {progress.scanned}, deleted {progress.deleted}"
+        )
+        if self.on_progress is not None:
+            outcome = self.on_progress(progress)
+            if outcome is not None:
+                await outcome
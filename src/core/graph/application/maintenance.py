@@ -1,6 +1,7 @@
 import logging
 
 from src.core.graph.application.communities.lifecycle import CommunityLifecycleManager
+from src.core.graph.application.explorer import mark_graph_changed, reconcile_entity_degrees
 from src.core.graph.domain.ports.graph_client import GraphClientPort
 
 logger = logging.getLogger(__name__)
@@ -30,6 +31,10 @@ class GraphMaintenanceService:
         # 3. Detect stalled summarization jobs
         await self.detect_stalled_jobs(tenant_id)
 
+        # 4. Repair entity degrees drifted by bulk deletes
+        if await reconcile_entity_degrees(self.graph, tenant_id):
+            await mark_graph_changed(tenant_id)
+
         logger.info(f"Maintenance complete for tenant {tenant_id}")
 
     async def check_broken_links(self, tenant_id: str):
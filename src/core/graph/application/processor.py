@@ -1,4 +1,5 @@
 import asyncio
+import contextlib
 import json
 import logging
 import time
@@ -6,9 +7,11 @@ from typing import TYPE_CHECKING, Any
 from collections.abc import Awaitable, Callable
 
 from src.core.graph.application.concurrency_governor import ConcurrencyGovernor
+from src.core.graph.application.explorer import mark_graph_changed
 from src.core.graph.application.sync_config import resolve_graph_sync_runtime_config
 from src.core.graph.application.writer import graph_writer
 from src.core.graph.domain.ports.graph_extractor import GraphExtractorPort, get_graph_extractor
+from src.shared.llm_capacity import RedisLLMCapacityLimiter, capacity_limiter_for
 
 if TYPE_CHECKING:
     from src.core.ingestion.domain.chunk import Chunk
@@ -58,7 +61,14 @@ class GraphProcessor:
         sem: asyncio.Semaphore | None = None
         governor: ConcurrencyGovernor | None = None
         concurrency_mode = "static"
-        if graph_sync_config.adaptive_concurrency_enabled:
+        # Cluster-wide limiter of the extraction endpoint: one lease per chunk; the
+        # extraction's LLM calls run under it and feed its adaptive limit
+        capacity = self._capacity_limiter(settings, tenant_config)
+        if capacity is not None and graph_sync_config.adaptive_concurrency_enabled:
+            # The shared limit adapts across all workers; don't also adapt locally
+            sem = asyncio.Semaphore(graph_sync_config.max_concurrency)
+            concurrency_mode = "cluster"
+        elif graph_sync_config.adaptive_concurrency_enabled:
             governor = ConcurrencyGovernor(
                 initial_limit=graph_sync_config.initial_concurrency,
                 min_limit=1,
@@ -157,7 +167,12 @@ class GraphProcessor:
                         await governor.release(latency_ms=extract_ms, had_error=had_error)
                 else:
                     wait_started = time.perf_counter()
-                    async with sem:
+                    lease = (
+                        capacity.hold(work_class="ingestion", kind=None)
+                        if capacity is not None
+                        else contextlib.nullcontext()
+                    )
+                    async with sem, lease:
                         extract_started = time.perf_counter()
                         chunk_metrics["extract_wait_ms"] = int((extract_started - wait_started) * 1000)
 
@@ -221,6 +236,9 @@ class GraphProcessor:
         tasks = [_process_one(c, idx) for idx, c in enumerate(chunks, start=1)]
         await asyncio.gather(*tasks)
 
+        if total_entities:
+            await mark_graph_changed(tenant_id)
+
         total_ms = int((time.perf_counter() - document_started) * 1000)
         throughput = 0.0
         if total_ms > 0:
@@ -228,6 +246,8 @@ class GraphProcessor:
         final_limit = graph_sync_config.initial_concurrency
         if governor is not None:
             final_limit = governor.limit
+        elif concurrency_mode == "cluster":
+            final_limit = await capacity.current_limit("ingestion")
 
         logger.info(
             "graph_sync_document_metrics %s",
@@ -257,10 +277,7 @@ class GraphProcessor:
             from src.core.admin_ops.application.metrics.collector import MetricsCollector
             from src.shared.identifiers import generate_query_id
 
-            if settings is None:
-                raise RuntimeError("Settings not configured")
-
-            collector = MetricsCollector(redis_url=settings.db.redis_url)
+            collector = MetricsCollector()
 
             label = f"Graph Extraction: {filename} ({len(chunks)} chunks)"
             async with collector.track_query(generate_query_id(), tenant_id, label) as qm:
@@ -280,5 +297,26 @@ class GraphProcessor:
 
         logger.info(f"Completed graph processing for {len(chunks)} chunks")
 
+    @staticmethod
+    def _capacity_limiter(
+        settings: Any, tenant_config: dict[str, Any]
+    ) -> RedisLLMCapacityLimiter | None:
+        if settings is None:
+            return None
+        try:
+            from src.core.generation.application.llm_steps import resolve_llm_step_config
+
+            llm_config = resolve_llm_step_config(
+                tenant_config=tenant_config,
+                step_id="ingestion.graph_extraction",
+                settings=settings,
+            )
+            return capacity_limiter_for(
+                llm_config.provider, getattr(settings, "ollama_base_url", None)
+            )
+        except Exception as e:
+            logger.debug(f"No capacity limiter for graph extraction: {e}")
+            return None
+
 
 graph_processor = GraphProcessor()
@@ -1,6 +1,9 @@
 import asyncio
 import logging
 
+from src.core.graph.application.context_writer import CONTEXT_GRAPH_CONSTRAINTS
+from src.core.graph.application.explorer import EXPLORER_INDEXES, backfill_entity_degrees
+from src.core.graph.application.garbage_collector import GC_INDEXES
 from src.core.graph.domain.ports.graph_client import get_graph_client
 from src.core.graph.domain.schema import NodeLabel
 
@@ -26,6 +29,8 @@ async def setup_constraints():
         f"CREATE INDEX entity_lookup IF NOT EXISTS FOR (e:{NodeLabel.Entity.value}) ON (e.name, e.tenant_id)",
         # Community constraints
         f"CREATE CONSTRAINT community_id_unique IF NOT EXISTS FOR (c:{NodeLabel.Community.value}) REQUIRE c.id IS UNIQUE",
+        # Context graph (decision traces) are written with MERGE on id
+        *CONTEXT_GRAPH_CONSTRAINTS,
     ]
 
     # Vector Index creation (Neo4j 5.x+)
@@ -37,6 +42,10 @@ async def setup_constraints():
     indexes = [
         f"CREATE INDEX document_tenant IF NOT EXISTS FOR (d:{NodeLabel.Document.value}) ON (d.tenant_id)",
         f"CREATE INDEX chunk_document IF NOT EXISTS FOR (c:{NodeLabel.Chunk.value}) ON (c.document_id)",
+        # Graph explorer read models (top nodes by degree, full-text entity search)
+        *EXPLORER_INDEXES,
+        # Per-tenant keyset scans for garbage collection and tenant deletion
+        *GC_INDEXES,
     ]
 
     try:
@@ -51,6 +60,9 @@ async def setup_constraints():
             logger.info(f"Applying index: {index}")
             await graph_client.execute_write(index)
 
+        # Entities written before degree was maintained
+        await backfill_entity_degrees(graph_client)
+
         logger.info("Neo4j schema setup complete.")
 
     except Exception as e:
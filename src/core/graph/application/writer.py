@@ -2,6 +2,7 @@ import logging
 import re
 from typing import Any
 
+from src.core.admin_ops.application.tenant_stats import record_graph_delta
 from src.core.generation.application.prompts.entity_extraction import ExtractionResult
 from src.core.graph.domain.ports.graph_client import get_graph_client
 from src.core.graph.domain.schema import NodeLabel, RelationshipType
@@ -20,6 +21,16 @@ class GraphWriter:
         safe_type = re.sub(r"[^A-Z0-9_]", "_", raw_type.upper())
         return safe_type or "RELATED_TO"
 
+    @staticmethod
+    def _count_created(results: list[Any], key: str) -> int:
+        """Sum a created-count column over the per-statement record lists."""
+        total = 0
+        for records in results:
+            for record in records if isinstance(records, list) else []:
+                if isinstance(record, dict):
+                    total += int(record.get(key) or 0)
+        return total
+
     def _build_base_query_and_params(
         self,
         *,
@@ -49,8 +60,12 @@ class GraphWriter:
             ON CREATE SET
                 e.type = ent.type,
                 e.description = ent.description,
+                e.degree = 0,
                 e.created_at = timestamp()
             MERGE (c)-[:{RelationshipType.MENTIONS.value}]->(e)
+            // timestamp() is fixed for the statement, so it identifies the entities created here
+            RETURN count(DISTINCT CASE WHEN e.created_at = timestamp() THEN e END)
+                AS entities_created
             """
 
         params = {
@@ -84,9 +99,13 @@ class GraphWriter:
                 r.description = rel.description,
                 r.weight = rel.weight,
                 r.tenant_id = $tenant_id,
-                r.created_at = timestamp()
+                r.created_at = timestamp(),
+                s.degree = coalesce(s.degree, 0) + 1,
+                t.degree = coalesce(t.degree, 0) + 1
             ON MATCH SET
                 r.weight = rel.weight
+            RETURN count(DISTINCT CASE WHEN r.created_at = timestamp() THEN r END)
+                AS relationships_created
             """
             statements.append((rel_query, {"batch": rel_batch, "tenant_id": tenant_id}))
         return statements
@@ -135,11 +154,18 @@ class GraphWriter:
             statements.extend(relationship_queries)
 
             if relationship_queries and hasattr(graph_client, "execute_write_batch"):
-                await graph_client.execute_write_batch(statements)
+                results = await graph_client.execute_write_batch(statements)
             else:
-                await graph_client.execute_write(base_query, base_params)
-                for rel_query, rel_params in relationship_queries:
-                    await graph_client.execute_write(rel_query, rel_params)
+                results = [
+                    await graph_client.execute_write(query, params)
+                    for query, params in statements
+                ]
+            results = results if isinstance(results, list) else []
+            record_graph_delta(
+                tenant_id,
+                entities_total=self._count_created(results, "entities_created"),
+                relationships_total=self._count_created(results, "relationships_created"),
+            )
 
             logger.info(
                 f"Graph write complete for chunk {chunk_id}: "
@@ -12,6 +12,21 @@ class GraphClientPort(Protocol):
         parameters: dict[str, Any] | None = None,
     ) -> list[dict[str, Any]]: ...
 
+    async def explain(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+    ) -> dict[str, Any]: ...
+
+    async def execute_bounded_read(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+        *,
+        timeout: float,
+        max_rows: int,
+    ) -> list[dict[str, Any]]: ...
+
     async def execute_write(
         self,
         query: str,
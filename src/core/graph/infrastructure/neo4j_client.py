@@ -2,8 +2,14 @@ import logging
 from collections.abc import AsyncIterator, Iterator
 from typing import Any
 
-from neo4j import AsyncDriver, AsyncGraphDatabase, basic_auth
-
+from neo4j import AsyncDriver, AsyncGraphDatabase, basic_auth, unit_of_work
+
+from src.core.graph.application.explorer import (
+    TOP_NODES_QUERY,
+    get_graph_explorer,
+    refresh_neighborhood_degrees,
+)
+from src.core.graph.application.garbage_collector import GraphGarbageCollector
 from src.shared.kernel.observability import trace_span
 from src.shared.kernel.runtime import get_settings
 
@@ -94,6 +100,54 @@ class Neo4jClient:
                 logger.error("Read transaction failed: %s", str(e))
                 raise
 
+    @trace_span("Neo4j.explain")
+    async def explain(self, query: str, parameters: dict[str, Any] = None) -> dict[str, Any]:
+        """
+        Plan a query without running it.
+
+        Returns:
+            {"query_type": "r" | "rw" | "w" | "s", "plan": plan tree with EstimatedRows}
+        """
+        driver = await self.get_driver()
+
+        async with driver.session() as session:
+            result = await session.run(f"EXPLAIN {query}", parameters or {})
+            summary = await result.consume()
+        return {"query_type": summary.query_type, "plan": summary.plan or {}}
+
+    @trace_span("Neo4j.execute_bounded_read")
+    async def execute_bounded_read(
+        self,
+        query: str,
+        parameters: dict[str, Any] = None,
+        *,
+        timeout: float,
+        max_rows: int,
+    ) -> list[dict[str, Any]]:
+        """
+        Read transaction with a server-side timeout that stops after max_rows records.
+
+        Returns at most max_rows + 1 records so callers can tell the result was cut.
+        """
+        driver = await self.get_driver()
+
+        @unit_of_work(timeout=timeout)
+        async def _bounded_tx(tx) -> list[dict[str, Any]]:
+            result = await tx.run(query, parameters or {})
+            records: list[dict[str, Any]] = []
+            async for record in result:
+                records.append(record.data())
+                if len(records) > max_rows:
+                    break
+            return records
+
+        async with driver.session(fetch_size=max_rows + 1) as session:
+            try:
+                return await session.execute_read(_bounded_tx)
+            except Exception as e:
+                logger.error("Bounded read transaction failed: %s", str(e))
+                raise
+
     @trace_span("Neo4j.execute_write")
     async def execute_write(
         self, query: str, parameters: dict[str, Any] = None
@@ -233,6 +287,7 @@ class Neo4jClient:
             await self.execute_write(
                 delete_sources, {"source_ids": source_ids, "tenant_id": tenant_id}
             )
+            await refresh_neighborhood_degrees(self, tenant_id, target_id)
             return True
         except Exception as e:
             logger.error(f"Merge nodes failed (verify APOC is installed): {e}")
@@ -295,143 +350,32 @@ class Neo4jClient:
     async def delete_tenant_data(self, tenant_id: str) -> int:
         """
         Delete all data associated with a tenant.
-        Used during destructive migration.
-        """
-        query = """
-        MATCH (n {tenant_id: $tenant_id})
-        DETACH DELETE n
-        RETURN count(n) as deleted
-        """
-        try:
-            result = await self.execute_write(query, {"tenant_id": tenant_id})
-            return result[0]["deleted"] if result else 0
-        except Exception as e:
-            logger.error(f"Failed to delete tenant data for {tenant_id}: {e}")
-            raise
-
-    async def prune_orphans(
-        self, valid_doc_ids: list[str], valid_chunk_ids: list[str]
-    ) -> dict[str, int]:
-        """
-        Remove chunks and entities that are not valid.
+        Used during destructive migration and tenant deletion.
 
-        Args:
-            valid_doc_ids: List of valid Document IDs from Postgres.
-            valid_chunk_ids: List of valid Chunk IDs from Postgres.
-
-        Returns:
-            Dictionary with counts of deleted items.
+        Deletes label by label in bounded batches so large tenants neither
+        exhaust the transaction heap nor scan nodes without an index.
         """
-        # 1. Delete orphan Documents
-        # If document ID is not in valid_doc_ids, delete it
-        # UNWIND creates rows, we want to filter EXISTING nodes against the list
-        # Passing huge lists to Cypher can be slow, but for maintenance it's acceptable usually.
-        # However, for huge datasets, logic should be inverted (find orphans via exclusion).
-
-        # Strategy:
-        # We can't pass ALL valid IDs if millions.
-        # But here we assume this usage is for maintenance/debugging or moderate scale.
-        # If lists are huge, we should batch. For now, simplistic implementation as requested.
-
-        counts = {"documents": 0, "chunks": 0, "entities": 0}
-
         try:
-            # A. Prune Documents
-            # Find all documents in Graph
-            # Check if they are in valid_docs. If not, delete.
-            # Doing this entirely in Cypher requires passing the full list of valid IDs.
-            # "MATCH (d:Document) WHERE NOT d.id IN $valid_ids DETACH DELETE d"
-
-            # Batching is safer. But for now:
-            query_docs = """
-            MATCH (d:Document)
-            WHERE NOT d.id IN $valid_ids
-            DETACH DELETE d
-            RETURN count(d) as deleted
-            """
-            res_docs = await self.execute_write(query_docs, {"valid_ids": valid_doc_ids})
-            counts["documents"] = res_docs[0]["deleted"] if res_docs else 0
-
-            # B. Prune Chunks
-            query_chunks = """
-            MATCH (c:Chunk)
-            WHERE NOT c.id IN $valid_ids
-            DETACH DELETE c
-            RETURN count(c) as deleted
-            """
-            res_chunks = await self.execute_write(query_chunks, {"valid_ids": valid_chunk_ids})
-            counts["chunks"] = res_chunks[0]["deleted"] if res_chunks else 0
-
-            # C. Prune Entities (Orphans)
-            # STRATEGY CHANGE: Instead of just deleting completely isolated nodes (WHERE NOT (e)--()),
-            # we now delete ANY entity that is not mentioned by a valid chunk.
-            # This handles "island" clusters that are connected to each other but detached from the knowledge base.
-
-            # Since we just deleted invalid chunks in step B, we can trust existing chunks.
-            query_entities = """
-            MATCH (e:Entity)
-            WHERE NOT (:Chunk)-[:MENTIONS]->(e)
-            DETACH DELETE e
-            RETURN count(e) as deleted
-            """
-            res_entities = await self.execute_write(query_entities)
-            counts["entities"] = res_entities[0]["deleted"] if res_entities else 0
-
-            # D. Prune Stale Communities
-            # Delete communities that are not reachable from any Entity.
-            # This handles hierarchical communities (C <- C <- E) correctly.
-            # Note: We use DETACH DELETE to remove PARENT_OF relationships.
-            # We use *1.. to handle any depth of IN_COMMUNITY or PARENT_OF hierarchy
-            # effectively checking if the community roots a subgraph containing at least one Entity.
-            # Logic: If no Entity points to this community (directly or indirectly), it is empty.
-            query_communities = """
-            MATCH (c:Community)
-            WHERE NOT EXISTS { (:Entity)-[:IN_COMMUNITY|HAS_MEMBER*1..]->(c) }
-            DETACH DELETE c
-            RETURN count(c) as deleted
-            """
-            # Note: We include HAS_MEMBER in the pattern just in case data model varies, though verification showed absent.
-
-            res_comm = await self.execute_write(query_communities)
-            counts["communities"] = res_comm[0]["deleted"] if res_comm else 0
-
-            logger.info(f"Pruned orphans: {counts}")
-            return counts
-
+            return await GraphGarbageCollector(self).delete_tenant(tenant_id)
         except Exception as e:
-            logger.error(f"Failed to prune orphans: {e}")
+            logger.error(f"Failed to delete tenant data for {tenant_id}: {e}")
             raise
 
     async def get_top_nodes(self, tenant_id: str, limit: int = 15) -> list[dict[str, Any]]:
         """
         Get top connected nodes for the global graph background.
+
+        Reads the materialized ``degree`` through the (tenant_id, degree) index.
         """
-        query = """
-        MATCH (n:Entity {tenant_id: $tenant_id})
-        OPTIONAL MATCH (n)-[r]-()
-        WITH n, count(r) as degree
-        ORDER BY degree DESC
-        LIMIT $limit
-        RETURN n.name as id, n.name as label, n.type as type, n.community as community_id, degree
-        """
-        return await self.execute_read(query, {"tenant_id": tenant_id, "limit": limit})
+        return await self.execute_read(TOP_NODES_QUERY, {"tenant_id": tenant_id, "limit": limit})
 
     async def search_nodes(
         self, query_str: str, tenant_id: str, limit: int = 10
     ) -> list[dict[str, Any]]:
         """
-        Search for nodes by name or description.
-        """
-        query = """
-        MATCH (n:Entity {tenant_id: $tenant_id})
-        WHERE toLower(n.name) CONTAINS toLower($q)
-           OR toLower(n.description) CONTAINS toLower($q)
-        RETURN n.name as id, n.name as label, n.type as type, n.community as community_id
-        LIMIT $limit
+        Search for nodes by name or description (full-text index, ranked).
         """
-        return await self.execute_read(
-            query, {"tenant_id": tenant_id, "q": query_str, "limit": limit}
-        )
+        return await get_graph_explorer().search_nodes(self, tenant_id, query_str, limit)
 
     async def get_node_neighborhood(
         self, node_id: str, tenant_id: str, limit: int = 50
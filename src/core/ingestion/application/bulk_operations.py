@@ -0,0 +1,216 @@
+"""
+Bulk Document Operations
+========================
+
+Delete or move many documents at once: an explicit set of document IDs, the
+contents of a folder, or both.
+
+Every operation is one Postgres transaction (one UPDATE for the documents,
+plus the folder row when the folder goes too), whatever the number of
+documents. Deletes only tombstone the rows; the stores are cleaned by
+``DocumentCleanupService`` in batches (one Milvus ``document_id in [...]``
+delete, one graph ``UNWIND`` write and one MinIO multi-object delete per
+batch), which reports its own progress as ``cleanup_operation_id(tenant)``.
+
+Operations report progress on the document status channel under their
+operation ID (see ``publish_operation_progress``).
+"""
+
+import logging
+import uuid
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.events.dispatcher import publish_operation_progress
+from src.core.events.ports import StateChangePublisher
+from src.core.ingestion.application.document_deletion import (
+    cleanup_operation_id,
+    schedule_document_cleanup,
+    tombstone_documents,
+    tombstones_committed,
+)
+from src.core.ingestion.domain.document import Document
+from src.core.ingestion.domain.folder import Folder
+from src.core.ingestion.domain.ports.dispatcher import TaskDispatcher
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BulkOperationResult:
+    """Outcome of one bulk operation."""
+
+    operation_id: str
+    operation: str
+    tenant_id: str
+    document_ids: list[str] = field(default_factory=list)
+    folder_deleted: bool = False
+    # Operation to follow for the background store cleanup (deletes only)
+    cleanup_operation_id: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "operation_id": self.operation_id,
+            "operation": self.operation,
+            "tenant_id": self.tenant_id,
+            "documents": len(self.document_ids),
+            "folder_deleted": self.folder_deleted,
+            "cleanup_operation_id": self.cleanup_operation_id,
+        }
+
+
+class BulkDocumentOperations:
+    """
+    Bulk delete and move of a tenant's documents.
+
+    Usage:
+        operations = BulkDocumentOperations(session, dispatcher, publisher)
+        result = await operations.delete("default", folder_id="f1", delete_folder=True)
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        task_dispatcher: TaskDispatcher,
+        publisher: StateChangePublisher | None = None,
+    ):
+        self._session = session
+        self._task_dispatcher = task_dispatcher
+        self._publisher = publisher
+
+    async def delete(
+        self,
+        tenant_id: str,
+        document_ids: list[str] | None = None,
+        folder_id: str | None = None,
+        delete_folder: bool = False,
+    ) -> BulkOperationResult:
+        """
+        Delete documents, and optionally their folder, in one transaction.
+
+        Raises:
+            LookupError: ``folder_id`` is not a folder of the tenant.
+        """
+        result = BulkOperationResult(str(uuid.uuid4()), "delete", tenant_id)
+        if folder_id is not None:
+            await self._get_folder(tenant_id, folder_id)
+
+        try:
+            by_tenant = await tombstone_documents(
+                self._session, document_ids or [], tenant_id, folder_id=folder_id, commit=False
+            )
+            if delete_folder and folder_id is not None:
+                result.folder_deleted = await self._delete_folder(tenant_id, folder_id)
+            await self._session.commit()
+        except Exception:
+            await self._session.rollback()
+            raise
+        tombstones_committed(by_tenant)
+        result.document_ids = by_tenant.get(tenant_id, [])
+
+        if result.document_ids:
+            result.cleanup_operation_id = cleanup_operation_id(tenant_id)
+            try:
+                await schedule_document_cleanup(self._task_dispatcher, tenant_id)
+            except Exception as e:
+                # Tombstoned documents stay hidden; the next delete reschedules cleanup
+                logger.error(f"Failed to schedule cleanup for tenant {tenant_id}: {e}")
+
+        logger.info(
+            f"Bulk delete {result.operation_id}: {len(result.document_ids)} documents "
+            f"for tenant {tenant_id}"
+        )
+        await self._completed(result)
+        return result
+
+    async def move(
+        self,
+        tenant_id: str,
+        target_folder_id: str | None,
+        document_ids: list[str] | None = None,
+        folder_id: str | None = None,
+        delete_folder: bool = False,
+    ) -> BulkOperationResult:
+        """
+        File documents into ``target_folder_id`` (None unfiles them) in one UPDATE.
+
+        Args:
+            tenant_id: Tenant owning the documents and folders
+            target_folder_id: Destination folder, or None to unfile
+            document_ids: Documents to move
+            folder_id: Move every document in this folder
+            delete_folder: Delete ``folder_id`` in the same transaction
+
+        Raises:
+            LookupError: A folder is not a folder of the tenant.
+        """
+        result = BulkOperationResult(str(uuid.uuid4()), "move", tenant_id)
+        if target_folder_id is not None:
+            await self._get_folder(tenant_id, target_folder_id)
+        if folder_id is not None:
+            await self._get_folder(tenant_id, folder_id)
+
+        selected = [Document.id.in_(document_ids)] if document_ids else []
+        if folder_id is not None:
+            selected.append(Document.folder_id == folder_id)
+
+        try:
+            if selected:
+                rows = await self._session.execute(
+                    update(Document)
+                    .where(
+                        or_(*selected),
+                        Document.tenant_id == tenant_id,
+                        Document.deleted_at.is_(None),
+                    )
+                    .values(folder_id=target_folder_id)
+                    .returning(Document.id)
+                )
+                result.document_ids = list(rows.scalars().all())
+            if delete_folder and folder_id is not None and folder_id != target_folder_id:
+                result.folder_deleted = await self._delete_folder(tenant_id, folder_id)
+            await self._session.commit()
+        except Exception:
+            await self._session.rollback()
+            raise
+
+        logger.info(
+            f"Bulk move {result.operation_id}: {len(result.document_ids)} documents "
+            f"to folder {target_folder_id} for tenant {tenant_id}"
+        )
+        await self._completed(result)
+        return result
+
+    async def _get_folder(self, tenant_id: str, folder_id: str) -> Folder:
+        folder = (
+            await self._session.execute(
+                select(Folder).where(Folder.id == folder_id, Folder.tenant_id == tenant_id)
+            )
+        ).scalar_one_or_none()
+        if folder is None:
+            raise LookupError(f"Folder {folder_id} not found")
+        return folder
+
+    async def _delete_folder(self, tenant_id: str, folder_id: str) -> bool:
+        # Tombstoned documents were detached from the folder by the same transaction
+        rows = await self._session.execute(
+            delete(Folder).where(Folder.id == folder_id, Folder.tenant_id == tenant_id)
+        )
+        return bool(rows.rowcount)
+
+    async def _completed(self, result: BulkOperationResult) -> None:
+        # Counts only: an event listing thousands of IDs would flood every tenant stream
+        await publish_operation_progress(
+            self._publisher,
+            result.operation_id,
+            result.tenant_id,
+            result.operation,
+            "completed",
+            100,
+            documents=len(result.document_ids),
+            folder_deleted=result.folder_deleted,
+            cleanup_operation_id=result.cleanup_operation_id,
+        )
@@ -6,14 +6,158 @@ Evaluates text chunks for quality, primarily to detect and filter out
 poor OCR results, scanner noise, and irrelevant fragments.
 
 Ported from reference `ocr_processor.py`.
+
+Scoring runs on the ingestion path between chunking and embedding, so the
+metrics for all of a document's chunks are counted in one NumPy pass over
+their code points instead of per-character Python loops.
 """
 
 import logging
-import re
-from typing import Any
+from collections.abc import Sequence
+from typing import Any, NamedTuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Character classes, with the semantics of str.isalnum / str.isspace / regex \w
+ALNUM, SPACE, WORD = 1, 2, 4
+
+NEWLINE = ord("\n")
+
+
+def _char_flags(char: str) -> int:
+    flags = 0
+    if char.isalnum():
+        flags |= ALNUM | WORD
+    if char.isspace():
+        flags |= SPACE
+    if char == "_":
+        flags |= WORD
+    return flags
+
+
+_ASCII_FLAGS = np.array([_char_flags(chr(code)) for code in range(128)], dtype=np.uint8)
+
+
+class ChunkMetrics(NamedTuple):
+    """Raw character, word and line counts of one chunk."""
+
+    total_chars: int
+    alpha_chars: int
+    whitespace_chars: int
+    non_empty_lines: int
+    total_words: int
+    short_words: int
+    is_ascii: bool
+
+
+def _decode(text: str) -> np.ndarray:
+    """Code points of ``text``; one byte each when it is pure ASCII."""
+    if text.isascii():
+        return np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+
+
+def _classify(codes: np.ndarray) -> np.ndarray:
+    """Class flags per code point; non-ASCII code points are looked up once each."""
+    if codes.dtype == np.uint8:
+        return _ASCII_FLAGS[codes]
+    non_ascii = codes >= 128
+    flags = _ASCII_FLAGS[np.where(non_ascii, 0, codes)]
+    unique, inverse = np.unique(codes[non_ascii], return_inverse=True)
+    table = np.array([_char_flags(chr(code)) for code in unique], dtype=np.uint8)
+    flags[non_ascii] = table[inverse]
+    return flags
+
+
+def _run_starts(mask: np.ndarray) -> np.ndarray:
+    """Positions where a run of True values begins."""
+    starts = mask.copy()
+    starts[1:] &= ~mask[:-1]
+    return np.flatnonzero(starts)
+
+
+def _run_ends(mask: np.ndarray) -> np.ndarray:
+    """Positions where a run of True values ends (inclusive)."""
+    ends = mask.copy()
+    ends[:-1] &= ~mask[1:]
+    return np.flatnonzero(ends)
+
+
+def measure_chunks(texts: Sequence[str]) -> list[ChunkMetrics]:
+    """
+    Count everything the scorer needs for a batch of chunks in one pass.
+
+    The chunks are joined with newlines (whitespace, not a word character and a
+    line break, so no word or line spans two chunks) and decoded to one
+    code-point array. Character classes are counted per chunk with
+    ``reduceat``; words, short words and lines are located as runs and binned
+    by chunk. Empty texts are measured as all zeros.
+    """
+    lengths = [len(text) for text in texts]
+    present = [i for i, length in enumerate(lengths) if length]
+    metrics = [ChunkMetrics(0, 0, 0, 0, 0, 0, True)] * len(texts)
+    if not present:
+        return metrics
+
+    codes = _decode("\n".join(texts[i] for i in present))
+    sizes = np.array([lengths[i] for i in present], dtype=np.int64)
+    starts = np.zeros(len(sizes), dtype=np.int64)
+    np.cumsum(sizes[:-1] + 1, out=starts[1:])
+
+    def per_chunk(positions: np.ndarray, weights: np.ndarray | None = None) -> np.ndarray:
+        chunk_ids = np.searchsorted(starts, positions, side="right") - 1
+        return np.bincount(chunk_ids, weights=weights, minlength=len(starts))
+
+    flags = _classify(codes)
+    space = (flags & SPACE).astype(bool)
+    visible = ~space
+    word = (flags & WORD).astype(bool)
+
+    alnum = np.add.reduceat(flags & ALNUM, starts, dtype=np.int64)
+    # Each chunk but the last is followed by a separator newline
+    whitespace = np.add.reduceat(space, starts, dtype=np.int64)
+    whitespace[:-1] -= 1
+    non_ascii = np.add.reduceat(codes >= 128, starts, dtype=np.int64)
+
+    # Whitespace-separated words (str.split) are runs of visible characters
+    words = per_chunk(_run_starts(visible))
+
+    # \b\w{1,2}\b matches word-character runs one or two characters long
+    word_starts = _run_starts(word)
+    short_words = per_chunk(word_starts[_run_ends(word) - word_starts < 2])
+
+    # Lines are the segments between newlines; empty segments end on their
+    # own newline, which reduceat then reads as invisible
+    line_starts = np.concatenate(([0], np.flatnonzero(codes == NEWLINE) + 1))
+    line_starts = line_starts[line_starts < len(codes)]
+    non_empty = np.add.reduceat(visible, line_starts, dtype=np.int64) > 0
+    lines = per_chunk(line_starts, weights=non_empty)
+
+    counts = zip(
+        alnum.tolist(),
+        whitespace.tolist(),
+        lines.astype(np.int64).tolist(),
+        words.tolist(),
+        short_words.tolist(),
+        non_ascii.tolist(),
+        strict=True,
+    )
+    for index, (alpha, spaces, line_count, word_count, short, wide) in zip(
+        present, counts, strict=True
+    ):
+        metrics[index] = ChunkMetrics(
+            total_chars=lengths[index],
+            alpha_chars=alpha,
+            whitespace_chars=spaces,
+            non_empty_lines=line_count,
+            total_words=word_count,
+            short_words=short,
+            is_ascii=not wide,
+        )
+    return metrics
+
 
 class ChunkQualityScorer:
     """
@@ -40,38 +184,51 @@ class ChunkQualityScorer:
             - reason: str
             - metrics: dict
         """
-        if not text or len(text.strip()) < 5:
-            return {
-                "quality_score": 0.0,
-                "is_readable": False,
-                "reason": "Empty or too short",
-                "metrics": {"total_chars": len(text) if text else 0},
-            }
-
-        # 1. Calculate base metrics
-        total_chars = len(text)
-        alpha_chars = sum(1 for c in text if c.isalnum())
-        whitespace_chars = sum(1 for c in text if c.isspace())
-        lines = text.split("\n")
+        return self.grade_chunks([text])[0]
+
+    def grade_chunks(self, texts: Sequence[str]) -> list[dict[str, Any]]:
+        """
+        Assess a whole batch of chunks (typically one document's) at once.
+
+        Args:
+            texts: Chunk contents
+
+        Returns:
+            One assessment per text, in order (see ``grade_chunk``)
+        """
+        gradable = [bool(text) and len(text.strip()) >= 5 for text in texts]
+        measured = iter(measure_chunks([t for t, ok in zip(texts, gradable, strict=True) if ok]))
+        return [
+            self._grade(text, next(measured)) if ok else self._too_short(text)
+            for text, ok in zip(texts, gradable, strict=True)
+        ]
+
+    @staticmethod
+    def _too_short(text: str) -> dict[str, Any]:
+        return {
+            "quality_score": 0.0,
+            "is_readable": False,
+            "reason": "Empty or too short",
+            "metrics": {"total_chars": len(text) if text else 0},
+        }
+
+    def _grade(self, text: str, metrics: ChunkMetrics) -> dict[str, Any]:
+        # 1. Base metrics
+        total_chars = metrics.total_chars
 
         # Composition ratios
-        text_ratio = alpha_chars / total_chars if total_chars > 0 else 0
-        whitespace_ratio = whitespace_chars / total_chars if total_chars > 0 else 0
+        text_ratio = metrics.alpha_chars / total_chars
+        whitespace_ratio = metrics.whitespace_chars / total_chars
 
-        # Link structure
-        non_empty_lines = [line.strip() for line in lines if line.strip()]
-        avg_words_per_line = 0
-        if non_empty_lines:
-            total_words = sum(len(line.split()) for line in non_empty_lines)
-            avg_words_per_line = total_words / len(non_empty_lines)
+        # Line structure (empty lines have no words, so all words are on non-empty lines)
+        avg_words_per_line = metrics.total_words / metrics.non_empty_lines
 
         # 2. Pattern Detection
         # Non-ASCII detection (common in bad OCR)
-        has_ocr_artifacts = bool(re.search(r"[^\x00-\x7F]+", text))
+        has_ocr_artifacts = not metrics.is_ascii
 
         # Fragmented words (e.g. "t h i s i s") - definition: 1-2 char words > 10%
-        short_words = len(re.findall(r"\b\w{1,2}\b", text))
-        has_fragmented_words = short_words > total_chars * 0.1
+        has_fragmented_words = metrics.short_words > total_chars * 0.1
 
         # Excessive spacing
         has_excessive_spaces = "   " in text
@@ -80,6 +80,12 @@ class SemanticChunker:
         # Fallback: rough word-based estimate
         return len(text.split())
 
+    def count_tokens_batch(self, texts: list[str]) -> list[int]:
+        """Count tokens in many texts; tiktoken encodes the batch on its thread pool."""
+        if self.encoder:
+            return [len(tokens) for tokens in self.encoder.encode_batch(texts)]
+        return [len(text.split()) for text in texts]
+
     def chunk(
         self, text: str, document_title: str | None = None, metadata: dict | None = None
     ) -> list[ChunkData]:
@@ -130,13 +136,15 @@ class SemanticChunker:
         # Step 4: Assign indices and add overlap
         final_chunks = self._apply_overlap(chunks)
 
-        # Step 5: Enrich metadata and Quality Scoring
-        for chunk in final_chunks:
+        # Step 5: Enrich metadata and Quality Scoring (whole document in one batch)
+        contents = [chunk.content for chunk in final_chunks]
+        token_counts = self.count_tokens_batch(contents)
+        quality = self.quality_scorer.grade_chunks(contents)
+        for chunk, token_count, quality_data in zip(
+            final_chunks, token_counts, quality, strict=True
+        ):
             chunk.metadata["document_title"] = document_title
-            chunk.token_count = self.count_tokens(chunk.content)
-
-            # Apply Quality Scoring
-            quality_data = self.quality_scorer.grade_chunk(chunk.content)
+            chunk.token_count = token_count
             chunk.metadata.update(quality_data)
 
         return final_chunks
@@ -0,0 +1,590 @@
+"""
+Document Deletion
+=================
+
+Deleting a document is a two-step operation:
+
+1. ``tombstone_documents`` stamps ``deleted_at`` on the Postgres rows and
+   returns at once. Retrieval drops chunks of tombstoned documents
+   (``TombstoneCache``), and listings skip them.
+2. ``DocumentCleanupService`` later removes the tombstoned documents of a
+   tenant in batches, with one pass per store per batch: a single graph write
+   for all documents and chunks, one Milvus delete expression per collection,
+   one multi-object MinIO delete and one Postgres delete.
+
+Graph cleanup is scoped to what the deleted chunks touched: only entities the
+chunks mentioned are checked for orphans, only the neighbours of removed
+entities get their degree refreshed, and only the communities those entities
+belonged to (and their parents) are checked for emptiness.
+
+``schedule_document_cleanup`` coalesces bursts: it enqueues the cleanup task
+with a short delay and skips the enqueue while a run for the tenant is still
+pending, so a folder delete or many single deletes share one cleanup run.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import delete, func, or_, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.admin_ops.application.tenant_stats import record_graph_delta
+from src.core.cache.decorators import get_cache_client
+from src.core.events.dispatcher import publish_operation_progress
+from src.core.events.ports import StateChangePublisher
+from src.core.graph.application.explorer import mark_graph_changed, refresh_entity_degrees
+from src.core.ingestion.application.file_delivery import preview_prefix
+from src.core.ingestion.domain.document import Document
+from src.core.ingestion.domain.ports.dispatcher import TaskDispatcher
+from src.core.ingestion.domain.ports.graph_client import GraphPort
+from src.core.ingestion.domain.ports.storage import StoragePort
+
+logger = logging.getLogger(__name__)
+
+CLEANUP_TASK = "src.workers.tasks.cleanup_deleted_documents"
+CLEANUP_PENDING_KEY = "document_cleanup:pending:{tenant_id}"
+# Deletes arriving within this window are handled by the same cleanup run
+CLEANUP_DELAY_SECONDS = 5
+# Safety expiry of the pending marker if the scheduled task never runs
+CLEANUP_PENDING_TTL_SECONDS = 15 * 60
+
+# Removes the documents and their chunks in one write and reports the
+# entities the chunks mentioned (the only orphan candidates).
+PURGE_DOCUMENTS_QUERY = """
+MATCH (d:Document {tenant_id: $tenant_id})
+WHERE d.id IN $document_ids
+OPTIONAL MATCH (d)-[:HAS_CHUNK]->(c:Chunk)
+WITH collect(DISTINCT d) AS documents, collect(DISTINCT c) AS chunks
+CALL {
+    WITH chunks
+    UNWIND chunks AS c
+    MATCH (c)-[:MENTIONS]->(e:Entity)
+    RETURN collect(DISTINCT e.name) AS entity_names
+}
+FOREACH (n IN chunks | DETACH DELETE n)
+FOREACH (n IN documents | DETACH DELETE n)
+RETURN size(documents) AS documents, size(chunks) AS chunks, entity_names
+"""
+
+# Deletes the candidates no chunk mentions any more and reports the entity
+# relationships removed with them, the surviving neighbours (their degree
+# changed) and the communities the entities left.
+DELETE_UNMENTIONED_ENTITIES_QUERY = """
+UNWIND $names AS name
+MATCH (e:Entity {name: name, tenant_id: $tenant_id})
+WHERE NOT EXISTS { (:Chunk)-[:MENTIONS]->(e) }
+WITH collect(e) AS doomed
+CALL {
+    WITH doomed
+    UNWIND doomed AS e
+    MATCH (e)--(m:Entity)
+    WHERE NOT m IN doomed
+    RETURN collect(DISTINCT m.name) AS neighbors
+}
+CALL {
+    WITH doomed
+    UNWIND doomed AS e
+    MATCH (e)-[r]-(:Entity)
+    RETURN count(DISTINCT r) AS relationships
+}
+CALL {
+    WITH doomed
+    UNWIND doomed AS e
+    MATCH (e)-[:BELONGS_TO|IN_COMMUNITY]->(c:Community)
+    RETURN collect(DISTINCT c.id) AS community_ids
+}
+FOREACH (e IN doomed | DETACH DELETE e)
+RETURN size(doomed) AS deleted, relationships, neighbors, community_ids
+"""
+
+# Removing an empty community can empty its parent; the parents are reported
+# so the caller can check them next.
+DELETE_EMPTY_COMMUNITIES_QUERY = """
+UNWIND $ids AS id
+MATCH (c:Community {id: id, tenant_id: $tenant_id})
+WHERE NOT EXISTS { (:Entity)-[:BELONGS_TO|IN_COMMUNITY]->(c) }
+  AND NOT EXISTS { (c)-[:PARENT_OF]->(:Community) }
+OPTIONAL MATCH (p:Community)-[:PARENT_OF]->(c)
+WITH collect(DISTINCT c) AS empty, collect(DISTINCT p.id) AS parent_ids
+FOREACH (c IN empty | DETACH DELETE c)
+RETURN size(empty) AS deleted, parent_ids
+"""
+
+
+# -----------------------------------------------------------------------------
+# Tombstones
+# -----------------------------------------------------------------------------
+
+
+async def tombstone_documents(
+    session: AsyncSession,
+    document_ids: Iterable[str],
+    tenant_id: str | None,
+    *,
+    folder_id: str | None = None,
+    commit: bool = True,
+) -> dict[str, list[str]]:
+    """
+    Mark documents as deleted in one UPDATE.
+
+    Args:
+        session: Database session
+        document_ids: Documents to delete
+        tenant_id: Restricts the update to this tenant; None for super admins
+        folder_id: Also delete every document filed in this folder
+        commit: Commit the update; pass False to make it part of a larger
+            transaction (and call ``tombstones_committed`` after committing)
+
+    Returns:
+        Newly tombstoned document IDs grouped by tenant. Documents that do not
+        exist, belong to another tenant or are already tombstoned are absent.
+    """
+    ids = list(dict.fromkeys(document_ids))
+    if not ids and folder_id is None:
+        return {}
+
+    selected = [Document.id.in_(ids)] if ids else []
+    if folder_id is not None:
+        selected.append(Document.folder_id == folder_id)
+    stmt = (
+        update(Document)
+        .where(or_(*selected), Document.deleted_at.is_(None))
+        # Detach from the folder so the folder can be removed right away
+        .values(deleted_at=datetime.now(UTC), folder_id=None)
+        .returning(Document.id, Document.tenant_id)
+    )
+    if tenant_id is not None:
+        stmt = stmt.where(Document.tenant_id == tenant_id)
+
+    result = await session.execute(stmt)
+    by_tenant: dict[str, list[str]] = {}
+    for document_id, document_tenant in result.all():
+        by_tenant.setdefault(document_tenant, []).append(document_id)
+    if commit:
+        await session.commit()
+        tombstones_committed(by_tenant)
+    return by_tenant
+
+
+def tombstones_committed(by_tenant: dict[str, list[str]]) -> None:
+    """Make committed tombstones visible to retrieval in this process."""
+    for document_tenant, tombstoned in by_tenant.items():
+        get_tombstone_cache().invalidate(document_tenant)
+        logger.info(f"Tombstoned {len(tombstoned)} documents for tenant {document_tenant}")
+
+
+class TombstoneCache:
+    """
+    Per-process cache of tombstoned document IDs, by tenant.
+
+    Entries live ``ttl_seconds``; tombstoning in this process invalidates the
+    tenant at once, other processes see new tombstones after the TTL.
+    """
+
+    def __init__(self, ttl_seconds: float = 2.0):
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[str, tuple[float, frozenset[str]]] = {}
+
+    async def get(self, tenant_id: str, loader: Callable[[str], Any]) -> frozenset[str]:
+        """Tombstoned IDs of the tenant, loading them with ``loader`` when stale."""
+        entry = self._entries.get(tenant_id)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < self.ttl_seconds:
+            return entry[1]
+
+        ids = frozenset(await loader(tenant_id))
+        self._entries[tenant_id] = (now, ids)
+        return ids
+
+    def invalidate(self, tenant_id: str | None = None) -> None:
+        """Drop one tenant or, with no id, every tenant."""
+        if tenant_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(tenant_id, None)
+
+
+_tombstone_cache = TombstoneCache()
+
+
+def get_tombstone_cache() -> TombstoneCache:
+    return _tombstone_cache
+
+
+# -----------------------------------------------------------------------------
+# Scheduling
+# -----------------------------------------------------------------------------
+
+
+async def schedule_document_cleanup(dispatcher: TaskDispatcher, tenant_id: str) -> str | None:
+    """
+    Enqueue the cleanup task for a tenant unless a run is already pending.
+
+    Returns:
+        The task ID, or None when a pending run will pick up the tombstones.
+    """
+    key = CLEANUP_PENDING_KEY.format(tenant_id=tenant_id)
+    try:
+        first = await get_cache_client().set(key, "1", nx=True, ex=CLEANUP_PENDING_TTL_SECONDS)
+    except Exception as e:
+        # Without Redis every delete schedules its own run; runs are idempotent
+        logger.debug(f"Cleanup coalescing unavailable: {e}")
+        first = True
+
+    if not first:
+        logger.debug(f"Document cleanup already pending for tenant {tenant_id}")
+        return None
+    try:
+        return await dispatcher.dispatch(
+            CLEANUP_TASK, args=[tenant_id], countdown=CLEANUP_DELAY_SECONDS
+        )
+    except Exception:
+        try:
+            await get_cache_client().delete(key)
+        except Exception as e:
+            logger.debug(f"Could not clear cleanup marker for tenant {tenant_id}: {e}")
+        raise
+
+
+async def clear_cleanup_pending(tenant_id: str) -> None:
+    """
+    Called by the cleanup run before it reads tombstones.
+
+    Deletes that tombstone after this point schedule a new run.
+    """
+    try:
+        await get_cache_client().delete(CLEANUP_PENDING_KEY.format(tenant_id=tenant_id))
+    except Exception as e:
+        logger.debug(f"Could not clear cleanup marker for tenant {tenant_id}: {e}")
+
+
+# -----------------------------------------------------------------------------
+# Cleanup
+# -----------------------------------------------------------------------------
+
+
+@dataclass
+class CleanupReport:
+    """Counts of one cleanup run for a tenant."""
+
+    tenant_id: str
+    documents: int = 0
+    graph_documents: int = 0
+    chunks: int = 0
+    entities: int = 0
+    relationships: int = 0
+    communities: int = 0
+    vectors: int = 0
+    files: int = 0
+    batches: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "status": "completed",
+            "tenant_id": self.tenant_id,
+            "documents": self.documents,
+            "graph_documents": self.graph_documents,
+            "chunks": self.chunks,
+            "entities": self.entities,
+            "relationships": self.relationships,
+            "communities": self.communities,
+            "vectors": self.vectors,
+            "files": self.files,
+            "batches": self.batches,
+            "errors": self.errors,
+        }
+
+
+def cleanup_operation_id(tenant_id: str) -> str:
+    """Operation ID under which a tenant's cleanup runs report progress."""
+    return f"cleanup-{tenant_id}"
+
+
+class DocumentCleanupService:
+    """
+    Removes tombstoned documents from Neo4j, Milvus, MinIO and Postgres.
+
+    Usage:
+        service = DocumentCleanupService(session, storage, graph_client, make_vector_store)
+        report = await service.purge_tenant("default")
+
+    The Postgres rows are deleted last, so a failed run leaves the tombstones
+    in place and the next run retries them; every step is idempotent.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        storage: StoragePort,
+        graph_client: GraphPort,
+        vector_store_factory,  # Callable returning VectorStorePort
+        batch_size: int = 200,
+        publisher: StateChangePublisher | None = None,
+    ):
+        self._session = session
+        self._storage = storage
+        self._graph_client = graph_client
+        self._vector_store_factory = vector_store_factory
+        self._publisher = publisher
+        self.batch_size = batch_size
+
+    async def purge_tenant(self, tenant_id: str) -> CleanupReport:
+        """
+        Remove every tombstoned document of the tenant, a batch at a time.
+
+        With a publisher, progress is reported after every batch as operation
+        ``cleanup_operation_id(tenant_id)`` on the document status channel.
+        """
+        report = CleanupReport(tenant_id=tenant_id)
+        after: tuple[datetime, str] | None = None
+        failed: set[str] = set()
+        total = await self._count_tombstoned(tenant_id) if self._publisher else 0
+        processed = 0
+
+        while True:
+            batch = await self._next_batch(tenant_id, after)
+            if not batch:
+                break
+            after = (batch[-1][2], batch[-1][0])
+            ok = await self._purge_batch(tenant_id, batch, report)
+            if not ok:
+                failed.update(document_id for document_id, _, _ in batch)
+            report.batches += 1
+            processed += len(batch)
+            await self._report_progress(
+                tenant_id,
+                report,
+                "processing",
+                min(99, 100 * processed // max(total, processed)),
+                document_ids=[document_id for document_id, _, _ in batch if ok],
+            )
+            if len(batch) < self.batch_size:
+                break
+
+        if report.documents or report.graph_documents:
+            get_tombstone_cache().invalidate(tenant_id)
+        # Postgres triggers count the document and chunk rows; the graph can't
+        record_graph_delta(
+            tenant_id,
+            entities_total=-report.entities,
+            relationships_total=-report.relationships,
+            communities_total=-report.communities,
+        )
+        if failed:
+            logger.warning(
+                f"Cleanup left {len(failed)} tombstoned documents for tenant {tenant_id}"
+            )
+        await self._report_progress(
+            tenant_id, report, "failed" if failed else "completed", 100, failed=len(failed)
+        )
+        return report
+
+    async def _count_tombstoned(self, tenant_id: str) -> int:
+        result = await self._session.execute(
+            select(func.count())
+            .select_from(Document)
+            .where(Document.tenant_id == tenant_id, Document.deleted_at.is_not(None))
+        )
+        return result.scalar_one_or_none() or 0
+
+    async def _report_progress(
+        self, tenant_id: str, report: CleanupReport, status: str, progress: int, **details: Any
+    ) -> None:
+        await publish_operation_progress(
+            self._publisher,
+            cleanup_operation_id(tenant_id),
+            tenant_id,
+            "cleanup",
+            status,
+            progress,
+            documents=report.documents,
+            vectors=report.vectors,
+            files=report.files,
+            **details,
+        )
+
+    async def _next_batch(
+        self, tenant_id: str, after: tuple[datetime, str] | None
+    ) -> list[tuple[str, str, datetime]]:
+        query = (
+            select(Document.id, Document.storage_path, Document.deleted_at)
+            .where(Document.tenant_id == tenant_id, Document.deleted_at.is_not(None))
+            .order_by(Document.deleted_at, Document.id)
+            .limit(self.batch_size)
+        )
+        if after is not None:
+            # Failed batches stay tombstoned; move past them instead of looping
+            query = query.where(tuple_(Document.deleted_at, Document.id) > after)
+        result = await self._session.execute(query)
+        return [tuple(row) for row in result.all()]
+
+    async def _purge_batch(
+        self,
+        tenant_id: str,
+        batch: list[tuple[str, str, datetime]],
+        report: CleanupReport,
+    ) -> bool:
+        document_ids = [document_id for document_id, _, _ in batch]
+        storage_paths = [path for _, path, _ in batch if path]
+
+        ok = await self._purge_graph(tenant_id, document_ids, report)
+        ok = await self._purge_vectors(tenant_id, document_ids, report) and ok
+        storage_paths += await self._list_previews(tenant_id, document_ids)
+        ok = await self._purge_files(storage_paths, report) and ok
+        if not ok:
+            return False
+
+        # Chunk rows go with their documents (ON DELETE CASCADE)
+        result = await self._session.execute(
+            delete(Document).where(
+                Document.id.in_(document_ids), Document.deleted_at.is_not(None)
+            )
+        )
+        await self._session.commit()
+        report.documents += result.rowcount or 0
+        logger.info(
+            f"Purged {result.rowcount} tombstoned documents for tenant {tenant_id}"
+        )
+        return True
+
+    async def _purge_graph(
+        self, tenant_id: str, document_ids: list[str], report: CleanupReport
+    ) -> bool:
+        try:
+            rows = await self._graph_client.execute_write(
+                PURGE_DOCUMENTS_QUERY, {"document_ids": document_ids, "tenant_id": tenant_id}
+            )
+            row = rows[0] if rows else {}
+            report.graph_documents += row.get("documents", 0)
+            report.chunks += row.get("chunks", 0)
+            entity_names = row.get("entity_names") or []
+            if not (row.get("documents") or row.get("chunks")):
+                return True
+
+            neighbors: list[str] = []
+            community_ids: list[str] = []
+            if entity_names:
+                rows = await self._graph_client.execute_write(
+                    DELETE_UNMENTIONED_ENTITIES_QUERY,
+                    {"names": entity_names, "tenant_id": tenant_id},
+                )
+                row = rows[0] if rows else {}
+                report.entities += row.get("deleted", 0)
+                report.relationships += row.get("relationships", 0)
+                neighbors = row.get("neighbors") or []
+                community_ids = row.get("community_ids") or []
+
+            # Surviving neighbours of the removed entities lost edges
+            await refresh_entity_degrees(self._graph_client, tenant_id, neighbors)
+            report.communities += await self._delete_empty_communities(tenant_id, community_ids)
+            await mark_graph_changed(tenant_id)
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to delete graph data for tenant {tenant_id}: {e}")
+            report.errors.append(f"graph: {e}")
+            return False
+
+    async def _delete_empty_communities(self, tenant_id: str, community_ids: list[str]) -> int:
+        deleted = 0
+        ids = [cid for cid in community_ids if cid]
+        # One pass per hierarchy level at most
+        while ids:
+            rows = await self._graph_client.execute_write(
+                DELETE_EMPTY_COMMUNITIES_QUERY, {"ids": ids, "tenant_id": tenant_id}
+            )
+            row = rows[0] if rows else {}
+            if not row.get("deleted"):
+                break
+            deleted += row["deleted"]
+            ids = [cid for cid in row.get("parent_ids") or [] if cid]
+        return deleted
+
+    async def _purge_vectors(
+        self, tenant_id: str, document_ids: list[str], report: CleanupReport
+    ) -> bool:
+        try:
+            collections = await self._get_vector_collections(tenant_id)
+        except Exception as e:
+            # Guessing the collection could leave the vectors behind; retry the batch
+            logger.warning(f"Failed to resolve vector collections for tenant {tenant_id}: {e}")
+            report.errors.append(f"vectors: {e}")
+            return False
+
+        ok = True
+        for collection_name in collections:
+            try:
+                vector_store = self._vector_store_factory(
+                    tenant_id, collection_name=collection_name
+                )
+                try:
+                    report.vectors += await vector_store.delete_by_documents(
+                        document_ids, tenant_id
+                    )
+                finally:
+                    if hasattr(vector_store, "disconnect"):
+                        await vector_store.disconnect()
+            except Exception as e:
+                logger.warning(f"Failed to delete vectors for tenant {tenant_id}: {e}")
+                report.errors.append(f"vectors: {e}")
+                ok = False
+        return ok
+
+    async def _list_previews(self, tenant_id: str, document_ids: list[str]) -> list[str]:
+        """Rendered page previews stored next to the documents' files."""
+        if not hasattr(self._storage, "list_files"):
+            return []
+        previews: list[str] = []
+        for document_id in document_ids:
+            try:
+                previews += await asyncio.to_thread(
+                    self._storage.list_files, preview_prefix(tenant_id, document_id)
+                )
+            except Exception as e:
+                # Orphaned previews are harmless; don't hold back the purge for them
+                logger.warning(f"Failed to list previews of document {document_id}: {e}")
+        return previews
+
+    async def _purge_files(self, storage_paths: list[str], report: CleanupReport) -> bool:
+        if not storage_paths:
+            return True
+        try:
+            if hasattr(self._storage, "delete_files"):
+                failed = await asyncio.to_thread(self._storage.delete_files, storage_paths)
+            else:
+                failed = []
+                for path in storage_paths:
+                    await asyncio.to_thread(self._storage.delete_file, path)
+        except Exception as e:
+            logger.warning(f"Failed to delete files from storage: {e}")
+            report.errors.append(f"storage: {e}")
+            return False
+        report.files += len(storage_paths) - len(failed)
+        if failed:
+            report.errors.append(f"storage: {len(failed)} objects not deleted")
+            return False
+        return True
+
+    async def _get_vector_collections(self, tenant_id: str) -> list[str]:
+        """
+        The tenant's active collection, plus the shadow collection of a
+        running embedding migration.
+        """
+        from src.core.tenants.application.active_vector_collection import (
+            resolve_active_vector_collection,
+            resolve_shadow_vector_collection,
+        )
+        from src.core.tenants.domain.tenant import Tenant
+
+        result = await self._session.execute(select(Tenant.config).where(Tenant.id == tenant_id))
+        config = result.scalar_one_or_none()
+        collections = [resolve_active_vector_collection(tenant_id, config)]
+        migration = resolve_shadow_vector_collection(config)
+        if migration and migration["target_collection"] not in collections:
+            collections.append(migration["target_collection"])
+        return collections
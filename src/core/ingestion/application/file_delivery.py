@@ -0,0 +1,217 @@
+"""
+Document File Delivery
+======================
+
+HTTP delivery helpers for stored document files: byte ranges, validators and
+per-page PDF preview images.
+
+Ranges are read from object storage directly (``get_file_stream`` with an
+offset and length), so seeking in a large PDF never downloads the whole
+object. ETags come from the document's content hash, which makes them strong
+validators that survive re-uploads of identical content.
+"""
+
+import asyncio
+import io
+import logging
+import os
+import tempfile
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from src.core.ingestion.domain.ports.storage import StoragePort
+
+logger = logging.getLogger(__name__)
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Preview widths are bucketed so a handful of renders serve every viewer size
+PREVIEW_WIDTHS = (320, 640, 960, 1280, 1600)
+DEFAULT_PREVIEW_WIDTH = 960
+
+
+class RangeNotSatisfiableError(ValueError):
+    """The requested byte range lies outside the file."""
+
+
+@dataclass(frozen=True)
+class ByteRange:
+    """Inclusive byte range ``start``-``end`` of a file."""
+
+    start: int
+    end: int
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start + 1
+
+    def content_range(self, size: int) -> str:
+        return f"bytes {self.start}-{self.end}/{size}"
+
+
+def parse_range(header: str | None, size: int) -> ByteRange | None:
+    """
+    Parse a ``Range`` header against a file of ``size`` bytes.
+
+    Returns None when the whole file should be sent: no header, a header in
+    another unit, a malformed one, or a multi-range request (not worth a
+    multipart/byteranges body for document viewers).
+
+    Raises:
+        RangeNotSatisfiableError: The range starts past the end of the file.
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, sep, last = spec.strip().partition("-")
+    if not sep or not (first or last):
+        return None
+    try:
+        start = int(first) if first else None
+        end = int(last) if last else None
+    except ValueError:
+        return None
+    if start is None:
+        # Suffix range: the last ``end`` bytes
+        if end <= 0:
+            raise RangeNotSatisfiableError(header)
+        return ByteRange(max(size - end, 0), size - 1) if size else None
+    if start >= size:
+        raise RangeNotSatisfiableError(header)
+    if end is None:
+        end = size - 1
+    if start < 0 or end < start:
+        return None
+    return ByteRange(start, min(end, size - 1))
+
+
+def strong_etag(content_hash: str) -> str:
+    return f'"{content_hash}"'
+
+
+def _etags(header: str) -> list[str]:
+    return [tag.strip() for tag in header.split(",") if tag.strip()]
+
+
+def _opaque(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def if_none_match(header: str | None, etag: str) -> bool:
+    """Whether ``If-None-Match`` matches ``etag`` (weak comparison, RFC 9110 13.1.2)."""
+    if not header:
+        return False
+    tags = _etags(header)
+    return "*" in tags or _opaque(etag) in (_opaque(tag) for tag in tags)
+
+
+def if_range_matches(header: str | None, etag: str) -> bool:
+    """
+    Whether a ``Range`` may be honoured under ``If-Range``.
+
+    Only strong ETag comparison is supported; a date or a stale tag means the
+    client's partial copy is out of date and gets the whole file.
+    """
+    if not header:
+        return True
+    return not header.startswith("W/") and header.strip() == etag
+
+
+def iter_stream(stream: Any, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield a storage stream in chunks and give its connection back to the pool."""
+    try:
+        while chunk := stream.read(chunk_size):
+            yield chunk
+    finally:
+        stream.close()
+        if hasattr(stream, "release_conn"):
+            stream.release_conn()
+
+
+def preview_width(width: int | None) -> int:
+    """Smallest preview bucket at least ``width`` wide (clamped to the largest)."""
+    if not width:
+        return DEFAULT_PREVIEW_WIDTH
+    return next((bucket for bucket in PREVIEW_WIDTHS if bucket >= width), PREVIEW_WIDTHS[-1])
+
+
+def preview_prefix(tenant_id: str, document_id: str) -> str:
+    return f"{tenant_id}/{document_id}/previews/"
+
+
+def preview_object_name(tenant_id: str, document_id: str, page: int, width: int) -> str:
+    return f"{preview_prefix(tenant_id, document_id)}page-{page:04d}-w{width}.png"
+
+
+# (pdf path, zero-based page, width) -> PNG bytes
+PageRenderer = Callable[[str, int, int], bytes]
+
+
+class PagePreviewService:
+    """
+    Renders PDF pages to PNG once and serves them from object storage after.
+
+    Concurrent requests for the same preview in this process share one render.
+    """
+
+    def __init__(self, storage: StoragePort, renderer: PageRenderer):
+        self._storage = storage
+        self._renderer = renderer
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def get_preview(
+        self, tenant_id: str, document_id: str, storage_path: str, page: int, width: int
+    ) -> bytes:
+        """
+        PNG of a one-based ``page`` at bucketed ``width``.
+
+        Raises:
+            IndexError: The document has no such page.
+        """
+        object_name = preview_object_name(tenant_id, document_id, page, width)
+        cached = await self._read(object_name)
+        if cached is not None:
+            return cached
+
+        lock = self._locks.setdefault(object_name, asyncio.Lock())
+        try:
+            async with lock:
+                cached = await self._read(object_name)
+                if cached is not None:
+                    return cached
+                png = await asyncio.to_thread(self._render, storage_path, page - 1, width)
+                try:
+                    await asyncio.to_thread(
+                        self._storage.upload_file,
+                        object_name,
+                        io.BytesIO(png),
+                        len(png),
+                        "image/png",
+                    )
+                except Exception as e:
+                    # Still serve the render; the next request retries the upload
+                    logger.warning(f"Failed to store preview {object_name}: {e}")
+                return png
+        finally:
+            if not lock.locked():
+                self._locks.pop(object_name, None)
+
+    async def _read(self, object_name: str) -> bytes | None:
+        if await asyncio.to_thread(self._storage.stat_file, object_name) is None:
+            return None
+        return await asyncio.to_thread(self._storage.get_file, object_name)
+
+    def _render(self, storage_path: str, page_index: int, width: int) -> bytes:
+        # Renderers need a seekable file; spool the PDF instead of holding it in memory
+        stream = self._storage.get_file_stream(storage_path)
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+            try:
+                for chunk in iter_stream(stream):
+                    tmp.write(chunk)
+                tmp.close()
+                return self._renderer(tmp.name, page_index, width)
+            finally:
+                os.unlink(tmp.name)
@@ -32,9 +32,13 @@ from src.core.ingestion.domain.ports.unit_of_work import UnitOfWork
 from src.core.ingestion.domain.ports.vector_store import VectorStorePort
 from src.core.retrieval.application.embeddings_service import EmbeddingService
 from src.core.state.machine import DocumentStatus
-from src.core.tenants.application.active_vector_collection import resolve_active_vector_collection
+from src.core.tenants.application.active_vector_collection import (
+    resolve_active_vector_collection,
+    resolve_shadow_vector_collection,
+)
 from src.core.tenants.domain.ports.tenant_repository import TenantRepository
 from src.shared.context import set_current_tenant
+from src.shared.exceptions import ConflictError
 from src.shared.identifiers import DocumentId
 
 logger = logging.getLogger(__name__)
@@ -109,6 +113,13 @@ class IngestionService:
         # 2. Check for existing document
         existing_doc = await self.document_repository.find_by_content_hash(tenant_id, content_hash)
 
+        if existing_doc and getattr(existing_doc, "deleted_at", None):
+            # Same content maps to the same ID; wait for the pending cleanup
+            raise ConflictError(
+                f"Document {existing_doc.id} with the same content is being deleted; "
+                "retry the upload shortly"
+            )
+
         if existing_doc:
             logger.info(f"Document deduplicated: {filename} (ID: {existing_doc.id})")
             return existing_doc
@@ -361,6 +372,8 @@ class IngestionService:
             )
 
             vector_store = None
+            # Reused to pick representative chunks for the document summary
+            chunk_embeddings: list[list[float]] | None = None
             try:
                 settings = self.settings
                 from src.core.generation.domain.ports.provider_factory import (
@@ -468,15 +481,14 @@ class IngestionService:
                     progress_callback=_on_embedding_progress
                 )
                 logger.debug("embed_texts returned")
+                chunk_embeddings = embeddings
 
                 # Log Aggregated Ingestion Metrics
                 try:
                     from src.core.admin_ops.application.metrics.collector import MetricsCollector
                     from src.shared.identifiers import generate_query_id
-                    from src.shared.kernel.runtime import get_settings
 
-                    m_settings = get_settings()
-                    m_collector = MetricsCollector(redis_url=m_settings.db.redis_url)
+                    m_collector = MetricsCollector()
                     m_label = f"Ingestion: {document.filename} ({len(chunks_to_process)} chunks)"
 
                     async with m_collector.track_query(
@@ -518,6 +530,11 @@ class IngestionService:
 
                 await vector_store.upsert_chunks(milvus_data)
 
+                # Online embedding migration: keep the shadow collection in step
+                migration = resolve_shadow_vector_collection(t_config)
+                if migration and self.vector_store_factory:
+                    await self._dual_write_shadow(migration, chunk_contents, milvus_data)
+
                 # Report Granular Embedding Progress (60-70%)
                 # We do this AFTER upserting to keep it simple, or during if the service supported it.
                 # Actually, the service now supports it via callback if we update it.
@@ -632,11 +649,11 @@ class IngestionService:
                 )
 
                 summarizer = get_document_summarizer()
-                chunk_contents = [c.content for c in chunks_to_process[:10]]
                 enrichment = await summarizer.extract_summary(
-                    chunks=chunk_contents,
+                    chunks=[c.content for c in chunks_to_process],
                     document_title=document.filename,
                     tenant_config=tenant_config,
+                    embeddings=chunk_embeddings,
                 )
                 document.summary = enrichment.get("summary", "")
                 document.document_type = enrichment.get("document_type", "other")
@@ -647,6 +664,8 @@ class IngestionService:
 
                 # Capture LLM Metadata
                 try:
+                    from src.shared.kernel.runtime import get_settings
+
                     llm_cfg = resolve_llm_step_config(
                         tenant_config=tenant_config,
                         step_id="ingestion.document_summarization",
@@ -715,3 +734,43 @@ class IngestionService:
             except Exception as inner_err:
                 logger.error(f"Failed to update error state for {document_id}: {inner_err}")
             raise
+
+    async def _dual_write_shadow(
+        self,
+        migration: dict[str, Any],
+        chunk_contents: list[str],
+        milvus_data: list[dict[str, Any]],
+    ) -> None:
+        """Embed new chunks with the migration's target model into its shadow collection."""
+        from src.core.admin_ops.application.online_migration import build_embedding_service
+
+        shadow_store = None
+        try:
+            embedding_service = build_embedding_service(
+                self.settings,
+                migration["embedding_provider"],
+                migration["embedding_model"],
+                migration["embedding_dimensions"],
+                migration.get("ollama_base_url"),
+            )
+            embeddings, _ = await embedding_service.embed_texts(chunk_contents)
+            shadow_rows = [
+                {**data, "embedding": emb}
+                for data, emb in zip(milvus_data, embeddings, strict=False)
+            ]
+            shadow_store = self.vector_store_factory(
+                migration["embedding_dimensions"],
+                collection_name=migration["target_collection"],
+            )
+            await shadow_store.upsert_chunks(shadow_rows)
+        except Exception as e:
+            # The primary write succeeded; cutover refuses to switch while the shadow lags
+            logger.error(
+                f"Dual-write to shadow collection {migration.get('target_collection')} failed: {e}"
+            )
+        finally:
+            if shadow_store is not None:
+                try:
+                    await shadow_store.disconnect()
+                except Exception as disconnect_error:
+                    logger.warning(f"Failed to disconnect Milvus: {disconnect_error}")
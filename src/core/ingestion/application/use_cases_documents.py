@@ -161,16 +161,6 @@ class UploadDocumentUseCase:
                     "No TaskDispatcher available, document not queued for async processing"
                 )
 
-        # Invalidate stats cache so numbers update immediately on frontend
-        try:
-            from src.core.cache.decorators import delete_cache
-
-            # Invalidate for the uploader's tenant
-            await delete_cache(f"admin:stats:database:{request.tenant_id}")
-            await delete_cache(f"admin:stats:vectors:{request.tenant_id}")
-        except Exception as e:
-            logger.warning(f"Failed to invalidate stats cache: {e}")
-
         return UploadDocumentResult(
             document_id=document.id,
             status=document.status.value,
@@ -195,142 +185,72 @@ class DeleteDocumentResult:
     """Result DTO for document deletion."""
 
     document_id: str
-    status: str = "deleted"
+    status: str = "deleting"
 
 
 class DeleteDocumentUseCase:
     """
-    Use case for deleting a document.
+    Use case for deleting documents.
 
-    Orchestrates deletion across:
-    - Graph Database (Neo4j)
-    - Vector Store (Milvus)
-    - Object Storage (MinIO)
-    - Relational Database (PostgreSQL)
+    Tombstones the documents in PostgreSQL and returns; retrieval stops
+    returning them immediately. A batched background job then removes them
+    from the Graph Database (Neo4j), Vector Store (Milvus), Object Storage
+    (MinIO) and finally PostgreSQL (see ``document_deletion``).
     """
 
-    def __init__(
-        self,
-        session: AsyncSession,
-        storage: StoragePort,
-        graph_client: GraphPort,
-        vector_store_factory,  # Callable returning VectorStorePort
-    ):
+    def __init__(self, session: AsyncSession, task_dispatcher: TaskDispatcher):
         self._session = session
-        self._storage = storage
-        self._graph_client = graph_client
-        self._vector_store_factory = vector_store_factory
+        self._task_dispatcher = task_dispatcher
 
     async def execute(self, request: DeleteDocumentRequest) -> DeleteDocumentResult:
         """
         Execute document deletion.
 
-        Attempts to clean up all stores (Neo4j, Milvus, MinIO, Postgres).
-        It is resilient to cases where the document is already partially deleted.
+        Raises:
+            LookupError: If the document does not exist, is not visible to the
+                tenant or is already being deleted.
         """
-        from sqlalchemy import select
-
-        from src.core.ingestion.domain.document import Document
-
-        # 1. Access Control & Metadata
-        # Even if the document is gone from Postgres, we need fixed info for cleanup.
-        query = select(Document).where(Document.id == request.document_id)
-        if not request.is_super_admin:
-            query = query.where(Document.tenant_id == request.tenant_id)
+        deleted = await self.execute_many(
+            [request.document_id],
+            tenant_id=request.tenant_id,
+            is_super_admin=request.is_super_admin,
+        )
+        if not deleted:
+            raise LookupError(f"Document {request.document_id} not found")
+        return deleted[0]
 
-        result = await self._session.execute(query)
-        document = result.scalars().first()
+    async def execute_many(
+        self,
+        document_ids: list[str],
+        tenant_id: str,
+        is_super_admin: bool = False,
+    ) -> list[DeleteDocumentResult]:
+        """
+        Delete several documents with one tombstone update and one cleanup run per tenant.
 
-        # We determine storage path and tenant_id
-        # If document not in Postgres, we use request info for best-effort cleanup
-        tenant_id = document.tenant_id if document else request.tenant_id
-        storage_path = document.storage_path if document else f"{tenant_id}/{request.document_id}/"
-
-        # 2. Delete from Neo4j (Hardened Query)
-        try:
-            # This query ensures we also clean up entities that no longer have ANY mentions
-            cypher = """
-            MATCH (d:Document {id: $document_id, tenant_id: $tenant_id})
-            OPTIONAL MATCH (d)-[:HAS_CHUNK]->(c:Chunk)
-            OPTIONAL MATCH (c)-[:MENTIONS]->(e:Entity)
-            WITH d, c, collect(DISTINCT e) AS entities
-            DETACH DELETE d, c
-            WITH entities
-            UNWIND entities AS entity
-            WITH entity
-            WHERE entity IS NOT NULL AND NOT (entity)<-[:MENTIONS]-()
-            DETACH DELETE entity
-            """
-            await self._graph_client.execute_write(
-                cypher,
-                {"document_id": request.document_id, "tenant_id": tenant_id},
-            )
-            logger.info(f"Cleaned up Neo4j data for document {request.document_id}")
-
-            # Post-deletion cleanup: Remove communities and isolated entities that became orphans
-            # This is a best-effort background cleanup to keep the graph healthy
-            cleanup_cypher = """
-            MATCH (c:Community {tenant_id: $tenant_id})
-            WHERE NOT EXISTS { (:Entity)-[:BELONGS_TO|IN_COMMUNITY]->(c) }
-            DETACH DELETE c
-            """
-            await self._graph_client.execute_write(cleanup_cypher, {"tenant_id": tenant_id})
-
-            # Clean isolated entities (no relationships at all or only connected to other entities but not chunks)
-            # More aggressive: Delete any Entity that is NOT reachable from a Chunk
-            orphan_cypher = """
-            MATCH (e:Entity {tenant_id: $tenant_id})
-            WHERE NOT (:Chunk)-[:MENTIONS]->(e)
-            DETACH DELETE e
-            """
-            await self._graph_client.execute_write(orphan_cypher, {"tenant_id": tenant_id})
+        Documents that are missing or already being deleted are skipped.
+        """
+        from src.core.ingestion.application.document_deletion import (
+            schedule_document_cleanup,
+            tombstone_documents,
+        )
 
-        except Exception as e:
-            logger.warning(f"Failed to delete graph data for document {request.document_id}: {e}")
+        by_tenant = await tombstone_documents(
+            self._session, document_ids, None if is_super_admin else tenant_id
+        )
 
-        # 3. Delete from Milvus
-        try:
-            vector_store = self._vector_store_factory(tenant_id)
+        for document_tenant in by_tenant:
             try:
-                await vector_store.delete_by_document(request.document_id, tenant_id)
-                logger.info(f"Cleaned up Milvus data for document {request.document_id}")
-            finally:
-                if hasattr(vector_store, "disconnect"):
-                    await vector_store.disconnect()
-        except Exception as e:
-            logger.warning(f"Failed to delete vectors for document {request.document_id}: {e}")
-
-        # 4. Delete from MinIO
-        try:
-            if hasattr(self._storage, "delete_file"):
-                # Best effort: if it was a folder or specific file
-                # In register_document it is f"{tenant_id}/{doc_id}/{filename}"
-                # We might need to delete the whole doc folder
-                self._storage.delete_file(storage_path)
-                logger.info(f"Cleaned up MinIO file: {storage_path}")
-        except Exception as e:
-            logger.warning(f"Failed to delete file from storage: {e}")
-
-        # 5. Delete from DB (Last, if exists)
-        if document:
-            await self._session.delete(document)
-            await self._session.commit()
-            logger.info(f"Removed Postgres record for document {request.document_id}")
-        else:
-            logger.info(f"Document {request.document_id} already absent from Postgres")
-
-        # 6. Invalidate Stats Cache
-        # Ensure stats update immediately
-        try:
-            from src.core.cache.decorators import delete_cache
-
-            await delete_cache(f"admin:stats:database:{tenant_id}")
-            await delete_cache(f"admin:stats:vectors:{tenant_id}")
-            # Cache keys might be just the prefix if used with @cached, but here we manually constructed them in maintenance.py
-        except Exception as e:
-            logger.warning(f"Failed to invalidate stats cache: {e}")
-
-        return DeleteDocumentResult(document_id=request.document_id)
+                await schedule_document_cleanup(self._task_dispatcher, document_tenant)
+            except Exception as e:
+                # Tombstoned documents stay hidden; the next delete reschedules cleanup
+                logger.error(f"Failed to schedule cleanup for tenant {document_tenant}: {e}")
+
+        return [
+            DeleteDocumentResult(document_id=document_id)
+            for ids in by_tenant.values()
+            for document_id in ids
+        ]
 
 
 # -----------------------------------------------------------------------------
@@ -393,7 +313,7 @@ class GetDocumentUseCase:
         query = (
             select(Document)
             .options(selectinload(Document.folder))
-            .where(Document.id == request.document_id)
+            .where(Document.id == request.document_id, Document.deleted_at.is_(None))
         )
         if not request.is_super_admin:
             query = query.where(Document.tenant_id == request.tenant_id)
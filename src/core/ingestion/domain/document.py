@@ -5,10 +5,11 @@ Document Model
 Database model for stored documents.
 """
 
+from datetime import datetime
 from typing import TYPE_CHECKING
 
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, text
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import ForeignKey, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -29,6 +30,15 @@ class Document(Base, TimestampMixin):
     """
 
     __tablename__ = "documents"
+    __table_args__ = (
+        # Serves the tombstone lookups of retrieval and the cleanup job
+        Index(
+            "ix_documents_tenant_deleted_at",
+            "tenant_id",
+            "deleted_at",
+            postgresql_where=text("deleted_at IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True, index=True)
     tenant_id: Mapped[str] = mapped_column(String, index=True, nullable=False)
@@ -77,6 +87,10 @@ class Document(Base, TimestampMixin):
     )
     folder: Mapped["Folder"] = relationship("Folder", back_populates="documents")
 
+    # Tombstone: set when deletion is requested. The row and the document's data
+    # in the other stores are removed later by the batched cleanup job.
+    deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
     # Relationship to chunks
     chunks: Mapped[list["Chunk"]] = relationship(
         "Chunk",
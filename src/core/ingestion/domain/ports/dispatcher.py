@@ -14,7 +14,11 @@ class TaskDispatcher(Protocol):
     """
 
     async def dispatch(
-        self, task_name: str, args: list[Any] | None = None, kwargs: dict[str, Any] | None = None
+        self,
+        task_name: str,
+        args: list[Any] | None = None,
+        kwargs: dict[str, Any] | None = None,
+        countdown: float | None = None,
     ) -> str:
         """
         Dispatch a task.
@@ -23,6 +27,7 @@ class TaskDispatcher(Protocol):
             task_name: Name of the task to execute
             args: Positional arguments
             kwargs: Keyword arguments
+            countdown: Optional delay in seconds before the task may start
 
         Returns:
             str: Task ID
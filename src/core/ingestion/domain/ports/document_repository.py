@@ -54,3 +54,15 @@ class DocumentRepository(Protocol):
     async def get_titles_by_ids(self, document_ids: list[str]) -> dict[str, str]:
         """Return a mapping of document_id to filename."""
         ...
+
+    async def list_ids(self, tenant_id: str, after: str = "", limit: int = 1000) -> list[str]:
+        """Document IDs of a tenant greater than ``after``, ascending in byte order."""
+        ...
+
+    async def list_chunk_ids(self, tenant_id: str, after: str = "", limit: int = 1000) -> list[str]:
+        """Chunk IDs of a tenant greater than ``after``, ascending in byte order."""
+        ...
+
+    async def list_tombstoned_ids(self, tenant_id: str) -> set[str]:
+        """IDs of the tenant's documents marked deleted and awaiting cleanup."""
+        ...
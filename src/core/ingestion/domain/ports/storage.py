@@ -8,10 +8,36 @@ class StoragePort(Protocol):
         """Upload a file to storage."""
         ...
 
+    def upload_stream(
+        self,
+        object_name: str,
+        data: Any,
+        content_type: str,
+        part_size: int = 10 * 1024 * 1024,
+    ) -> None:
+        """Upload a stream of unknown length using a multipart upload."""
+        ...
+
     def get_file(self, object_name: str) -> bytes:
         """Get file content from storage."""
         ...
 
+    def get_file_stream(self, object_name: str, offset: int = 0, length: int | None = None) -> Any:
+        """Get a readable stream for a file, or for ``length`` bytes from ``offset``."""
+        ...
+
+    def stat_file(self, object_name: str) -> dict[str, Any] | None:
+        """Size, content type and ETag of a stored file; None if it doesn't exist."""
+        ...
+
+    def list_files(self, prefix: str) -> list[str]:
+        """Names of the files under a prefix."""
+        ...
+
     def delete_file(self, object_name: str) -> None:
         """Delete a file from storage."""
         ...
+
+    def delete_files(self, object_names: list[str]) -> list[str]:
+        """Delete several files; returns the names that could not be deleted."""
+        ...
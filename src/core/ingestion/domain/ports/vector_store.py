@@ -22,6 +22,10 @@ class VectorStorePort(Protocol):
         """Delete all chunks for a document."""
         ...
 
+    async def delete_by_documents(self, document_ids: list[str], tenant_id: str) -> int:
+        """Delete all chunks of several documents."""
+        ...
+
     async def disconnect(self) -> None:
         """Disconnect from the vector store."""
         ...
@@ -5,6 +5,11 @@ Connectors Module
 External data source connectors.
 """
 
-from src.core.ingestion.infrastructure.connectors.base import BaseConnector, ConnectorItem
+from src.core.ingestion.infrastructure.connectors.base import (
+    BaseConnector,
+    ConnectorItem,
+    FetchedContent,
+    RateLimitGate,
+)
 
-__all__ = ["BaseConnector", "ConnectorItem"]
+__all__ = ["BaseConnector", "ConnectorItem", "FetchedContent", "RateLimitGate"]
@@ -5,12 +5,26 @@ Base Connector
 Abstract interface for external data source connectors.
 """
 
+import asyncio
+import hashlib
+import logging
+import time
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from typing import Any
 
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Connection pool shared by all requests of one connector instance
+HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+HTTP_TIMEOUT = httpx.Timeout(30.0)
+
 
 @dataclass
 class ConnectorItem:
@@ -24,14 +38,166 @@ class ConnectorItem:
     metadata: dict[str, Any]
 
 
+@dataclass
+class FetchedContent:
+    """
+    Result of a conditional content fetch.
+
+    ``content`` is None when the upstream item is unchanged since ``known_version``.
+    """
+
+    item_id: str
+    content: bytes | None
+    version: str | None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.content is None
+
+
+class RateLimitGate:
+    """
+    Pauses outgoing requests according to upstream rate-limit headers.
+
+    Understands ``Retry-After`` (seconds or HTTP date) and the
+    ``X-RateLimit-Remaining``/``X-RateLimit-Reset`` family used by Atlassian
+    and Zendesk (``ratelimit-remaining``/``ratelimit-reset``).
+    """
+
+    def __init__(self):
+        self._resume_at = 0.0
+
+    @property
+    def delay(self) -> float:
+        return max(0.0, self._resume_at - time.monotonic())
+
+    async def wait(self) -> None:
+        delay = self.delay
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def observe(self, response: httpx.Response) -> None:
+        headers = response.headers
+        pause = None
+
+        if "retry-after" in headers:
+            pause = _parse_delay(headers["retry-after"])
+        elif response.status_code == 429:
+            pause = 1.0
+
+        remaining = headers.get("x-ratelimit-remaining", headers.get("ratelimit-remaining"))
+        if pause is None and remaining is not None and remaining.strip() == "0":
+            reset = headers.get("x-ratelimit-reset", headers.get("ratelimit-reset"))
+            pause = _parse_delay(reset) if reset else 1.0
+
+        if pause:
+            self._resume_at = max(self._resume_at, time.monotonic() + pause)
+            logger.info(f"Upstream rate limit reached, pausing requests for {pause:.1f}s")
+
+
+def _parse_delay(value: str) -> float | None:
+    """Parse a rate-limit reset value: seconds, epoch seconds, HTTP date or ISO timestamp."""
+    value = value.strip()
+    try:
+        number = float(value)
+        # Large values are absolute epoch timestamps
+        if number > 1_000_000_000:
+            return max(0.0, number - time.time())
+        return max(0.0, number)
+    except ValueError:
+        pass
+
+    for parse in (parsedate_to_datetime, lambda v: datetime.fromisoformat(v.replace("Z", "+00:00"))):
+        try:
+            reset_at = parse(value)
+            if reset_at.tzinfo is None:
+                reset_at = reset_at.replace(tzinfo=UTC)
+            return max(0.0, (reset_at - datetime.now(UTC)).total_seconds())
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+def _is_etag(version: str | None) -> bool:
+    return bool(version) and (version.startswith('"') or version.startswith("W/"))
+
+
 class BaseConnector(ABC):
     """
     Abstract base class for external data source connectors.
 
     Connectors must implement methods for authentication,
     fetching items (with incremental sync support), and content retrieval.
+
+    Each instance owns one pooled HTTP client (see ``_client``) whose requests
+    are throttled by a shared ``RateLimitGate``. Call ``aclose()`` (or use the
+    connector as an async context manager) when done.
     """
 
+    _http: httpx.AsyncClient | None = None
+    _rate_limit: RateLimitGate | None = None
+
+    @property
+    def rate_limit(self) -> RateLimitGate:
+        if self._rate_limit is None:
+            self._rate_limit = RateLimitGate()
+        return self._rate_limit
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Shared, pooled HTTP client for this connector instance."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                limits=HTTP_LIMITS,
+                timeout=HTTP_TIMEOUT,
+                event_hooks={
+                    "request": [self._before_request],
+                    "response": [self._after_response],
+                },
+            )
+        return self._http
+
+    @asynccontextmanager
+    async def _client(self):
+        """Yield the pooled client (kept open across calls)."""
+        yield self.http_client
+
+    async def _before_request(self, request: httpx.Request) -> None:
+        await self.rate_limit.wait()
+
+    async def _after_response(self, response: httpx.Response) -> None:
+        self.rate_limit.observe(response)
+
+    async def _conditional_get(
+        self, url: str, known_version: str | None = None, **kwargs: Any
+    ) -> httpx.Response | None:
+        """
+        GET with ``If-None-Match`` when the known version is an ETag.
+
+        Returns None on 304 Not Modified.
+        """
+        headers = dict(kwargs.pop("headers", None) or {})
+        if _is_etag(known_version):
+            headers["If-None-Match"] = known_version
+
+        response = await self.http_client.get(url, headers=headers, **kwargs)
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+        return response
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
     @abstractmethod
     async def authenticate(self, credentials: dict[str, Any]) -> bool:
         """
@@ -98,6 +264,22 @@ class BaseConnector(ABC):
         """
         pass
 
+    async def fetch_item_content(
+        self, item_id: str, known_version: str | None = None
+    ) -> FetchedContent:
+        """
+        Fetch an item's content unless it is unchanged since ``known_version``.
+
+        The default implementation versions items by content hash, which still
+        skips re-registration of unchanged items. Connectors whose API exposes
+        ETags or revision numbers override this to skip the download as well.
+        """
+        content = await self.get_item_content(item_id)
+        version = hashlib.sha256(content).hexdigest()
+        if version == known_version:
+            return FetchedContent(item_id=item_id, content=None, version=version)
+        return FetchedContent(item_id=item_id, content=content, version=version)
+
     async def test_connection(self) -> bool:
         """
         Test if the connection to the external service is working.
@@ -10,9 +10,11 @@ from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any
 
-import httpx
-
-from src.core.ingestion.infrastructure.connectors.base import BaseConnector, ConnectorItem
+from src.core.ingestion.infrastructure.connectors.base import (
+    BaseConnector,
+    ConnectorItem,
+    FetchedContent,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +63,7 @@ class ConfluenceConnector(BaseConnector):
         # Test authentication by fetching current user or simple endpoint
         # /rest/api/user/current is a good candidate
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.get(
                     f"{self.base_url}/rest/api/user/current", auth=(email, api_token)
                 )
@@ -101,7 +103,7 @@ class ConfluenceConnector(BaseConnector):
         # Actually, let's use the V2 endpoint and client-side filter if needed,
         # OR just acknowledge that 'since' might be hard with pure /pages.
 
-        async with httpx.AsyncClient() as client:
+        async with self._client() as client:
             while url:
                 response = await client.get(url, params=params, auth=(self.email, self.api_token))
                 response.raise_for_status()
@@ -130,25 +132,41 @@ class ConfluenceConnector(BaseConnector):
         """
         Get the storage format (HTML-like) of a page.
         """
+        fetched = await self.fetch_item_content(item_id)
+        return fetched.content
+
+    async def fetch_item_content(
+        self, item_id: str, known_version: str | None = None
+    ) -> FetchedContent:
+        """
+        Get a page's storage format unless it is unchanged.
+
+        Pages are versioned by ETag when Confluence sends one, otherwise by the
+        page version number.
+        """
         if not self._authenticated:
             raise RuntimeError("Not authenticated. Call authenticate() first.")
 
-        async with httpx.AsyncClient() as client:
-            # V2 API: /api/v2/pages/{id}?body-format=storage
-            url = f"{self.base_url}/api/v2/pages/{item_id}"
+        # V2 API: /api/v2/pages/{id}?body-format=storage
+        response = await self._conditional_get(
+            f"{self.base_url}/api/v2/pages/{item_id}",
+            known_version,
+            params={"body-format": "storage"},
+            auth=(self.email, self.api_token),
+        )
+        if response is None:
+            return FetchedContent(item_id=item_id, content=None, version=known_version)
 
-            response = await client.get(
-                url, params={"body-format": "storage"}, auth=(self.email, self.api_token)
-            )
-            response.raise_for_status()
-            data = response.json()
+        data = response.json()
+        page_version = data.get("version", {}).get("number")
+        version = response.headers.get("etag") or (
+            f"v{page_version}" if page_version is not None else None
+        )
+        if version and version == known_version:
+            return FetchedContent(item_id=item_id, content=None, version=version)
 
-            # V2: body.storage.value (Wait, V2 response structure is different)
-            # V2 response: { "body": { "storage": { "value": "..." } } } ?
-            # Actually V2 usually returns 'body' field if requested.
-            # Let's verify structure via mapping logic or just safe access.
-            body = data.get("body", {}).get("storage", {}).get("value", "")
-            return body.encode("utf-8")
+        body = data.get("body", {}).get("storage", {}).get("value", "")
+        return FetchedContent(item_id=item_id, content=body.encode("utf-8"), version=version)
 
     def get_connector_type(self) -> str:
         return "confluence"
@@ -172,7 +190,7 @@ class ConfluenceConnector(BaseConnector):
 
         params = {"cql": cql, "start": start, "limit": page_size, "expand": "version,history"}
 
-        async with httpx.AsyncClient() as client:
+        async with self._client() as client:
             # Using CQL search endpoint might be better for 'text ~', but /content/search is also standard.
             # /rest/api/content/search is usually better for CQL.
             # However, /rest/api/content with `cql` param is deprecated in some versions but works in Cloud.
@@ -272,7 +290,7 @@ class ConfluenceConnector(BaseConnector):
                     "cql": cql,
                     "limit": limit,
                 }
-                async with httpx.AsyncClient() as client:
+                async with self._client() as client:
                     response = await client.get(
                         f"{self.base_url}/rest/api/content/search",
                         params=params,
@@ -362,7 +380,7 @@ class ConfluenceConnector(BaseConnector):
             }
 
             try:
-                async with httpx.AsyncClient() as client:
+                async with self._client() as client:
                     response = await client.post(
                         f"{self.base_url}/rest/api/content",
                         json=body,
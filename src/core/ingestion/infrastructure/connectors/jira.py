@@ -8,8 +8,6 @@ Connector for Jira Cloud.
 import logging
 from typing import Any
 
-import httpx
-
 from src.core.ingestion.infrastructure.connectors.base import BaseConnector
 
 logger = logging.getLogger(__name__)
@@ -44,7 +42,7 @@ class JiraConnector(BaseConnector):
 
         # Test auth (Get Current User)
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.get(
                     f"{self.base_url}/rest/api/3/myself", auth=(email, api_token)
                 )
@@ -72,7 +70,7 @@ class JiraConnector(BaseConnector):
                 return "Error: Not authenticated."
 
             try:
-                async with httpx.AsyncClient() as client:
+                async with self._client() as client:
                     response = await client.get(
                         f"{self.base_url}/rest/api/3/search",
                         params={
@@ -137,7 +135,7 @@ class JiraConnector(BaseConnector):
                 return "Error: Not authenticated."
 
             try:
-                async with httpx.AsyncClient() as client:
+                async with self._client() as client:
                     response = await client.get(
                         f"{self.base_url}/rest/api/3/issue/{issue_key}",
                         auth=(self.email, self.api_token),
@@ -155,7 +153,7 @@ class JiraConnector(BaseConnector):
                     pass
 
                 # RETRY with expand=renderedFields
-                async with httpx.AsyncClient() as client:
+                async with self._client() as client:
                     response = await client.get(
                         f"{self.base_url}/rest/api/3/issue/{issue_key}",
                         params={"expand": "renderedFields"},
@@ -232,7 +230,7 @@ class JiraConnector(BaseConnector):
             }
 
             try:
-                async with httpx.AsyncClient() as client:
+                async with self._client() as client:
                     response = await client.post(
                         f"{self.base_url}/rest/api/3/issue",
                         json=body,
@@ -336,7 +334,7 @@ class JiraConnector(BaseConnector):
             }
         }
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.base_url}/rest/api/3/issue/{issue_key}/comment",
                     json=body,
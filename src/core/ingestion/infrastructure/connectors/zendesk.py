@@ -10,9 +10,11 @@ from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any
 
-import httpx
-
-from src.core.ingestion.infrastructure.connectors.base import BaseConnector, ConnectorItem
+from src.core.ingestion.infrastructure.connectors.base import (
+    BaseConnector,
+    ConnectorItem,
+    FetchedContent,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -59,7 +61,7 @@ class ZendeskConnector(BaseConnector):
 
         # Test authentication
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.get(
                     f"{self.base_url}/users/me.json", auth=(f"{email}/token", api_token)
                 )
@@ -87,7 +89,7 @@ class ZendeskConnector(BaseConnector):
         if since:
             params["updated_after"] = since.isoformat()
 
-        async with httpx.AsyncClient() as client:
+        async with self._client() as client:
             while url:
                 response = await client.get(
                     url, params=params, auth=(f"{self.email}/token", self.api_token)
@@ -121,19 +123,36 @@ class ZendeskConnector(BaseConnector):
         """
         Get the HTML content of a specific article.
         """
+        fetched = await self.fetch_item_content(item_id)
+        return fetched.content
+
+    async def fetch_item_content(
+        self, item_id: str, known_version: str | None = None
+    ) -> FetchedContent:
+        """
+        Get an article's HTML unless it is unchanged.
+
+        Articles are versioned by ETag when Zendesk sends one, otherwise by
+        their ``updated_at`` timestamp.
+        """
         if not self._authenticated:
             raise RuntimeError("Not authenticated. Call authenticate() first.")
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/help_center/articles/{item_id}.json",
-                auth=(f"{self.email}/token", self.api_token),
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await self._conditional_get(
+            f"{self.base_url}/help_center/articles/{item_id}.json",
+            known_version,
+            auth=(f"{self.email}/token", self.api_token),
+        )
+        if response is None:
+            return FetchedContent(item_id=item_id, content=None, version=known_version)
+
+        article = response.json().get("article", {})
+        version = response.headers.get("etag") or article.get("updated_at")
+        if version and version == known_version:
+            return FetchedContent(item_id=item_id, content=None, version=version)
 
-            body = data.get("article", {}).get("body", "")
-            return body.encode("utf-8")
+        body = article.get("body", "")
+        return FetchedContent(item_id=item_id, content=body.encode("utf-8"), version=version)
 
     def get_connector_type(self) -> str:
         return "zendesk"
@@ -155,7 +174,7 @@ class ZendeskConnector(BaseConnector):
         else:
             url = f"{self.base_url}/help_center/articles.json"
 
-        async with httpx.AsyncClient() as client:
+        async with self._client() as client:
             response = await client.get(
                 url, params=params, auth=(f"{self.email}/token", self.api_token)
             )
@@ -229,7 +248,7 @@ class ZendeskConnector(BaseConnector):
                 params["query"] = " ".join(query_parts)
 
             try:
-                async with httpx.AsyncClient() as client:
+                async with self._client() as client:
                     response = await client.get(
                         url, params=params, auth=(f"{self.email}/token", self.api_token)
                     )
@@ -296,7 +315,7 @@ class ZendeskConnector(BaseConnector):
                 return "Error: Connector not authenticated."
 
             try:
-                async with httpx.AsyncClient() as client:
+                async with self._client() as client:
                     response = await client.get(
                         f"{self.base_url}/tickets/{ticket_id}.json",
                         auth=(f"{self.email}/token", self.api_token),
@@ -361,7 +380,7 @@ class ZendeskConnector(BaseConnector):
             }
 
             try:
-                async with httpx.AsyncClient() as client:
+                async with self._client() as client:
                     response = await client.post(
                         f"{self.base_url}/tickets.json",
                         json=body,
@@ -432,7 +451,7 @@ class ZendeskConnector(BaseConnector):
             body = {"ticket": ticket_data}
 
             try:
-                async with httpx.AsyncClient() as client:
+                async with self._client() as client:
                     response = await client.put(
                         f"{self.base_url}/tickets/{ticket_id}.json",
                         json=body,
@@ -487,7 +506,7 @@ class ZendeskConnector(BaseConnector):
                 return "Error: Not authenticated."
 
             try:
-                async with httpx.AsyncClient() as client:
+                async with self._client() as client:
                     response = await client.get(
                         f"{self.base_url}/tickets/{ticket_id}/comments.json",
                         auth=(f"{self.email}/token", self.api_token),
@@ -47,6 +47,9 @@ class ExtractionSettings(BaseSettings):
     hybrid_ocr_enabled: bool = False
     mistral_ocr_enabled: bool = False
     ocr_text_density_threshold: int = 50  # Character count threshold for triggering OCR
+    ocr_batch_max_pages: int = 8  # Consecutive OCR pages sent to Marker in one call
+    ocr_max_workers: int = 2  # Concurrent Marker calls per document
+    ocr_cache_max_entries: int = 256  # Cached OCR runs (per process), 0 disables
 
     # Quality actions
     mark_low_quality_as_needs_review: bool = True
@@ -173,7 +173,7 @@ class GraphExtractor:
         from src.shared.identifiers import generate_query_id
 
         query_id = generate_query_id()
-        collector = MetricsCollector(redis_url=settings.db.redis_url)
+        collector = MetricsCollector()
         effective_tenant_id = tenant_id or get_current_tenant() or "system"
         progress_fields: dict[str, Any] = {}
         if chunk_number is not None:
@@ -3,13 +3,12 @@ Hybrid Marker Extractor
 =======================
 
 Intelligently switches between fast text extraction (PyMuPDF) and
-high-quality OCR (Marker) on a per-page basis.
+high-quality OCR (Marker) on a per-page basis. OCR pages are batched by
+the OcrScheduler.
 """
 
 import logging
-import os
 import re
-import tempfile
 import time
 
 import fitz  # PyMuPDF
@@ -18,6 +17,10 @@ import pymupdf4llm
 from src.core.ingestion.infrastructure.extraction.base import BaseExtractor, ExtractionResult
 from src.core.ingestion.infrastructure.extraction.config import extraction_settings
 from src.core.ingestion.infrastructure.extraction.local.marker_extractor import MarkerExtractor
+from src.core.ingestion.infrastructure.extraction.local.ocr_scheduler import (
+    OcrResultCache,
+    OcrScheduler,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +58,8 @@ class HybridMarkerExtractor(BaseExtractor):
 
     def __init__(self):
         self._marker = None
+        # Shared across documents so re-ingested scans skip OCR
+        self._ocr_cache = OcrResultCache(extraction_settings.ocr_cache_max_entries)
 
     @property
     def name(self) -> str:
@@ -66,6 +71,14 @@ class HybridMarkerExtractor(BaseExtractor):
             self._marker = MarkerExtractor()
         return self._marker
 
+    def _get_ocr_scheduler(self) -> OcrScheduler:
+        return OcrScheduler(
+            self._get_marker().convert_bytes,
+            max_pages_per_batch=extraction_settings.ocr_batch_max_pages,
+            max_workers=extraction_settings.ocr_max_workers,
+            cache=self._ocr_cache,
+        )
+
     async def extract(self, file_content: bytes, file_type: str, **kwargs) -> ExtractionResult:
         """
         Extract content using a hybrid strategy.
@@ -129,51 +142,9 @@ class HybridMarkerExtractor(BaseExtractor):
                 for page_idx in text_pages:
                     results[page_idx] = doc[page_idx].get_text()
 
-        # 3b. Heavy Extraction (OCR Pages)
+        # 3b. Heavy Extraction (OCR Pages), batched into multi-page runs
         if ocr_pages:
-            marker = self._get_marker()
-
-            # We must save each page to a temporary PDF for Marker
-            for page_idx in ocr_pages:
-                try:
-                    # Create single-page PDF
-                    new_doc = fitz.open()
-                    new_doc.insert_pdf(doc, from_page=page_idx, to_page=page_idx)
-
-                    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-                        # Write to temp file
-                        new_doc.save(tmp.name)
-                        tmp_path = tmp.name
-
-                    try:
-                        # We need to manually call the raw marker function?
-                        # Or use the MarkerExtractor.extract() with file content?
-                        # MarkerExtractor.extract() takes bytes.
-                        # We can pass the bytes of the new single-page PDF.
-                        pdf_bytes = new_doc.tobytes()
-
-                        # Use the extract method (it handles temp file creation internally too,
-                        # which is double IO, but keeps abstraction clean).
-                        # Optimization: Refactor MarkerExtractor later to accept path.
-                        # For now, double IO for these few pages is acceptable.
-
-                        result = await marker.extract(pdf_bytes, "pdf")
-                        results[page_idx] = result.content
-
-                        # Merge metadata (images mainly)
-                        # We might want to capture images? Marker returns image paths in a dict usually?
-                        # Our base MarkerExtractor implementation returns images in result.images.
-                        # We should collect them.
-
-                    finally:
-                        if os.path.exists(tmp_path):
-                            os.remove(tmp_path)
-
-                        new_doc.close()
-
-                except Exception as e:
-                    logger.error(f"OCR failed for page {page_idx}: {e}")
-                    results[page_idx] = "[OCR Failed]"
+            results.update(await self._get_ocr_scheduler().run(doc, ocr_pages))
 
         # 4. Stitch Results
         final_content = []
@@ -5,8 +5,13 @@ Marker Extractor
 High-fidelity PDF extraction using the marker-pdf library.
 """
 
+import asyncio
 import logging
+import os
+import tempfile
+import threading
 import time
+from typing import Any
 
 try:
     # marker-pdf exposes main functions.
@@ -32,43 +37,63 @@ class MarkerExtractor(BaseExtractor):
 
     def __init__(self):
         self._model_lst = None
+        self._model_lock = threading.Lock()
 
     @property
     def name(self) -> str:
         return "marker"
 
-    async def extract(self, file_content: bytes, file_type: str, **kwargs) -> ExtractionResult:
+    def _get_models(self):
+        """Load the Marker models once; safe to call from worker threads."""
+        with self._model_lock:
+            if self._model_lst is None:
+                # This might be slow on first call
+                self._model_lst = load_all_models()
+        return self._model_lst
+
+    def convert_file(self, path: str) -> tuple[str, Any, dict[str, Any]]:
         """
-        Extract content using Marker.
+        Run Marker on a PDF file (blocking).
+
+        Returns (full_text, images, metadata).
         """
         if not HAS_MARKER:
             raise ImportError("marker-pdf is not installed.")
 
-        start_time = time.time()
-
-        # Marker requires a file path usually.
-        # We'll write to a temp file.
-        import os
-        import tempfile
-
+        full_text, images, out_meta = convert_single_pdf(
+            path,
+            self._get_models(),
+            max_pages=None,  # Extract all
+            parallel_factor=1,  # Single threaded within this call
+        )
+        return full_text, images, out_meta or {}
+
+    def convert_bytes(self, file_content: bytes) -> tuple[str, Any, dict[str, Any]]:
+        """Run Marker on an in-memory PDF via a temporary file (blocking)."""
+        # Marker requires a file path.
         with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
             tmp.write(file_content)
             tmp_path = tmp.name
 
         try:
-            # Lazy load models
-            if self._model_lst is None:
-                # This might be slow on first call
-                # load_all_models returns (model_list)
-                self._model_lst = load_all_models()
+            return self.convert_file(tmp_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    async def extract(self, file_content: bytes, file_type: str, **kwargs) -> ExtractionResult:
+        """
+        Extract content using Marker.
+        """
+        if not HAS_MARKER:
+            raise ImportError("marker-pdf is not installed.")
+
+        start_time = time.time()
 
-            # convert_single_pdf is sync/blocking.
-            # returns (full_text, images, out_meta)
-            full_text, images, out_meta = convert_single_pdf(
-                tmp_path,
-                self._model_lst,
-                max_pages=None,  # Extract all
-                parallel_factor=1,  # Single threaded within this process
+        try:
+            # Marker is CPU-bound and blocking; keep it off the event loop
+            full_text, images, out_meta = await asyncio.to_thread(
+                self.convert_bytes, file_content
             )
 
             elapsed = (time.time() - start_time) * 1000
@@ -77,7 +102,7 @@ class MarkerExtractor(BaseExtractor):
                 content=full_text,
                 tables=[],  # Marker integrates tables into text (markdown tables)
                 images=images,  # Marker returns image paths/data
-                metadata=out_meta if out_meta else {},
+                metadata=out_meta,
                 extractor_used=self.name,
                 confidence=0.9,  # High confidence generally
                 extraction_time_ms=elapsed,
@@ -86,6 +111,3 @@ class MarkerExtractor(BaseExtractor):
         except Exception as e:
             logger.error(f"Marker extraction failed: {e}")
             raise RuntimeError(f"Marker extraction failed: {e}") from e
-        finally:
-            if os.path.exists(tmp_path):
-                os.remove(tmp_path)
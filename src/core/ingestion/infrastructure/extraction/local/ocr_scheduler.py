@@ -0,0 +1,147 @@
+"""
+OCR Scheduler
+=============
+
+Batches the OCR pages of a hybrid PDF extraction.
+
+Consecutive OCR pages are cut into multi-page sub-documents so Marker's
+per-call overhead (PDF parsing, layout setup) is paid once per run instead of
+once per page. Runs are converted in worker threads with bounded parallelism,
+and results are cached by the content hash of their pages so re-ingesting a
+document does not OCR it again.
+"""
+
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+import fitz  # PyMuPDF
+
+logger = logging.getLogger(__name__)
+
+OCR_FAILED = "[OCR Failed]"
+
+# Blocking converter: PDF bytes -> (markdown, images, metadata)
+Converter = Callable[[bytes], tuple[str, Any, dict[str, Any]]]
+
+
+def contiguous_runs(pages: list[int], max_pages: int) -> list[list[int]]:
+    """Split sorted page indices into runs of consecutive pages, at most max_pages long."""
+    runs: list[list[int]] = []
+    for page in sorted(pages):
+        if runs and page == runs[-1][-1] + 1 and len(runs[-1]) < max_pages:
+            runs[-1].append(page)
+        else:
+            runs.append([page])
+    return runs
+
+
+def page_fingerprint(doc: fitz.Document, page_index: int) -> str:
+    """Hash of a page's content stream and the raw bytes of its images."""
+    page = doc[page_index]
+    digest = hashlib.sha256(page.read_contents())
+    for image in page.get_images(full=True):
+        digest.update(doc.xref_stream_raw(image[0]) or b"")
+    return digest.hexdigest()
+
+
+class OcrResultCache:
+    """In-process LRU of OCR output keyed by page content hashes."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def run_key(fingerprints: list[str]) -> str:
+        return hashlib.sha256("|".join(fingerprints).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        content = self._entries.get(key)
+        if content is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return content
+
+    def set(self, key: str, content: str) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = content
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class OcrScheduler:
+    """
+    Runs OCR for a set of pages of one document.
+
+    Marker returns a single markdown stream per sub-document, so results (and
+    cache entries) are per run: the returned mapping holds each run's text
+    under its first page index, which keeps page-ordered stitching intact.
+    """
+
+    def __init__(
+        self,
+        convert: Converter,
+        max_pages_per_batch: int = 8,
+        max_workers: int = 2,
+        cache: OcrResultCache | None = None,
+    ):
+        self.convert = convert
+        self.max_pages_per_batch = max(1, max_pages_per_batch)
+        self.max_workers = max(1, max_workers)
+        self.cache = cache if cache is not None else OcrResultCache()
+
+    async def run(self, doc: fitz.Document, pages: list[int]) -> dict[int, str]:
+        runs = contiguous_runs(pages, self.max_pages_per_batch)
+        results: dict[int, str] = {}
+        pending: list[tuple[list[int], str, bytes]] = []
+
+        # PyMuPDF is not thread-safe: fingerprint and split on the event loop thread
+        for run in runs:
+            key = OcrResultCache.run_key([page_fingerprint(doc, page) for page in run])
+            cached = self.cache.get(key)
+            if cached is not None:
+                results[run[0]] = cached
+                continue
+            pending.append((run, key, self._sub_document(doc, run)))
+
+        logger.info(
+            f"OCR schedule: {len(pages)} pages in {len(runs)} runs, "
+            f"{len(runs) - len(pending)} cached, {self.max_workers} workers"
+        )
+
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def _ocr(run: list[int], key: str, pdf_bytes: bytes) -> None:
+            async with semaphore:
+                try:
+                    content, _images, _metadata = await asyncio.to_thread(
+                        self.convert, pdf_bytes
+                    )
+                except Exception as e:
+                    logger.error(f"OCR failed for pages {run[0]}-{run[-1]}: {e}")
+                    results[run[0]] = OCR_FAILED
+                    return
+            self.cache.set(key, content)
+            results[run[0]] = content
+
+        await asyncio.gather(*(_ocr(*item) for item in pending))
+        return results
+
+    @staticmethod
+    def _sub_document(doc: fitz.Document, run: list[int]) -> bytes:
+        sub_doc = fitz.open()
+        try:
+            sub_doc.insert_pdf(doc, from_page=run[0], to_page=run[-1])
+            return sub_doc.tobytes()
+        finally:
+            sub_doc.close()
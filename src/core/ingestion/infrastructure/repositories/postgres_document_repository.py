@@ -43,7 +43,10 @@ class PostgresDocumentRepository(DocumentRepository):
     ) -> list[Document]:
         """List documents for a tenant."""
         result = await self._session.execute(
-            select(Document).where(Document.tenant_id == tenant_id).limit(limit).offset(offset)
+            select(Document)
+            .where(Document.tenant_id == tenant_id, Document.deleted_at.is_(None))
+            .limit(limit)
+            .offset(offset)
         )
         return list(result.scalars().all())
 
@@ -94,3 +97,34 @@ class PostgresDocumentRepository(DocumentRepository):
         )
         rows = result.all()
         return {row.id: row.filename for row in rows}
+
+    async def list_ids(self, tenant_id: str, after: str = "", limit: int = 1000) -> list[str]:
+        """Document IDs of a tenant after ``after``, in byte order (keyset page)."""
+        key = Document.id.collate("C")
+        result = await self._session.execute(
+            select(Document.id)
+            .where(Document.tenant_id == tenant_id, key > after)
+            .order_by(key)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def list_chunk_ids(self, tenant_id: str, after: str = "", limit: int = 1000) -> list[str]:
+        """Chunk IDs of a tenant after ``after``, in byte order (keyset page)."""
+        key = Chunk.id.collate("C")
+        result = await self._session.execute(
+            select(Chunk.id)
+            .where(Chunk.tenant_id == tenant_id, key > after)
+            .order_by(key)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def list_tombstoned_ids(self, tenant_id: str) -> set[str]:
+        """IDs of the tenant's documents marked deleted and awaiting cleanup."""
+        result = await self._session.execute(
+            select(Document.id).where(
+                Document.tenant_id == tenant_id, Document.deleted_at.is_not(None)
+            )
+        )
+        return set(result.scalars().all())
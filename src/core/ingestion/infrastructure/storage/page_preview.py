@@ -0,0 +1,32 @@
+"""
+PDF Page Preview Renderer
+=========================
+
+Renders single PDF pages to PNG with PyMuPDF for the document preview endpoint.
+"""
+
+try:
+    import fitz
+
+    HAS_PYMUPDF = True
+except ImportError:
+    HAS_PYMUPDF = False
+
+
+def render_pdf_page(pdf_path: str, page_index: int, width: int) -> bytes:
+    """
+    Render the zero-based ``page_index`` of a PDF as a PNG ``width`` pixels wide.
+
+    Raises:
+        IndexError: The PDF has no such page.
+        RuntimeError: PyMuPDF is not installed.
+    """
+    if not HAS_PYMUPDF:
+        raise RuntimeError("PyMuPDF is required to render page previews")
+    with fitz.open(pdf_path) as pdf:
+        if not 0 <= page_index < pdf.page_count:
+            raise IndexError(f"Page {page_index + 1} out of range (1-{pdf.page_count})")
+        page = pdf.load_page(page_index)
+        zoom = width / page.rect.width
+        pixmap = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+        return pixmap.tobytes("png")
@@ -110,6 +110,34 @@ class MinIOClient:
             content_type=content_type,
         )
 
+    def upload_stream(
+        self,
+        object_name: str,
+        data: BinaryIO,
+        content_type: str = "application/octet-stream",
+        part_size: int = 10 * 1024 * 1024,
+    ) -> None:
+        """
+        Upload a stream of unknown length to MinIO.
+
+        Uses a multipart upload so only one part is held in memory at a time.
+
+        Args:
+            object_name: The path/name of the object in the bucket
+            data: Readable binary stream
+            content_type: MIME type
+            part_size: Multipart part size in bytes (minimum 5 MiB)
+        """
+        self.ensure_bucket_exists()
+        self.client.put_object(
+            bucket_name=self.bucket_name,
+            object_name=object_name,
+            data=data,
+            length=-1,
+            part_size=part_size,
+            content_type=content_type,
+        )
+
     def get_file(self, object_name: str) -> bytes:
         """
         Download a file's content as bytes.
@@ -132,24 +160,71 @@ class MinIOClient:
             if "response" in locals():
                 response.close()
 
-    def get_file_stream(self, object_name: str):
+    def get_file_stream(self, object_name: str, offset: int = 0, length: int | None = None):
         """
         Get a file stream from MinIO.
 
         Args:
             object_name: The path/name of the object
+            offset: First byte to read
+            length: Number of bytes to read (None: to the end of the object)
 
         Returns:
             urllib3.response.HTTPResponse: The file stream
         """
-        logger.info(f"DEBUG: MinIO Stream Fetching {object_name} from {self.bucket_name}")
+        logger.debug(
+            f"MinIO stream fetching {object_name} from {self.bucket_name} "
+            f"(offset={offset}, length={length})"
+        )
         try:
-            return self.client.get_object(self.bucket_name, object_name)
+            # Ranged reads send an HTTP Range request; MinIO uses length=0 for "to the end"
+            return self.client.get_object(
+                self.bucket_name, object_name, offset=offset, length=length or 0
+            )
         except S3Error as e:
             msg = f"Storage Error: {e.code} - {e.message}. Resource: {object_name}"
             # Preserve original traceback
             raise FileNotFoundError(msg) from e
 
+    def stat_file(self, object_name: str) -> dict | None:
+        """
+        Get object metadata without downloading it.
+
+        Returns:
+            Dict with size, content_type and etag, or None if the object doesn't exist
+        """
+        try:
+            stat = self.client.stat_object(self.bucket_name, object_name)
+        except S3Error as e:
+            if e.code in ("NoSuchKey", "NoSuchObject", "NotFound"):
+                return None
+            raise
+        return {"size": stat.size, "content_type": stat.content_type, "etag": stat.etag}
+
+    def list_files(self, prefix: str) -> list[str]:
+        """Names of the objects under a prefix."""
+        objects = self.client.list_objects(self.bucket_name, prefix=prefix, recursive=True)
+        return [obj.object_name for obj in objects]
+
     def delete_file(self, object_name: str) -> None:
         """Delete a file from storage."""
         self.client.remove_object(self.bucket_name, object_name)
+
+    def delete_files(self, object_names: list[str]) -> list[str]:
+        """
+        Delete several files with multi-object delete requests.
+
+        Returns:
+            Names of the objects that could not be deleted.
+        """
+        from minio.deleteobjects import DeleteObject
+
+        errors = self.client.remove_objects(
+            self.bucket_name, [DeleteObject(name) for name in object_names]
+        )
+        # remove_objects is lazy: iterating sends the requests
+        failed = []
+        for error in errors:
+            logger.warning(f"Failed to delete {error.name}: {error.code} - {error.message}")
+            failed.append(error.name)
+        return failed
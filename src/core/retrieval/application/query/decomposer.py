@@ -16,6 +16,7 @@ from src.core.generation.domain.ports.provider_factory import (
 )
 from src.core.generation.domain.ports.providers import LLMProviderPort
 from src.core.generation.domain.provider_models import ProviderTier
+from src.core.tenants.application.tenant_config_cache import derive_from_config
 
 logger = logging.getLogger(__name__)
 
@@ -82,10 +83,14 @@ class QueryDecomposer:
             
             scoped_factory = self.factory
             if res_ollama_url and res_ollama_url != settings.ollama_base_url:
-                scoped_factory = build_provider_factory(
-                    openai_api_key=settings.openai_api_key,
-                    anthropic_api_key=settings.anthropic_api_key,
-                    ollama_base_url=res_ollama_url,
+                scoped_factory = derive_from_config(
+                    tenant_config,
+                    ("query_provider_factory", res_ollama_url),
+                    lambda: build_provider_factory(
+                        openai_api_key=settings.openai_api_key,
+                        anthropic_api_key=settings.anthropic_api_key,
+                        ollama_base_url=res_ollama_url,
+                    ),
                 )
 
             llm_cfg = resolve_llm_step_config(
@@ -8,6 +8,7 @@ Unified retrieval pipeline combining vector search, caching, and reranking.
 import asyncio
 import logging
 import time
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -19,6 +20,7 @@ from src.core.generation.domain.ports.provider_factory import (
     get_provider_factory,
 )
 from src.core.generation.domain.ports.providers import RerankerProviderPort
+from src.core.ingestion.application.document_deletion import get_tombstone_cache
 from src.core.ingestion.domain.ports.document_repository import DocumentRepository
 from src.core.retrieval.application.embeddings_service import EmbeddingService
 from src.core.retrieval.application.query.decomposer import QueryDecomposer
@@ -40,6 +42,10 @@ from src.core.retrieval.domain.ports.graph_store_port import GraphStorePort
 from src.core.retrieval.domain.ports.vector_store_port import SearchResult, VectorStorePort
 from src.core.system.circuit_breaker import CircuitBreaker
 from src.core.tenants.application.active_vector_collection import resolve_active_vector_collection
+from src.core.tenants.application.tenant_config_cache import (
+    TenantConfigSnapshot,
+    derive_from_config,
+)
 from src.shared.kernel.models.query import QueryOptions, SearchMode
 from src.shared.kernel.observability import trace_span
 
@@ -227,15 +233,26 @@ class RetrievalService:
         self.tuning = tuning_service
         # or TuningService(session_factory=async_session_maker) - REMOVED DEFAULT
 
-    async def _resolve_active_collection(self, tenant_id: str) -> str:
-        """Resolve the active vector collection for a tenant."""
+    async def get_tenant_config(self, tenant_id: str) -> TenantConfigSnapshot:
+        """Resolve the tenant's config snapshot (once per request; pass it down)."""
         if self.tuning:
-            config = await self.tuning.get_tenant_config(tenant_id)
-            return resolve_active_vector_collection(tenant_id, config)
-        logger.warning("TuningService not provided; falling back to default active collection")
-        return resolve_active_vector_collection(tenant_id, {})
+            return await self.tuning.get_tenant_snapshot(tenant_id)
+        logger.warning("TuningService not provided; falling back to default tenant config")
+        return TenantConfigSnapshot(tenant_id, {})
 
-    def _resolve_embedding_service(self, tenant_config: dict[str, Any] | None) -> EmbeddingService:
+    async def _resolve_active_collection(
+        self, tenant_id: str, tenant_config: Mapping[str, Any] | None = None
+    ) -> str:
+        """Resolve the active vector collection for a tenant."""
+        if tenant_config is None:
+            tenant_config = await self.get_tenant_config(tenant_id)
+        if isinstance(tenant_config, TenantConfigSnapshot):
+            return tenant_config.active_collection
+        return resolve_active_vector_collection(tenant_id, dict(tenant_config))
+
+    def _resolve_embedding_service(
+        self, tenant_config: Mapping[str, Any] | None
+    ) -> EmbeddingService:
         """Resolve embedding service based on tenant config."""
         if not tenant_config:
             return self.embedding_service
@@ -248,31 +265,34 @@ class RetrievalService:
         # If no overrides, return default
         if not (t_provider or t_model or t_ollama_url):
             return self.embedding_service
-        
-        # Build scoped factory
-        from src.core.generation.domain.ports.provider_factory import build_provider_factory
+
+        # Scoped services are memoized on the tenant's config snapshot
+        return derive_from_config(
+            tenant_config,
+            ("embedding_service", t_provider, t_model, t_ollama_url),
+            lambda: self._build_scoped_embedding_service(t_provider, t_model, t_ollama_url),
+        )
+
+    def _build_scoped_embedding_service(
+        self, t_provider: str | None, t_model: str | None, t_ollama_url: str | None
+    ) -> EmbeddingService:
         from src.shared.kernel.runtime import get_settings
-        
+
         settings = get_settings()
-        
-        # Valid Ollama URL? 
+
+        # Valid Ollama URL?
         effective_ollama_url = t_ollama_url or settings.ollama_base_url
-        
+
         factory = build_provider_factory(
             openai_api_key=settings.openai_api_key,
             anthropic_api_key=settings.anthropic_api_key,
             ollama_base_url=effective_ollama_url,
         )
-        
-        # Determine provider name
-        # If tenant doesn't specify provider but specifies model, we might need to resolve it.
-        # If tenant specifies nothing, we shouldn't be here (checked above).
-        
+
         # If t_provider is None, use default? Or resolve from model?
         # Safe default: if ollama_url is set, likely want ollama? Not necessarily.
-        
         provider_name = t_provider or self.config.default_embedding_provider
-        
+
         return EmbeddingService(
             provider=factory.get_embedding_provider(
                 provider_name=provider_name,
@@ -292,10 +312,14 @@ class RetrievalService:
         include_trace: bool = False,
         options: QueryOptions | None = None,
         history: list[dict] | None = None,
+        tenant_config: Mapping[str, Any] | None = None,
     ) -> RetrievalResult:
         """
         Retrieve relevant chunks for a query with Phase 5 analysis.
 
+        ``tenant_config`` is the request's tenant config snapshot; it is
+        resolved here only when the caller did not pass one.
+
         Pipeline:
         1. Contextual Rewriting (if enabled)
         2. Filter Extraction & Parsing
@@ -311,10 +335,9 @@ class RetrievalService:
         trace = []
         top_k = top_k or self.config.top_k
         options = options or QueryOptions()
-        tenant_config: dict[str, Any] = {}
-        if self.tuning:
-            tenant_config = await self.tuning.get_tenant_config(tenant_id)
-        active_collection = await self._resolve_active_collection(tenant_id)
+        if tenant_config is None:
+            tenant_config = await self.get_tenant_config(tenant_id)
+        active_collection = await self._resolve_active_collection(tenant_id, tenant_config)
 
         # Step 1: Contextual Rewriting
         processed_query = query
@@ -399,6 +422,9 @@ class RetrievalService:
                 collection_name=active_collection,
             )
 
+        # Deleted documents stay in the stores until the cleanup job removes them
+        result.chunks = await self._drop_tombstoned(tenant_id, result.chunks)
+
         # Record latency for circuit breaker
         total_latency = (time.perf_counter() - start_time) * 1000
         self.circuit_breaker.record_latency(total_latency)
@@ -788,6 +814,27 @@ class RetrievalService:
             trace=trace,
         )
 
+    async def _drop_tombstoned(self, tenant_id: str, chunks: list[Any]) -> list[Any]:
+        """Remove chunks of documents marked deleted."""
+        if not chunks:
+            return chunks
+        try:
+            tombstoned = await get_tombstone_cache().get(
+                tenant_id, self.document_repository.list_tombstoned_ids
+            )
+        except Exception as e:
+            logger.warning(f"Tombstone lookup failed for tenant {tenant_id}: {e}")
+            return chunks
+        if not tombstoned:
+            return chunks
+
+        def document_id(chunk: Any) -> str | None:
+            if isinstance(chunk, dict):
+                return chunk.get("document_id")
+            return getattr(chunk, "document_id", None)
+
+        return [c for c in chunks if document_id(c) not in tombstoned]
+
     async def _fetch_chunks_by_ids(
         self,
         chunk_ids: list[str],
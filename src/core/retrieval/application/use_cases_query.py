@@ -106,7 +106,7 @@ class QueryUseCase:
         # 2. AGENTIC MODE
         if request.options and request.options.agent_mode:
             try:
-                return await self._execute_agent(request, tenant_id, start_time)
+                return await self._execute_agent(request, tenant_id, start_time, user_id)
             except Exception as e:
                 logger.error(f"Agent execution failed: {e}")
                 # Fallback to standard RAG
@@ -136,6 +136,8 @@ class QueryUseCase:
                 # Step 2: Retrieval
                 step_start = time.perf_counter()
                 document_ids = request.filters.document_ids if request.filters else None
+                # Resolved once and shared by retrieval and generation
+                tenant_config = await self.retrieval_service.get_tenant_config(tenant_id)
 
                 retrieval_result = await self.retrieval_service.retrieve(
                     query=request.query,
@@ -145,6 +147,7 @@ class QueryUseCase:
                     include_trace=include_trace,
                     options=request.options,
                     history=None,
+                    tenant_config=tenant_config,
                 )
 
                 retrieval_ms = (time.perf_counter() - step_start) * 1000
@@ -179,6 +182,7 @@ class QueryUseCase:
                             "user_id": user_id,
                             "tenant_id": tenant_id,
                             "model": request.options.model if request.options else None,
+                            "tenant_config": tenant_config,
                         },
                     )
 
@@ -244,7 +248,9 @@ class QueryUseCase:
             follow_up_questions=follow_ups,
         )
 
-    async def _execute_agent(self, request: QueryRequest, tenant_id: str, start_time: float):
+    async def _execute_agent(
+        self, request: QueryRequest, tenant_id: str, start_time: float, user_id: str
+    ):
         from src.core.generation.application.agent.orchestrator import AgentOrchestrator
         from src.core.generation.application.agent.prompts import AGENT_SYSTEM_PROMPT
         from src.core.tools.filesystem import create_filesystem_tools
@@ -262,10 +268,11 @@ class QueryUseCase:
                 tool_map[t["name"]] = t["func"]
                 tool_schemas.append(t["schema"])
         else:
-            from src.core.tools.graph import GRAPH_TOOLS, query_graph
+            from src.core.tools.graph import create_graph_tool
 
-            tool_map["query_graph"] = query_graph
-            tool_schemas.extend(GRAPH_TOOLS)
+            graph_tool_def = create_graph_tool(tenant_id)
+            tool_map[graph_tool_def["name"]] = graph_tool_def["func"]
+            tool_schemas.append(graph_tool_def["schema"])
 
         agent = AgentOrchestrator(
             generation_service=self.generation_service,
@@ -275,7 +282,10 @@ class QueryUseCase:
         )
 
         agent_response = await agent.run(
-            query=request.query, conversation_id=request.conversation_id
+            query=request.query,
+            conversation_id=request.conversation_id,
+            tenant_id=tenant_id,
+            user_id=user_id,
         )
 
         total_ms = (time.perf_counter() - start_time) * 1000
@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import Any, Protocol
 
 
 class VectorStoreAdminPort(Protocol):
@@ -15,3 +15,15 @@ class VectorStoreAdminPort(Protocol):
     async def get_collection_dimensions(self) -> int | None:
         """Return the configured collection's vector dimensions, if available."""
         ...
+
+    async def upsert_chunks(self, chunks: list[dict[str, Any]], flush: bool = True) -> int:
+        """Insert or update chunks with their embeddings."""
+        ...
+
+    async def flush(self) -> None:
+        """Seal pending writes (after bulk upserts with ``flush=False``)."""
+        ...
+
+    async def get_stats(self) -> dict[str, Any]:
+        """Collection statistics (``num_entities``)."""
+        ...
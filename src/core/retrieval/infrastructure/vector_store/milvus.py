@@ -300,6 +300,7 @@ class MilvusVectorStore:
     async def upsert_chunks(
         self,
         chunks: list[dict[str, Any]],
+        flush: bool = True,
     ) -> int:
         """
         Insert or update chunks with their embeddings.
@@ -312,6 +313,8 @@ class MilvusVectorStore:
                 - content: Chunk text content
                 - embedding: Vector embedding
                 - ... any other metadata keys (will be stored as dynamic fields)
+            flush: Seal segments after the upsert. Bulk callers pass False and
+                flush once at the end.
 
         Returns:
             Number of chunks upserted
@@ -357,7 +360,8 @@ class MilvusVectorStore:
         try:
             # Upsert (insert with replace semantics)
             self._collection.upsert(data)
-            self._collection.flush()
+            if flush:
+                self._collection.flush()
 
             logger.info(f"Upserted {len(chunks)} chunks to Milvus")
             return len(chunks)
@@ -585,6 +589,31 @@ class MilvusVectorStore:
             logger.error(f"Failed to delete chunks: {e}")
             raise
 
+    async def delete_by_documents(self, document_ids: list[str], tenant_id: str) -> int:
+        """Delete all chunks of several documents in one request."""
+        if not document_ids:
+            return 0
+
+        await self.connect()
+
+        quoted_ids = ", ".join(f'"{did}"' for did in document_ids)
+        expr = (
+            f"{self.FIELD_DOCUMENT_ID} in [{quoted_ids}] && "
+            f'{self.FIELD_TENANT_ID} == "{tenant_id}"'
+        )
+
+        try:
+            result = self._collection.delete(expr=expr)
+            self._collection.flush()
+
+            count = result.delete_count if hasattr(result, "delete_count") else 0
+            logger.info(f"Deleted {count} chunks for {len(document_ids)} documents")
+            return count
+
+        except Exception as e:
+            logger.error(f"Failed to delete chunks: {e}")
+            raise
+
     async def delete_by_tenant(self, tenant_id: str) -> int:
         """Delete all chunks for a tenant."""
         await self.connect()
@@ -603,6 +632,11 @@ class MilvusVectorStore:
             logger.error(f"Failed to delete chunks: {e}")
             raise
 
+    async def flush(self) -> None:
+        """Seal segments after bulk upserts made with ``flush=False``."""
+        await self.connect()
+        self._collection.flush()
+
     async def get_stats(self) -> dict[str, Any]:
         """Get collection statistics."""
         await self.connect()
@@ -885,9 +919,9 @@ class MilvusVectorStore:
             for hit in results:
                 yield hit
 
-    async def import_vectors(self, vectors: Iterator[dict], batch_size: int = 500) -> int:
+    async def import_vectors(self, vectors: Iterator[dict], batch_size: int = 2000) -> int:
         """
-        Import vectors in batches.
+        Import vectors in large batches with a single flush at the end.
 
         Args:
             vectors: Iterator of dicts (from export_vectors)
@@ -905,7 +939,7 @@ class MilvusVectorStore:
             # Adapt format for upsert_chunks
             # Input has 'vector' (field name), upsert expects 'embedding'
             if self.FIELD_VECTOR in vec and "embedding" not in vec:
-                vec["embedding"] = vec[self.FIELD_VECTOR]
+                vec["embedding"] = vec.pop(self.FIELD_VECTOR)
 
             # Handle sparse vector mapping if present
             # upsert_chunks checks for FIELD_SPARSE_VECTOR directly in input dict
@@ -914,12 +948,15 @@ class MilvusVectorStore:
 
             batch.append(vec)
             if len(batch) >= batch_size:
-                await self.upsert_chunks(batch)
+                await self.upsert_chunks(batch, flush=False)
                 count += len(batch)
                 batch = []
 
         if batch:
-            await self.upsert_chunks(batch)
+            await self.upsert_chunks(batch, flush=False)
             count += len(batch)
 
+        if count:
+            self._collection.flush()
+
         return count
@@ -8,6 +8,10 @@ Helpers for selecting the per-tenant active vector collection.
 DEFAULT_TENANT_ID = "default"
 DEFAULT_COLLECTION_PREFIX = "amber_"
 DEFAULT_COLLECTION_NAME = "document_chunks"
+EMBEDDING_MIGRATION_KEY = "embedding_migration"
+# Migration states in which the shadow collection must receive new vectors
+# (a failed backfill can be resumed, so it keeps receiving them too)
+DUAL_WRITE_STATUSES = frozenset({"backfilling", "ready", "failed"})
 
 
 class ActiveCollectionPermissionError(Exception):
@@ -35,6 +39,18 @@ def resolve_active_vector_collection(tenant_id: str, config: dict | None) -> str
     return f"{DEFAULT_COLLECTION_PREFIX}{tenant_id.replace('-', '_')}"
 
 
+def resolve_shadow_vector_collection(config: dict | None) -> dict | None:
+    """Return the running embedding migration (shadow collection and model), if any.
+
+    While a migration is running, new vectors are written to both the active
+    collection and the shadow collection.
+    """
+    migration = (config or {}).get(EMBEDDING_MIGRATION_KEY)
+    if not migration or migration.get("status") not in DUAL_WRITE_STATUSES:
+        return None
+    return migration
+
+
 def ensure_active_vector_collection_config(tenant_id: str, config: dict | None) -> dict:
     """Ensure tenant config includes an active collection, returning a new dict."""
     new_config = dict(config or {})
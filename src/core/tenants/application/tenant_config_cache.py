@@ -0,0 +1,239 @@
+"""
+Tenant Config Snapshots
+=======================
+
+Immutable, per-process cached snapshots of tenant configuration.
+
+A request resolves its tenant's snapshot once and passes it down to
+retrieval and generation instead of each layer re-reading the tenant row.
+Snapshots are versioned through Redis counters: writers bump the version and
+broadcast an invalidation, and cached snapshots are re-validated against the
+version counter (one Redis round trip) before they are trusted again after
+``revalidate_after`` seconds. Derived objects (active collection, scoped
+provider factories, embedding services) are memoized on the snapshot and are
+dropped with it.
+"""
+
+import asyncio
+import copy
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterator, Mapping
+from typing import Any
+
+from src.core.cache.decorators import get_cache_client
+from src.core.cache.invalidation import InvalidationListener, publish_invalidation
+from src.core.tenants.application.active_vector_collection import (
+    resolve_active_vector_collection,
+)
+
+logger = logging.getLogger(__name__)
+
+TENANT_CONFIG_CHANNEL = "tenant_config:invalidate"
+TENANT_CONFIG_VERSION_KEY = "tenant_config:version:{tenant_id}"
+TENANT_CONFIG_EPOCH_KEY = "tenant_config:epoch"
+INVALIDATE_ALL = "*"
+
+
+class TenantConfigSnapshot(Mapping[str, Any]):
+    """
+    Read-only view of a tenant's configuration at a given version.
+
+    Behaves like the ``tenant.config`` dict for reads (``get``, ``[]``, ``in``),
+    so it can be passed wherever a tenant config mapping is expected. Use
+    ``to_dict()`` for a mutable copy.
+    """
+
+    __slots__ = ("tenant_id", "version", "loaded_at", "_data", "_derived")
+
+    def __init__(self, tenant_id: str, config: Mapping[str, Any] | None, version: str = ""):
+        self.tenant_id = tenant_id
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self._data: dict[str, Any] = copy.deepcopy(dict(config or {}))
+        self._derived: dict[Any, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"<TenantConfigSnapshot(tenant={self.tenant_id}, version={self.version})>"
+
+    def to_dict(self) -> dict[str, Any]:
+        return copy.deepcopy(self._data)
+
+    def derive(self, key: Any, builder: Callable[[], Any]) -> Any:
+        """Memoize an object derived from this snapshot's configuration."""
+        if key not in self._derived:
+            self._derived[key] = builder()
+        return self._derived[key]
+
+    @property
+    def active_collection(self) -> str:
+        return self.derive(
+            "active_collection",
+            lambda: resolve_active_vector_collection(self.tenant_id, self._data),
+        )
+
+
+def derive_from_config(config: Mapping[str, Any] | None, key: Any, builder: Callable[[], Any]):
+    """Memoize on a snapshot; build fresh for plain dict configs."""
+    if isinstance(config, TenantConfigSnapshot):
+        return config.derive(key, builder)
+    return builder()
+
+
+ConfigLoader = Callable[[str], Awaitable[Mapping[str, Any] | None]]
+
+
+class TenantConfigCache:
+    """
+    Per-process cache of ``TenantConfigSnapshot`` keyed by tenant id.
+    """
+
+    def __init__(
+        self,
+        loader: ConfigLoader | None = None,
+        revalidate_after: float = 10.0,
+        max_age: float = 300.0,
+    ):
+        self._loader = loader
+        self.revalidate_after = revalidate_after
+        self.max_age = max_age
+        self._entries: dict[str, TenantConfigSnapshot] = {}
+        self._checked_at: dict[str, float] = {}
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._listener: InvalidationListener | None = None
+
+    async def get(self, tenant_id: str) -> TenantConfigSnapshot:
+        """Return the tenant's snapshot, loading or re-validating it as needed."""
+        snapshot = self._entries.get(tenant_id)
+        now = time.monotonic()
+
+        if snapshot is not None and now - snapshot.loaded_at <= self.max_age:
+            if now - self._checked_at.get(tenant_id, 0.0) <= self.revalidate_after:
+                return snapshot
+            current = await self._read_version(tenant_id)
+            if current is not None and current == snapshot.version:
+                self._checked_at[tenant_id] = now
+                return snapshot
+
+        pending = self._inflight.get(tenant_id)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[tenant_id] = future
+        try:
+            snapshot = await self._load(tenant_id)
+            future.set_result(snapshot)
+            return snapshot
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(tenant_id, None)
+
+    async def _load(self, tenant_id: str) -> TenantConfigSnapshot:
+        # Read the version first so a concurrent update can only make us stale-then-reload
+        version = await self._read_version(tenant_id)
+        config = await self._load_config(tenant_id)
+        snapshot = TenantConfigSnapshot(tenant_id, config, version=version or "")
+        self._entries[tenant_id] = snapshot
+        self._checked_at[tenant_id] = time.monotonic()
+        return snapshot
+
+    async def _load_config(self, tenant_id: str) -> Mapping[str, Any] | None:
+        if self._loader is not None:
+            return await self._loader(tenant_id)
+
+        from sqlalchemy import select
+
+        from src.core.database.session import get_session_maker
+        from src.core.tenants.domain.tenant import Tenant
+
+        async with get_session_maker()() as session:
+            result = await session.execute(select(Tenant.config).where(Tenant.id == tenant_id))
+            return result.scalar_one_or_none()
+
+    async def _read_version(self, tenant_id: str) -> str | None:
+        """Current "epoch:tenant" version from Redis, or None if unavailable."""
+        try:
+            epoch, version = await get_cache_client().mget(
+                TENANT_CONFIG_EPOCH_KEY, TENANT_CONFIG_VERSION_KEY.format(tenant_id=tenant_id)
+            )
+        except Exception as e:
+            logger.debug(f"Tenant config version check unavailable: {e}")
+            return None
+        return f"{_as_int(epoch)}:{_as_int(version)}"
+
+    def invalidate(self, tenant_id: str | None = None) -> None:
+        """Drop one tenant's snapshot or, with no id, every snapshot."""
+        if tenant_id is None or tenant_id == INVALIDATE_ALL:
+            self._entries.clear()
+            self._checked_at.clear()
+            return
+        self._entries.pop(tenant_id, None)
+        self._checked_at.pop(tenant_id, None)
+
+    def ensure_listener(self, redis_url: str | None = None) -> None:
+        """Start the Redis invalidation listener for this process (idempotent)."""
+        if self._listener is None:
+            self._listener = InvalidationListener(
+                TENANT_CONFIG_CHANNEL,
+                on_message=lambda tenant_id: self.invalidate(tenant_id or None),
+                # Version checks still catch updates missed while disconnected
+                on_disconnect=None,
+            )
+        self._listener.ensure_started(redis_url)
+
+    async def stop_listener(self) -> None:
+        if self._listener is not None:
+            await self._listener.stop()
+
+
+def _as_int(value: Any) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+_tenant_config_cache = TenantConfigCache()
+
+
+def get_tenant_config_cache() -> TenantConfigCache:
+    return _tenant_config_cache
+
+
+async def get_tenant_config_snapshot(tenant_id: str) -> TenantConfigSnapshot:
+    """Resolve the current configuration snapshot for a tenant."""
+    return await _tenant_config_cache.get(tenant_id)
+
+
+async def invalidate_tenant_config(tenant_id: str | None = None) -> None:
+    """
+    Bump the tenant's config version and invalidate cached snapshots everywhere.
+
+    Args:
+        tenant_id: Tenant whose config changed; None invalidates every tenant.
+    """
+    _tenant_config_cache.invalidate(tenant_id)
+    try:
+        if tenant_id is None:
+            await get_cache_client().incr(TENANT_CONFIG_EPOCH_KEY)
+        else:
+            await get_cache_client().incr(TENANT_CONFIG_VERSION_KEY.format(tenant_id=tenant_id))
+    except Exception as e:
+        logger.warning(f"Failed to bump tenant config version: {e}")
+    await publish_invalidation(TENANT_CONFIG_CHANNEL, tenant_id or INVALIDATE_ALL)
@@ -11,11 +11,13 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from src.core.admin_ops.application.auth_principal_cache import invalidate_principals
 from src.core.admin_ops.domain.api_key import ApiKey, ApiKeyTenant
 from src.core.ingestion.domain.document import Document
 from src.core.tenants.application.active_vector_collection import (
     ensure_active_vector_collection_config,
 )
+from src.core.tenants.application.tenant_config_cache import invalidate_tenant_config
 from src.core.tenants.domain.tenant import Tenant
 
 
@@ -69,6 +71,8 @@ class TenantService:
 
         await self.session.commit()
         await self.session.refresh(tenant)
+        if "config" in kwargs:
+            await invalidate_tenant_config(tenant_id)
         return tenant
 
     async def delete_tenant(
@@ -99,6 +103,10 @@ class TenantService:
         # 2. Cleanup Postgres
         await self.session.delete(tenant)
         await self.session.commit()
+
+        # Cached principals may still list the tenant
+        await invalidate_principals()
+        await invalidate_tenant_config(tenant_id)
         return True
 
     async def add_key_to_tenant(self, api_key_id: str, tenant_id: str, role: str = "user") -> bool:
@@ -113,17 +121,20 @@ class TenantService:
 
         try:
             await self.session.commit()
-            return True
         except Exception:
             await self.session.rollback()
             return False
 
+        await invalidate_principals(api_key_id)
+        return True
+
     async def remove_key_from_tenant(self, api_key_id: str, tenant_id: str) -> bool:
         """Unlink an API key from a tenant."""
         link = await self.session.get(ApiKeyTenant, (api_key_id, tenant_id))
         if link:
             await self.session.delete(link)
             await self.session.commit()
+            await invalidate_principals(api_key_id)
             return True
         return False
 
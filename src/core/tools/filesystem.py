@@ -3,43 +3,340 @@ File System Tools
 =================
 
 Tools that allow the Agent to explore the codebase structure and content.
+
+The tools are sandboxed to their base path and never touch the disk on the
+event loop: every call runs in a small shared worker pool under a time limit,
+and its output is capped. ``grep_search`` is answered from a ``CodeIndex``,
+a process-wide index of the tree (paths, mtimes and a trigram index of file
+contents) that is refreshed incrementally, so a search only opens the files
+that can contain the pattern.
 """
 
+import asyncio
+import logging
 import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+IGNORED_DIRS = frozenset({"__pycache__", "node_modules", "venv", ".git", ".gemini"})
+
+# Time a worker gets past its deadline to notice it and return partial results
+TIMEOUT_GRACE_SECONDS = 1.0
+
+
+@dataclass
+class FilesystemToolsConfig:
+    max_workers: int = 4
+    timeout_seconds: float = 5.0
+    max_output_chars: int = 12_000
+    max_matches: int = 20
+    max_entries: int = 500
+    # Larger files are listed but neither indexed nor searched
+    max_indexed_file_bytes: int = 1_000_000
+    # Minimum time between two stat walks of the tree
+    refresh_interval_seconds: float = 2.0
+
+
+class ToolTimeoutError(Exception):
+    """A filesystem tool ran past its time limit."""
+
+
+def _is_ignored(name: str) -> bool:
+    return name.startswith(".") or name in IGNORED_DIRS
+
+
+def _trigrams(data: bytes) -> set[int]:
+    """Distinct byte trigrams of ``data``, packed into ints."""
+    if len(data) < 3:
+        return set()
+    codes = np.frombuffer(data, dtype=np.uint8).astype(np.uint32)
+    packed = (codes[:-2] << 16) | (codes[1:-1] << 8) | codes[2:]
+    return set(np.unique(packed).tolist())
+
+
+def _fold(text: str) -> bytes:
+    return text.casefold().encode("utf-8")
+
+
+@dataclass
+class _IndexedFile:
+    mtime_ns: int
+    size: int
+    trigrams: frozenset[int]
+
+
+class CodeIndex:
+    """
+    Incremental index of the text files under a root directory.
+
+    ``refresh`` stats the tree and re-reads only files whose mtime or size
+    changed; deleted files leave the index. Trigrams are taken from the
+    case-folded UTF-8 content, so candidates for a pattern are a superset of
+    the files that contain it in any case, and matches are confirmed against
+    the file itself.
+    Thread-safe; meant to be called from the worker pool.
+    """
+
+    def __init__(self, root: str, config: FilesystemToolsConfig | None = None):
+        self.root = root
+        self.config = config or FilesystemToolsConfig()
+        self._files: dict[str, _IndexedFile] = {}
+        self._postings: dict[int, set[str]] = {}
+        self._refreshed_at = 0.0
+        self._lock = threading.Lock()
+
+    def refresh(self, force: bool = False) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._refreshed_at < self.config.refresh_interval_seconds:
+                return
+            seen = self._walk()
+            for rel_path in self._files.keys() - seen.keys():
+                self._drop(rel_path)
+            changed = 0
+            for rel_path, (mtime_ns, size) in seen.items():
+                entry = self._files.get(rel_path)
+                if entry is None or (entry.mtime_ns, entry.size) != (mtime_ns, size):
+                    self._add(rel_path, mtime_ns, size)
+                    changed += 1
+            self._refreshed_at = now
+            if changed:
+                logger.debug(f"Code index of {self.root}: {changed} files (re)indexed")
+
+    def candidates(self, pattern: str, prefix: str = "") -> list[str]:
+        """Indexed paths under ``prefix`` that may contain ``pattern``, sorted."""
+        with self._lock:
+            paths: set[str] | None = None
+            for trigram in _trigrams(_fold(pattern)):
+                posting = self._postings.get(trigram, set())
+                paths = set(posting) if paths is None else paths & posting
+                if not paths:
+                    return []
+            if paths is None:
+                # Under three characters: every indexed file is a candidate
+                paths = set(self._files)
+        return sorted(path for path in paths if path.startswith(prefix))
+
+    def _walk(self) -> dict[str, tuple[int, int]]:
+        seen: dict[str, tuple[int, int]] = {}
+        pending = [self.root]
+        while pending:
+            directory = pending.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                if _is_ignored(entry.name):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        stat = entry.stat(follow_symlinks=False)
+                        rel_path = os.path.relpath(entry.path, self.root)
+                        seen[rel_path] = (stat.st_mtime_ns, stat.st_size)
+                except OSError:
+                    continue
+        return seen
+
+    def _add(self, rel_path: str, mtime_ns: int, size: int) -> None:
+        self._drop(rel_path)
+        trigrams: frozenset[int] = frozenset()
+        if size <= self.config.max_indexed_file_bytes:
+            try:
+                with open(os.path.join(self.root, rel_path), "rb") as f:
+                    data = f.read()
+                # Binary files are remembered (so they aren't re-read) but not searchable
+                if b"\0" not in data:
+                    trigrams = frozenset(_trigrams(_fold(data.decode("utf-8", errors="ignore"))))
+            except OSError:
+                return
+        self._files[rel_path] = _IndexedFile(mtime_ns, size, trigrams)
+        for trigram in trigrams:
+            self._postings.setdefault(trigram, set()).add(rel_path)
+
+    def _drop(self, rel_path: str) -> None:
+        entry = self._files.pop(rel_path, None)
+        if entry is None:
+            return
+        for trigram in entry.trigrams:
+            posting = self._postings.get(trigram)
+            if posting is not None:
+                posting.discard(rel_path)
+                if not posting:
+                    del self._postings[trigram]
+
+    def searchable(self, rel_path: str) -> bool:
+        entry = self._files.get(rel_path)
+        return entry is not None and bool(entry.trigrams)
 
-def create_filesystem_tools(base_path: str = ".") -> list[dict[str, Any]]:
+
+_indexes: dict[str, CodeIndex] = {}
+_indexes_lock = threading.Lock()
+_executor: ThreadPoolExecutor | None = None
+
+
+def get_code_index(root: str, config: FilesystemToolsConfig | None = None) -> CodeIndex:
+    """Process-wide index of ``root``, kept warm across agent calls."""
+    root = os.path.realpath(root)
+    with _indexes_lock:
+        index = _indexes.get(root)
+        if index is None:
+            index = _indexes[root] = CodeIndex(root, config)
+        return index
+
+
+def _get_executor(max_workers: int) -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fs-tools")
+    return _executor
+
+
+def _truncate(text: str, limit: int) -> str:
+    if len(text) <= limit:
+        return text
+    return text[:limit] + f"\n... (output truncated at {limit} characters)"
+
+
+class Workspace:
+    """Sandboxed, time- and output-bounded file access below a root directory."""
+
+    def __init__(self, base_path: str, config: FilesystemToolsConfig | None = None):
+        self.config = config or FilesystemToolsConfig()
+        self.root = os.path.realpath(base_path)
+        self.index = get_code_index(self.root, self.config)
+
+    async def run(self, fn: Callable[[float], str]) -> str:
+        """Run ``fn(deadline)`` in the worker pool under the time and output limits."""
+        timeout = self.config.timeout_seconds
+        deadline = time.monotonic() + timeout
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(_get_executor(self.config.max_workers), fn, deadline)
+        try:
+            output = await asyncio.wait_for(future, timeout + TIMEOUT_GRACE_SECONDS)
+        except (TimeoutError, ToolTimeoutError):
+            return f"Error: the operation timed out after {timeout:g}s; narrow it down."
+        return _truncate(output, self.config.max_output_chars)
+
+    def resolve(self, path: str) -> str:
+        """Absolute path of ``path`` inside the workspace; raises ValueError outside it."""
+        full_path = os.path.realpath(os.path.join(self.root, path))
+        if os.path.commonpath([full_path, self.root]) != self.root:
+            raise ValueError(f"Path '{path}' is outside the workspace.")
+        return full_path
+
+    def list_directory(self, path: str, deadline: float) -> str:
+        full_path = self.resolve(path)
+        if not os.path.exists(full_path):
+            return f"Error: Path '{path}' does not exist."
+
+        output = []
+        with os.scandir(full_path) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if _is_ignored(entry.name):
+                    continue
+                if len(output) >= self.config.max_entries:
+                    output.append(f"... (truncated at {self.config.max_entries} entries)")
+                    break
+                label = "[DIR] " if entry.is_dir() else "[FILE]"
+                output.append(f"{label} {entry.name}")
+        return "\n".join(output) if output else "(empty directory)"
+
+    def read_file(self, path: str, start_line: int, end_line: int, deadline: float) -> str:
+        full_path = self.resolve(path)
+        if not os.path.exists(full_path):
+            return f"Error: File '{path}' does not exist."
+        if not os.path.isfile(full_path):
+            return f"Error: '{path}' is not a file."
+
+        start_line = max(start_line, 1)
+        budget = self.config.max_output_chars
+        selected: list[str] = []
+        total_lines = 0
+        with open(full_path, encoding="utf-8") as f:
+            for total_lines, line in enumerate(f, 1):
+                if total_lines % 10_000 == 0 and time.monotonic() > deadline:
+                    raise ToolTimeoutError(path)
+                # Past the budget, keep counting lines for the header but stop collecting
+                if budget <= 0 or total_lines < start_line:
+                    continue
+                if end_line != -1 and total_lines > end_line:
+                    continue
+                selected.append(line)
+                budget -= len(line)
+        if end_line == -1 or end_line > total_lines:
+            end_line = total_lines
+        shown_end = start_line + len(selected) - 1 if selected else end_line
+        note = "" if shown_end >= end_line else f" (truncated at line {shown_end})"
+        content = "".join(selected)
+        return f"--- File: {path} ({start_line}-{end_line}/{total_lines}){note} ---\n{content}"
+
+    def grep(self, pattern: str, path: str, recursive: bool, deadline: float) -> str:
+        search_path = self.resolve(path)
+        self.index.refresh()
+        prefix = os.path.relpath(search_path, self.root)
+        prefix = "" if prefix == "." else prefix + os.sep
+
+        limit = self.config.max_matches
+        matches: list[str] = []
+        timed_out = False
+        for rel_path in self.index.candidates(pattern, prefix):
+            if not recursive and os.sep in rel_path[len(prefix) :]:
+                continue
+            if not self.index.searchable(rel_path):
+                continue
+            if time.monotonic() > deadline:
+                timed_out = True
+                break
+            try:
+                with open(
+                    os.path.join(self.root, rel_path), encoding="utf-8", errors="ignore"
+                ) as f:
+                    for i, line in enumerate(f, 1):
+                        if pattern in line:
+                            matches.append(f"{rel_path}:{i}: {line.strip()[:100]}")
+                            if len(matches) >= limit:
+                                return f"Found matches (truncated at {limit}):\n" + "\n".join(
+                                    matches
+                                )
+            except OSError:
+                continue  # Skip unreadable files
+
+        if timed_out:
+            header = "Search timed out; partial matches" if matches else "Search timed out"
+            return f"{header} for '{pattern}'." + ("\n" + "\n".join(matches) if matches else "")
+        if not matches:
+            return f"No matches found for '{pattern}'."
+        return "Found matches:\n" + "\n".join(matches)
+
+
+def create_filesystem_tools(
+    base_path: str = ".", config: FilesystemToolsConfig | None = None
+) -> list[dict[str, Any]]:
     """
     Create a list of filesystem tool definitions.
     """
+    workspace = Workspace(base_path, config)
+    # Build or catch up the index in the background so the first search is fast
+    _get_executor(workspace.config.max_workers).submit(workspace.index.refresh)
 
     # 1. list_directory
     async def list_directory(path: str = ".") -> str:
         """List files and directories in a given path."""
         try:
-            full_path = os.path.join(base_path, path)
-            if not os.path.exists(full_path):
-                return f"Error: Path '{path}' does not exist."
-
-            items = os.listdir(full_path)
-            # Filter out hidden files and common ignore folders
-            items = [
-                i
-                for i in items
-                if not i.startswith(".")
-                and i not in ("__pycache__", "node_modules", "venv", ".git", ".gemini")
-            ]
-
-            output = []
-            for item in sorted(items):
-                item_path = os.path.join(full_path, item)
-                if os.path.isdir(item_path):
-                    output.append(f"[DIR]  {item}")
-                else:
-                    output.append(f"[FILE] {item}")
-
-            return "\n".join(output) if output else "(empty directory)"
+            return await workspace.run(lambda deadline: workspace.list_directory(path, deadline))
+        except ValueError as e:
+            return f"Error: {e}"
         except Exception as e:
             return f"Error listing directory: {str(e)}"
 
@@ -47,76 +344,27 @@ def create_filesystem_tools(base_path: str = ".") -> list[dict[str, Any]]:
     async def read_file(path: str, start_line: int = 1, end_line: int = -1) -> str:
         """Read the contents of a file."""
         try:
-            full_path = os.path.join(base_path, path)
-            if not os.path.exists(full_path):
-                return f"Error: File '{path}' does not exist."
-            if not os.path.isfile(full_path):
-                return f"Error: '{path}' is not a file."
-
-            with open(full_path, encoding="utf-8") as f:
-                lines = f.readlines()
-
-            total_lines = len(lines)
-            if start_line < 1:
-                start_line = 1
-            if end_line == -1 or end_line > total_lines:
-                end_line = total_lines
-
-            # 0-indexed slicing
-            selected_lines = lines[start_line - 1 : end_line]
-            content = "".join(selected_lines)
-
-            return f"--- File: {path} ({start_line}-{end_line}/{total_lines}) ---\n{content}"
-
+            return await workspace.run(
+                lambda deadline: workspace.read_file(path, start_line, end_line, deadline)
+            )
         except UnicodeDecodeError:
             return "Error: File appears to be binary or non-UTF-8."
+        except ValueError as e:
+            return f"Error: {e}"
         except Exception as e:
             return f"Error reading file: {str(e)}"
 
-    # 3. grep_search (Simple regex/string search)
+    # 3. grep_search (substring search over the code index)
     async def grep_search(pattern: str, path: str = ".", recursive: bool = True) -> str:
         """Search for a string pattern in files."""
+        if not pattern:
+            return "Error: empty search pattern."
         try:
-            # Basic implementation using glob and reading files
-            # In a real system, we might shell out to grep/ripgrep for speed,
-            # but keeping it python-native is safer for this demo.
-
-            matches = []
-            search_path = os.path.join(base_path, path)
-
-            # Walk through directory
-            for root, dirs, files in os.walk(search_path):
-                # Skip hidden/ignored
-                dirs[:] = [
-                    d
-                    for d in dirs
-                    if not d.startswith(".")
-                    and d not in ("__pycache__", "node_modules", "venv", ".git", ".gemini")
-                ]
-
-                for file in files:
-                    if file.startswith("."):
-                        continue
-
-                    file_path = os.path.join(root, file)
-                    rel_path = os.path.relpath(file_path, base_path)
-
-                    try:
-                        with open(file_path, encoding="utf-8", errors="ignore") as f:
-                            for i, line in enumerate(f, 1):
-                                if pattern in line:  # Simple substring match for MVP
-                                    matches.append(f"{rel_path}:{i}: {line.strip()[:100]}")
-                                    if len(matches) >= 20:  # Limit results
-                                        return "Found matches (truncated at 20):\n" + "\n".join(
-                                            matches
-                                        )
-                    except Exception:
-                        continue  # Skip unreadable files
-
-            if not matches:
-                return f"No matches found for '{pattern}'."
-            return "Found matches:\n" + "\n".join(matches)
-
+            return await workspace.run(
+                lambda deadline: workspace.grep(pattern, path, recursive, deadline)
+            )
+        except ValueError as e:
+            return f"Error: {e}"
         except Exception as e:
             return f"Error executing grep: {str(e)}"
 
@@ -3,43 +3,48 @@ Graph Tools
 ===========
 
 Tools for the agent to interact with the Neo4j Knowledge Graph.
+
+Agent-written Cypher runs through the CypherGuard: read-only, scoped to the
+tenant, row- and time-bounded, and serialized under a size budget.
 """
 
 import logging
 from typing import Any
 
-from src.core.graph.domain.ports.graph_client import get_graph_client
+from src.core.graph.application.cypher_guard import CypherRejectedError, get_cypher_guard
+from src.shared.context import get_current_tenant
 
 logger = logging.getLogger(__name__)
 
 
-async def query_graph(query: str, parameters: dict[str, Any] | None = None) -> str:
+async def query_graph(
+    query: str,
+    parameters: dict[str, Any] | None = None,
+    tenant_id: str | None = None,
+) -> str:
     """
-    Execute a read-only Cypher query against the knowledge graph.
+    Execute a read-only Cypher query against the tenant's knowledge graph.
 
     Use this tool to find relationships between entities, explore the graph structure,
     or look up specific nodes.
 
     Args:
-        query: The Cypher query string (e.g. "MATCH (n:Person) RETURN n LIMIT 5")
+        query: The Cypher query string (e.g. "MATCH (n:Entity) RETURN n.name LIMIT 5")
         parameters: Optional dictionary of query parameters.
+        tenant_id: Tenant to scope the query to (defaults to the request's tenant).
 
     Returns:
-        JSON string representation of the query results.
+        Compact text of the query results (a column header and one JSON row per line).
     """
-    try:
-        results = await get_graph_client().execute_read(query, parameters)
-
-        if not results:
-            return "No results found."
-
-        # Format results for readability
-        formatted = []
-        for record in results:
-            formatted.append(str(record))
-
-        return "\n".join(formatted)
+    tenant_id = tenant_id or get_current_tenant()
+    if not tenant_id:
+        return "Error executing graph query: no tenant context."
 
+    try:
+        return await get_cypher_guard().run(query, str(tenant_id), parameters)
+    except CypherRejectedError as e:
+        logger.info(f"Rejected agent Cypher for tenant {tenant_id}: {e}")
+        return f"Query rejected: {e}"
     except Exception as e:
         return f"Error executing graph query: {str(e)}"
 
@@ -50,7 +55,12 @@ GRAPH_TOOLS = [
         "type": "function",
         "function": {
             "name": "query_graph",
-            "description": "Execute a Cypher query to search the Knowledge Graph (Neo4j). Use this to find entities and relationships.",
+            "description": (
+                "Execute a read-only Cypher query to search the Knowledge Graph (Neo4j). "
+                "Use this to find entities and relationships. Results are limited to the "
+                "current tenant and to a few dozen rows, so anchor queries on specific "
+                "entities and return only the properties you need."
+            ),
             "parameters": {
                 "type": "object",
                 "properties": {
@@ -61,3 +71,14 @@ GRAPH_TOOLS = [
         },
     }
 ]
+
+
+def create_graph_tool(tenant_id: str) -> dict[str, Any]:
+    """
+    Create the 'query_graph' tool definition bound to a tenant.
+    """
+
+    async def bound_query_graph(query: str, parameters: dict[str, Any] | None = None) -> str:
+        return await query_graph(query, parameters, tenant_id=tenant_id)
+
+    return {"name": "query_graph", "func": bound_query_graph, "schema": GRAPH_TOOLS[0]}
@@ -20,7 +20,11 @@ class CeleryTaskDispatcher(TaskDispatcher):
     """
 
     async def dispatch(
-        self, task_name: str, args: list[Any] | None = None, kwargs: dict[str, Any] | None = None
+        self,
+        task_name: str,
+        args: list[Any] | None = None,
+        kwargs: dict[str, Any] | None = None,
+        countdown: float | None = None,
     ) -> str:
         args = args or []
         kwargs = kwargs or {}
@@ -43,7 +47,9 @@ class CeleryTaskDispatcher(TaskDispatcher):
                         f"Task {task_name} not found in registry for eager execution. Falling back to send_task."
                     )
 
-            result = celery_app.send_task(task_name, args=args, kwargs=kwargs)
+            result = celery_app.send_task(
+                task_name, args=args, kwargs=kwargs, countdown=countdown
+            )
             return str(result.id)
         except Exception as e:
             logger.error(f"Failed to dispatch task {task_name}: {e}")
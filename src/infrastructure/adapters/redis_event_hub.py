@@ -0,0 +1,236 @@
+"""
+Document Event Hub
+==================
+
+Process-wide fan-out of document status events for SSE streams.
+
+A single Redis pattern subscription (``document:*:status``) feeds every SSE
+client in the API process through in-process subscriptions, instead of one
+Redis connection and subscription per client. Each subscription coalesces
+progress ticks per document so a slow or busy client receives at most one
+progress update per ``min_interval`` seconds for each document, while status
+transitions are delivered immediately.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+import redis.asyncio as redis
+
+from src.shared.kernel.runtime import get_settings
+
+logger = logging.getLogger(__name__)
+
+DOCUMENT_STATUS_PATTERN = "document:*:status"
+TERMINAL_STATUSES = frozenset({"ready", "failed", "completed"})
+
+
+def is_terminal_event(event: dict[str, Any]) -> bool:
+    """Whether the event reports a terminal document status."""
+    return str(event.get("status", "")).lower() in TERMINAL_STATUSES
+
+
+class EventSubscription:
+    """
+    In-process subscriber to document status events.
+
+    Holds at most one pending event per document: a newer event for the same
+    document replaces the queued one, so memory is bounded by the number of
+    documents being watched rather than by the event rate.
+    """
+
+    def __init__(
+        self,
+        tenant_id: str | None = None,
+        document_ids: set[str] | None = None,
+        min_interval: float = 0.5,
+    ):
+        self.tenant_id = tenant_id
+        self.document_ids = document_ids
+        self.min_interval = min_interval
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._last_status: dict[str, str] = {}
+        self._last_sent: dict[str, float] = {}
+        self._wakeup = asyncio.Event()
+
+    def matches(self, event: dict[str, Any]) -> bool:
+        if self.document_ids is not None and event.get("document_id") not in self.document_ids:
+            return False
+        if self.tenant_id is not None and event.get("tenant_id") != self.tenant_id:
+            return False
+        return True
+
+    def offer(self, event: dict[str, Any]) -> None:
+        """Queue an event, replacing any undelivered event for the same document."""
+        document_id = str(event.get("document_id"))
+        self._pending.pop(document_id, None)
+        self._pending[document_id] = event
+        self._wakeup.set()
+
+    def _is_due(self, document_id: str, event: dict[str, Any], now: float) -> bool:
+        status = event.get("status")
+        if status != self._last_status.get(document_id) or is_terminal_event(event):
+            return True
+        return now - self._last_sent.get(document_id, 0.0) >= self.min_interval
+
+    async def get(self, timeout: float) -> dict[str, Any] | None:
+        """
+        Wait for the next deliverable event.
+
+        Returns:
+            The event, or None if nothing became deliverable within ``timeout``.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            now = time.monotonic()
+            next_due = deadline
+            for document_id, event in self._pending.items():
+                if self._is_due(document_id, event, now):
+                    del self._pending[document_id]
+                    if is_terminal_event(event):
+                        # The document is done; don't keep its state for the stream's lifetime
+                        self._last_status.pop(document_id, None)
+                        self._last_sent.pop(document_id, None)
+                    else:
+                        self._last_status[document_id] = event.get("status")
+                        self._last_sent[document_id] = now
+                    return event
+                last_sent = self._last_sent.get(document_id, 0.0)
+                next_due = min(next_due, last_sent + self.min_interval)
+
+            if now >= deadline:
+                return None
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(0.0, next_due - now))
+            except TimeoutError:
+                pass
+
+
+class DocumentEventHub:
+    """
+    Single Redis pattern subscription shared by all SSE clients of the process.
+
+    The reader task starts with the first subscriber and stops when the last
+    one leaves; it reconnects with backoff if the Redis connection drops.
+    """
+
+    def __init__(
+        self,
+        redis_url: str,
+        pattern: str = DOCUMENT_STATUS_PATTERN,
+        min_interval: float = 0.5,
+    ):
+        self.redis_url = redis_url
+        self.pattern = pattern
+        self.min_interval = min_interval
+        self._subscribers: set[EventSubscription] = set()
+        self._reader: asyncio.Task | None = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @asynccontextmanager
+    async def subscribe(
+        self,
+        tenant_id: str | None = None,
+        document_ids: set[str] | None = None,
+    ) -> AsyncIterator[EventSubscription]:
+        """
+        Subscribe to document status events.
+
+        Args:
+            tenant_id: Only deliver events of this tenant
+            document_ids: Only deliver events of these documents
+        """
+        subscription = EventSubscription(
+            tenant_id=tenant_id, document_ids=document_ids, min_interval=self.min_interval
+        )
+        self._subscribers.add(subscription)
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.create_task(self._run())
+        try:
+            yield subscription
+        finally:
+            self._subscribers.discard(subscription)
+            if not self._subscribers:
+                await self._stop_reader()
+
+    def publish_local(self, data: str | bytes | dict[str, Any]) -> None:
+        """Fan an event out to matching in-process subscribers."""
+        if isinstance(data, dict):
+            event = data
+        else:
+            try:
+                event = json.loads(data)
+            except (TypeError, ValueError):
+                logger.debug(f"Ignoring non-JSON document event: {data!r}")
+                return
+        if not isinstance(event, dict) or "document_id" not in event:
+            return
+
+        for subscription in list(self._subscribers):
+            if subscription.matches(event):
+                subscription.offer(event)
+
+    async def close(self) -> None:
+        self._subscribers.clear()
+        await self._stop_reader()
+
+    async def _stop_reader(self) -> None:
+        reader, self._reader = self._reader, None
+        if reader and not reader.done():
+            reader.cancel()
+            await asyncio.gather(reader, return_exceptions=True)
+
+    async def _run(self) -> None:
+        backoff = 1.0
+        while True:
+            client = redis.from_url(self.redis_url, decode_responses=True)
+            pubsub = client.pubsub()
+            try:
+                await pubsub.psubscribe(self.pattern)
+                logger.info(f"Document event hub subscribed to {self.pattern}")
+                backoff = 1.0
+                async for message in pubsub.listen():
+                    if message.get("type") == "pmessage":
+                        self.publish_local(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Document event hub connection lost: {e}")
+            finally:
+                try:
+                    await pubsub.aclose()
+                    await client.aclose()
+                except Exception:
+                    pass
+
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30.0)
+
+
+_event_hub: DocumentEventHub | None = None
+
+
+def get_event_hub() -> DocumentEventHub:
+    """Get or create the process-wide document event hub."""
+    global _event_hub
+    if _event_hub is None:
+        _event_hub = DocumentEventHub(get_settings().db.redis_url)
+    return _event_hub
+
+
+async def close_event_hub() -> None:
+    """Stop the process-wide hub (application shutdown)."""
+    global _event_hub
+    if _event_hub is not None:
+        await _event_hub.close()
+        _event_hub = None
@@ -18,23 +18,48 @@ Design
 
 This is *non-preemptive*: in-flight requests are never cancelled. Reservations
 ensure higher classes can always acquire capacity without needing to preempt.
+
+Adaptive limits
+- Each provider endpoint (e.g. one Ollama base URL) gets its own limiter.
+- Within the static ceilings above, every work class has an adaptive limit kept
+  in a Redis hash next to its leases, so all API and Celery processes share it.
+- Every call held through `hold()` reports its outcome (latency, 429, error).
+  The limit follows AIMD (see `AdaptiveLimitState.observe`): +1/limit per
+  healthy call, multiplied by `decrease_factor` on a 429, a high error rate or
+  recent latency well above its long-run average. Decreases are rate-limited
+  cluster-wide, so N workers hitting the same 429 burst back off once, not N
+  times.
+- `capacity_snapshot()` exposes limits, in-flight and queued calls per endpoint.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import logging
 import os
 import time
 import uuid
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
-from typing import AsyncIterator, Literal
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Literal
+from urllib.parse import urlparse
 
 
 logger = logging.getLogger(__name__)
 
 WorkClass = Literal["chat", "ingestion", "communities"]
+Outcome = Literal["ok", "error", "rate_limited"]
+
+WORK_CLASSES: tuple[WorkClass, ...] = ("chat", "ingestion", "communities")
+
+# Registry of endpoint keys that have reported, for `capacity_snapshot()`
+_ENDPOINTS_KEY = "llm_capacity:endpoints"
+
+# Endpoint keys whose lease the current task holds (nested calls reuse it)
+_held_endpoints: contextvars.ContextVar[frozenset[str]] = contextvars.ContextVar(
+    "llm_capacity_held", default=frozenset()
+)
 
 
 def _env_int(name: str, default: int) -> int:
@@ -74,11 +99,22 @@ class LLMCapacitySettings:
     chat_wait_timeout_seconds: float
     ingestion_wait_timeout_seconds: float
     communities_wait_timeout_seconds: float
+    # Adaptive limits (AIMD within the static ceilings above)
+    adaptive: bool = True
+    min_limit: int = 1
+    decrease_factor: float = 0.7
+    # Minimum time between two decreases of one limit, across the cluster
+    decrease_cooldown_seconds: float = 5.0
+    # Recent latency above this multiple of the baseline counts as congestion
+    latency_tolerance: float = 2.0
+    error_rate_threshold: float = 0.2
 
     @staticmethod
-    def from_env() -> "LLMCapacitySettings":
+    def from_env() -> LLMCapacitySettings:
         enabled_raw = os.getenv("OLLAMA_CAPACITY_ENABLED", "true").lower()
         enabled = enabled_raw in ("1", "true", "yes", "y", "on")
+        adaptive_raw = os.getenv("OLLAMA_CAPACITY_ADAPTIVE", "true").lower()
+        adaptive = adaptive_raw in ("1", "true", "yes", "y", "on")
 
         total = _env_int("OLLAMA_CAPACITY_TOTAL", 6)
         reserved_chat = _env_int("OLLAMA_CAPACITY_RESERVED_CHAT", 2)
@@ -109,14 +145,189 @@ class LLMCapacitySettings:
             communities_wait_timeout_seconds=_env_float(
                 "OLLAMA_CAPACITY_COMMUNITIES_WAIT_TIMEOUT_SECONDS", 600.0
             ),
+            adaptive=adaptive,
+            min_limit=max(1, _env_int("OLLAMA_CAPACITY_MIN_LIMIT", 1)),
+            decrease_factor=min(
+                0.95, max(0.1, _env_float("OLLAMA_CAPACITY_DECREASE_FACTOR", 0.7))
+            ),
+            decrease_cooldown_seconds=_env_float(
+                "OLLAMA_CAPACITY_DECREASE_COOLDOWN_SECONDS", 5.0
+            ),
+            latency_tolerance=max(1.1, _env_float("OLLAMA_CAPACITY_LATENCY_TOLERANCE", 2.0)),
+            error_rate_threshold=_env_float("OLLAMA_CAPACITY_ERROR_RATE_THRESHOLD", 0.2),
         )
 
+    def ceiling(self, work_class: WorkClass) -> int:
+        """Static upper bound of a class's limit (the reservations of higher classes)."""
+        if work_class == "chat":
+            return self.total
+        if work_class == "ingestion":
+            return max(0, self.total - self.reserved_chat)
+        return max(0, self.total - self.reserved_chat - self.reserved_ingestion)
+
+
+# EWMA weights: error rate and recent latency react within ~5-10 calls, while
+# the baseline only creeps up, so it tracks the uncongested latency
+_ERROR_ALPHA = 0.1
+# Latency is averaged geometrically: a fast average of recent calls against a
+# slow one as the baseline, so heavy-tailed latency (long outputs, big
+# batches) moves both alike and only a sustained shift reads as congestion
+_LATENCY_ALPHA = 0.2
+_BASELINE_ALPHA = 0.02
+# Calls needed before the error rate can trigger a decrease
+_MIN_SAMPLES = 5
+
+
+@dataclass
+class AdaptiveLimitState:
+    """
+    Adaptive limit of one work class on one endpoint, as stored in Redis.
+
+    Latency is tracked per call kind (generation, embeddings, ...), because
+    calls of different kinds sharing a class have unrelated latencies.
+    """
+
+    limit: float
+    error_rate: float = 0.0
+    latency_ms: dict[str, float] = field(default_factory=dict)
+    baseline_ms: dict[str, float] = field(default_factory=dict)
+    last_decrease_ms: int = 0
+    completed: int = 0
+    errors: int = 0
+    rate_limited: int = 0
+    decreases: int = 0
+
+    @classmethod
+    def from_hash(cls, data: dict[str, str], default_limit: float) -> AdaptiveLimitState:
+        state = cls(limit=float(data.get("limit", default_limit)))
+        state.error_rate = float(data.get("error_rate", 0.0))
+        state.last_decrease_ms = int(data.get("last_decrease_ms", 0))
+        for name in ("completed", "errors", "rate_limited", "decreases"):
+            setattr(state, name, int(data.get(name, 0)))
+        for key, value in data.items():
+            prefix, _, kind = key.partition(":")
+            if prefix == "latency_ms":
+                state.latency_ms[kind] = float(value)
+            elif prefix == "baseline_ms":
+                state.baseline_ms[kind] = float(value)
+        return state
+
+    def to_hash(self) -> dict[str, str]:
+        data = {
+            "limit": f"{self.limit:.4f}",
+            "error_rate": f"{self.error_rate:.4f}",
+            "last_decrease_ms": str(self.last_decrease_ms),
+            "completed": str(self.completed),
+            "errors": str(self.errors),
+            "rate_limited": str(self.rate_limited),
+            "decreases": str(self.decreases),
+        }
+        for kind, value in self.latency_ms.items():
+            data[f"latency_ms:{kind}"] = f"{value:.1f}"
+        for kind, value in self.baseline_ms.items():
+            data[f"baseline_ms:{kind}"] = f"{value:.1f}"
+        return data
+
+    def observe(
+        self,
+        outcome: Outcome,
+        latency_ms: float,
+        *,
+        kind: str,
+        now_ms: int,
+        ceiling: int,
+        settings: LLMCapacitySettings,
+    ) -> None:
+        """Fold one call's outcome into the limit (AIMD)."""
+        self.completed += 1
+        self.error_rate += _ERROR_ALPHA * (float(outcome != "ok") - self.error_rate)
+
+        congested = False
+        if outcome == "rate_limited":
+            self.rate_limited += 1
+            congested = True
+        elif outcome == "error":
+            self.errors += 1
+        else:
+            latency_ms = max(latency_ms, 1.0)
+            recent = self.latency_ms.get(kind, latency_ms)
+            recent *= (latency_ms / recent) ** _LATENCY_ALPHA
+            baseline = self.baseline_ms.get(kind, latency_ms)
+            baseline *= (latency_ms / baseline) ** _BASELINE_ALPHA
+            self.latency_ms[kind] = recent
+            self.baseline_ms[kind] = baseline
+            congested = recent > settings.latency_tolerance * baseline
+
+        if self.completed >= _MIN_SAMPLES and self.error_rate >= settings.error_rate_threshold:
+            congested = True
+
+        upper = max(settings.min_limit, ceiling)
+        cooldown_ms = settings.decrease_cooldown_seconds * 1000
+        if congested and now_ms - self.last_decrease_ms >= cooldown_ms:
+            self.limit *= settings.decrease_factor
+            self.last_decrease_ms = now_ms
+            self.decreases += 1
+        elif outcome == "ok":
+            # Also within the cooldown: one decrease answers the congestion
+            # signals that follow it, as in TCP's one cut per round trip
+            self.limit += 1.0 / max(self.limit, 1.0)
+        self.limit = min(float(upper), max(float(settings.min_limit), self.limit))
+
+
+def classify_outcome(error: BaseException | None, *, responded: bool = False) -> Outcome | None:
+    """
+    Signal an outcome sends to the adaptive limit; None sends no signal.
+
+    Client errors (4xx other than 429) say nothing about endpoint load.
+    Cancelled calls count as healthy once the endpoint has responded.
+    """
+    if error is None:
+        return "ok"
+    if isinstance(error, (asyncio.CancelledError, GeneratorExit)):
+        return "ok" if responded else None
+    status = getattr(error, "status_code", None)
+    if status == 429 or type(error).__name__ == "RateLimitError":
+        return "rate_limited"
+    if isinstance(status, int) and status < 500:
+        return None
+    return "error"
+
+
+class CapacityLease:
+    """Handle yielded by `RedisLLMCapacityLimiter.hold()`."""
+
+    def __init__(self, wait_ms: float = 0.0):
+        self.wait_ms = wait_ms
+        self._started = time.perf_counter()
+        self._responded_ms: float | None = None
+
+    def responded(self) -> None:
+        """
+        Mark the endpoint's first response (e.g. a stream opening).
+
+        The latency reported for the call is then the time to this mark rather
+        than to the end of the block, which for streams depends on the reader.
+        """
+        if self._responded_ms is None:
+            self._responded_ms = (time.perf_counter() - self._started) * 1000
+
+    @property
+    def has_responded(self) -> bool:
+        return self._responded_ms is not None
+
+    @property
+    def latency_ms(self) -> float:
+        if self._responded_ms is not None:
+            return self._responded_ms
+        return (time.perf_counter() - self._started) * 1000
+
 
 _ACQUIRE_LUA = r"""
 -- KEYS:
 -- 1 chat_zset
 -- 2 ingestion_zset
 -- 3 communities_zset
+-- 4 control hash of the requested work class (adaptive limit)
 --
 -- ARGV:
 -- 1 now_ms
@@ -126,6 +337,8 @@ _ACQUIRE_LUA = r"""
 -- 5 reserved_chat
 -- 6 reserved_ingestion
 -- 7 lease_id
+-- 8 adaptive (1|0)
+-- 9 min_limit
 
 local chat_key = KEYS[1]
 local ing_key = KEYS[2]
@@ -159,6 +372,23 @@ if non_chat_max < 0 then non_chat_max = 0 end
 local communities_max = total - reserved_chat - reserved_ingestion
 if communities_max < 0 then communities_max = 0 end
 
+-- Adaptive limit of the requested class; the static rules above still apply.
+local class_limit = total
+local class_n = total_n
+if work_class == 'chat' then
+  class_n = chat_n
+elseif work_class == 'ingestion' then
+  class_n = ing_n
+elseif work_class == 'communities' then
+  class_n = com_n
+end
+if ARGV[8] == '1' then
+  local adaptive_limit = tonumber(redis.call('HGET', KEYS[4], 'limit'))
+  if adaptive_limit then
+    class_limit = math.max(tonumber(ARGV[9]), math.floor(adaptive_limit))
+  end
+end
+
 local allowed = 0
 
 if work_class == 'chat' then
@@ -179,6 +409,10 @@ else
   end
 end
 
+if class_n >= class_limit then
+  allowed = 0
+end
+
 if allowed == 1 then
   local expiry = now_ms + ttl_ms
   if work_class == 'chat' then
@@ -206,8 +440,9 @@ removed = removed + redis.call('ZREM', KEYS[3], lease_id)
 return removed
 """
 
+
 class RedisLLMCapacityLimiter:
-    """Distributed capacity limiter using Redis leases."""
+    """Distributed, adaptive capacity limiter using Redis leases."""
 
     def __init__(self, *, provider_key: str, settings: LLMCapacitySettings):
         self._provider_key = provider_key
@@ -217,6 +452,24 @@ class RedisLLMCapacityLimiter:
         self._chat_key = f"llm_capacity:{provider_key}:chat"
         self._ingestion_key = f"llm_capacity:{provider_key}:ingestion"
         self._communities_key = f"llm_capacity:{provider_key}:communities"
+        self._control_keys = {c: f"llm_capacity:{provider_key}:control:{c}" for c in WORK_CLASSES}
+        self._waiting_keys = {c: f"llm_capacity:{provider_key}:waiting:{c}" for c in WORK_CLASSES}
+        self._lease_keys = {
+            "chat": self._chat_key,
+            "ingestion": self._ingestion_key,
+            "communities": self._communities_key,
+        }
+        # Callers of this process currently queued for capacity
+        self._waiting_local = dict.fromkeys(WORK_CLASSES, 0)
+
+    @property
+    def provider_key(self) -> str:
+        return self._provider_key
+
+    @property
+    def active(self) -> bool:
+        """Whether leases are enforced (enabled and Redis configured)."""
+        return self._settings.enabled and bool(self._settings.redis_url)
 
     async def _get_redis(self):
         if self._redis is not None:
@@ -265,10 +518,11 @@ class RedisLLMCapacityLimiter:
         try:
             res = await redis.eval(
                 _ACQUIRE_LUA,
-                3,
+                4,
                 self._chat_key,
                 self._ingestion_key,
                 self._communities_key,
+                self._control_keys.get(work_class, self._control_keys["ingestion"]),
                 now_ms,
                 ttl_ms,
                 work_class,
@@ -276,6 +530,8 @@ class RedisLLMCapacityLimiter:
                 self._settings.reserved_chat,
                 self._settings.reserved_ingestion,
                 lease_id,
+                1 if self._settings.adaptive else 0,
+                self._settings.min_limit,
             )
         except Exception as e:
             # Fail open (no limiter) if Redis is unstable.
@@ -305,20 +561,148 @@ class RedisLLMCapacityLimiter:
         except Exception as e:
             logger.warning(f"LLM capacity limiter release failed (leaking lease?): {e}")
 
-    @asynccontextmanager
-    async def hold(self, *, work_class: WorkClass) -> AsyncIterator[None]:
-        """Acquire capacity (waiting up to timeout) and release on exit."""
+    async def report(
+        self,
+        *,
+        work_class: WorkClass,
+        outcome: Outcome,
+        latency_ms: float,
+        kind: str = "generate",
+    ) -> None:
+        """Feed one call's outcome into the shared adaptive limit of its class."""
+        if not (self._settings.enabled and self._settings.adaptive):
+            return
+        redis = await self._get_redis()
+        if redis is None:
+            return
+
+        from redis.exceptions import WatchError
+
+        key = self._control_keys.get(work_class, self._control_keys["ingestion"])
+        ceiling = self._settings.ceiling(work_class)
+        # Concurrent reports retry on conflict; a signal lost under heavy contention
+        # is harmless, the next call reports again
+        for _ in range(3):
+            try:
+                async with redis.pipeline(transaction=True) as pipe:
+                    await pipe.watch(key)
+                    state = AdaptiveLimitState.from_hash(await pipe.hgetall(key), ceiling)
+                    before = int(state.limit)
+                    state.observe(
+                        outcome,
+                        latency_ms,
+                        kind=kind,
+                        now_ms=int(time.time() * 1000),
+                        ceiling=ceiling,
+                        settings=self._settings,
+                    )
+                    pipe.multi()
+                    pipe.hset(key, mapping=state.to_hash())
+                    pipe.sadd(_ENDPOINTS_KEY, self._provider_key)
+                    await pipe.execute()
+            except WatchError:
+                continue
+            except Exception as e:
+                logger.warning(f"LLM capacity report failed for {key}: {e}")
+                return
+            if int(state.limit) != before:
+                logger.info(
+                    f"LLM capacity limit {self._provider_key}/{work_class}: "
+                    f"{before} -> {int(state.limit)} (outcome={outcome}, "
+                    f"error_rate={state.error_rate:.2f}, kind={kind})"
+                )
+            return
+
+    async def current_limit(self, work_class: WorkClass) -> int:
+        """Limit currently enforced for a class across the cluster."""
+        ceiling = self._settings.ceiling(work_class)
+        redis = await self._get_redis() if self._settings.adaptive else None
+        if redis is None:
+            return max(self._settings.min_limit, ceiling)
+        try:
+            raw = await redis.hget(self._control_keys[work_class], "limit")
+        except Exception as e:
+            logger.warning(f"LLM capacity limit lookup failed: {e}")
+            raw = None
+        if raw is None:
+            return max(self._settings.min_limit, ceiling)
+        return max(self._settings.min_limit, min(ceiling, int(float(raw))))
+
+    async def _set_waiting(self, work_class: WorkClass, waiter_id: str, expiry_ms: int | None):
+        redis = await self._get_redis()
+        if redis is None:
+            return
+        key = self._waiting_keys[work_class]
+        try:
+            if expiry_ms is None:
+                await redis.zrem(key, waiter_id)
+            else:
+                await redis.zadd(key, {waiter_id: expiry_ms})
+        except Exception as e:
+            logger.debug(f"LLM capacity queue tracking failed: {e}")
+
+    async def snapshot(self) -> dict[str, Any]:
+        """Limits, in-flight and queued calls per work class."""
+        classes: dict[str, dict[str, Any]] = {}
+        redis = await self._get_redis() if self.active else None
+        raw: list[Any] = []
+        if redis is not None:
+            now_ms = int(time.time() * 1000)
+            try:
+                pipe = redis.pipeline(transaction=False)
+                for work_class in WORK_CLASSES:
+                    pipe.zremrangebyscore(self._lease_keys[work_class], 0, now_ms)
+                    pipe.zcard(self._lease_keys[work_class])
+                    pipe.zremrangebyscore(self._waiting_keys[work_class], 0, now_ms)
+                    pipe.zcard(self._waiting_keys[work_class])
+                    pipe.hgetall(self._control_keys[work_class])
+                raw = await pipe.execute()
+            except Exception as e:
+                logger.warning(f"LLM capacity snapshot failed for {self._provider_key}: {e}")
+                raw = []
+
+        for index, work_class in enumerate(WORK_CLASSES):
+            ceiling = self._settings.ceiling(work_class)
+            in_flight = waiting = None
+            control: dict[str, str] = {}
+            if raw:
+                _, in_flight, _, waiting, control = raw[index * 5 : index * 5 + 5]
+            state = AdaptiveLimitState.from_hash(control or {}, ceiling)
+            classes[work_class] = {
+                "limit": max(self._settings.min_limit, min(ceiling, int(state.limit))),
+                "ceiling": ceiling,
+                "in_flight": in_flight,
+                "waiting": waiting,
+                "waiting_local": self._waiting_local[work_class],
+                "error_rate": round(state.error_rate, 4),
+                "latency_ms": {k: round(v, 1) for k, v in state.latency_ms.items()},
+                "baseline_ms": {k: round(v, 1) for k, v in state.baseline_ms.items()},
+                "completed": state.completed,
+                "errors": state.errors,
+                "rate_limited": state.rate_limited,
+                "decreases": state.decreases,
+            }
+        return {
+            "endpoint": self._provider_key,
+            "enabled": self.active,
+            "adaptive": self._settings.adaptive,
+            "total": self._settings.total,
+            "classes": classes,
+        }
+
+    async def _acquire(self, work_class: WorkClass) -> str:
+        """Wait up to the class's timeout for a lease; raises TimeoutError."""
         timeout = self._wait_timeout(work_class)
         deadline = time.monotonic() + max(0.0, timeout)
 
-        lease_id: str | None = None
+        waiter_id: str | None = None
         warned = False
 
         try:
             while True:
                 lease_id = await self.try_acquire(work_class=work_class)
                 if lease_id is not None:
-                    break
+                    return lease_id
 
                 now = time.monotonic()
                 if timeout > 0 and now >= deadline:
@@ -326,6 +710,12 @@ class RedisLLMCapacityLimiter:
                         f"LLM capacity busy (class={work_class}, total={self._settings.total})"
                     )
 
+                if waiter_id is None:
+                    waiter_id = uuid.uuid4().hex
+                    self._waiting_local[work_class] += 1
+                    expiry_ms = int((time.time() + max(timeout, 1.0)) * 1000)
+                    await self._set_waiting(work_class, waiter_id, expiry_ms)
+
                 if not warned and (now + 1.0) >= deadline and work_class == "chat":
                     warned = True
                     logger.warning(
@@ -333,26 +723,123 @@ class RedisLLMCapacityLimiter:
                     )
 
                 await asyncio.sleep(self._poll_interval(work_class))
+        finally:
+            if waiter_id is not None:
+                self._waiting_local[work_class] -= 1
+                await self._set_waiting(work_class, waiter_id, None)
 
-            yield None
-
+    @asynccontextmanager
+    async def hold(
+        self, *, work_class: WorkClass, kind: str | None = "generate"
+    ) -> AsyncIterator[CapacityLease]:
+        """
+        Acquire capacity (waiting up to timeout) and release on exit.
+
+        The block's outcome is reported to the adaptive limit as a call of
+        ``kind``; ``kind=None`` holds capacity without reporting (for blocks that
+        are not one endpoint call). Blocks nested in one that already holds a
+        lease on this endpoint, e.g. the LLM calls of one graph extraction, run
+        under that lease and only report.
+        """
+        held = _held_endpoints.get()
+        nested = self._provider_key in held
+
+        started = time.monotonic()
+        lease_id = None if nested else await self._acquire(work_class)
+        lease = CapacityLease(wait_ms=(time.monotonic() - started) * 1000)
+        if not nested:
+            _held_endpoints.set(held | {self._provider_key})
+
+        error: BaseException | None = None
+        try:
+            yield lease
+        except BaseException as e:
+            error = e
+            raise
         finally:
             if lease_id is not None:
+                _held_endpoints.set(held)
                 await self.release(lease_id)
+            if kind is not None and lease_id != "bypass":
+                outcome = classify_outcome(error, responded=lease.has_responded)
+                if outcome is not None:
+                    await self.report(
+                        work_class=work_class,
+                        outcome=outcome,
+                        latency_ms=lease.latency_ms,
+                        kind=kind,
+                    )
 
 
-_ollama_limiter: RedisLLMCapacityLimiter | None = None
+_settings: LLMCapacitySettings | None = None
+_limiters: dict[str, RedisLLMCapacityLimiter] = {}
+# Redis access for the endpoint registry, without registering an endpoint itself
+_registry: RedisLLMCapacityLimiter | None = None
 
 
-def get_ollama_capacity_limiter() -> RedisLLMCapacityLimiter:
-    global _ollama_limiter
-    if _ollama_limiter is None:
-        settings = LLMCapacitySettings.from_env()
-        _ollama_limiter = RedisLLMCapacityLimiter(provider_key="ollama", settings=settings)
+def _get_settings() -> LLMCapacitySettings:
+    global _settings
+    if _settings is None:
+        _settings = LLMCapacitySettings.from_env()
+    return _settings
+
+
+def endpoint_key(provider: str, base_url: str | None = None) -> str:
+    """Redis key namespace of one provider endpoint, e.g. ``ollama@ollama:11434``."""
+    if not base_url:
+        return provider
+    parsed = urlparse(base_url if "//" in base_url else f"//{base_url}")
+    host = (parsed.netloc or parsed.path).lower().rstrip("/")
+    return f"{provider}@{host}" if host else provider
+
+
+def _get_limiter(key: str) -> RedisLLMCapacityLimiter:
+    limiter = _limiters.get(key)
+    if limiter is None:
+        settings = _get_settings()
+        limiter = _limiters[key] = RedisLLMCapacityLimiter(provider_key=key, settings=settings)
         logger.info(
-            "Ollama capacity limiter initialized | "
-            f"enabled={settings.enabled}, total={settings.total}, "
-            f"reserved_chat={settings.reserved_chat}, reserved_ingestion={settings.reserved_ingestion}, "
+            f"LLM capacity limiter initialized for {key} | "
+            f"enabled={settings.enabled}, adaptive={settings.adaptive}, "
+            f"total={settings.total}, reserved_chat={settings.reserved_chat}, "
+            f"reserved_ingestion={settings.reserved_ingestion}, "
             f"redis_url={'set' if settings.redis_url else 'unset'}"
         )
-    return _ollama_limiter
+    return limiter
+
+
+def get_ollama_capacity_limiter(base_url: str | None = None) -> RedisLLMCapacityLimiter:
+    """Limiter of the Ollama endpoint at ``base_url`` (one shared limiter without it)."""
+    return _get_limiter(endpoint_key("ollama", base_url))
+
+
+def capacity_limiter_for(
+    provider_name: str | None, base_url: str | None = None
+) -> RedisLLMCapacityLimiter | None:
+    """Enforcing limiter of a provider endpoint, or None if its calls are not limited."""
+    if provider_name != "ollama":
+        return None
+    limiter = get_ollama_capacity_limiter(base_url if isinstance(base_url, str) else None)
+    return limiter if limiter.active else None
+
+
+async def capacity_snapshot() -> list[dict[str, Any]]:
+    """Snapshots of every endpoint known to this process or reported by any process."""
+    global _registry
+    keys = set(_limiters)
+    if _registry is None:
+        _registry = RedisLLMCapacityLimiter(provider_key="registry", settings=_get_settings())
+    redis = await _registry._get_redis() if _registry.active else None
+    if redis is not None:
+        try:
+            keys.update(await redis.smembers(_ENDPOINTS_KEY))
+        except Exception as e:
+            logger.warning(f"LLM capacity endpoint registry unavailable: {e}")
+    return [await _get_limiter(key).snapshot() for key in sorted(keys)]
+
+
+def reset_capacity_limiters() -> None:
+    """Drop Redis clients bound to the current event loop (e.g. after a worker fork)."""
+    for limiter in [*_limiters.values(), _registry]:
+        if limiter is not None:
+            limiter._redis = None
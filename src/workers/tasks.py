@@ -43,8 +43,27 @@ import threading
 # threading.Thread(target=_background_warmup, daemon=True).start()
 
 
+async def _with_metrics_flush(coro):
+    """Run a task coroutine, then write the metrics and stats it recorded before its loop closes."""
+    try:
+        return await coro
+    finally:
+        from src.core.admin_ops.application.metrics.store import shutdown_metrics_store
+        from src.core.admin_ops.application.tenant_stats import shutdown_tenant_stats
+
+        try:
+            await shutdown_metrics_store()
+        except Exception as e:
+            logger.warning(f"Failed to flush query metrics: {e}")
+        try:
+            await shutdown_tenant_stats()
+        except Exception as e:
+            logger.warning(f"Failed to flush tenant stats: {e}")
+
+
 def run_async(coro):
     """Helper to run async code in sync Celery task."""
+    coro = _with_metrics_flush(coro)
     try:
         loop = asyncio.get_running_loop()
     except RuntimeError:
@@ -269,6 +288,13 @@ async def _process_communities_async(tenant_id: str) -> dict:
         if detect_res["status"] == "skipped":
             return detect_res
 
+        try:
+            from src.core.admin_ops.application.tenant_stats import recount_communities
+
+            await recount_communities(platform.neo4j_client, tenant_id)
+        except Exception as e:
+            logger.warning(f"Failed to update community count for tenant {tenant_id}: {e}")
+
         tuning_service = TuningService(get_session_maker())
         tenant_config = await tuning_service.get_tenant_config(tenant_id)
         
@@ -351,6 +377,209 @@ async def _process_communities_async(tenant_id: str) -> dict:
             logger.warning(f"Failed to close Neo4j client: {e}")
 
 
+@celery_app.task(
+    bind=True,
+    name="src.workers.tasks.migrate_tenant_embeddings",
+    base=BaseTask,
+    max_retries=3,
+    queue="low_priority",
+)
+def migrate_tenant_embeddings(self, tenant_id: str, cutover: bool = True) -> dict:
+    """
+    Backfill a tenant's shadow collection and (optionally) cut over to it.
+
+    Retries resume from the persisted cursor. Only one backfill runs per tenant.
+    """
+    lock_key = f"locks:migrate_embeddings:{tenant_id}"
+    redis_client = None
+    try:
+        import redis
+
+        from src.api.config import settings
+
+        redis_client = redis.Redis.from_url(settings.db.redis_url)
+        if not redis_client.set(lock_key, str(self.request.id), nx=True, ex=60 * 60 * 24):
+            logger.info(
+                f"[Task {self.request.id}] Embedding migration already running for {tenant_id}"
+            )
+            return {"status": "skipped", "reason": "already_running", "tenant_id": tenant_id}
+    except Exception as e:
+        logger.warning(f"[Task {self.request.id}] Could not acquire migration lock: {e}")
+
+    logger.info(f"[Task {self.request.id}] Online embedding migration for tenant {tenant_id}")
+    deep_reset_singletons()
+    try:
+        return run_async(_migrate_tenant_embeddings_async(tenant_id, cutover))
+    except ValueError as e:
+        # Not resumable (no migration, or shadow behind at cutover); surface it
+        logger.error(f"Embedding migration for {tenant_id} stopped: {e}")
+        return {"status": "failed", "tenant_id": tenant_id, "error": str(e)}
+    finally:
+        if redis_client is not None:
+            try:
+                current = redis_client.get(lock_key)
+                if current is not None and current.decode() == str(self.request.id):
+                    redis_client.delete(lock_key)
+                redis_client.close()
+            except Exception:
+                pass
+
+
+async def _migrate_tenant_embeddings_async(tenant_id: str, cutover: bool) -> dict:
+    from src.amber_platform.composition_root import build_vector_store_factory
+    from src.api.config import settings
+    from src.core.admin_ops.application.online_migration import OnlineEmbeddingMigrator
+    from src.core.database.session import get_session_maker
+    from src.shared.kernel.runtime import configure_settings
+
+    configure_settings(settings)
+    migrator = OnlineEmbeddingMigrator(
+        session_factory=get_session_maker(),
+        settings=settings,
+        vector_store_factory=build_vector_store_factory(),
+    )
+    if cutover:
+        return await migrator.run(tenant_id)
+    return await migrator.backfill(tenant_id)
+
+
+@celery_app.task(
+    bind=True,
+    name="src.workers.tasks.cleanup_deleted_documents",
+    base=BaseTask,
+    max_retries=5,
+    queue="low_priority",
+)
+def cleanup_deleted_documents(self, tenant_id: str) -> dict:
+    """
+    Remove a tenant's tombstoned documents from every store, in batches.
+
+    Deletes are coalesced by the scheduler; only one run per tenant at a time.
+    A run that finds another in progress retries later rather than dropping
+    the tombstones it was scheduled for.
+    """
+    lock_key = f"locks:cleanup_documents:{tenant_id}"
+    redis_client = None
+    lock_acquired = True
+    try:
+        import redis
+
+        from src.api.config import settings
+
+        redis_client = redis.Redis.from_url(settings.db.redis_url)
+        lock_acquired = bool(
+            redis_client.set(lock_key, str(self.request.id), nx=True, ex=60 * 60)
+        )
+    except Exception as e:
+        logger.warning(f"[Task {self.request.id}] Could not acquire cleanup lock: {e}")
+
+    if not lock_acquired:
+        try:
+            redis_client.close()
+        except Exception:
+            pass
+        logger.info(f"[Task {self.request.id}] Document cleanup already running for {tenant_id}")
+        raise self.retry(countdown=30)
+
+    deep_reset_singletons()
+    try:
+        return run_async(_cleanup_deleted_documents_async(tenant_id))
+    except Exception as e:
+        logger.error(f"Document cleanup for tenant {tenant_id} failed: {e}")
+        raise self.retry(exc=e, countdown=60) from e
+    finally:
+        if redis_client is not None:
+            try:
+                current = redis_client.get(lock_key)
+                if current is not None and current.decode() == str(self.request.id):
+                    redis_client.delete(lock_key)
+                redis_client.close()
+            except Exception:
+                pass
+
+
+async def _cleanup_deleted_documents_async(tenant_id: str) -> dict:
+    from src.amber_platform.composition_root import build_vector_store_factory, platform
+    from src.api.config import settings
+    from src.core.database.session import get_session_maker
+    from src.core.ingestion.application.document_deletion import (
+        DocumentCleanupService,
+        clear_cleanup_pending,
+    )
+    from src.infrastructure.adapters.redis_state_publisher import RedisStatePublisher
+    from src.shared.kernel.runtime import configure_settings
+
+    configure_settings(settings)
+    # Deletes from here on schedule a new run
+    await clear_cleanup_pending(tenant_id)
+
+    vector_store_factory = build_vector_store_factory()
+    dimensions = settings.embedding_dimensions or 1536
+
+    def make_vector_store(tid: str, collection_name: str):
+        return vector_store_factory(dimensions, collection_name=collection_name)
+
+    try:
+        async with get_session_maker()() as session:
+            service = DocumentCleanupService(
+                session=session,
+                storage=platform.minio_client,
+                graph_client=platform.neo4j_client,
+                vector_store_factory=make_vector_store,
+                publisher=RedisStatePublisher(),
+            )
+            report = await service.purge_tenant(tenant_id)
+        if report.errors:
+            # Failed batches stay tombstoned; retrying the task picks them up
+            raise RuntimeError(f"cleanup incomplete: {'; '.join(report.errors)}")
+        return report.to_dict()
+    finally:
+        try:
+            await platform.neo4j_client.close()
+        except Exception as e:
+            logger.warning(f"Failed to close Neo4j client: {e}")
+
+
+@celery_app.task(
+    bind=True,
+    name="src.workers.tasks.reconcile_tenant_stats",
+    base=BaseTask,
+    max_retries=2,
+    queue="low_priority",
+)
+def reconcile_tenant_stats(self, tenant_id: str) -> dict:
+    """
+    Recount a tenant's documents, chunks, vectors and graph into tenant_stats.
+
+    Scheduled by stats reads when the counters were last recounted more than
+    an hour ago; the counters stay readable while this runs.
+    """
+    deep_reset_singletons()
+    try:
+        return run_async(_reconcile_tenant_stats_async(tenant_id))
+    except Exception as e:
+        logger.error(f"Stats reconciliation for tenant {tenant_id} failed: {e}")
+        raise self.retry(exc=e, countdown=300) from e
+
+
+async def _reconcile_tenant_stats_async(tenant_id: str) -> dict:
+    from src.amber_platform.composition_root import platform
+    from src.api.config import settings
+    from src.core.admin_ops.application.tenant_stats import TenantStatsService
+    from src.shared.kernel.runtime import configure_settings
+
+    configure_settings(settings)
+    try:
+        counts = await TenantStatsService().reconcile(tenant_id, platform.neo4j_client)
+        counts["reconciled_at"] = counts["reconciled_at"].isoformat()
+        return {"status": "completed", "tenant_id": tenant_id, **counts}
+    finally:
+        try:
+            await platform.neo4j_client.close()
+        except Exception as e:
+            logger.warning(f"Failed to close Neo4j client: {e}")
+
+
 def deep_reset_singletons():
     """
     Force reset of all singleton instances that might capture the event loop
@@ -379,6 +608,11 @@ def deep_reset_singletons():
     platform._content_extractor = None
     platform._initialized = False
 
+    # The state event publisher's client is bound to the previous task's loop
+    from src.infrastructure.adapters import redis_state_publisher
+
+    redis_state_publisher._redis_client = None
+
     # 4. Ollama/OpenAI httpx clients (prevent "attached to different loop" errors)
     try:
         from src.core.generation.infrastructure.providers.ollama import (
@@ -389,6 +623,11 @@ def deep_reset_singletons():
     except Exception:
         pass  # Ollama module may not be available in all envs
 
+    # The LLM capacity limiters' Redis clients are bound to the previous loop
+    from src.shared.llm_capacity import reset_capacity_limiters
+
+    reset_capacity_limiters()
+
     # 5. Document Summarizer (Reset singleton instance)
     try:
         from src.core.generation.application.intelligence.document_summarizer import (
@@ -535,7 +774,7 @@ async def _process_document_async(document_id: str, tenant_id: str, task_id: str
             )
 
             # Publish starting event
-            _publish_status(document_id, DocumentStatus.EXTRACTING.value, 10)
+            _publish_status(document_id, DocumentStatus.EXTRACTING.value, 10, tenant_id=tenant_id)
 
             # Process document (this does extraction, classification, chunking)
             await service.process_document(document_id)
@@ -544,7 +783,7 @@ async def _process_document_async(document_id: str, tenant_id: str, task_id: str
             document = await repo.get(document_id)
 
             # Publish completion
-            _publish_status(document_id, document.status.value, 100)
+            _publish_status(document_id, document.status.value, 100, tenant_id=document.tenant_id)
 
             # Get chunk count for stats
             from src.core.ingestion.domain.chunk import Chunk
@@ -592,12 +831,24 @@ async def _mark_document_failed(document_id: str, error: str):
             if document:
                 document.status = DocumentStatus.FAILED
                 await session.commit()
-                _publish_status(document_id, DocumentStatus.FAILED.value, 100, error=error)
+                _publish_status(
+                    document_id,
+                    DocumentStatus.FAILED.value,
+                    100,
+                    error=error,
+                    tenant_id=document.tenant_id,
+                )
     finally:
         await engine.dispose()
 
 
-def _publish_status(document_id: str, status: str, progress: int, error: str = None):
+def _publish_status(
+    document_id: str,
+    status: str,
+    progress: int,
+    error: str = None,
+    tenant_id: str | None = None,
+):
     """Publish status update to Redis Pub/Sub."""
     import json
 
@@ -610,6 +861,8 @@ def _publish_status(document_id: str, status: str, progress: int, error: str = N
         try:
             channel = f"document:{document_id}:status"
             message = {"document_id": document_id, "status": status, "progress": progress}
+            if tenant_id:
+                message["tenant_id"] = tenant_id
             if error:
                 message["error"] = error
 
@@ -713,9 +966,12 @@ async def _run_ragas_benchmark_async(benchmark_run_id: str, tenant_id: str, task
             if not benchmark:
                 raise ValueError(f"BenchmarkRun {benchmark_run_id} not found")
 
-            # Update status to RUNNING
+            # Update status to RUNNING. Details from an interrupted attempt are
+            # kept so the executor only evaluates the remaining samples.
+            completed_details = list(benchmark.details or [])
             benchmark.status = BenchmarkStatus.RUNNING
-            benchmark.started_at = datetime.now(UTC)
+            benchmark.started_at = benchmark.started_at or datetime.now(UTC)
+            benchmark.error_message = None
             benchmark.metrics = {"progress": 5}
             await session.commit()
             _publish_benchmark_status(benchmark_run_id, "running", 5)
@@ -757,12 +1013,19 @@ async def _run_ragas_benchmark_async(benchmark_run_id: str, tenant_id: str, task
             # Initialize RAG Services
             from openai import AsyncOpenAI
 
+            from src.core.admin_ops.application.evaluation.benchmark_executor import (
+                BenchmarkExecutor,
+                BenchmarkLimits,
+                BenchmarkRetrievalCache,
+            )
             from src.core.admin_ops.application.evaluation.ragas_service import RagasService
             from src.core.generation.application.generation_service import GenerationService
             from src.core.retrieval.application.retrieval_service import (
                 RetrievalConfig,
                 RetrievalService,
             )
+            from src.core.tenants.application.tenant_config_cache import TenantConfigSnapshot
+            from src.shared.llm_capacity import LLMCapacitySettings
 
             # Initialize Ragas
             client = AsyncOpenAI(api_key=settings.openai_api_key)
@@ -774,16 +1037,22 @@ async def _run_ragas_benchmark_async(benchmark_run_id: str, tenant_id: str, task
             )
 
             resolved_ollama_url = settings.ollama_base_url
+            raw_config = {}
             try:
                 # We need a separate session or query execution to get tenant config
                 # Since we are already in an async session, we can reuse it
                 t_repo = PostgresTenantRepository(session)
                 t_obj = await t_repo.get(tenant_id)
                 if t_obj and t_obj.config:
+                    raw_config = t_obj.config
                     resolved_ollama_url = t_obj.config.get("ollama_base_url") or resolved_ollama_url
             except Exception as e:
                 logger.warning(f"Failed to fetch tenant config for benchmark: {e}")
 
+            # One snapshot for the whole run: every sample sees the same config and
+            # shares the providers derived from it.
+            tenant_config = TenantConfigSnapshot(tenant_id, raw_config)
+
             # Initialize RAG Pipeline
             retrieval_config = RetrievalConfig(
                 milvus_host=settings.db.milvus_host,
@@ -802,84 +1071,44 @@ async def _run_ragas_benchmark_async(benchmark_run_id: str, tenant_id: str, task
                 ollama_base_url=resolved_ollama_url,
             )
 
+            executor = BenchmarkExecutor(
+                retrieval_service=retrieval_service,
+                generation_service=generation_service,
+                ragas_service=ragas_service,
+                limits=BenchmarkLimits.from_capacity(LLMCapacitySettings.from_env()),
+                retrieval_cache=BenchmarkRetrievalCache(redis_url=settings.db.redis_url),
+            )
+
             # Update progress: Services initialized
             benchmark.metrics = {"progress": 15}
             await session.commit()
             _publish_benchmark_status(benchmark_run_id, "running", 15)
 
-            # Run evaluation on each sample
-            details = []
             total_samples = len(dataset)
-
             logger.info(f"Starting benchmark execution for {total_samples} samples...")
 
-            for i, sample in enumerate(dataset):
-                query = sample.get("query", sample.get("question", ""))
-
-                # 1. Execute Retrieval
-                retrieval_result = await retrieval_service.retrieve(
-                    query=query, tenant_id=tenant_id, top_k=5
-                )
-
-                # 2. Execute Generation
-                if retrieval_result.chunks:
-                    gen_result = await generation_service.generate(
-                        query=query, candidates=retrieval_result.chunks
-                    )
-                    generated_answer = gen_result.answer
-                    retrieved_contexts = [c.get("content", "") for c in retrieval_result.chunks]
-                else:
-                    generated_answer = "I couldn't find any relevant information."
-                    retrieved_contexts = []
-
-                logger.info(f"Processing Sample {i + 1}/{total_samples} - Query: {query[:30]}...")
-
-                # Evaluate using RagasService
-                # Pass GENERATED answer and RETRIEVED contexts (this is the real benchmark)
-                eval_result = await ragas_service.evaluate_sample(
-                    query=query,
-                    context=retrieved_contexts,  # Pass list of strings
-                    response=generated_answer,
-                )
-
-                import math
-
-                def clean_score(score):
-                    if score is None:
-                        return None
-                    if isinstance(score, float) and (math.isnan(score) or math.isinf(score)):
-                        return None
-                    return score
-
-                details.append(
-                    {
-                        "query": query,
-                        "faithfulness": clean_score(eval_result.faithfulness),
-                        "response_relevancy": clean_score(eval_result.response_relevancy),
-                        "context_precision": clean_score(eval_result.context_precision),
-                        "context_recall": clean_score(eval_result.context_recall),
-                    }
-                )
-
-                # Publish progress (Scale 15% to 100%)
-                metrics_progress = 15 + int((i + 1) / total_samples * 85)
-                _publish_benchmark_status(benchmark_run_id, "running", metrics_progress)
-
-                # Update progress in DB for polling UI
+            async def checkpoint(detail: dict, done: int, total: int) -> None:
+                """Persist each finished sample so a crashed run can resume."""
+                logger.info(f"Processed sample {done}/{total} - Query: {detail['query'][:30]}...")
+                metrics_progress = 15 + int(done / total * 85)
+                # Reassign (not mutate) so SQLAlchemy sees the JSON change
+                benchmark.details = [*(benchmark.details or []), detail]
                 benchmark.metrics = {"progress": metrics_progress}
                 await session.commit()
+                _publish_benchmark_status(benchmark_run_id, "running", metrics_progress)
 
-            # Aggregate metrics
-            faith_scores = [d["faithfulness"] for d in details if d["faithfulness"] is not None]
-            rel_scores = [
-                d["response_relevancy"] for d in details if d["response_relevancy"] is not None
-            ]
+            try:
+                details = await executor.run(
+                    dataset,
+                    tenant_id,
+                    tenant_config=tenant_config,
+                    completed=completed_details,
+                    on_sample=checkpoint,
+                )
+            finally:
+                await executor.retrieval_cache.close()
 
-            metrics = {
-                "faithfulness": sum(faith_scores) / len(faith_scores) if faith_scores else 0.0,
-                "response_relevancy": sum(rel_scores) / len(rel_scores) if rel_scores else 0.0,
-                "samples_evaluated": len(details),
-            }
+            metrics = BenchmarkExecutor.aggregate(details)
 
             # Update benchmark with results
             benchmark.status = BenchmarkStatus.COMPLETED
@@ -0,0 +1,18 @@
+"""
+Offline Benchmarks
+==================
+
+Reproducible performance benchmarks for Amber's hot paths.
+
+The suite drives the real application services (``RetrievalService``,
+``IngestionService``, ``SemanticChunker``, ``CommunityDetector``,
+``DocumentEventHub``) through their ports, wired to deterministic in-memory
+stand-ins for Postgres, Milvus, Neo4j, Redis, object storage and the
+LLM/embedding providers. Backends can be given a fake latency so results
+reflect the application's own overhead plus a controlled I/O budget.
+
+Usage:
+    python -m tests.benchmarks --list
+    python -m tests.benchmarks query ingestion --output before.json
+    python -m tests.benchmarks --output after.json --compare before.json
+"""
@@ -0,0 +1,133 @@
+"""
+Benchmark CLI
+=============
+
+    python -m tests.benchmarks [scenario ...] [--scale 0.1] [--output out.json]
+                               [--compare baseline.json] [--estimate-tokens]
+
+Tokenizer and chunker scenarios use tiktoken's cached encoding (see
+TIKTOKEN_CACHE_DIR); ``--estimate-tokens`` or BENCHMARK_ESTIMATE_TOKENS=1 falls
+back to a character estimate on machines without one.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+
+from tests.benchmarks.harness import (
+    ESTIMATE_TOKENS_ENV,
+    BenchmarkConfig,
+    compare,
+    dumps,
+    run_suite,
+)
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    from tests.benchmarks.scenarios import SCENARIOS
+
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks",
+        description="Run offline performance benchmarks against in-memory backends.",
+    )
+    parser.add_argument(
+        "scenarios",
+        nargs="*",
+        metavar="scenario",
+        help=f"Scenarios to run (default: all of {', '.join(SCENARIOS)})",
+    )
+    parser.add_argument("--scale", type=float, default=1.0, help="Dataset size multiplier")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent requests")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0)
+    parser.add_argument("--embedding-latency-ms", type=float, default=0.0)
+    parser.add_argument("--vector-latency-ms", type=float, default=0.0)
+    parser.add_argument("--graph-latency-ms", type=float, default=0.0)
+    parser.add_argument("--db-latency-ms", type=float, default=0.0)
+    parser.add_argument(
+        "--estimate-tokens",
+        action="store_true",
+        default=os.getenv(ESTIMATE_TOKENS_ENV, "").lower() in ("1", "true", "yes", "on"),
+        help="Count tokens as ~4 characters each when tiktoken's encoding is not cached",
+    )
+    parser.add_argument("--output", type=Path, help="Write JSON results to this file")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON to compare against")
+    parser.add_argument("--list", action="store_true", help="List scenarios and exit")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Show application logs")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    from tests.benchmarks.scenarios import SCENARIOS
+
+    args = _parse_args(argv)
+    if args.list:
+        for name, scenario in SCENARIOS.items():
+            doc = (sys.modules[scenario.__module__].__doc__ or "").strip().splitlines()
+            print(f"{name:<12} {doc[0] if doc else ''}")
+        return 0
+
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    if not args.verbose:
+        # The pipeline logs every state change and extraction at INFO/ERROR;
+        # keep the benchmark output readable.
+        logging.getLogger("src").setLevel(logging.CRITICAL)
+
+    config = BenchmarkConfig(
+        scale=args.scale,
+        seed=args.seed,
+        concurrency=args.concurrency,
+        llm_latency_ms=args.llm_latency_ms,
+        embedding_latency_ms=args.embedding_latency_ms,
+        vector_latency_ms=args.vector_latency_ms,
+        graph_latency_ms=args.graph_latency_ms,
+        db_latency_ms=args.db_latency_ms,
+        estimate_tokens=args.estimate_tokens,
+    )
+    try:
+        result = asyncio.run(run_suite(args.scenarios or list(SCENARIOS), config))
+    except RuntimeError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+    output = dumps(result)
+    if args.output:
+        args.output.write_text(output + "\n")
+        print(f"Wrote {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        print(f"\nChange vs {args.compare}:", file=sys.stderr)
+        if baseline.get("tokenizer") != result["tokenizer"]:
+            print(
+                f"  note: tokenizer differs ({baseline.get('tokenizer')} -> "
+                f"{result['tokenizer']}); tokenizer and chunking rows are not comparable",
+                file=sys.stderr,
+            )
+        for row in compare(baseline, result):
+            change = "n/a" if row["change_pct"] is None else f"{row['change_pct']:+.1f}%"
+            print(
+                f"  {row['metric']:<55} {row['baseline']:>12.3f} -> {row['current']:>12.3f}"
+                f"  {change}",
+                file=sys.stderr,
+            )
+
+    failed = [name for name, res in result["scenarios"].items() if "error" in res]
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
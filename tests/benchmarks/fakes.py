@@ -0,0 +1,700 @@
+"""
+Benchmark Fakes
+===============
+
+Deterministic in-memory implementations of the ports the benchmarked services
+depend on. Each backend awaits a ``LatencyModel`` per call so scenarios can
+budget simulated I/O separately from the application's own CPU time.
+"""
+
+import asyncio
+import json
+import re
+import zlib
+from collections import Counter
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from src.core.generation.application.prompts.entity_extraction import (
+    ExtractedEntity,
+    ExtractedRelationship,
+    ExtractionResult,
+    ExtractionUsage,
+)
+from src.core.generation.domain.provider_models import (
+    EmbeddingResult,
+    GenerationResult,
+    RerankResult,
+    TokenUsage,
+)
+from src.core.retrieval.domain.ports.vector_store_port import SearchResult
+from src.core.state.machine import DocumentStatus
+from src.infrastructure.adapters.redis_event_hub import DocumentEventHub
+from tests.benchmarks.harness import BenchmarkConfig, LatencyModel, build_settings
+
+_WORD_RE = re.compile(r"[A-Za-z][A-Za-z0-9_-]+")
+_ENTITY_RE = re.compile(r"\b[A-Z][a-z]{2,}(?:\s+[A-Z][a-z]{2,})?\b")
+
+
+def _tokens(text: str) -> list[str]:
+    return [w.lower() for w in _WORD_RE.findall(text)]
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+# =============================================================================
+# Providers
+# =============================================================================
+
+
+class FakeLLMProvider:
+    """LLM returning canned, well-formed answers after a simulated delay."""
+
+    provider_name = "fake"
+    model_name = "fake-llm"
+
+    def __init__(self, latency: LatencyModel):
+        self.latency = latency
+        self.calls = 0
+
+    def _answer(self, prompt: str, system_prompt: str | None) -> str:
+        if "json" in f"{system_prompt or ''} {prompt}".lower():
+            keywords = [w for w, _ in Counter(_tokens(prompt)).most_common(5)]
+            return json.dumps(
+                {
+                    "summary": f"Synthetic summary covering {', '.join(keywords[:3])}.",
+                    "document_type": "report",
+                    "hashtags": [f"#{w}" for w in keywords[:3]],
+                    "keywords": keywords,
+                }
+            )
+        return "Based on the provided context, the answer is described in the sources [1]."
+
+    async def generate(
+        self,
+        prompt: str,
+        model: str | None = None,
+        system_prompt: str | None = None,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        stop: list[str] | None = None,
+        **kwargs: Any,
+    ) -> GenerationResult:
+        self.calls += 1
+        await self.latency.wait()
+        text = self._answer(prompt, system_prompt)
+        return GenerationResult(
+            text=text,
+            model=model or self.model_name,
+            provider=self.provider_name,
+            usage=TokenUsage(_estimate_tokens(prompt), _estimate_tokens(text)),
+        )
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        model: str | None = None,
+        system_prompt: str | None = None,
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+        stop: list[str] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        result = await self.generate(prompt, model, system_prompt, temperature, max_tokens, stop)
+        for word in result.text.split(" "):
+            yield word + " "
+
+    async def chat(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        tool_choice: Any | None = "auto",
+        **kwargs: Any,
+    ) -> GenerationResult:
+        prompt = "\n".join(str(m.get("content", "")) for m in messages)
+        return await self.generate(prompt)
+
+
+class HashEmbeddingProvider:
+    """Bag-of-words embeddings via feature hashing (similar texts stay close)."""
+
+    provider_name = "fake"
+    default_model = "hash-embedding"
+
+    def __init__(self, latency: LatencyModel, dimensions: int = 256):
+        self.latency = latency
+        self.dimensions = dimensions
+        self.calls = 0
+
+    def get_default_model(self) -> str:
+        return self.default_model
+
+    def get_dimensions(self, model: str) -> int:
+        return self.dimensions
+
+    def vector(self, text: str, dimensions: int | None = None) -> list[float]:
+        size = dimensions or self.dimensions
+        vec = np.zeros(size, dtype=np.float32)
+        for token in _tokens(text):
+            vec[zlib.crc32(token.encode()) % size] += 1.0
+        norm = float(np.linalg.norm(vec))
+        if norm == 0:
+            vec[0] = 1.0
+            norm = 1.0
+        return (vec / norm).tolist()
+
+    async def embed(
+        self,
+        texts: list[str],
+        model: str | None = None,
+        dimensions: int | None = None,
+        **kwargs: Any,
+    ) -> EmbeddingResult:
+        self.calls += 1
+        await self.latency.wait()
+        size = dimensions or self.dimensions
+        return EmbeddingResult(
+            embeddings=[self.vector(t, size) for t in texts],
+            model=model or self.default_model,
+            provider=self.provider_name,
+            usage=TokenUsage(input_tokens=sum(_estimate_tokens(t) for t in texts)),
+            dimensions=size,
+        )
+
+
+class FakeReranker:
+    """Scores documents by query-token overlap."""
+
+    provider_name = "fake"
+
+    def __init__(self, latency: LatencyModel):
+        self.latency = latency
+
+    async def rerank(
+        self,
+        query: str,
+        documents: list[str],
+        model: str | None = None,
+        top_k: int | None = None,
+        **kwargs: Any,
+    ) -> RerankResult:
+        await self.latency.wait()
+        query_tokens = set(_tokens(query))
+        scored = []
+        for i, doc in enumerate(documents):
+            doc_tokens = set(_tokens(doc))
+            overlap = len(query_tokens & doc_tokens) / (len(query_tokens) or 1)
+            scored.append(RerankResult.ScoredItem(index=i, score=overlap))
+        scored.sort(key=lambda item: item.score, reverse=True)
+        return RerankResult(
+            results=scored[: top_k or len(scored)], model="fake-rerank", provider="fake"
+        )
+
+
+class FakeProviderFactory:
+    """Provider factory handing out the shared fake providers."""
+
+    def __init__(self, config: BenchmarkConfig):
+        self.llm = FakeLLMProvider(config.latency(config.llm_latency_ms, salt=1))
+        self.embedding = HashEmbeddingProvider(config.latency(config.embedding_latency_ms, salt=2))
+        self.reranker = FakeReranker(config.latency(config.embedding_latency_ms, salt=3))
+
+    def get_llm_provider(self, provider_name=None, tier=None, model=None, **kwargs):
+        return self.llm
+
+    def get_embedding_provider(self, provider_name=None, **kwargs):
+        return self.embedding
+
+    def get_reranker_provider(self, provider_name=None, **kwargs):
+        return self.reranker
+
+
+class HashingSparseEmbeddingService:
+    """Stand-in for the SPLADE service: term frequencies over hashed token ids."""
+
+    def __init__(self, model_name: str | None = None):
+        self.model_name = model_name
+
+    def embed_sparse(self, text: str) -> dict[int, float]:
+        counts = Counter(zlib.crc32(t.encode()) % 30522 for t in _tokens(text))
+        total = sum(counts.values()) or 1
+        return {token_id: count / total for token_id, count in counts.items()}
+
+    def embed_batch(self, texts: list[str], batch_size: int = 32) -> list[dict[int, float]]:
+        return [self.embed_sparse(t) for t in texts]
+
+
+class FakeGraphExtractor:
+    """Treats capitalized words as entities and links consecutive ones."""
+
+    def __init__(self, latency: LatencyModel):
+        self.latency = latency
+        self.calls = 0
+
+    async def extract(
+        self,
+        text: str,
+        chunk_id: str = "UNKNOWN",
+        track_usage: bool = True,
+        tenant_id: str | None = None,
+        tenant_config: dict | None = None,
+        chunk_number: int | None = None,
+        total_chunks: int | None = None,
+    ) -> ExtractionResult:
+        self.calls += 1
+        await self.latency.wait()
+        names = list(dict.fromkeys(_ENTITY_RE.findall(text)))[:12]
+        entities = [
+            ExtractedEntity(name=n, type="CONCEPT", description=f"{n} mentioned in {chunk_id}")
+            for n in names
+        ]
+        relationships = [
+            ExtractedRelationship(
+                source=a, target=b, type="RELATED_TO", description=f"{a} appears with {b}"
+            )
+            for a, b in zip(names, names[1:], strict=False)
+        ]
+        return ExtractionResult(
+            entities=entities,
+            relationships=relationships,
+            usage=ExtractionUsage(
+                total_tokens=_estimate_tokens(text),
+                input_tokens=_estimate_tokens(text),
+                llm_calls=1,
+                model="fake-llm",
+                provider="fake",
+            ),
+        )
+
+
+# =============================================================================
+# Stores
+# =============================================================================
+
+
+class InMemoryVectorStore:
+    """Exact cosine search over numpy arrays; one store for all collections."""
+
+    def __init__(self, latency: LatencyModel):
+        self.latency = latency
+        self.rows: dict[str, dict[str, Any]] = {}
+        self._matrix: np.ndarray | None = None
+        self._ids: list[str] = []
+        self.searches = 0
+
+    async def connect(self) -> None:
+        return None
+
+    async def disconnect(self) -> None:
+        return None
+
+    async def upsert_chunks(self, chunks_data: list[dict[str, Any]], flush: bool = True) -> int:
+        await self.latency.wait()
+        for row in chunks_data:
+            self.rows[row["chunk_id"]] = dict(row)
+        self._matrix = None
+        return len(chunks_data)
+
+    async def delete_by_document(self, document_id: str, tenant_id: str | None = None) -> int:
+        doomed = [cid for cid, row in self.rows.items() if row["document_id"] == document_id]
+        for chunk_id in doomed:
+            del self.rows[chunk_id]
+        self._matrix = None
+        return len(doomed)
+
+    async def delete_by_documents(self, document_ids: list[str], tenant_id: str) -> int:
+        doomed = set(document_ids)
+        removed = [cid for cid, row in self.rows.items() if row["document_id"] in doomed]
+        for chunk_id in removed:
+            del self.rows[chunk_id]
+        self._matrix = None
+        return len(removed)
+
+    def _index(self) -> np.ndarray:
+        if self._matrix is None:
+            self._ids = list(self.rows)
+            vectors = [self.rows[cid]["embedding"] for cid in self._ids]
+            self._matrix = np.asarray(vectors, dtype=np.float32) if vectors else np.zeros((0, 1))
+        return self._matrix
+
+    async def search(
+        self,
+        query_vector: list[float],
+        tenant_id: str,
+        document_ids: list[str] | None = None,
+        limit: int = 10,
+        score_threshold: float | None = None,
+        filters: dict[str, Any] | None = None,
+        collection_name: str | None = None,
+        **kwargs: Any,
+    ) -> list[SearchResult]:
+        self.searches += 1
+        await self.latency.wait()
+        matrix = self._index()
+        if not len(self._ids):
+            return []
+
+        scores = matrix @ np.asarray(query_vector, dtype=np.float32)
+        allowed = set(document_ids) if document_ids else None
+        results = []
+        for i in np.argsort(-scores):
+            row = self.rows[self._ids[i]]
+            if row["tenant_id"] != tenant_id:
+                continue
+            if allowed is not None and row["document_id"] not in allowed:
+                continue
+            score = float(scores[i])
+            if score_threshold is not None and score < score_threshold:
+                break
+            metadata = {k: v for k, v in row.items() if k not in ("embedding", "sparse_vector")}
+            results.append(
+                SearchResult(
+                    chunk_id=row["chunk_id"],
+                    document_id=row["document_id"],
+                    tenant_id=row["tenant_id"],
+                    score=score,
+                    metadata=metadata,
+                )
+            )
+            if len(results) >= limit:
+                break
+        return results
+
+    async def hybrid_search(
+        self,
+        dense_vector: list[float],
+        sparse_vector: dict[int, float],
+        tenant_id: str,
+        limit: int = 10,
+        filters: dict[str, Any] | None = None,
+        document_ids: list[str] | None = None,
+    ) -> list[SearchResult]:
+        return await self.search(dense_vector, tenant_id, document_ids, limit, filters=filters)
+
+
+class InMemoryGraphClient:
+    """Graph client that records statements; reads are answered by ``read_handler``."""
+
+    def __init__(
+        self,
+        latency: LatencyModel,
+        read_handler: Callable[[str, dict[str, Any]], list[dict[str, Any]]] | None = None,
+    ):
+        self.latency = latency
+        self.read_handler = read_handler
+        self.reads = 0
+        self.writes = 0
+        self.statements = 0
+
+    async def connect(self) -> None:
+        return None
+
+    async def close(self) -> None:
+        return None
+
+    async def execute_read(
+        self, query: str, parameters: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
+        self.reads += 1
+        await self.latency.wait()
+        if self.read_handler is None:
+            return []
+        return self.read_handler(query, parameters or {})
+
+    async def execute_write(
+        self, query: str, parameters: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
+        self.writes += 1
+        self.statements += 1
+        await self.latency.wait()
+        return []
+
+    async def execute_write_batch(
+        self, statements: list[tuple[str, dict[str, Any] | None]]
+    ) -> list[list[dict[str, Any]]]:
+        self.writes += 1
+        self.statements += len(statements)
+        await self.latency.wait()
+        return [[] for _ in statements]
+
+    async def import_graph(self, items: Any, mode: str) -> dict:
+        return {}
+
+    async def export_graph(self, tenant_id: str) -> AsyncIterator[Any]:
+        for item in ():
+            yield item
+
+
+class InMemoryStorage:
+    """Object storage kept in a dict."""
+
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+
+    def upload_file(self, object_name: str, data: Any, length: int, content_type: str) -> None:
+        self.objects[object_name] = data.read() if hasattr(data, "read") else bytes(data)
+
+    def upload_stream(self, object_name: str, data: Any, content_type: str, **kwargs: Any) -> None:
+        self.upload_file(object_name, data, -1, content_type)
+
+    def get_file(self, object_name: str) -> bytes:
+        return self.objects[object_name]
+
+    def get_file_stream(self, object_name: str, offset: int = 0, length: int | None = None) -> Any:
+        import io
+
+        data = self.objects[object_name][offset:]
+        return io.BytesIO(data if length is None else data[:length])
+
+    def stat_file(self, object_name: str) -> dict | None:
+        if object_name not in self.objects:
+            return None
+        return {"size": len(self.objects[object_name]), "content_type": None, "etag": None}
+
+    def list_files(self, prefix: str) -> list[str]:
+        return [name for name in self.objects if name.startswith(prefix)]
+
+    def delete_file(self, object_name: str) -> None:
+        self.objects.pop(object_name, None)
+
+
+class InMemoryDocumentRepository:
+    """Document repository over a dict of ORM objects (never flushed to a database)."""
+
+    def __init__(self, latency: LatencyModel):
+        self.latency = latency
+        self.documents: dict[str, Any] = {}
+
+    async def get(self, document_id: str) -> Any:
+        await self.latency.wait()
+        return self.documents.get(document_id)
+
+    async def save(self, document: Any) -> Any:
+        await self.latency.wait()
+        self.documents[document.id] = document
+        return document
+
+    async def delete(self, document: Any) -> None:
+        self.documents.pop(document.id, None)
+
+    async def list_by_tenant(self, tenant_id: str, limit: int = 100, offset: int = 0) -> list:
+        docs = [d for d in self.documents.values() if d.tenant_id == tenant_id]
+        return docs[offset : offset + limit]
+
+    async def find_by_content_hash(self, tenant_id: str, content_hash: str) -> Any:
+        for doc in self.documents.values():
+            if doc.tenant_id == tenant_id and doc.content_hash == content_hash:
+                return doc
+        return None
+
+    async def update_status(
+        self, document_id: str, status: DocumentStatus, old_status: DocumentStatus | None = None
+    ) -> bool:
+        await self.latency.wait()
+        doc = self.documents.get(document_id)
+        if doc is None or (old_status is not None and doc.status != old_status):
+            return False
+        doc.status = status
+        return True
+
+    async def get_chunks(self, chunk_ids: list[str]) -> list:
+        wanted = set(chunk_ids)
+        return [
+            chunk
+            for doc in self.documents.values()
+            for chunk in doc.chunks
+            if chunk.id in wanted
+        ]
+
+    async def get_titles_by_ids(self, document_ids: list[str]) -> dict[str, str]:
+        return {d: self.documents[d].filename for d in document_ids if d in self.documents}
+
+
+class InMemoryTenantRepository:
+    def __init__(self):
+        self.tenants: dict[str, Any] = {}
+
+    async def get(self, tenant_id: str) -> Any:
+        return self.tenants.get(tenant_id)
+
+    async def save(self, tenant: Any) -> Any:
+        self.tenants[tenant.id] = tenant
+        return tenant
+
+
+class NullUnitOfWork:
+    def __init__(self):
+        self.commits = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        return None
+
+
+# =============================================================================
+# Tokenizer and Redis
+# =============================================================================
+
+
+class CharTokenEncoding:
+    """tiktoken stand-in counting ~4 characters per token, as in tests/conftest.py."""
+
+    name = "char_estimate"
+
+    def encode(self, text: str, **kwargs) -> list[int]:
+        if not text:
+            return []
+        return list(range(max(1, len(text) // 4)))
+
+    def encode_batch(self, texts: list[str], **kwargs) -> list[list[int]]:
+        return [self.encode(text) for text in texts]
+
+    def decode(self, tokens: list[int]) -> str:
+        return "x" * (len(tokens) * 4)
+
+
+class OfflineTiktoken:
+    """Replaces tiktoken's encoding loaders, which download BPE files on first use."""
+
+    def get_encoding(self, encoding_name: str) -> CharTokenEncoding:
+        return CharTokenEncoding()
+
+    def encoding_for_model(self, model_name: str) -> CharTokenEncoding:
+        return CharTokenEncoding()
+
+
+class InMemoryRedis:
+    """
+    The Redis commands of the graph version counter and the cache client.
+
+    Expiry is ignored: a benchmark run is shorter than any cache TTL. Other
+    commands raise ``ConnectionError``, as an unreachable Redis would.
+    """
+
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        return value if isinstance(value, bytes) else str(value).encode()
+
+    async def get(self, key: str) -> bytes | None:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: Any, nx: bool = False, **kwargs) -> bool | None:
+        if nx and key in self.data:
+            return None
+        self.data[key] = self._encode(value)
+        return True
+
+    async def incr(self, key: str) -> int:
+        value = int(self.data.get(key, b"0")) + 1
+        self.data[key] = self._encode(value)
+        return value
+
+    async def exists(self, *keys: str) -> int:
+        return sum(key in self.data for key in keys)
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def eval(self, script: str, numkeys: int, *args: Any) -> int:
+        from src.core.cache.decorators import RELEASE_LOCK_SCRIPT
+
+        if script != RELEASE_LOCK_SCRIPT:
+            raise ConnectionError("Lua scripts are not available offline")
+        key, token = args
+        if self.data.get(key) != self._encode(token):
+            return 0
+        return await self.delete(key)
+
+    async def aclose(self) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> Any:
+        raise ConnectionError(f"Redis command {name!r} is not available offline")
+
+
+# =============================================================================
+# Events
+# =============================================================================
+
+
+class InMemoryEventHub(DocumentEventHub):
+    """
+    Event hub whose reader consumes an in-process queue instead of Redis.
+
+    ``publish`` stands in for ``PUBLISH document:<id>:status``: events are
+    serialized and decoded by the reader task exactly as pub/sub messages are.
+    """
+
+    def __init__(self, min_interval: float = 0.5):
+        super().__init__(redis_url="", min_interval=min_interval)
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+
+    async def publish(self, event: dict[str, Any]) -> None:
+        await self._queue.put(json.dumps(event))
+
+    async def drain(self) -> None:
+        """Wait until the reader has fanned out every published event."""
+        await self._queue.join()
+
+    async def _run(self) -> None:
+        while True:
+            message = await self._queue.get()
+            try:
+                self.publish_local(message)
+            finally:
+                self._queue.task_done()
+
+
+# =============================================================================
+# Wiring
+# =============================================================================
+
+
+@dataclass
+class OfflineBackends:
+    """All fakes for one benchmark run."""
+
+    config: BenchmarkConfig
+    settings: Any
+    providers: FakeProviderFactory
+    graph: InMemoryGraphClient
+    graph_extractor: FakeGraphExtractor
+    content_extractor: Any
+    vector_store: InMemoryVectorStore
+    storage: InMemoryStorage = field(default_factory=InMemoryStorage)
+    redis: InMemoryRedis = field(default_factory=InMemoryRedis)
+    documents: InMemoryDocumentRepository | None = None
+    tenants: InMemoryTenantRepository = field(default_factory=InMemoryTenantRepository)
+    unit_of_work: NullUnitOfWork = field(default_factory=NullUnitOfWork)
+
+    @classmethod
+    def create(cls, config: BenchmarkConfig) -> "OfflineBackends":
+        from src.core.ingestion.infrastructure.extraction.fallback_extractor import (
+            FallbackContentExtractor,
+        )
+
+        providers = FakeProviderFactory(config)
+        settings = build_settings()
+        # Ingestion sizes vectors from settings; queries use the provider default
+        settings.embedding_dimensions = providers.embedding.dimensions
+
+        return cls(
+            config=config,
+            settings=settings,
+            providers=providers,
+            graph=InMemoryGraphClient(config.latency(config.graph_latency_ms, salt=4)),
+            graph_extractor=FakeGraphExtractor(config.latency(config.llm_latency_ms, salt=5)),
+            content_extractor=FallbackContentExtractor(),
+            vector_store=InMemoryVectorStore(config.latency(config.vector_latency_ms, salt=6)),
+            documents=InMemoryDocumentRepository(config.latency(config.db_latency_ms, salt=7)),
+        )
@@ -0,0 +1,340 @@
+"""
+Benchmark Harness
+=================
+
+Configuration, timing helpers, offline runtime wiring and the JSON result
+envelope shared by all scenarios.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+SUITE_NAME = "amber-offline-benchmarks"
+RESULT_VERSION = 1
+
+# Opt-in to counting tokens with a character estimate when tiktoken's
+# encoding is not cached on this machine
+ESTIMATE_TOKENS_ENV = "BENCHMARK_ESTIMATE_TOKENS"
+
+
+@dataclass
+class BenchmarkConfig:
+    """Knobs shared by every scenario."""
+
+    # Multiplies dataset sizes and iteration counts (1.0 = full run)
+    scale: float = 1.0
+    seed: int = 0
+    concurrency: int = 8
+
+    # Fake backend latencies (mean, in milliseconds; jitter is 20% of the mean)
+    llm_latency_ms: float = 0.0
+    embedding_latency_ms: float = 0.0
+    vector_latency_ms: float = 0.0
+    graph_latency_ms: float = 0.0
+    db_latency_ms: float = 0.0
+
+    # Count tokens as ~4 characters each instead of with tiktoken; tokenizer
+    # and chunker results are then marked as estimated
+    estimate_tokens: bool = False
+
+    def scaled(self, full: int, minimum: int = 1) -> int:
+        return max(minimum, int(full * self.scale))
+
+    def latency(self, mean_ms: float, salt: int = 0) -> "LatencyModel":
+        return LatencyModel(mean_ms=mean_ms, jitter_ms=mean_ms * 0.2, seed=self.seed + salt)
+
+
+@dataclass
+class LatencyModel:
+    """Deterministic simulated I/O latency (gaussian, seeded)."""
+
+    mean_ms: float = 0.0
+    jitter_ms: float = 0.0
+    seed: int = 0
+    _rng: random.Random = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._rng = random.Random(self.seed)
+
+    async def wait(self) -> None:
+        if self.mean_ms <= 0:
+            # Still yield so concurrency behaves like real I/O
+            await asyncio.sleep(0)
+            return
+        delay_ms = max(0.0, self._rng.gauss(self.mean_ms, self.jitter_ms))
+        await asyncio.sleep(delay_ms / 1000)
+
+
+def percentiles(samples_ms: list[float]) -> dict[str, float]:
+    """Latency summary (nearest-rank percentiles) in milliseconds."""
+    if not samples_ms:
+        return {"count": 0}
+    ordered = sorted(samples_ms)
+
+    def rank(p: float) -> float:
+        index = max(0, math.ceil(p / 100 * len(ordered)) - 1)
+        return round(ordered[index], 3)
+
+    return {
+        "count": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered), 3),
+        "p50_ms": rank(50),
+        "p95_ms": rank(95),
+        "p99_ms": rank(99),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+async def timed_gather(
+    calls: list[Callable[[], Awaitable[Any]]], concurrency: int
+) -> tuple[list[float], list[Any], float]:
+    """
+    Run ``calls`` with bounded concurrency.
+
+    Returns:
+        (per-call latencies in ms, results in call order, wall time in seconds)
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    latencies: list[float] = [0.0] * len(calls)
+
+    async def run(i: int, call: Callable[[], Awaitable[Any]]) -> Any:
+        async with semaphore:
+            started = time.perf_counter()
+            result = await call()
+            latencies[i] = (time.perf_counter() - started) * 1000
+            return result
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(run(i, call) for i, call in enumerate(calls)))
+    return latencies, list(results), time.perf_counter() - started
+
+
+def build_settings() -> Any:
+    """Application settings with every network backend disabled."""
+    from src.api.config import Settings
+
+    settings = Settings()
+    settings.db.redis_url = ""
+    settings.openai_api_key = ""
+    settings.anthropic_api_key = ""
+    settings.ollama_base_url = ""
+    return settings
+
+
+def _cached_encoding() -> str:
+    """Name of tiktoken's default encoding, loaded from the local cache only."""
+    from src.core.utils.tokenizer import DEFAULT_ENCODING
+
+    try:
+        import tiktoken
+
+        return getattr(tiktoken.get_encoding(DEFAULT_ENCODING), "name", DEFAULT_ENCODING)
+    except Exception as e:
+        raise RuntimeError(
+            f"tiktoken encoding {DEFAULT_ENCODING} is not available offline; cache it "
+            f"(TIKTOKEN_CACHE_DIR) or opt in to estimated token counts with "
+            f"--estimate-tokens / {ESTIMATE_TOKENS_ENV}=1"
+        ) from e
+
+
+@contextmanager
+def offline_tokenizer(estimate: bool = False) -> Iterator[str]:
+    """
+    Keep tiktoken off the network for a run.
+
+    tiktoken downloads its encodings on first use. Here it only loads them from
+    its cache (already populated, or provisioned through TIKTOKEN_CACHE_DIR), so
+    the chunking benchmarks measure the real encoder. With ``estimate`` tokens
+    are counted as ~4 characters each instead, which says nothing about
+    tiktoken cost.
+
+    Yields the name of the encoding in use ("char_estimate" when estimating).
+
+    Raises:
+        RuntimeError: The encoding is not cached and ``estimate`` is off.
+    """
+    import tiktoken
+
+    from tests.benchmarks.fakes import OfflineTiktoken
+
+    try:
+        from tiktoken import load
+    except ImportError:
+        # Stand-in module (tests/conftest.py) that never downloads anything
+        load = None
+
+    def no_download(blobpath: str) -> bytes:
+        raise FileNotFoundError(f"{blobpath} is not in the tiktoken cache")
+
+    saved = (tiktoken.get_encoding, tiktoken.encoding_for_model)
+    saved_read_file = load.read_file if load else None
+    if load:
+        load.read_file = no_download
+    try:
+        if estimate:
+            offline = OfflineTiktoken()
+            tiktoken.get_encoding = offline.get_encoding
+            tiktoken.encoding_for_model = offline.encoding_for_model
+            yield "char_estimate"
+        else:
+            yield _cached_encoding()
+    finally:
+        tiktoken.get_encoding, tiktoken.encoding_for_model = saved
+        if load:
+            load.read_file = saved_read_file
+
+
+@contextmanager
+def offline_runtime(config: BenchmarkConfig) -> Iterator[Any]:
+    """
+    Wire the process-wide ports to in-memory backends.
+
+    Yields the fakes namespace used by the scenarios; every global that is
+    replaced here is restored on exit.
+    """
+    import redis.asyncio as redis
+
+    from src.core.cache import decorators as cache
+    from src.core.generation.application.intelligence import document_summarizer
+    from src.core.generation.domain.ports import provider_factory
+    from src.core.graph.domain.ports import graph_client, graph_extractor
+    from src.core.ingestion.domain.ports import content_extractor
+    from src.core.retrieval.application import sparse_embeddings_service
+    from src.shared.kernel import runtime
+    from tests.benchmarks import fakes
+
+    backends = fakes.OfflineBackends.create(config)
+
+    saved = {
+        "settings": runtime._settings,
+        "factory": provider_factory._provider_factory,
+        "builder": provider_factory._provider_factory_builder,
+        "graph_client": graph_client._graph_client,
+        "graph_extractor": graph_extractor._graph_extractor,
+        "content_extractor": content_extractor._content_extractor,
+        "sparse": sparse_embeddings_service.SparseEmbeddingService,
+        "redis_from_url": redis.from_url,
+        "cache_client": (cache._client, cache._client_loop),
+    }
+
+    runtime.configure_settings(backends.settings)
+    provider_factory.set_provider_factory(backends.providers)
+    provider_factory.set_provider_factory_builder(lambda **kwargs: backends.providers)
+    graph_client.set_graph_client(backends.graph)
+    graph_extractor.set_graph_extractor(backends.graph_extractor)
+    content_extractor.set_content_extractor(backends.content_extractor)
+    # SPLADE loads a model from the hub; use the hashing stand-in instead
+    sparse_embeddings_service.SparseEmbeddingService = fakes.HashingSparseEmbeddingService
+    document_summarizer.reset_document_summarizer()
+    # Graph version counters and the pooled cache client live in memory
+    redis.from_url = lambda *args, **kwargs: backends.redis
+    cache._client, cache._client_loop = None, None
+
+    try:
+        yield backends
+    finally:
+        runtime._settings = saved["settings"]
+        provider_factory.set_provider_factory(saved["factory"])
+        provider_factory.set_provider_factory_builder(saved["builder"])
+        graph_client.set_graph_client(saved["graph_client"])
+        graph_extractor.set_graph_extractor(saved["graph_extractor"])
+        content_extractor.set_content_extractor(saved["content_extractor"])
+        sparse_embeddings_service.SparseEmbeddingService = saved["sparse"]
+        document_summarizer.reset_document_summarizer()
+        redis.from_url = saved["redis_from_url"]
+        cache._client, cache._client_loop = saved["cache_client"]
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            check=False,
+        )
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+async def run_suite(names: list[str], config: BenchmarkConfig) -> dict[str, Any]:
+    """Run the named scenarios and return the JSON-serializable result envelope."""
+    from tests.benchmarks.scenarios import SCENARIOS
+
+    results: dict[str, Any] = {}
+    with offline_tokenizer(config.estimate_tokens) as encoding:
+        for name in names:
+            scenario = SCENARIOS[name]
+            logger.info(f"Running benchmark scenario {name}")
+            started = time.perf_counter()
+            try:
+                result = await scenario(config)
+            except Exception as e:
+                logger.exception(f"Benchmark scenario {name} failed")
+                result = {"error": f"{type(e).__name__}: {e}"}
+            result["duration_s"] = round(time.perf_counter() - started, 3)
+            results[name] = result
+
+    return {
+        "suite": SUITE_NAME,
+        "version": RESULT_VERSION,
+        "created_at": datetime.now(UTC).isoformat(),
+        "git_commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "config": asdict(config),
+        "tokenizer": {"encoding": encoding, "estimated": config.estimate_tokens},
+        "scenarios": results,
+    }
+
+
+def _flatten(prefix: str, value: Any, out: dict[str, float]) -> None:
+    if isinstance(value, bool):
+        return
+    if isinstance(value, int | float):
+        out[prefix] = float(value)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            _flatten(f"{prefix}.{key}" if prefix else str(key), item, out)
+    elif isinstance(value, list):
+        for i, item in enumerate(value):
+            _flatten(f"{prefix}[{i}]", item, out)
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Numeric metrics present in both result files, with relative change.
+
+    Returns rows of ``{"metric", "baseline", "current", "change_pct"}``.
+    """
+    base_metrics: dict[str, float] = {}
+    current_metrics: dict[str, float] = {}
+    _flatten("", baseline.get("scenarios", {}), base_metrics)
+    _flatten("", current.get("scenarios", {}), current_metrics)
+
+    rows = []
+    for metric in sorted(base_metrics.keys() & current_metrics.keys()):
+        before, after = base_metrics[metric], current_metrics[metric]
+        change = None if before == 0 else round((after - before) / abs(before) * 100, 2)
+        rows.append({"metric": metric, "baseline": before, "current": after, "change_pct": change})
+    return rows
+
+
+def dumps(result: dict[str, Any]) -> str:
+    return json.dumps(result, indent=2, sort_keys=True, default=str)
@@ -0,0 +1,29 @@
+"""
+Benchmark Scenarios
+===================
+
+Each scenario is an async callable taking a ``BenchmarkConfig`` and returning
+a JSON-serializable dict of metrics.
+"""
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from tests.benchmarks.harness import BenchmarkConfig
+from tests.benchmarks.scenarios.chunking import run_chunking
+from tests.benchmarks.scenarios.ingestion import run_ingestion
+from tests.benchmarks.scenarios.leiden import run_leiden
+from tests.benchmarks.scenarios.query import run_query
+from tests.benchmarks.scenarios.sse import run_sse
+
+Scenario = Callable[[BenchmarkConfig], Awaitable[dict[str, Any]]]
+
+SCENARIOS: dict[str, Scenario] = {
+    "query": run_query,
+    "ingestion": run_ingestion,
+    "chunking": run_chunking,
+    "leiden": run_leiden,
+    "sse": run_sse,
+}
+
+__all__ = ["SCENARIOS", "Scenario"]
@@ -0,0 +1,80 @@
+"""
+Chunker and Tokenizer Throughput
+================================
+
+CPU-only throughput of ``SemanticChunker`` per domain strategy and of
+``Tokenizer.count_tokens`` on the synthetic corpus.
+"""
+
+import random
+import time
+from typing import Any
+
+from tests.benchmarks import synthetic
+from tests.benchmarks.harness import BenchmarkConfig
+
+
+def _encoder_name() -> str:
+    from src.core.utils.tokenizer import Tokenizer
+
+    encoding = Tokenizer.get_encoding()
+    return getattr(encoding, "name", None) or "char_estimate"
+
+
+async def run_chunking(config: BenchmarkConfig) -> dict[str, Any]:
+    from src.core.generation.application.intelligence.strategies import (
+        DocumentDomain,
+        get_strategy,
+    )
+    from src.core.ingestion.application.chunking.semantic import SemanticChunker
+    from src.core.utils.tokenizer import Tokenizer
+
+    rng = random.Random(config.seed)
+    texts = [
+        synthetic.markdown_document(rng, i, paragraphs=20).text
+        for i in range(config.scaled(30, minimum=2))
+    ]
+    total_chars = sum(len(t) for t in texts)
+
+    strategies: dict[str, Any] = {}
+    for domain in DocumentDomain:
+        chunker = SemanticChunker(get_strategy(domain.value))
+        started = time.perf_counter()
+        chunks = 0
+        for i, text in enumerate(texts):
+            chunks += len(chunker.chunk(text, document_title=f"doc-{i}"))
+        elapsed = time.perf_counter() - started
+        strategies[domain.value] = {
+            "chunks": chunks,
+            "seconds": round(elapsed, 4),
+            "mb_per_s": round(total_chars / 1_000_000 / elapsed, 4) if elapsed else None,
+            "chunks_per_s": round(chunks / elapsed, 2) if elapsed else None,
+        }
+
+    # Tokenizer: paragraph-sized calls, the shape the chunker issues
+    paragraphs = [p for t in texts for p in t.split("\n\n") if p]
+    repeats = max(1, config.scaled(5))
+    started = time.perf_counter()
+    tokens = 0
+    for _ in range(repeats):
+        for paragraph in paragraphs:
+            tokens += Tokenizer.count_tokens(paragraph)
+    elapsed = time.perf_counter() - started
+    calls = len(paragraphs) * repeats
+    encoder = _encoder_name()
+
+    return {
+        "documents": len(texts),
+        "characters": total_chars,
+        "strategies": strategies,
+        "tokenizer": {
+            "encoder": encoder,
+            # Character estimate, not tiktoken: the throughput is not comparable
+            "estimated": encoder == "char_estimate",
+            "calls": calls,
+            "tokens": tokens,
+            "seconds": round(elapsed, 4),
+            "calls_per_s": round(calls / elapsed, 1) if elapsed else None,
+            "tokens_per_s": round(tokens / elapsed, 1) if elapsed else None,
+        },
+    }
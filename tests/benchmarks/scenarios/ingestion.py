@@ -0,0 +1,143 @@
+"""
+Ingestion Throughput
+====================
+
+Runs ``IngestionService.process_document`` end to end (extraction, domain
+classification, chunking, embedding, vector upsert, graph extraction and
+summarization) over synthetic PDF and markdown documents.
+"""
+
+import hashlib
+import random
+from collections import defaultdict
+from datetime import UTC, datetime
+from typing import Any
+
+from tests.benchmarks import synthetic
+from tests.benchmarks.harness import (
+    BenchmarkConfig,
+    offline_runtime,
+    percentiles,
+    timed_gather,
+)
+
+TENANT_ID = "bench"
+
+
+def build_ingestion_service(backends: Any) -> Any:
+    from src.core.ingestion.application.ingestion_service import IngestionService
+
+    return IngestionService(
+        document_repository=backends.documents,
+        tenant_repository=backends.tenants,
+        unit_of_work=backends.unit_of_work,
+        storage_client=backends.storage,
+        neo4j_client=backends.graph,
+        vector_store=backends.vector_store,
+        content_extractor=backends.content_extractor,
+        settings=backends.settings,
+    )
+
+
+async def register(backends: Any, doc: synthetic.SyntheticDocument, tenant_id: str) -> str:
+    """Store the file and create an INGESTED document row, as upload does."""
+    from src.core.ingestion.domain.document import Document
+    from src.core.state.machine import DocumentStatus
+    from src.core.tenants.domain.tenant import Tenant
+    from src.shared.identifiers import generate_document_id
+
+    if await backends.tenants.get(tenant_id) is None:
+        await backends.tenants.save(Tenant(id=tenant_id, name=tenant_id, config={}))
+
+    document_id = str(generate_document_id())
+    storage_path = f"{tenant_id}/{document_id}/{doc.filename}"
+    backends.storage.objects[storage_path] = doc.content
+    await backends.documents.save(
+        Document(
+            id=document_id,
+            tenant_id=tenant_id,
+            filename=doc.filename,
+            content_hash=hashlib.sha256(doc.content).hexdigest(),
+            storage_path=storage_path,
+            status=DocumentStatus.INGESTED,
+            metadata_={},
+            created_at=datetime.now(UTC),
+        )
+    )
+    return document_id
+
+
+def corpus(config: BenchmarkConfig, count: int) -> list[synthetic.SyntheticDocument]:
+    """Deterministic mix of markdown and (when PyMuPDF is available) PDF documents."""
+    rng = random.Random(config.seed)
+    docs = []
+    for i in range(count):
+        doc = synthetic.pdf_document(rng, i) if i % 2 else None
+        docs.append(doc or synthetic.markdown_document(rng, i))
+    return docs
+
+
+async def ingest(backends: Any, docs: list[synthetic.SyntheticDocument], concurrency: int):
+    """Register and process ``docs``; returns (ids, latencies in ms, success flags, wall s)."""
+    service = build_ingestion_service(backends)
+    document_ids = [await register(backends, doc, TENANT_ID) for doc in docs]
+
+    async def process(document_id: str) -> bool:
+        try:
+            await service.process_document(document_id)
+            return True
+        except Exception:
+            return False
+
+    latencies, ok, wall = await timed_gather(
+        [lambda d=d: process(d) for d in document_ids], concurrency
+    )
+    return document_ids, latencies, ok, wall
+
+
+async def run_ingestion(config: BenchmarkConfig) -> dict[str, Any]:
+    docs = corpus(config, config.scaled(40, minimum=2))
+    with offline_runtime(config) as backends:
+        document_ids, latencies, ok, wall = await ingest(backends, docs, config.concurrency)
+
+        by_format: dict[str, dict[str, Any]] = defaultdict(
+            lambda: {"documents": 0, "bytes": 0, "latencies": []}
+        )
+        chunk_count = 0
+        for doc, document_id, latency, success in zip(
+            docs, document_ids, latencies, ok, strict=True
+        ):
+            fmt = doc.filename.rsplit(".", 1)[-1]
+            stats = by_format[fmt]
+            stats["documents"] += 1
+            stats["bytes"] += len(doc.content)
+            stats["latencies"].append(latency)
+            if success:
+                chunk_count += len(backends.documents.documents[document_id].chunks)
+
+        total_bytes = sum(len(doc.content) for doc in docs)
+        return {
+            "documents": len(docs),
+            "failures": ok.count(False),
+            "chunks": chunk_count,
+            "wall_s": round(wall, 3),
+            "docs_per_s": round(len(docs) / wall, 3) if wall else None,
+            "chunks_per_s": round(chunk_count / wall, 3) if wall else None,
+            "mb_per_s": round(total_bytes / 1_000_000 / wall, 4) if wall else None,
+            "latency": percentiles(latencies),
+            "formats": {
+                fmt: {
+                    "documents": stats["documents"],
+                    "bytes": stats["bytes"],
+                    "latency": percentiles(stats["latencies"]),
+                }
+                for fmt, stats in sorted(by_format.items())
+            },
+            "backend_calls": {
+                "embedding": backends.providers.embedding.calls,
+                "llm": backends.providers.llm.calls,
+                "graph_extraction": backends.graph_extractor.calls,
+                "graph_writes": backends.graph.writes,
+                "graph_statements": backends.graph.statements,
+            },
+        }
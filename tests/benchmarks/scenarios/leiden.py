@@ -0,0 +1,57 @@
+"""
+Leiden Scaling
+==============
+
+Hierarchical community detection (``CommunityDetector``) on synthetic entity
+graphs with planted communities, at increasing sizes.
+"""
+
+import importlib.util
+import random
+import time
+from typing import Any
+
+from tests.benchmarks import synthetic
+from tests.benchmarks.harness import BenchmarkConfig
+
+GRAPH_SIZES = (500, 2000, 8000)
+
+
+def leiden_available() -> bool:
+    return all(importlib.util.find_spec(m) is not None for m in ("igraph", "leidenalg"))
+
+
+async def run_leiden(config: BenchmarkConfig) -> dict[str, Any]:
+    if not leiden_available():
+        return {"skipped": "igraph/leidenalg not installed"}
+
+    from src.core.graph.application.communities.leiden import CommunityDetector
+    from tests.benchmarks.fakes import InMemoryGraphClient
+
+    rng = random.Random(config.seed)
+    runs = []
+    for full_size in GRAPH_SIZES:
+        nodes = config.scaled(full_size, minimum=50)
+        records = synthetic.community_graph(rng, nodes, communities=max(2, nodes // 100))
+        graph = InMemoryGraphClient(
+            config.latency(config.graph_latency_ms, salt=nodes),
+            read_handler=lambda query, params, records=records: records,
+        )
+        detector = CommunityDetector(graph)
+
+        started = time.perf_counter()
+        result = await detector.detect_communities("bench", seed=config.seed)
+        elapsed = time.perf_counter() - started
+
+        runs.append(
+            {
+                "nodes": nodes,
+                "edges": len(records),
+                "communities": result.get("community_count", 0),
+                "seconds": round(elapsed, 4),
+                "graph_writes": graph.writes,
+                "graph_statements": graph.statements,
+            }
+        )
+
+    return {"runs": runs}
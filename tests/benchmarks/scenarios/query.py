@@ -0,0 +1,78 @@
+"""
+Query Latency
+=============
+
+Ingests a synthetic corpus, then measures ``RetrievalService.retrieve``
+latency (embedding, vector search, reranking) under concurrent load.
+"""
+
+import random
+from typing import Any
+
+from tests.benchmarks import synthetic
+from tests.benchmarks.harness import (
+    BenchmarkConfig,
+    offline_runtime,
+    percentiles,
+    timed_gather,
+)
+from tests.benchmarks.scenarios.ingestion import TENANT_ID, corpus, ingest
+
+
+def build_retrieval_service(backends: Any) -> Any:
+    from src.core.retrieval.application.retrieval_service import (
+        RetrievalConfig,
+        RetrievalService,
+    )
+
+    return RetrievalService(
+        document_repository=backends.documents,
+        vector_store=backends.vector_store,
+        neo4j_client=backends.graph,
+        redis_url="",
+        config=RetrievalConfig(
+            top_k=10,
+            enable_embedding_cache=False,
+            enable_result_cache=False,
+        ),
+    )
+
+
+async def run_query(config: BenchmarkConfig) -> dict[str, Any]:
+    from src.core.tenants.application.tenant_config_cache import TenantConfigSnapshot
+    from src.shared.kernel.models.query import QueryOptions, SearchMode
+
+    docs = corpus(config, config.scaled(20, minimum=2))
+    questions = synthetic.queries(random.Random(config.seed + 1), config.scaled(200, minimum=5))
+
+    with offline_runtime(config) as backends:
+        await ingest(backends, docs, config.concurrency)
+        service = build_retrieval_service(backends)
+        tenant_config = TenantConfigSnapshot(TENANT_ID, {})
+        options = QueryOptions(search_mode=SearchMode.BASIC, use_rewrite=False)
+
+        async def ask(question: str) -> int:
+            result = await service.retrieve(
+                question, TENANT_ID, options=options, tenant_config=tenant_config
+            )
+            return len(result.chunks)
+
+        # Warm-up outside the measurement (lazy imports, first-call setup)
+        await ask(questions[0])
+        searches_before = backends.vector_store.searches
+
+        latencies, hits, wall = await timed_gather(
+            [lambda q=q: ask(q) for q in questions], config.concurrency
+        )
+
+        return {
+            "corpus_documents": len(docs),
+            "corpus_chunks": len(backends.vector_store.rows),
+            "queries": len(questions),
+            "concurrency": config.concurrency,
+            "empty_results": hits.count(0),
+            "vector_searches": backends.vector_store.searches - searches_before,
+            "wall_s": round(wall, 3),
+            "qps": round(len(questions) / wall, 3) if wall else None,
+            "latency": percentiles(latencies),
+        }
@@ -0,0 +1,109 @@
+"""
+SSE Fan-out
+===========
+
+Many SSE subscribers on one ``DocumentEventHub`` while documents emit
+progress ticks and terminal events. Measures publish-to-delivery latency,
+how many progress ticks per-subscriber coalescing drops, and event throughput.
+"""
+
+import asyncio
+import time
+from typing import Any
+
+from tests.benchmarks.harness import BenchmarkConfig, percentiles
+
+TENANT_ID = "bench"
+
+
+async def run_sse(config: BenchmarkConfig) -> dict[str, Any]:
+    from src.infrastructure.adapters.redis_event_hub import is_terminal_event
+    from tests.benchmarks.fakes import InMemoryEventHub
+
+    documents = [f"doc-{i}" for i in range(config.scaled(20, minimum=2))]
+    subscribers = config.scaled(200, minimum=4)
+    ticks = config.scaled(50, minimum=5)
+    # Progress interval small enough for the run to finish quickly, but well
+    # above the tick spacing so coalescing is exercised
+    hub = InMemoryEventHub(min_interval=0.05)
+
+    latencies: list[float] = []
+    received = 0
+    publish_done = asyncio.Event()
+
+    async def subscriber(index: int, ready: asyncio.Event) -> None:
+        nonlocal received
+        if index % 2:
+            # Document detail page: watches one document
+            watched = {documents[index % len(documents)]}
+            kwargs: dict[str, Any] = {"document_ids": watched}
+        else:
+            # Document list page: watches the whole tenant
+            watched = set(documents)
+            kwargs = {"tenant_id": TENANT_ID}
+        remaining = set(watched)
+        async with hub.subscribe(**kwargs) as subscription:
+            ready.set()
+            while remaining:
+                event = await subscription.get(timeout=1.0)
+                if event is None:
+                    if publish_done.is_set():
+                        break
+                    continue
+                received += 1
+                latencies.append((time.perf_counter() - event["sent_at"]) * 1000)
+                if is_terminal_event(event):
+                    remaining.discard(event["document_id"])
+
+    readies = [asyncio.Event() for _ in range(subscribers)]
+    tasks = [asyncio.create_task(subscriber(i, readies[i])) for i in range(subscribers)]
+    await asyncio.gather(*(r.wait() for r in readies))
+
+    started = time.perf_counter()
+    published = 0
+    for tick in range(ticks):
+        for document_id in documents:
+            await hub.publish(
+                {
+                    "document_id": document_id,
+                    "tenant_id": TENANT_ID,
+                    "status": "embedding",
+                    "progress": int(tick / ticks * 100),
+                    "sent_at": time.perf_counter(),
+                }
+            )
+            published += 1
+        await asyncio.sleep(0.001)
+    for document_id in documents:
+        await hub.publish(
+            {
+                "document_id": document_id,
+                "tenant_id": TENANT_ID,
+                "status": "ready",
+                "progress": 100,
+                "sent_at": time.perf_counter(),
+            }
+        )
+        published += 1
+    await hub.drain()
+    publish_done.set()
+
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=30)
+    elapsed = time.perf_counter() - started
+    await hub.close()
+
+    # What delivery would cost without coalescing: every event to every match
+    watched_per_subscriber = [1 if i % 2 else len(documents) for i in range(subscribers)]
+    uncoalesced = sum(w * (ticks + 1) for w in watched_per_subscriber)
+
+    return {
+        "subscribers": subscribers,
+        "documents": len(documents),
+        "events_published": published,
+        "events_delivered": received,
+        "uncoalesced_deliveries": uncoalesced,
+        "coalescing_ratio": round(received / uncoalesced, 4) if uncoalesced else None,
+        "wall_s": round(elapsed, 3),
+        "deliveries_per_s": round(received / elapsed, 1) if elapsed else None,
+        "delivery_latency": percentiles(latencies),
+    }
@@ -0,0 +1,123 @@
+"""
+Synthetic Data
+==============
+
+Seeded generators for benchmark corpora: markdown and PDF documents, queries
+drawn from the same vocabulary, and entity graphs with planted communities.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Any
+
+TOPICS = {
+    "infrastructure": ["Kubernetes", "Milvus", "Postgres", "Redis", "Neo4j", "Celery"],
+    "retrieval": ["Reranker", "Embedding", "Hybrid", "Vector", "Chunking", "Query"],
+    "security": ["Tenant", "Token", "Audit", "Principal", "Permission", "Secret"],
+    "operations": ["Latency", "Throughput", "Capacity", "Backpressure", "Incident", "Alert"],
+}
+
+FILLER = (
+    "the system handles requests across several services while keeping state consistent "
+    "under load and recovering from partial failures without operator intervention"
+).split()
+
+
+@dataclass
+class SyntheticDocument:
+    filename: str
+    content: bytes
+    topic: str
+    text: str
+
+
+def _sentence(rng: random.Random, topic: str) -> str:
+    names = rng.sample(TOPICS[topic], 2)
+    words = rng.sample(FILLER, 10)
+    return f"{names[0]} works with {names[1]} so that {' '.join(words)}."
+
+
+def document_text(rng: random.Random, topic: str, paragraphs: int) -> str:
+    sections = []
+    for p in range(paragraphs):
+        heading = f"## {topic.title()} section {p + 1}"
+        body = " ".join(_sentence(rng, topic) for _ in range(rng.randint(4, 8)))
+        sections.append(f"{heading}\n\n{body}")
+    return f"# {topic.title()} handbook\n\n" + "\n\n".join(sections)
+
+
+def markdown_document(rng: random.Random, index: int, paragraphs: int = 12) -> SyntheticDocument:
+    topic = rng.choice(sorted(TOPICS))
+    text = document_text(rng, topic, paragraphs)
+    return SyntheticDocument(f"doc-{index:04d}.md", text.encode(), topic, text)
+
+
+def pdf_document(
+    rng: random.Random, index: int, pages: int = 3, paragraphs: int = 4
+) -> SyntheticDocument | None:
+    """Single-column text PDF rendered with PyMuPDF (None when it is not installed)."""
+    try:
+        import fitz
+    except ImportError:
+        return None
+
+    topic = rng.choice(sorted(TOPICS))
+    pdf = fitz.open()
+    texts = []
+    for _ in range(pages):
+        text = document_text(rng, topic, paragraphs).replace("#", "").strip()
+        page = pdf.new_page()
+        page.insert_textbox(fitz.Rect(50, 50, 545, 800), text, fontsize=9)
+        texts.append(text)
+    content = pdf.tobytes()
+    pdf.close()
+    return SyntheticDocument(f"doc-{index:04d}.pdf", content, topic, "\n\n".join(texts))
+
+
+def queries(rng: random.Random, count: int) -> list[str]:
+    out = []
+    for _ in range(count):
+        topic = rng.choice(sorted(TOPICS))
+        a, b = rng.sample(TOPICS[topic], 2)
+        out.append(f"How does {a} interact with {b} when {rng.choice(FILLER)} fails?")
+    return out
+
+
+def community_graph(
+    rng: random.Random,
+    nodes: int,
+    communities: int,
+    intra_degree: int = 6,
+    inter_ratio: float = 0.05,
+) -> list[dict[str, Any]]:
+    """
+    Entity graph records shaped like the L0 fetch in ``CommunityDetector``.
+
+    Nodes are split into ``communities`` groups; each node links to
+    ``intra_degree`` random members of its own group and, with probability
+    ``inter_ratio`` per link, to a node of another group instead.
+    """
+    members: list[list[str]] = [[] for _ in range(communities)]
+    for i in range(nodes):
+        members[i % communities].append(f"Entity {i}")
+
+    records = []
+    for group_index, group in enumerate(members):
+        for name in group:
+            for _ in range(intra_degree // 2):
+                if communities > 1 and rng.random() < inter_ratio:
+                    other = rng.choice([g for j, g in enumerate(members) if j != group_index])
+                    target = rng.choice(other)
+                else:
+                    target = rng.choice(group)
+                if target == name:
+                    continue
+                records.append(
+                    {
+                        "source": name,
+                        "target": target,
+                        "rel_type": "RELATED_TO",
+                        "props": {"weight": round(rng.uniform(0.5, 1.0), 3)},
+                    }
+                )
+    return records
@@ -29,6 +29,9 @@ class MockTiktokenEncoding:
         estimated_tokens = max(1, len(text) // 4)
         return list(range(estimated_tokens))
 
+    def encode_batch(self, texts, **kwargs):
+        return [self.encode(text) for text in texts]
+
     def decode(self, tokens):
         """Decode tokens back to approximate text length."""
         if not tokens:
@@ -48,13 +48,45 @@ async def mock_storage():
 
 
 @pytest_asyncio.fixture
-async def backup_service(mock_session, mock_storage):
-    return BackupService(mock_session, mock_storage)
+async def mock_graph_client():
+    graph_client = MagicMock()
+    graph_client.export_graph.side_effect = lambda *a, **k: mock_aiter([{"id": "g1"}])
+    graph_client.import_graph = AsyncMock(return_value={"nodes_created": 1})
+    return graph_client
 
 
 @pytest_asyncio.fixture
-async def restore_service(mock_session, mock_storage):
-    return RestoreService(mock_session, mock_storage)
+async def mock_vector_store():
+    store = MagicMock()
+    store.export_vectors.side_effect = lambda *a, **k: mock_aiter([])
+    store.import_vectors = AsyncMock(return_value=0)
+    store.close = AsyncMock()
+    return store
+
+
+@pytest_asyncio.fixture
+async def backup_service(mock_session, mock_storage, mock_graph_client, mock_vector_store):
+    return BackupService(
+        mock_session, mock_storage, mock_graph_client, MagicMock(return_value=mock_vector_store)
+    )
+
+
+@pytest_asyncio.fixture
+async def restore_service(mock_session, mock_storage, mock_graph_client, mock_vector_store):
+    return RestoreService(
+        mock_session, mock_storage, mock_graph_client, MagicMock(return_value=mock_vector_store)
+    )
+
+
+def capture_upload(mock_storage) -> io.BytesIO:
+    """Make upload_stream drain the archive pipe into a buffer."""
+    uploaded = io.BytesIO()
+
+    def _upload(object_name, data, content_type, part_size):
+        uploaded.write(data.read())
+
+    mock_storage.upload_stream.side_effect = _upload
+    return uploaded
 
 
 # --- Tests for BackupService ---
@@ -122,8 +154,8 @@ async def test_create_backup_user_data(backup_service, mock_session, mock_storag
     result_mock_facts = MagicMock()
     result_mock_facts.scalars.return_value.all.return_value = [fact]
 
-    result_mock_chunks = MagicMock()
-    result_mock_chunks.scalars.return_value.all.return_value = []
+    result_mock_tenant = MagicMock()
+    result_mock_tenant.scalar_one_or_none.return_value = None
 
     # BackupService:
     # 1. _add_documents_metadata -> select(Document)
@@ -132,6 +164,8 @@ async def test_create_backup_user_data(backup_service, mock_session, mock_storag
     # 4. _add_conversations -> select(ConversationSummary)
     # 5. _add_user_facts -> select(UserFact)
     # 6. _add_conversation_summaries (pass)
+    # 7. _add_chunks_table -> stream_scalars(select(Chunk))
+    # 8. _add_vectors -> select(Tenant)
 
     mock_session.execute.side_effect = [
         result_mock_docs,  # Metadata
@@ -139,37 +173,26 @@ async def test_create_backup_user_data(backup_service, mock_session, mock_storag
         result_mock_docs,  # Files
         result_mock_conv,  # Conversations
         result_mock_facts,  # Facts
-        result_mock_chunks,  # Chunks
+        result_mock_tenant,  # Vector collection resolution
     ]
+    mock_session.stream_scalars = AsyncMock(return_value=mock_aiter([]))
 
     # Mock storage file retrieval
-    mock_storage.get_file.return_value = b"fake-pdf-content"
-
-    # Patch platform for Vectors/Graph
-    with patch("src.amber_platform.composition_root.platform") as mock_platform:
-        # Mock iterators using side_effect to return fresh generators
-        mock_platform.milvus_vector_store.export_vectors.side_effect = lambda *a, **k: mock_aiter(
-            [{"id": "v1"}]
-        )
-        mock_platform.neo4j_client.export_graph.side_effect = lambda *a, **k: mock_aiter(
-            [{"id": "g1"}]
-        )
+    mock_storage.get_file_stream.side_effect = lambda *a: io.BytesIO(b"fake-pdf-content")
+    uploaded = capture_upload(mock_storage)
 
-        # Execute
-        path, size = await backup_service.create_backup(
-            tenant_id="tenant_1", job_id="job_1", scope=BackupScope.USER_DATA
-        )
+    # Execute
+    path, size = await backup_service.create_backup(
+        tenant_id="tenant_1", job_id="job_1", scope=BackupScope.USER_DATA
+    )
 
     # Asserts
     assert path == "backups/tenant_1/job_1/backup.zip"
     assert size > 0
-    mock_storage.upload_file.assert_called_once()
-
-    # Verify ZIP content (inspect the arguments passed to mock_storage.upload_file)
-    call_args = mock_storage.upload_file.call_args
-    uploaded_data = call_args.kwargs["data"]
+    assert size == len(uploaded.getvalue())
+    mock_storage.upload_stream.assert_called_once()
 
-    with zipfile.ZipFile(uploaded_data, "r") as zf:
+    with zipfile.ZipFile(uploaded, "r") as zf:
         namelist = zf.namelist()
         assert "manifest.json" in namelist
         assert "documents/metadata.json" in namelist
@@ -185,6 +208,8 @@ async def test_create_backup_user_data(backup_service, mock_session, mock_storag
         assert len(meta_json) == 1
         assert meta_json[0]["id"] == "doc_1"
         assert meta_json[0]["mime_type"] == "application/pdf"  # This verifies our fix
+        assert zf.read("documents/files/root/test.pdf") == b"fake-pdf-content"
+        assert zf.read("graph/graph.jsonl") == b'{"id":"g1"}\n'
 
 
 @pytest.mark.asyncio
@@ -224,7 +249,7 @@ async def test_restore_backup(restore_service, mock_session, mock_storage):
         zf.writestr("documents/files/root/restored.pdf", b"restored content")
 
     zip_buffer.seek(0)
-    mock_storage.get_file.return_value = zip_buffer.getvalue()
+    mock_storage.get_file_stream.return_value = zip_buffer
 
     # Mock session.add as synchronous MagicMock
     mock_session.add = MagicMock()
@@ -304,7 +329,7 @@ async def test_restore_full_system_config(restore_service, mock_session, mock_st
         )
 
     zip_buffer.seek(0)
-    mock_storage.get_file.return_value = zip_buffer.getvalue()
+    mock_storage.get_file_stream.return_value = zip_buffer
 
     # Mock mocks
     mock_session.add = MagicMock()
@@ -366,7 +391,9 @@ async def test_restore_full_system_config(restore_service, mock_session, mock_st
 
 
 @pytest.mark.asyncio
-async def test_restore_extended_components(restore_service, mock_session, mock_storage, caplog):
+async def test_restore_extended_components(
+    restore_service, mock_session, mock_storage, mock_graph_client, mock_vector_store
+):
     """Test chunks, vectors, graph, and dump restore."""
     # ZIP content
     zip_buffer = io.BytesIO()
@@ -399,29 +426,36 @@ async def test_restore_extended_components(restore_service, mock_session, mock_s
         zf.writestr("graph/graph.jsonl", json.dumps({"type": "node", "id": "n1"}) + "\n")
 
     zip_buffer.seek(0)
-    mock_storage.get_file.return_value = zip_buffer.getvalue()
+    mock_storage.get_file_stream.return_value = zip_buffer
 
-    # Mock Chunks check
-    mock_session.execute.return_value.scalar_one_or_none.return_value = None  # No existing chunk
-    mock_session.add = MagicMock()  # Ensure sync mock for add
+    mock_session.execute.return_value.scalar_one_or_none.return_value = None
 
-    # Mock Platform
-    with patch("src.amber_platform.composition_root.platform") as mock_platform:
-        mock_platform.milvus_vector_store.import_vectors = AsyncMock(return_value=10)
-        mock_platform.neo4j_client.import_graph = AsyncMock(return_value={"nodes_created": 1})
+    await restore_service.restore("backup_ext", "t1", RestoreMode.MERGE)
 
-        await restore_service.restore("backup_ext", "t1", RestoreMode.MERGE)
-
-        # Verify Chunks
-        # Check logs if failed
-        errors = [r.message for r in caplog.records if r.levelname in ("WARNING", "ERROR")]
-        assert mock_session.add.call_count >= 1, f"Session add not called. Errors: {errors}"
+    # Verify Chunks (bulk insert with the row batch as parameters)
+    chunk_batches = [
+        c.args[1] for c in mock_session.execute.call_args_list if len(c.args) > 1
+    ]
+    assert chunk_batches == [
+        [
+            {
+                "id": "chunk_1",
+                "tenant_id": "t1",
+                "document_id": "doc_1",
+                "index": 0,
+                "tokens": 10,
+                "content": "text",
+                "metadata_": {},
+                "embedding_status": EmbeddingStatus.PENDING,
+            }
+        ]
+    ]
 
-        # Verify Vectors
-        mock_platform.milvus_vector_store.import_vectors.assert_called_once()
+    # Verify Vectors
+    mock_vector_store.import_vectors.assert_called_once()
 
-        # Verify Graph
-        mock_platform.neo4j_client.import_graph.assert_called_once()
+    # Verify Graph
+    mock_graph_client.import_graph.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -437,15 +471,15 @@ async def test_restore_postgres_dump(restore_service, mock_session, mock_storage
         zf.writestr("database/postgres_dump.sql", b"SQL DUMP CONTENT")
 
     zip_buffer.seek(0)
-    mock_storage.get_file.return_value = zip_buffer.getvalue()
+    mock_storage.get_file_stream.return_value = zip_buffer
 
     # Patch subprocess
     with patch("src.core.admin_ops.application.restore_service.subprocess.run") as mock_run:
         mock_run.return_value.returncode = 0
 
         # Patch settings
-        with patch("src.api.config.settings") as mock_settings:
-            mock_settings.db.database_url = "postgresql://u:p@h:5432/db"
+        with patch("src.shared.kernel.runtime.get_settings") as mock_get_settings:
+            mock_get_settings.return_value.db.database_url = "postgresql://u:p@h:5432/db"
 
             await restore_service.restore("backup_dump", "t1", RestoreMode.REPLACE)
 
@@ -453,3 +487,58 @@ async def test_restore_postgres_dump(restore_service, mock_session, mock_storage
             args = mock_run.call_args[0][0]
             assert args[0] == "psql"
             assert "-f" in args
+
+
+def test_vector_shards_round_trip():
+    """Vectors are written as float32 .npy shards and read back joined with their rows."""
+    from src.core.admin_ops.application.backup_format import (
+        VectorShardWriter,
+        iter_vector_shard,
+        vector_shard_names,
+    )
+
+    buffer = io.BytesIO()
+    records = [
+        {"chunk_id": f"c{i}", "tenant_id": "t1", "vector": [float(i), 0.5]} for i in range(5)
+    ]
+    with zipfile.ZipFile(buffer, "w") as zf:
+        shards = VectorShardWriter(lambda name: zf.open(name, "w"), shard_rows=2)
+        for record in records:
+            shards.add(record)
+        shards.flush()
+
+    assert shards.count == 5
+    assert shards.shards == 3
+
+    restored = []
+    with zipfile.ZipFile(buffer, "r") as zf:
+        names = vector_shard_names(zf.namelist())
+        assert names == ["vectors/part-00000", "vectors/part-00001", "vectors/part-00002"]
+        for shard in names:
+            with zf.open(f"{shard}.npy") as matrix_fp, zf.open(f"{shard}.jsonl") as rows_fp:
+                restored.extend(iter_vector_shard(matrix_fp, rows_fp))
+
+    assert restored == records
+
+
+@pytest.mark.asyncio
+async def test_create_backup_aborts_upload_on_failure(backup_service, mock_session, mock_storage):
+    """A failing section must fail the multipart upload instead of completing it."""
+    mock_session.execute.side_effect = RuntimeError("db down")
+    upload_errors = []
+
+    def _upload(object_name, data, content_type, part_size):
+        try:
+            data.read()
+        except RuntimeError as e:
+            upload_errors.append(e)
+            raise
+
+    mock_storage.upload_stream.side_effect = _upload
+
+    with pytest.raises(RuntimeError, match="db down"):
+        await backup_service.create_backup(
+            tenant_id="t1", job_id="job_1", scope=BackupScope.USER_DATA
+        )
+
+    assert len(upload_errors) == 1
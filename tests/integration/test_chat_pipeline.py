@@ -31,6 +31,11 @@ from sqlalchemy import text
 # 2. Application Imports
 # ----------------------------------------------------------------------
 from src.api.main import app
+from src.core.admin_ops.application.auth_principal_cache import (
+    AuthPrincipal,
+    TenantLink,
+    get_principal_cache,
+)
 from src.core.database.session import (
     close_database,
     configure_database,
@@ -248,6 +253,15 @@ class TestChatPipelineComprehensive:
         mock_tenant.id = self.tenant_id
         mock_key.tenants = [mock_tenant]
         mock_auth_service.validate_key = AsyncMock(return_value=mock_key)
+        mock_auth_service.resolve_principal = AsyncMock(
+            return_value=AuthPrincipal(
+                id="test-key-id",
+                name="Test Key",
+                scopes=("admin",),
+                tenants=(TenantLink(id=self.tenant_id),),
+            )
+        )
+        get_principal_cache().clear()
 
         # 11. Database Cleanup
         try:
@@ -26,6 +26,11 @@ from sqlalchemy import text
 # 2. Application Imports
 # ----------------------------------------------------------------------
 from src.api.main import app
+from src.core.admin_ops.application.auth_principal_cache import (
+    AuthPrincipal,
+    TenantLink,
+    get_principal_cache,
+)
 from src.core.database.session import get_session_maker
 from src.core.generation.domain.memory_models import ConversationSummary, UserFact
 from src.core.ingestion.domain.chunk import Chunk
@@ -168,6 +173,15 @@ class TestChatRetrievalDirectSeeding:
                 mock_key.tenants = [mock_tenant]
 
                 mock_service.validate_key = AsyncMock(return_value=mock_key)
+                mock_service.resolve_principal = AsyncMock(
+                    return_value=AuthPrincipal(
+                        id="test-key-id",
+                        name="Test Key",
+                        scopes=("admin",),
+                        tenants=(TenantLink(id=self.tenant_id),),
+                    )
+                )
+                get_principal_cache().clear()
 
                 # Cleanup DB
                 async_session = get_session_maker()
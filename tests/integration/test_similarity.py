@@ -5,6 +5,11 @@ import pytest
 from httpx import AsyncClient
 
 from src.amber_platform.composition_root import platform
+from src.core.admin_ops.application.auth_principal_cache import (
+    AuthPrincipal,
+    TenantLink,
+    get_principal_cache,
+)
 
 neo4j_client = platform.neo4j_client
 
@@ -40,6 +45,15 @@ class TestSimilarity:
         mock_key.tenants = [MagicMock(id=test_tenant)]
 
         mock_auth_service.validate_key = AsyncMock(return_value=mock_key)
+        mock_auth_service.resolve_principal = AsyncMock(
+            return_value=AuthPrincipal(
+                id="test-key-id",
+                name="Test Key",
+                scopes=("admin",),
+                tenants=(TenantLink(id=test_tenant),),
+            )
+        )
+        get_principal_cache().clear()
 
         # ----------------------------------------------------------------------
         # GLOBAL MOCKS (Moved out of create_pdf so we can clean them up)
@@ -0,0 +1,157 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from src.core.generation.application.agent.orchestrator import AgentOrchestrator
+from src.core.generation.application.agent.tool_runtime import (
+    ToolResultCache,
+    budget_tool_output,
+)
+
+
+def _tool_call_chunks(calls: list[tuple[str, str, dict]]):
+    """Stream chunks as the OpenAI SDK emits them: id and name first, arguments split."""
+    chunks = []
+    for index, (call_id, name, args) in enumerate(calls):
+        encoded = json.dumps(args)
+        function = SimpleNamespace(name=name, arguments=encoded[:5])
+        chunks.append(SimpleNamespace(index=index, id=call_id, function=function))
+        rest = SimpleNamespace(name=None, arguments=encoded[5:])
+        chunks.append(SimpleNamespace(index=index, id=None, function=rest))
+    return [
+        SimpleNamespace(
+            choices=[SimpleNamespace(delta=SimpleNamespace(content=None, tool_calls=[c]))]
+        )
+        for c in chunks
+    ]
+
+
+def _text_chunks(*tokens: str):
+    return [
+        SimpleNamespace(
+            choices=[SimpleNamespace(delta=SimpleNamespace(content=t, tool_calls=None))]
+        )
+        for t in tokens
+    ]
+
+
+class ScriptedGeneration:
+    """chat_completion returning a scripted chunk stream per step."""
+
+    def __init__(self, steps):
+        self.steps = list(steps)
+        self.requests = []
+
+    async def chat_completion(self, messages, tools=None, stream=False):
+        self.requests.append(list(messages))
+        chunks = self.steps.pop(0)
+
+        async def _stream():
+            for chunk in chunks:
+                yield chunk
+
+        return _stream()
+
+
+async def _collect(agent, **kwargs):
+    return [event async for event in agent.run_stream(query="q", **kwargs)]
+
+
+async def test_tool_calls_run_concurrently_and_answer_streams():
+    running = 0
+    peak = 0
+
+    async def search(query: str) -> str:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return f"results for {query}"
+
+    gen = ScriptedGeneration(
+        [
+            _tool_call_chunks(
+                [("c1", "search", {"query": "a"}), ("c2", "search", {"query": "b"})]
+            ),
+            _text_chunks("The ", "answer"),
+        ]
+    )
+    agent = AgentOrchestrator(
+        gen, {"search": search}, [], "system", tool_cache=ToolResultCache()
+    )
+
+    events = await _collect(agent, conversation_id="conv-1")
+
+    kinds = [e["event"] for e in events]
+    assert kinds == [
+        "tool_call", "tool_call", "tool_result", "tool_result", "token", "token", "done"
+    ]
+    assert peak == 2
+    assert events[-1]["data"]["answer"] == "The answer"
+    # Tool messages follow the order the LLM requested the calls
+    tool_messages = [m for m in gen.requests[1] if isinstance(m, dict) and m["role"] == "tool"]
+    assert [m["content"] for m in tool_messages] == ["results for a", "results for b"]
+
+
+async def test_identical_invocations_are_memoized_per_conversation():
+    calls = []
+
+    async def search(query: str) -> str:
+        calls.append(query)
+        return "x" * 4000
+
+    cache = ToolResultCache()
+
+    def _agent():
+        gen = ScriptedGeneration(
+            [_tool_call_chunks([("c1", "search", {"query": "a"})]), _text_chunks("done")]
+        )
+        return AgentOrchestrator(
+            gen, {"search": search}, [], "system", tool_output_tokens=100, tool_cache=cache
+        )
+
+    first = await _collect(_agent(), conversation_id="conv-1")
+    second = await _collect(_agent(), conversation_id="conv-1")
+    await _collect(_agent(), conversation_id="conv-2")
+
+    assert calls == ["a", "a"]
+    first_result = next(e for e in first if e["event"] == "tool_result")["data"]
+    second_result = next(e for e in second if e["event"] == "tool_result")["data"]
+    assert first_result["truncated"] and not first_result["cached"]
+    assert second_result["cached"]
+
+
+async def test_memoized_tool_output_is_not_shared_across_tenants():
+    calls = []
+
+    def _agent(tenant_id):
+        async def search(query: str) -> str:
+            calls.append((tenant_id, query))
+            return f"{tenant_id} results"
+
+        gen = ScriptedGeneration(
+            [_tool_call_chunks([("c1", "search", {"query": "a"})]), _text_chunks("done")]
+        )
+        return AgentOrchestrator(gen, {"search": search}, [], "system", tool_cache=cache)
+
+    cache = ToolResultCache()
+    await _collect(_agent("tenant-a"), conversation_id="conv-1", tenant_id="tenant-a")
+    # Tenant B reuses tenant A's conversation ID and repeats the call
+    events = await _collect(_agent("tenant-b"), conversation_id="conv-1", tenant_id="tenant-b")
+
+    result = next(e for e in events if e["event"] == "tool_result")["data"]
+    assert calls == [("tenant-a", "a"), ("tenant-b", "a")]
+    assert not result["cached"] and result["output"] == "tenant-b results"
+
+
+def test_budget_keeps_head_and_tail(monkeypatch):
+    # conftest stubs tiktoken's decode; character-based budgeting keeps the real text
+    monkeypatch.setattr("src.core.utils.tokenizer.TIKTOKEN_AVAILABLE", False)
+    text = "start " + "middle " * 2000 + "end"
+    budgeted, truncated = budget_tool_output(text, 50)
+
+    assert truncated
+    assert budgeted.startswith("start") and budgeted.endswith("end")
+    assert "tokens of tool output omitted" in budgeted
+    assert budget_tool_output("short", 50) == ("short", False)
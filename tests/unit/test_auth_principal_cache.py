@@ -0,0 +1,129 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from src.core.admin_ops.application import api_key_service
+from src.core.admin_ops.application.api_key_service import ApiKeyService
+from src.core.admin_ops.application.auth_principal_cache import (
+    AuthPrincipal,
+    AuthPrincipalCache,
+    LastUsedRecorder,
+    TenantLink,
+)
+
+
+def _principal(key_id="key-1"):
+    return AuthPrincipal(
+        id=key_id,
+        name="Key",
+        scopes=("admin",),
+        tenants=(TenantLink(id="t1", role="admin"), TenantLink(id="t2")),
+    )
+
+
+def test_principal_roles_and_tenants():
+    principal = _principal()
+
+    assert principal.allowed_tenants == {"t1", "t2"}
+    assert principal.role_for("t1") == "admin"
+    assert principal.role_for("t2") == "user"
+    assert principal.role_for("other") == "user"
+
+
+async def test_resolve_caches_and_shares_concurrent_loads():
+    cache = AuthPrincipalCache(ttl_seconds=60)
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return _principal()
+
+    results = await asyncio.gather(*(cache.resolve("hash", loader) for _ in range(5)))
+    await cache.resolve("hash", loader)
+
+    assert calls == 1
+    assert all(r.id == "key-1" for r in results)
+
+
+async def test_invalid_keys_are_not_cached():
+    cache = AuthPrincipalCache()
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        return None
+
+    assert await cache.resolve("hash", loader) is None
+    assert await cache.resolve("hash", loader) is None
+    assert calls == 2
+
+
+def test_invalidate_by_key_id_and_ttl_expiry():
+    cache = AuthPrincipalCache(ttl_seconds=60)
+    cache.put("h1", _principal("key-1"))
+    cache.put("h2", _principal("key-2"))
+
+    cache.invalidate("key-1")
+    assert cache.get("h1") is None
+    assert cache.get("h2") is not None
+
+    cache.invalidate()
+    assert cache.get("h2") is None
+
+    expired = AuthPrincipalCache(ttl_seconds=0)
+    expired.put("h1", _principal())
+    assert expired.get("h1") is None
+
+
+class FakeSession:
+    def __init__(self, log):
+        self.log = log
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, params=None):
+        self.log.append(params)
+
+    async def commit(self):
+        self.log.append("commit")
+
+
+async def test_usage_recorder_batches_updates_into_one_statement():
+    log = []
+    recorder = LastUsedRecorder(session_factory=lambda: FakeSession(log), flush_interval=60)
+
+    for _ in range(100):
+        recorder.record("key-1")
+    recorder.record("key-2")
+
+    assert recorder.pending_count == 2
+    await recorder.close()
+
+    assert len(log) == 2
+    assert {row["id"] for row in log[0]} == {"key-1", "key-2"}
+    assert log[1] == "commit"
+    assert recorder.pending_count == 0
+
+
+async def test_principal_load_leaves_usage_to_the_request(monkeypatch):
+    key = SimpleNamespace(id="key-1", name="Key", scopes=["admin"], tenants=[])
+    lookup = MagicMock()
+    lookup.scalars.return_value.first.return_value = key
+    roles = MagicMock()
+    roles.all.return_value = []
+    session = SimpleNamespace(execute=AsyncMock(side_effect=[lookup, roles]))
+    recorded = []
+    recorder = SimpleNamespace(record=recorded.append)
+    monkeypatch.setattr(api_key_service, "get_usage_recorder", lambda: recorder)
+
+    principal = await ApiKeyService(session).resolve_principal("amber_secret")
+
+    # The auth middleware records each request once, cache hit or miss
+    assert principal.id == "key-1" and recorded == []
@@ -0,0 +1,131 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.admin_ops.application.evaluation.benchmark_executor import (
+    BenchmarkExecutor,
+    BenchmarkLimits,
+    BenchmarkRetrievalCache,
+    config_hash,
+)
+
+
+class FakeRetrieval:
+    def __init__(self):
+        self.calls = []
+
+    async def retrieve(self, query, tenant_id, top_k=None, tenant_config=None):
+        self.calls.append(query)
+        await asyncio.sleep(0)
+        return SimpleNamespace(chunks=[{"chunk_id": f"{query}-1", "content": f"about {query}"}])
+
+
+class FakeGeneration:
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def generate(self, query, candidates, options=None):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return SimpleNamespace(answer=f"answer to {query}")
+
+
+class FakeRagas:
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.evaluated = []
+
+    async def evaluate_sample(self, query, context, response):
+        if query == self.fail_on:
+            raise RuntimeError("judge unavailable")
+        self.evaluated.append(query)
+        return SimpleNamespace(
+            faithfulness=float("nan") if query == "q1" else 0.5,
+            response_relevancy=1.0,
+            context_precision=None,
+            context_recall=None,
+        )
+
+
+def _dataset(n):
+    return [{"query": f"q{i}"} for i in range(n)]
+
+
+def _executor(ragas=None, limits=None, cache=None):
+    return BenchmarkExecutor(
+        FakeRetrieval(),
+        FakeGeneration(),
+        ragas or FakeRagas(),
+        limits=limits or BenchmarkLimits(retrieval=2, generation=2, evaluation=2),
+        retrieval_cache=cache,
+    )
+
+
+async def test_run_bounds_stage_concurrency_and_checkpoints_each_sample():
+    executor = _executor()
+    checkpoints = []
+
+    async def on_sample(detail, done, total):
+        checkpoints.append((detail["index"], done, total))
+
+    details = await executor.run(_dataset(6), "t1", on_sample=on_sample)
+
+    assert [d["index"] for d in details] == list(range(6))
+    assert executor.generation_service.peak == 2
+    assert sorted(c[0] for c in checkpoints) == list(range(6))
+    assert [c[1] for c in checkpoints] == [1, 2, 3, 4, 5, 6]
+    assert details[1]["faithfulness"] is None
+    assert BenchmarkExecutor.aggregate(details)["faithfulness"] == 0.5
+
+
+async def test_resume_skips_completed_samples():
+    ragas = FakeRagas(fail_on="q3")
+    executor = _executor(ragas=ragas, limits=BenchmarkLimits(1, 1, 1))
+    saved = []
+
+    async def on_sample(detail, done, total):
+        saved.append(detail)
+
+    with pytest.raises(RuntimeError):
+        await executor.run(_dataset(5), "t1", on_sample=on_sample)
+    assert [d["query"] for d in saved] == ["q0", "q1", "q2"]
+
+    ragas = FakeRagas()
+    executor = _executor(ragas=ragas)
+    # Rows written before indices were recorded are matched by query
+    legacy = [{k: v for k, v in saved[0].items() if k != "index"}, *saved[1:]]
+    details = await executor.run(_dataset(5), "t1", completed=legacy)
+
+    assert sorted(ragas.evaluated) == ["q3", "q4"]
+    assert len(details) == 5
+
+
+async def test_retrieval_cache_keyed_by_retrieval_config():
+    cache = BenchmarkRetrievalCache()
+    first = _executor(cache=cache)
+    await first.run(_dataset(3), "t1", tenant_config={"top_k": 5, "temperature": 0.1})
+
+    # Only generation settings changed: retrieval is reused
+    second = _executor(cache=cache)
+    await second.run(_dataset(3), "t1", tenant_config={"top_k": 5, "temperature": 0.9})
+    assert second.retrieval_service.calls == []
+
+    third = _executor(cache=cache)
+    await third.run(_dataset(3), "t1", tenant_config={"top_k": 8, "temperature": 0.9})
+    assert len(third.retrieval_service.calls) == 3
+
+
+def test_config_hash_ignores_generation_only_keys():
+    assert config_hash({"a": 1, "rag_system_prompt": "x"}) == config_hash({"a": 1})
+    assert config_hash({"a": 1}) != config_hash({"a": 2})
+
+
+def test_limits_follow_shared_llm_capacity():
+    capacity = SimpleNamespace(enabled=True, total=6, reserved_chat=2)
+    limits = BenchmarkLimits.from_capacity(capacity)
+    assert (limits.generation, limits.evaluation) == (4, 4)
+    assert BenchmarkLimits.from_capacity(SimpleNamespace(enabled=False)) == BenchmarkLimits()
@@ -0,0 +1,90 @@
+import json
+
+import pytest
+import redis.asyncio as redis
+import tiktoken
+
+from src.core.generation.domain.ports import provider_factory
+from src.core.graph.application.explorer import mark_graph_changed, read_graph_version
+from src.core.utils.tokenizer import Tokenizer
+from tests.benchmarks.harness import (
+    BenchmarkConfig,
+    compare,
+    offline_runtime,
+    offline_tokenizer,
+    percentiles,
+    run_suite,
+)
+
+
+async def test_suite_runs_offline_and_serializes():
+    config = BenchmarkConfig(scale=0.02, concurrency=4, estimate_tokens=True)
+    result = await run_suite(["chunking", "ingestion", "query", "sse"], config)
+
+    scenarios = json.loads(json.dumps(result))["scenarios"]
+    assert all("error" not in s for s in scenarios.values()), scenarios
+
+    assert scenarios["ingestion"]["failures"] == 0
+    assert scenarios["ingestion"]["chunks"] > 0
+    assert set(scenarios["ingestion"]["formats"]) <= {"md", "pdf"}
+    assert scenarios["query"]["empty_results"] == 0
+    assert scenarios["query"]["latency"]["p99_ms"] >= scenarios["query"]["latency"]["p50_ms"]
+    assert scenarios["chunking"]["tokenizer"]["encoder"] == "char_estimate"
+    assert scenarios["chunking"]["tokenizer"]["estimated"] is True
+    assert result["tokenizer"] == {"encoding": "char_estimate", "estimated": True}
+    assert scenarios["sse"]["events_delivered"] <= scenarios["sse"]["uncoalesced_deliveries"]
+    assert result["config"]["scale"] == 0.02
+
+
+async def test_offline_runtime_restores_ports():
+    before = (provider_factory._provider_factory, redis.from_url)
+    with offline_runtime(BenchmarkConfig()) as backends:
+        assert provider_factory.get_provider_factory() is backends.providers
+        # Graph version bumps land in memory instead of failing on a blank Redis URL
+        await mark_graph_changed("t1")
+        assert await read_graph_version("t1") == "1"
+    assert (provider_factory._provider_factory, redis.from_url) == before
+
+
+def test_offline_tokenizer_estimates_only_when_asked():
+    before = tiktoken.get_encoding
+    with offline_tokenizer(estimate=True) as encoding:
+        assert encoding == "char_estimate"
+        assert Tokenizer.count_tokens("x" * 40) == 10
+    assert tiktoken.get_encoding == before
+
+
+class ByteEncoding:
+    name = "cl100k_base"
+
+    def encode(self, text, **kwargs):
+        return list(text.encode())
+
+
+def test_offline_tokenizer_uses_the_cached_encoding(monkeypatch):
+    monkeypatch.setattr(tiktoken, "get_encoding", lambda name: ByteEncoding())
+
+    with offline_tokenizer() as encoding:
+        assert encoding == "cl100k_base"
+        assert Tokenizer.count_tokens("abcd efgh") == 9
+
+
+def test_offline_tokenizer_requires_opt_in_without_a_cached_encoding(monkeypatch):
+    def not_cached(name):
+        raise FileNotFoundError(f"{name} is not in the tiktoken cache")
+
+    monkeypatch.setattr(tiktoken, "get_encoding", not_cached)
+
+    with pytest.raises(RuntimeError, match="--estimate-tokens"):
+        with offline_tokenizer():
+            pass
+
+
+def test_percentiles_and_compare():
+    stats = percentiles([float(i) for i in range(1, 101)])
+    assert (stats["p50_ms"], stats["p95_ms"], stats["p99_ms"]) == (50.0, 95.0, 99.0)
+
+    baseline = {"scenarios": {"query": {"qps": 100.0, "latency": {"p50_ms": 10.0}}}}
+    current = {"scenarios": {"query": {"qps": 150.0, "latency": {"p50_ms": 8.0}, "new": 1}}}
+    rows = {row["metric"]: row["change_pct"] for row in compare(baseline, current)}
+    assert rows == {"query.latency.p50_ms": -20.0, "query.qps": 50.0}
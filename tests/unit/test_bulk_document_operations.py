@@ -0,0 +1,108 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.ingestion.application import bulk_operations, document_deletion
+from src.core.ingestion.application.bulk_operations import BulkDocumentOperations
+
+
+class FakeSession:
+    """Records statements; answers folder lookups and document updates."""
+
+    def __init__(self, folders=("f1", "f2"), documents=()):
+        self.folders = set(folders)
+        self.documents = list(documents)
+        self.statements: list[str] = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def execute(self, stmt):
+        sql = str(stmt)
+        self.statements.append(sql)
+        params = stmt.compile().params
+        if sql.startswith("SELECT") and "FROM folders" in sql:
+            found = params.get("id_1") in self.folders
+            return SimpleNamespace(scalar_one_or_none=lambda: object() if found else None)
+        if sql.startswith("UPDATE documents"):
+            rows = [(document_id, "t1") for document_id in self.documents]
+            return SimpleNamespace(
+                all=lambda: rows,
+                scalars=lambda: SimpleNamespace(all=lambda: [r[0] for r in rows]),
+            )
+        if sql.startswith("DELETE FROM folders"):
+            return SimpleNamespace(rowcount=1)
+        raise AssertionError(f"unexpected statement: {sql}")
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+class Publisher:
+    def __init__(self):
+        self.messages = []
+
+    async def publish(self, payload):
+        assert payload["channel"] == f"document:{payload['message']['document_id']}:status"
+        self.messages.append(payload["message"])
+
+
+@pytest.fixture
+def scheduled(monkeypatch):
+    calls = []
+
+    async def schedule(dispatcher, tenant_id):
+        calls.append(tenant_id)
+
+    monkeypatch.setattr(bulk_operations, "schedule_document_cleanup", schedule)
+    document_deletion.get_tombstone_cache().invalidate()
+    return calls
+
+
+async def test_deleting_a_folder_is_one_transaction_and_one_cleanup(scheduled):
+    session = FakeSession(documents=[f"d{i}" for i in range(3000)])
+    publisher = Publisher()
+
+    result = await BulkDocumentOperations(session, None, publisher).delete(
+        "t1", folder_id="f1", delete_folder=True
+    )
+
+    assert [sql.split()[0] for sql in session.statements] == ["SELECT", "UPDATE", "DELETE"]
+    update_sql = session.statements[1]
+    assert "documents.folder_id = " in update_sql and "deleted_at" in update_sql
+    assert session.commits == 1
+    assert scheduled == ["t1"]
+    assert len(result.document_ids) == 3000 and result.folder_deleted
+    assert result.cleanup_operation_id == "cleanup-t1"
+
+    (event,) = publisher.messages
+    assert event["document_id"] == result.operation_id and event["status"] == "completed"
+    assert event["details"]["documents"] == 3000
+    assert event["details"]["cleanup_operation_id"] == "cleanup-t1"
+
+
+async def test_move_files_documents_with_one_update(scheduled):
+    session = FakeSession(documents=["d1", "d2"])
+
+    result = await BulkDocumentOperations(session, None).move(
+        "t1", "f2", document_ids=["d1", "d2"]
+    )
+
+    assert [sql.split()[0] for sql in session.statements] == ["SELECT", "UPDATE"]
+    assert "SET folder_id=" in session.statements[1]
+    assert result.document_ids == ["d1", "d2"] and session.commits == 1
+    assert scheduled == []
+
+
+async def test_unknown_folder_changes_nothing(scheduled):
+    session = FakeSession(folders=())
+
+    with pytest.raises(LookupError):
+        await BulkDocumentOperations(session, None).delete("t1", folder_id="nope")
+    with pytest.raises(LookupError):
+        await BulkDocumentOperations(session, None).move("t1", "nope", document_ids=["d1"])
+
+    assert session.commits == 0
+    assert all(sql.startswith("SELECT") for sql in session.statements)
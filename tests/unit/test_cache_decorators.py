@@ -0,0 +1,148 @@
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.cache import decorators
+from src.core.cache.decorators import (
+    LOCK_PREFIX,
+    cached,
+    decode_value,
+    encode_value,
+    get_cache_metrics,
+    get_from_cache,
+    get_or_compute,
+    set_cache,
+)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data: dict[str, bytes | str] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None, px=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    async def exists(self, key):
+        return int(key in self.data)
+
+    async def eval(self, script, numkeys, key, token):
+        if self.data.get(key) == token:
+            del self.data[key]
+            return 1
+        return 0
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+    connects = []
+
+    def from_url(url, **kwargs):
+        connects.append(kwargs)
+        return redis
+
+    monkeypatch.setattr(decorators, "_get_redis", lambda: SimpleNamespace(from_url=from_url))
+    monkeypatch.setattr(decorators, "_client", None)
+    monkeypatch.setattr(decorators, "LOCK_POLL_SECONDS", 0.01)
+    decorators._inflight.clear()
+    decorators.reset_cache_metrics()
+    redis.connects = connects
+    return redis
+
+
+async def test_values_are_binary_and_legacy_json_still_reads(fake_redis):
+    await set_cache("admin:stats:x", {"total": 3}, ttl=60)
+    await set_cache("admin:stats:y", [1, 2], ttl=60)
+    fake_redis.data["admin:stats:legacy"] = json.dumps({"old": True})
+
+    raw = fake_redis.data["admin:stats:x"]
+    assert isinstance(raw, bytes) and raw[:1] in (b"M", b"J")
+    assert await get_from_cache("admin:stats:x") == {"total": 3}
+    assert await get_from_cache("admin:stats:legacy") == {"old": True}
+    assert await get_from_cache("admin:stats:missing") is None
+    # One pooled client for every call on this loop
+    assert len(fake_redis.connects) == 1 and fake_redis.connects[0]["max_connections"] > 1
+    assert get_cache_metrics()["admin"]["hits"] == 2
+    assert get_cache_metrics()["admin"]["misses"] == 1
+
+
+async def test_concurrent_misses_compute_once(fake_redis):
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        return {"n": calls}
+
+    results = await asyncio.gather(*(get_or_compute("k:1", loader, ttl=60) for _ in range(10)))
+
+    assert calls == 1
+    assert results == [{"n": 1}] * 10
+    assert LOCK_PREFIX + "k:1" not in fake_redis.data
+    assert get_cache_metrics()["k"]["coalesced"] == 9
+
+
+async def test_miss_waits_for_the_process_holding_the_lock(fake_redis):
+    fake_redis.data[LOCK_PREFIX + "k:2"] = "other-process"
+
+    async def peer():
+        await asyncio.sleep(0.03)
+        await set_cache("k:2", "from peer", ttl=60)
+
+    async def loader():
+        raise AssertionError("must not recompute while a peer holds the lock")
+
+    _, value = await asyncio.gather(peer(), get_or_compute("k:2", loader, ttl=60))
+    assert value == "from peer"
+
+
+async def test_stale_value_is_served_while_refreshed_in_background(fake_redis):
+    fake_redis.data["k:3"] = encode_value("old", time.time() - 1)
+    refreshed = asyncio.Event()
+
+    async def loader():
+        refreshed.set()
+        return "new"
+
+    assert await get_or_compute("k:3", loader, ttl=60, stale_ttl=300) == "old"
+    await asyncio.wait_for(refreshed.wait(), 1)
+    await asyncio.gather(*decorators._background)
+
+    assert decode_value(fake_redis.data["k:3"])[0] == "new"
+    assert await get_or_compute("k:3", loader, ttl=60, stale_ttl=300) == "new"
+    metrics = get_cache_metrics()["k"]
+    assert (metrics["stale_hits"], metrics["refreshes"], metrics["hits"]) == (1, 1, 1)
+    # Without a stale window an expired value is a miss
+    fake_redis.data["k:3"] = encode_value("old", time.time() - 1)
+    assert await get_from_cache("k:3") is None
+
+
+async def test_cached_decorator_keys_by_arguments(fake_redis):
+    calls = []
+
+    @cached(ttl=30, key_prefix="curation")
+    async def stats(tenant_id: str, full: bool = False):
+        calls.append((tenant_id, full))
+        return {"tenant": tenant_id}
+
+    assert await stats("t1") == {"tenant": "t1"}
+    assert await stats("t1") == {"tenant": "t1"}
+    assert await stats("t1", full=True) == {"tenant": "t1"}
+
+    assert calls == [("t1", False), ("t1", True)]
+    assert "curation:stats:t1:full=True" in fake_redis.data
+    assert get_cache_metrics()["curation"]["hits"] == 1
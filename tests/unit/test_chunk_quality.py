@@ -0,0 +1,69 @@
+import random
+import re
+from types import SimpleNamespace
+
+from src.core.ingestion.application.chunking import semantic
+from src.core.ingestion.application.chunking.quality import (
+    ChunkMetrics,
+    ChunkQualityScorer,
+    measure_chunks,
+)
+from src.core.ingestion.application.chunking.semantic import SemanticChunker
+
+
+def _reference_metrics(text: str) -> ChunkMetrics:
+    """Per-character definitions of the metrics the vectorized pass must reproduce."""
+    return ChunkMetrics(
+        total_chars=len(text),
+        alpha_chars=sum(1 for c in text if c.isalnum()),
+        whitespace_chars=sum(1 for c in text if c.isspace()),
+        non_empty_lines=sum(1 for line in text.split("\n") if line.strip()),
+        total_words=len(text.split()),
+        short_words=len(re.findall(r"\b\w{1,2}\b", text)),
+        is_ascii=not re.search(r"[^\x00-\x7F]", text),
+    )
+
+
+def test_batch_metrics_match_per_character_definitions():
+    rng = random.Random(7)
+    alphabet = "abcXYZ019 _.,\n\n\t\r\x0b\x1c  éß漢\U0001f600"
+    texts = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 300))) for _ in range(500)]
+    texts += ["", "\n", "word\n", "\n\nx y\n", "a" * 3]
+
+    assert measure_chunks(texts) == [_reference_metrics(text) for text in texts]
+    # Pure ASCII batches take the byte path
+    ascii_texts = [text.encode("ascii", "ignore").decode() for text in texts]
+    assert measure_chunks(ascii_texts) == [_reference_metrics(text) for text in ascii_texts]
+
+
+def test_grade_chunks_matches_grade_chunk():
+    scorer = ChunkQualityScorer()
+    good = "The quarterly report covers revenue, margins and the outlook for next year.\n" * 3
+    texts = [good, "", "tiny", "t h i s i s n o t r e a l l y t e x t a t a l l", "Café ☕ menu"]
+
+    graded = scorer.grade_chunks(texts)
+
+    assert graded == [scorer.grade_chunk(text) for text in texts]
+    assert graded[0]["is_readable"] and graded[0]["reason"] == "Good quality"
+    assert graded[1]["reason"] == graded[2]["reason"] == "Empty or too short"
+    assert graded[3]["metrics"]["is_fragmented"] and not graded[3]["is_readable"]
+    assert graded[4]["metrics"]["has_artifacts"]
+
+
+def test_chunker_scores_the_document_in_one_batch(monkeypatch):
+    monkeypatch.setattr(semantic, "HAS_TIKTOKEN", False)
+    chunker = SemanticChunker(SimpleNamespace(chunk_size=40, chunk_overlap=0))
+    batches = []
+    grade_chunks = chunker.quality_scorer.grade_chunks
+    monkeypatch.setattr(
+        chunker.quality_scorer,
+        "grade_chunks",
+        lambda texts: batches.append(list(texts)) or grade_chunks(texts),
+    )
+    text = "# Intro\n\n" + "Plain sentences about the topic at hand. " * 20 + "\n\n# Next\n\nMore."
+
+    chunks = chunker.chunk(text, document_title="Doc")
+
+    assert len(chunks) > 1 and batches == [[chunk.content for chunk in chunks]]
+    assert all("quality_score" in chunk.metadata for chunk in chunks)
+    assert [c.token_count for c in chunks] == [len(c.content.split()) for c in chunks]
@@ -0,0 +1,206 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+
+from src.core.ingestion.application.connector_sync import (
+    PROCESS_DOCUMENT_TASK,
+    ConnectorSyncEngine,
+)
+from src.core.ingestion.infrastructure.connectors.base import FetchedContent, RateLimitGate
+from src.core.state.machine import DocumentStatus
+
+
+class FakeConnector:
+    def __init__(self, versions: dict[str, str], delay: float = 0.0) -> None:
+        self.versions = versions
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def fetch_item_content(self, item_id, known_version=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            version = self.versions[item_id]
+            if version == known_version:
+                return FetchedContent(item_id=item_id, content=None, version=version)
+            return FetchedContent(item_id=item_id, content=b"<p>body</p>", version=version)
+        finally:
+            self.in_flight -= 1
+
+    def get_connector_type(self) -> str:
+        return "fake"
+
+
+class FakeRegistrar:
+    def __init__(self, duplicates: set[str] = frozenset()) -> None:
+        self.duplicates = duplicates
+        self.registered = []
+
+    async def register_document(self, tenant_id, filename, file_content, content_type=""):
+        self.registered.append(filename)
+        status = DocumentStatus.READY if filename in self.duplicates else DocumentStatus.INGESTED
+        return SimpleNamespace(id=f"doc_{filename}", status=status)
+
+
+class FakeUoW:
+    def __init__(self) -> None:
+        self.commits = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def rollback(self) -> None:
+        return None
+
+
+class FakeDispatcher:
+    def __init__(self) -> None:
+        self.calls = []
+
+    async def dispatch(self, task_name, args=None, kwargs=None):
+        self.calls.append((task_name, args))
+        return "task"
+
+
+def _engine(connector, registrar=None, **kwargs):
+    uow = FakeUoW()
+    dispatcher = FakeDispatcher()
+    engine = ConnectorSyncEngine(
+        connector=connector,
+        registrar=registrar or FakeRegistrar(),
+        unit_of_work=uow,
+        task_dispatcher=dispatcher,
+        **kwargs,
+    )
+    return engine, uow, dispatcher
+
+
+async def test_unchanged_items_are_skipped_and_new_ones_dispatched():
+    connector = FakeConnector({"1": '"a"', "2": '"b"', "3": '"c"'})
+    registrar = FakeRegistrar()
+    engine, uow, dispatcher = _engine(connector, registrar)
+
+    result = await engine.run("tenant", ["1", "2", "3"], known_versions={"2": '"b"'})
+
+    assert result.unchanged == 1
+    assert result.fetched == 2
+    assert result.dispatched == 2
+    assert sorted(registrar.registered) == ["fake_1.html", "fake_3.html"]
+    assert {args[0] for _, args in dispatcher.calls} == {"doc_fake_1.html", "doc_fake_3.html"}
+    assert all(name == PROCESS_DOCUMENT_TASK for name, _ in dispatcher.calls)
+    assert result.versions == {"1": '"a"', "2": '"b"', "3": '"c"'}
+    assert uow.commits == 1
+
+
+async def test_deduplicated_documents_are_not_redispatched():
+    connector = FakeConnector({"1": "v1", "2": "v2"})
+    registrar = FakeRegistrar(duplicates={"fake_2.html"})
+    engine, _, dispatcher = _engine(connector, registrar)
+
+    result = await engine.run("tenant", ["1", "2"])
+
+    assert result.dispatched == 1
+    assert dispatcher.calls == [(PROCESS_DOCUMENT_TASK, ["doc_fake_1.html", "tenant"])]
+
+
+async def test_fetch_concurrency_is_bounded_and_async_sources_supported():
+    ids = [str(i) for i in range(20)]
+    connector = FakeConnector({i: f"v{i}" for i in ids}, delay=0.01)
+    engine, uow, _ = _engine(connector, concurrency=4, commit_batch_size=5)
+
+    async def source():
+        for item_id in ids:
+            yield item_id
+
+    result = await engine.run("tenant", source())
+
+    assert result.dispatched == 20
+    assert 1 < connector.max_in_flight <= 4
+    assert uow.commits == 4
+
+
+async def test_failed_fetch_is_recorded_without_stopping_sync():
+    connector = FakeConnector({"1": "v1"})
+    engine, _, _ = _engine(connector)
+
+    result = await engine.run("tenant", ["1", "missing"])
+
+    assert result.dispatched == 1
+    assert result.failed == 1
+    assert "missing" in result.errors
+
+
+def test_rate_limit_gate_honours_retry_after_and_remaining_headers():
+    gate = RateLimitGate()
+    gate.observe(httpx.Response(429, headers={"Retry-After": "5"}))
+    assert 4 < gate.delay <= 5
+
+    gate = RateLimitGate()
+    gate.observe(httpx.Response(200, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2"}))
+    assert 1 < gate.delay <= 2
+
+    gate = RateLimitGate()
+    gate.observe(httpx.Response(200, headers={"X-RateLimit-Remaining": "10"}))
+    assert gate.delay == 0
+
+
+class RouteConnector:
+    """Connector registered in the routes' registry for one test."""
+
+    instances: list["RouteConnector"] = []
+
+    def __init__(self, subdomain=""):
+        self.subdomain = subdomain
+        self.closed = False
+        RouteConnector.instances.append(self)
+
+    async def authenticate(self, credentials):
+        return credentials.get("api_token") == "secret"
+
+    async def list_items(self, page=1, page_size=20, search=None):
+        return [], False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+
+async def test_connector_routes_close_connectors_and_keep_item_versions(monkeypatch):
+    from src.api.routes import connectors
+
+    state = SimpleNamespace(
+        connector_type="zendesk",
+        status="idle",
+        error_message=None,
+        last_sync_at=None,
+        sync_cursor={"subdomain": "old", connectors.ITEM_VERSIONS_KEY: {"t1": "v1"}},
+    )
+
+    async def get_state(db, tenant_id, connector_type):
+        return state
+
+    class Session:
+        async def commit(self):
+            pass
+
+        async def refresh(self, obj):
+            pass
+
+    RouteConnector.instances = []
+    monkeypatch.setitem(connectors.CONNECTOR_REGISTRY, "zendesk", RouteConnector)
+    monkeypatch.setattr(connectors, "get_or_create_connector_state", get_state)
+    credentials = {"subdomain": "acme", "email": "a@b.c", "api_token": "secret"}
+
+    await connectors.authenticate_connector(
+        "zendesk", connectors.ConnectorAuthRequest(credentials=credentials), db=Session()
+    )
+    await connectors.list_connector_items("zendesk", db=Session())
+
+    assert state.sync_cursor == {**credentials, connectors.ITEM_VERSIONS_KEY: {"t1": "v1"}}
+    assert [c.subdomain for c in RouteConnector.instances] == ["acme", "acme"]
+    assert all(c.closed for c in RouteConnector.instances)
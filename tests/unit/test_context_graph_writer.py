@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+
+from src.core.graph.application import context_writer
+from src.core.graph.application.context_writer import (
+    LINK_FEEDBACK_TO_LATEST_TURN_QUERY,
+    LINK_FEEDBACK_TO_TURN_QUERY,
+    WRITE_FEEDBACK_QUERY,
+    WRITE_TURNS_QUERY,
+    ContextGraphWriter,
+)
+
+
+class BatchGraph:
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.transactions: list[list[tuple[str, dict]]] = []
+
+    async def connect(self):
+        pass
+
+    async def execute_write_batch(self, statements):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("neo4j unavailable")
+        self.transactions.append(statements)
+        return [[] for _ in statements]
+
+
+@pytest.fixture
+def graph(monkeypatch):
+    client = BatchGraph()
+    monkeypatch.setattr(context_writer, "get_graph_client", lambda: client)
+    return client
+
+
+async def _log_turn(writer, conversation_id="conv", sources=None):
+    return await writer.log_turn(
+        conversation_id=conversation_id,
+        tenant_id="t1",
+        query="q",
+        answer="a",
+        sources=sources,
+    )
+
+
+async def test_turns_and_feedback_flush_in_one_transaction(graph):
+    writer = ContextGraphWriter(flush_interval=60)
+    turn_id = await _log_turn(
+        writer, sources=[{"chunk_id": "c1", "score": 0.9}, {"chunk_id": None}, {"chunk_id": "c2"}]
+    )
+    await _log_turn(writer, conversation_id="conv2")
+    await writer.log_feedback("conv", turn_id, "t1", is_positive=True, feedback_id="fb1")
+    await writer.log_feedback("conv2", None, "t1", is_positive=False)
+
+    assert await writer.flush() == 4
+
+    [statements] = graph.transactions
+    assert [q for q, _ in statements] == [
+        WRITE_TURNS_QUERY,
+        WRITE_FEEDBACK_QUERY,
+        LINK_FEEDBACK_TO_TURN_QUERY,
+        LINK_FEEDBACK_TO_LATEST_TURN_QUERY,
+    ]
+    turns = statements[0][1]["turns"]
+    assert turns[0]["id"] == turn_id
+    assert turns[0]["sources"] == [
+        {"chunk_id": "c1", "score": 0.9},
+        {"chunk_id": "c2", "score": 0.0},
+    ]
+    assert statements[2][1]["feedback"][0]["id"] == "fb1"
+    assert writer.stats.written == 4 and writer.pending_count == 0
+    await writer.close()
+
+
+async def test_full_buffer_drops_instead_of_blocking(graph):
+    writer = ContextGraphWriter(max_pending=2, flush_interval=60)
+
+    assert await _log_turn(writer)
+    assert await _log_turn(writer)
+    assert await _log_turn(writer) is None
+
+    assert writer.stats.dropped == 1
+    assert writer.stats.dropped_by_kind == {"turn": 1, "feedback": 0}
+    await writer.close()
+    assert len(graph.transactions) == 1
+
+
+async def test_failed_flush_retries_then_drops(graph):
+    graph.failures = 10
+    writer = ContextGraphWriter(flush_interval=60, max_attempts=2)
+    await _log_turn(writer)
+
+    assert await writer.flush() == 0
+    assert writer.pending_count == 1
+    assert await writer.flush() == 0
+    assert writer.pending_count == 0
+    assert writer.stats.failed_flushes == 2 and writer.stats.dropped == 1
+    await writer.close()
+
+
+async def test_background_flush_when_batch_fills(graph):
+    writer = ContextGraphWriter(batch_size=3, flush_interval=60)
+    for _ in range(3):
+        await _log_turn(writer)
+
+    for _ in range(50):
+        if graph.transactions:
+            break
+        await asyncio.sleep(0.01)
+
+    assert len(graph.transactions[0][0][1]["turns"]) == 3
+    await writer.close()
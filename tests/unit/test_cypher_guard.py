@@ -0,0 +1,130 @@
+import pytest
+
+from src.core.graph.application.cypher_guard import (
+    CypherGuard,
+    CypherGuardConfig,
+    CypherRejectedError,
+    prepare_cypher,
+    serialize_records,
+)
+
+
+class PlanningGraphClient:
+    def __init__(self, query_type="r", estimated_rows=10.0, records=None):
+        self.query_type = query_type
+        self.estimated_rows = estimated_rows
+        self.records = records if records is not None else [{"name": "Alice"}]
+        self.reads: list[tuple[str, dict, float, int]] = []
+
+    async def explain(self, query, parameters=None):
+        return {
+            "query_type": self.query_type,
+            "plan": {
+                "args": {"EstimatedRows": 1.0},
+                "children": [{"args": {"EstimatedRows": self.estimated_rows}, "children": []}],
+            },
+        }
+
+    async def execute_bounded_read(self, query, parameters=None, *, timeout, max_rows):
+        self.reads.append((query, parameters, timeout, max_rows))
+        return self.records[: max_rows + 1]
+
+
+def _guard(client, version="1", **config):
+    async def _version(_tenant_id):
+        return version
+
+    return CypherGuard(client, CypherGuardConfig(**config), version_reader=_version)
+
+
+def test_node_patterns_are_tenant_scoped_and_limit_clamped():
+    guarded = prepare_cypher(
+        "MATCH (a:Entity {name: 'x'})-[:RELATED_TO]->(b) WHERE size(b.name) > 2 "
+        "RETURN a.name, count(b) LIMIT 1000;",
+        max_rows=50,
+    )
+
+    assert guarded.cypher == (
+        "MATCH (a:Entity {name: 'x', tenant_id: $guard_tenant_id})-[:RELATED_TO]->"
+        "(b {tenant_id: $guard_tenant_id}) WHERE size(b.name) > 2 "
+        "RETURN a.name, count(b) LIMIT 50"
+    )
+    union = prepare_cypher("MATCH (a) RETURN a.name AS n UNION MATCH (b) RETURN b.id AS n", 5)
+    assert union.cypher.startswith("CALL { MATCH (a {tenant_id: $guard_tenant_id})")
+    assert union.cypher.endswith("} RETURN * LIMIT 5")
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "MATCH (n) DETACH DELETE n",
+        "MATCH (n) SET n.x = 1 RETURN n",
+        "CALL apoc.periodic.iterate('a', 'b', {}) YIELD batches RETURN batches",
+        "MATCH (n) RETURN n; MATCH (m) RETURN m",
+        "MATCH (n {tenant_id: 'other'}) RETURN n",
+        "MATCH (n:A|B) RETURN n",
+        "MATCH (n)",
+        # Queries inside APOC function strings would escape tenant scoping
+        "MATCH (a:Entity) WITH a LIMIT 1 RETURN apoc.cypher.runFirstColumnMany("
+        "'MATCH (n:Entity) RETURN n.name, n.tenant_id', {}) AS leak",
+        'RETURN apoc.cypher.runFirstColumnSingle("MATCH (d:Document) RETURN '
+        'collect(d.tenant_id)", {})',
+        "MATCH (n) RETURN apoc . text . join([n.name], ',')",
+        # Nested property maps must not slip past the tenant scoping
+        "MATCH (n {name: {a:'Alice'}.a}) RETURN n.name",
+        "MATCH (m:Entity)-->(n {name: {a: {b: 'Alice'}}.a.b}) RETURN n.name",
+    ],
+)
+def test_unsafe_statements_are_rejected(query):
+    with pytest.raises(CypherRejectedError):
+        prepare_cypher(query, max_rows=50)
+
+
+def test_allowlisted_procedures_and_functions_pass():
+    guarded = prepare_cypher(
+        "CALL db.labels() YIELD label MATCH (n) "
+        "RETURN label, date.truncate('month', n.created_at) AS month",
+        10,
+    )
+    assert "date.truncate('month', n.created_at)" in guarded.cypher
+
+
+def test_keywords_inside_literals_are_ignored():
+    guarded = prepare_cypher("MATCH (n) WHERE n.name = 'DELETE; SET' RETURN n // DROP", 10)
+    assert "'DELETE; SET'" in guarded.cypher and "DROP" not in guarded.cypher
+
+
+async def test_run_plans_bounds_and_caches_per_graph_version():
+    records = [{"name": f"e{i}", "embedding": [0.1] * 64} for i in range(5)]
+    client = PlanningGraphClient(records=records)
+    guard = _guard(client, max_rows=3, timeout_seconds=2.0)
+    query = "MATCH (e:Entity) RETURN e.name AS name, e.embedding AS embedding"
+
+    text = await guard.run(query, "t1")
+
+    _cypher, params, timeout, max_rows = client.reads[0]
+    assert params["guard_tenant_id"] == "t1" and timeout == 2.0 and max_rows == 3
+    assert text.splitlines()[0] == 'columns: ["name", "embedding"]'
+    assert '["e0","<64 numbers>"]' in text
+    assert "row limit 3 reached" in text
+
+    # Whitespace differences normalize to the same cached query
+    again = await guard.run(query.replace(" RETURN", "\n  RETURN"), "t1")
+    assert again == text and len(client.reads) == 1
+    await guard.run(query, "t2")
+    assert len(client.reads) == 2
+
+
+async def test_run_rejects_writes_and_broad_plans():
+    with pytest.raises(CypherRejectedError, match="not a read"):
+        await _guard(PlanningGraphClient(query_type="rw")).run("MATCH (n) RETURN n", "t1")
+    with pytest.raises(CypherRejectedError, match="too broad"):
+        await _guard(PlanningGraphClient(estimated_rows=1e7)).run("MATCH (n) RETURN n", "t1")
+
+
+def test_serialization_respects_byte_budget():
+    records = [{"text": "x" * 200} for _ in range(20)]
+    text = serialize_records(records, CypherGuardConfig(max_result_bytes=1000), row_limit=20)
+
+    assert len(text.encode("utf-8")) < 1200
+    assert "more rows omitted: output budget" in text
@@ -0,0 +1,330 @@
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.graph.application.explorer import REFRESH_DEGREES_QUERY
+from src.core.ingestion.application import document_deletion
+from src.core.ingestion.application.document_deletion import (
+    DELETE_EMPTY_COMMUNITIES_QUERY,
+    DELETE_UNMENTIONED_ENTITIES_QUERY,
+    PURGE_DOCUMENTS_QUERY,
+    DocumentCleanupService,
+    TombstoneCache,
+    cleanup_operation_id,
+    get_tombstone_cache,
+    schedule_document_cleanup,
+)
+from src.core.retrieval.application.retrieval_service import RetrievalService
+
+NOW = datetime(2026, 10, 18, tzinfo=UTC)
+
+
+class FakeResult:
+    def __init__(self, rows=None, rowcount=0, count=None):
+        self._rows = rows or []
+        self.rowcount = rowcount
+        self._count = count
+
+    def all(self):
+        return self._rows
+
+    def scalar_one_or_none(self):
+        return self._count
+
+
+class FakeSession:
+    """Answers the cleanup service's batch reads and deletes."""
+
+    def __init__(self, batches, tenant_config=None):
+        self.batches = list(batches)
+        self.tenant_config = tenant_config
+        self.deleted: list[list[str]] = []
+
+    async def execute(self, stmt):
+        sql = str(stmt)
+        if "FROM tenants" in sql:
+            return FakeResult(count=self.tenant_config)
+        if sql.startswith("DELETE FROM documents"):
+            ids = next(v for v in stmt.compile().params.values() if isinstance(v, list))
+            self.deleted.append(ids)
+            return FakeResult(rowcount=len(ids))
+        if "count(" in sql:
+            return FakeResult(count=sum(len(batch) for batch in self.batches))
+        if "FROM documents" in sql:
+            return FakeResult(self.batches.pop(0) if self.batches else [])
+        return FakeResult()
+
+    async def commit(self):
+        pass
+
+
+class FakeGraph:
+    def __init__(self, responses):
+        self.responses = responses
+        self.writes: list[tuple[str, dict]] = []
+
+    async def execute_write(self, query, parameters):
+        self.writes.append((query, parameters))
+        return self.responses.get(query, [])
+
+
+class FakeVectorStore:
+    def __init__(self):
+        self.calls = []
+
+    async def delete_by_documents(self, document_ids, tenant_id):
+        self.calls.append((list(document_ids), tenant_id))
+        return 3 * len(document_ids)
+
+
+class FakeStorage:
+    def __init__(self):
+        self.batches = []
+        self.previews = {"t1/d1/previews/": ["t1/d1/previews/page-0001-w960.png"]}
+
+    def list_files(self, prefix):
+        return self.previews.get(prefix, [])
+
+    def delete_files(self, object_names):
+        self.batches.append(list(object_names))
+        return []
+
+
+@pytest.fixture(autouse=True)
+def graph_deltas(monkeypatch):
+    async def _noop(_tenant_id):
+        return None
+
+    deltas = []
+    monkeypatch.setattr(document_deletion, "mark_graph_changed", _noop)
+    monkeypatch.setattr(
+        document_deletion,
+        "record_graph_delta",
+        lambda tenant_id, **kw: deltas.append((tenant_id, kw)),
+    )
+    get_tombstone_cache().invalidate()
+    return deltas
+
+
+async def test_cleanup_makes_one_pass_per_store_and_scopes_graph_checks(graph_deltas):
+    graph = FakeGraph(
+        {
+            PURGE_DOCUMENTS_QUERY: [
+                {"documents": 2, "chunks": 5, "entity_names": ["Alice", "Acme"]}
+            ],
+            DELETE_UNMENTIONED_ENTITIES_QUERY: [
+                {"deleted": 1, "relationships": 4, "neighbors": ["Bob"], "community_ids": ["c1"]}
+            ],
+        }
+    )
+    session = FakeSession([[("d1", "t1/d1/a.pdf", NOW), ("d2", "t1/d2/b.pdf", NOW)]])
+    vectors = FakeVectorStore()
+    storage = FakeStorage()
+    service = DocumentCleanupService(session, storage, graph, lambda tid, **kw: vectors)
+
+    report = await service.purge_tenant("t1")
+
+    queries = [q for q, _ in graph.writes]
+    assert queries.count(PURGE_DOCUMENTS_QUERY) == 1
+    assert graph.writes[0][1] == {"document_ids": ["d1", "d2"], "tenant_id": "t1"}
+    # Only the entities the deleted chunks mentioned are orphan candidates
+    assert graph.writes[1] == (
+        DELETE_UNMENTIONED_ENTITIES_QUERY, {"names": ["Alice", "Acme"], "tenant_id": "t1"}
+    )
+    assert (REFRESH_DEGREES_QUERY, {"names": ["Bob"], "tenant_id": "t1"}) in graph.writes
+    assert (DELETE_EMPTY_COMMUNITIES_QUERY, {"ids": ["c1"], "tenant_id": "t1"}) in graph.writes
+    assert vectors.calls == [(["d1", "d2"], "t1")]
+    # Rendered page previews go with the originals
+    assert storage.batches == [
+        ["t1/d1/a.pdf", "t1/d2/b.pdf", "t1/d1/previews/page-0001-w960.png"]
+    ]
+    assert session.deleted == [["d1", "d2"]]
+    assert report.documents == 2 and report.entities == 1 and report.vectors == 6
+    assert graph_deltas == [
+        ("t1", {"entities_total": -1, "relationships_total": -4, "communities_total": 0})
+    ]
+
+
+async def test_cleanup_purges_the_active_collection_of_the_default_tenant():
+    graph = FakeGraph({PURGE_DOCUMENTS_QUERY: [{"documents": 1, "chunks": 1, "entity_names": []}]})
+    session = FakeSession([[("d1", None, NOW)]])
+    stores: dict[str, FakeVectorStore] = {}
+
+    def make_vector_store(tenant_id, collection_name):
+        return stores.setdefault(collection_name, FakeVectorStore())
+
+    service = DocumentCleanupService(session, FakeStorage(), graph, make_vector_store)
+
+    report = await service.purge_tenant("default")
+
+    # Ingestion writes the default tenant's chunks to document_chunks, not amber_default
+    assert list(stores) == ["document_chunks"]
+    assert stores["document_chunks"].calls == [(["d1"], "default")]
+    assert report.vectors == 3 and session.deleted == [["d1"]]
+
+
+async def test_cleanup_after_a_migration_cutover_purges_the_new_collection():
+    graph = FakeGraph({PURGE_DOCUMENTS_QUERY: [{"documents": 1, "chunks": 1, "entity_names": []}]})
+    config = {
+        "active_vector_collection": "amber_t_1_1024d_1760000000",
+        "previous_vector_collection": "amber_t_1",
+        "embedding_migration": {
+            "status": "completed",
+            "target_collection": "amber_t_1_1024d_1760000000",
+        },
+    }
+    session = FakeSession([[("d1", None, NOW)]], tenant_config=config)
+    stores: dict[str, FakeVectorStore] = {}
+
+    def make_vector_store(tenant_id, collection_name):
+        return stores.setdefault(collection_name, FakeVectorStore())
+
+    service = DocumentCleanupService(session, FakeStorage(), graph, make_vector_store)
+
+    await service.purge_tenant("t-1")
+
+    assert list(stores) == ["amber_t_1_1024d_1760000000"]
+    assert stores["amber_t_1_1024d_1760000000"].calls == [(["d1"], "t-1")]
+
+    # While the next migration backfills, its shadow collection is purged too
+    config["embedding_migration"] = {"status": "backfilling", "target_collection": "shadow"}
+    session = FakeSession([[("d2", None, NOW)]], tenant_config=config)
+    service = DocumentCleanupService(session, FakeStorage(), graph, make_vector_store)
+
+    await service.purge_tenant("t-1")
+
+    assert list(stores) == ["amber_t_1_1024d_1760000000", "shadow"]
+    assert stores["shadow"].calls == [(["d2"], "t-1")]
+
+
+async def test_failed_store_keeps_the_tombstones():
+    class BrokenVectorStore(FakeVectorStore):
+        async def delete_by_documents(self, document_ids, tenant_id):
+            raise ConnectionError("milvus down")
+
+    session = FakeSession([[("d1", "t1/d1/a.pdf", NOW)]])
+    service = DocumentCleanupService(
+        session, FakeStorage(), FakeGraph({}), lambda tid, **kw: BrokenVectorStore()
+    )
+
+    report = await service.purge_tenant("t1")
+
+    assert session.deleted == []
+    assert report.documents == 0 and report.errors == ["vectors: milvus down"]
+
+
+async def test_cleanup_scheduling_coalesces_while_a_run_is_pending(monkeypatch):
+    keys: dict[str, str] = {}
+
+    class FakeRedis:
+        async def set(self, key, value, nx=False, ex=None):
+            if nx and key in keys:
+                return None
+            keys[key] = value
+            return True
+
+        async def delete(self, key):
+            keys.pop(key, None)
+
+    # Every call shares the pooled client rather than opening a connection
+    pooled = FakeRedis()
+    monkeypatch.setattr(document_deletion, "get_cache_client", lambda: pooled)
+
+    class Dispatcher:
+        def __init__(self):
+            self.calls = []
+
+        async def dispatch(self, task_name, args=None, kwargs=None, countdown=None):
+            self.calls.append((task_name, args, countdown))
+            return f"task-{len(self.calls)}"
+
+    dispatcher = Dispatcher()
+    first = await schedule_document_cleanup(dispatcher, "t1")
+    second = await schedule_document_cleanup(dispatcher, "t1")
+    other = await schedule_document_cleanup(dispatcher, "t2")
+
+    assert (first, second, other) == ("task-1", None, "task-2")
+    assert dispatcher.calls[0] == (
+        document_deletion.CLEANUP_TASK, ["t1"], document_deletion.CLEANUP_DELAY_SECONDS
+    )
+
+    # The run clears the marker before reading tombstones; later deletes schedule again
+    await document_deletion.clear_cleanup_pending("t1")
+    assert await schedule_document_cleanup(dispatcher, "t1") == "task-3"
+
+
+async def test_retrieval_drops_chunks_of_tombstoned_documents():
+    loads = []
+
+    async def list_tombstoned_ids(tenant_id):
+        loads.append(tenant_id)
+        return {"d-gone"}
+
+    service = SimpleNamespace(
+        document_repository=SimpleNamespace(list_tombstoned_ids=list_tombstoned_ids)
+    )
+    chunks = [
+        {"chunk_id": "c1", "document_id": "d-live"},
+        {"chunk_id": "c2", "document_id": "d-gone"},
+        SimpleNamespace(chunk_id="c3", document_id="d-gone"),
+        {"chunk_id": "summary"},
+    ]
+
+    kept = await RetrievalService._drop_tombstoned(service, "t1", chunks)
+    await RetrievalService._drop_tombstoned(service, "t1", chunks)
+
+    assert [c["chunk_id"] for c in kept] == ["c1", "summary"]
+    assert loads == ["t1"]  # second lookup served from the cache
+
+
+async def test_tombstone_cache_expires_and_invalidates():
+    calls = []
+
+    async def loader(tenant_id):
+        calls.append(tenant_id)
+        return {f"d{len(calls)}"}
+
+    cache = TombstoneCache(ttl_seconds=0)
+    assert await cache.get("t1", loader) == {"d1"}
+    assert await cache.get("t1", loader) == {"d2"}
+
+    cache = TombstoneCache(ttl_seconds=60)
+    await cache.get("t1", loader)
+    cache.invalidate("t1")
+    assert await cache.get("t1", loader) == {"d4"}
+
+
+async def test_cleanup_reports_progress_per_batch():
+    class Publisher:
+        def __init__(self):
+            self.payloads = []
+
+        async def publish(self, payload):
+            self.payloads.append(payload)
+
+    graph = FakeGraph({PURGE_DOCUMENTS_QUERY: [{"documents": 1, "chunks": 1, "entity_names": []}]})
+    session = FakeSession([[("d1", "t1/d1/a.pdf", NOW)], [("d2", None, NOW)]])
+    publisher = Publisher()
+    service = DocumentCleanupService(
+        session,
+        FakeStorage(),
+        graph,
+        lambda tid, **kw: FakeVectorStore(),
+        batch_size=1,
+        publisher=publisher,
+    )
+
+    await service.purge_tenant("t1")
+
+    assert {p["channel"] for p in publisher.payloads} == {"document:cleanup-t1:status"}
+    events = [p["message"] for p in publisher.payloads]
+    assert [(e["status"], e["progress"]) for e in events] == [
+        ("processing", 50),
+        ("processing", 99),
+        ("completed", 100),
+    ]
+    assert events[0]["details"]["document_ids"] == ["d1"]
+    assert events[0]["document_id"] == cleanup_operation_id("t1")
+    assert events[-1]["details"]["documents"] == 2
+
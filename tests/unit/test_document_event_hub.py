@@ -0,0 +1,91 @@
+import asyncio
+
+from src.infrastructure.adapters.redis_event_hub import DocumentEventHub, EventSubscription
+
+
+def _event(document_id, status, progress=0, tenant_id="t1"):
+    return {
+        "document_id": document_id,
+        "status": status,
+        "progress": progress,
+        "tenant_id": tenant_id,
+    }
+
+
+async def test_subscription_coalesces_progress_per_document():
+    subscription = EventSubscription(min_interval=60)
+
+    subscription.offer(_event("d1", "embedding", 60))
+    assert (await subscription.get(timeout=0.1))["progress"] == 60
+
+    for progress in range(61, 70):
+        subscription.offer(_event("d1", "embedding", progress))
+    # Same-status ticks inside the interval are held back
+    assert await subscription.get(timeout=0.05) is None
+
+    # A status transition replaces the pending tick and is delivered at once
+    subscription.offer(_event("d1", "graph_sync", 70))
+    event = await subscription.get(timeout=0.1)
+    assert event["status"] == "graph_sync"
+    assert await subscription.get(timeout=0.05) is None
+
+
+async def test_subscription_releases_latest_tick_after_interval():
+    subscription = EventSubscription(min_interval=0.05)
+    subscription.offer(_event("d1", "embedding", 60))
+    await subscription.get(timeout=0.1)
+
+    subscription.offer(_event("d1", "embedding", 61))
+    subscription.offer(_event("d1", "embedding", 65))
+
+    event = await subscription.get(timeout=1.0)
+    assert event["progress"] == 65
+
+
+async def test_subscription_forgets_finished_documents():
+    subscription = EventSubscription(tenant_id="t1", min_interval=60)
+    for document_id in ("d1", "d2"):
+        subscription.offer(_event(document_id, "embedding", 50))
+        await subscription.get(timeout=0.1)
+        subscription.offer(_event(document_id, "ready", 100))
+        assert (await subscription.get(timeout=0.1))["status"] == "ready"
+
+    assert subscription._last_status == {} and subscription._last_sent == {}
+
+    # An event without a status for an unseen document is still delivered
+    subscription.offer({"document_id": "d3", "tenant_id": "t1"})
+    assert (await subscription.get(timeout=0.1))["document_id"] == "d3"
+
+
+async def test_hub_fans_out_by_tenant_and_document():
+    hub = DocumentEventHub("redis://unused")
+    tenant_sub = EventSubscription(tenant_id="t1")
+    doc_sub = EventSubscription(document_ids={"d2"})
+    hub._subscribers.update({tenant_sub, doc_sub})
+
+    hub.publish_local('{"document_id": "d1", "status": "chunking", "tenant_id": "t1"}')
+    hub.publish_local(_event("d2", "ready", tenant_id="t2"))
+    hub.publish_local("not json")
+
+    assert (await tenant_sub.get(timeout=0.1))["document_id"] == "d1"
+    assert await tenant_sub.get(timeout=0.01) is None
+    assert (await doc_sub.get(timeout=0.1))["document_id"] == "d2"
+
+
+async def test_hub_shares_one_reader_and_stops_with_last_subscriber(monkeypatch):
+    started = []
+
+    async def fake_run(self):
+        started.append(self)
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(DocumentEventHub, "_run", fake_run)
+    hub = DocumentEventHub("redis://unused")
+
+    async with hub.subscribe(tenant_id="t1"), hub.subscribe(document_ids={"d1"}):
+        await asyncio.sleep(0)
+        assert hub.subscriber_count == 2
+        assert len(started) == 1
+
+    assert hub.subscriber_count == 0
+    assert hub._reader is None
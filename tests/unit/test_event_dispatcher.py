@@ -26,3 +26,45 @@ async def test_event_dispatcher_calls_publisher():
     await dispatcher.emit_state_change(event)
 
     assert dispatcher.publisher.published
+
+
+@pytest.mark.asyncio
+async def test_event_dispatcher_coalesces_progress_ticks():
+    dispatcher = EventDispatcher(publisher=FakePublisher(), progress_interval=60)
+
+    def tick(progress, old=DocumentStatus.EMBEDDING, new=DocumentStatus.EMBEDDING):
+        return StateChangeEvent(
+            document_id="doc-1",
+            old_status=old,
+            new_status=new,
+            tenant_id="tenant-1",
+            details={"progress": progress},
+        )
+
+    await dispatcher.emit_state_change(tick(60, old=DocumentStatus.CHUNKING))
+    for progress in range(61, 70):
+        await dispatcher.emit_state_change(tick(progress))
+    await dispatcher.emit_state_change(tick(70, new=DocumentStatus.GRAPH_SYNC))
+
+    statuses = [p["message"]["status"] for p in dispatcher.publisher.published]
+    assert statuses == ["embedding", "graph_sync"]
+
+
+@pytest.mark.asyncio
+async def test_event_dispatcher_forgets_finished_documents():
+    dispatcher = EventDispatcher(publisher=FakePublisher())
+
+    for document_id in ("doc-1", "doc-2"):
+        for old, new in (
+            (None, DocumentStatus.INGESTED),
+            (DocumentStatus.INGESTED, DocumentStatus.EMBEDDING),
+            (DocumentStatus.EMBEDDING, DocumentStatus.READY),
+        ):
+            await dispatcher.emit_state_change(
+                StateChangeEvent(
+                    document_id=document_id, old_status=old, new_status=new, tenant_id="t1"
+                )
+            )
+
+    assert dispatcher._last_progress_at == {}
+    assert len(dispatcher.publisher.published) == 6
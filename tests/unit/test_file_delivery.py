@@ -0,0 +1,179 @@
+import asyncio
+import io
+from types import SimpleNamespace
+
+import pytest
+
+from src.api.routes import documents as documents_routes
+from src.core.ingestion.application.file_delivery import (
+    ByteRange,
+    PagePreviewService,
+    RangeNotSatisfiableError,
+    if_none_match,
+    if_range_matches,
+    parse_range,
+    preview_object_name,
+    preview_width,
+    strong_etag,
+)
+from src.core.ingestion.infrastructure.storage.page_preview import HAS_PYMUPDF, render_pdf_page
+
+ETAG = strong_etag("abc123")
+
+
+class FakeStorage:
+    def __init__(self, objects=None):
+        self.objects = dict(objects or {})
+        self.reads: list[tuple[str, int, int | None]] = []
+
+    def stat_file(self, object_name):
+        if object_name not in self.objects:
+            return None
+        return {"size": len(self.objects[object_name]), "content_type": None, "etag": None}
+
+    def get_file(self, object_name):
+        return self.objects[object_name]
+
+    def get_file_stream(self, object_name, offset=0, length=None):
+        self.reads.append((object_name, offset, length))
+        data = self.objects[object_name][offset:]
+        return io.BytesIO(data if length is None else data[:length])
+
+    def upload_file(self, object_name, data, length, content_type):
+        self.objects[object_name] = data.read()
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, None),
+        ("bytes=0-99", ByteRange(0, 99)),
+        ("bytes=900-", ByteRange(900, 999)),
+        ("bytes=-100", ByteRange(900, 999)),
+        ("bytes=-5000", ByteRange(0, 999)),
+        ("bytes=500-5000", ByteRange(500, 999)),
+        # Whole file: other units, garbage, multiple ranges
+        ("items=0-1", None),
+        ("bytes=abc-", None),
+        ("bytes=9-3", None),
+        ("bytes=0-1,5-9", None),
+    ],
+)
+def test_parse_range(header, expected):
+    assert parse_range(header, 1000) == expected
+
+
+def test_unsatisfiable_ranges():
+    for header in ("bytes=1000-", "bytes=-0"):
+        with pytest.raises(RangeNotSatisfiableError):
+            parse_range(header, 1000)
+    assert ByteRange(0, 99).content_range(1000) == "bytes 0-99/1000"
+
+
+def test_validators():
+    assert if_none_match(ETAG, ETAG)
+    assert if_none_match(f'"other", W/{ETAG}', ETAG)
+    assert if_none_match("*", ETAG)
+    assert not if_none_match('"other"', ETAG)
+    assert not if_none_match(None, ETAG)
+
+    assert if_range_matches(None, ETAG)
+    assert if_range_matches(ETAG, ETAG)
+    assert not if_range_matches(f"W/{ETAG}", ETAG)
+    assert not if_range_matches("Wed, 21 Oct 2026 07:28:00 GMT", ETAG)
+
+
+def _request(**headers):
+    return SimpleNamespace(
+        headers=headers, state=SimpleNamespace(permissions=[], tenant_id="t1")
+    )
+
+
+async def _body(response):
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+async def test_file_route_serves_ranges_from_storage(monkeypatch):
+    data = bytes(range(256)) * 4
+    storage = FakeStorage({"t1/d1/a.pdf": data})
+    document = SimpleNamespace(
+        id="d1",
+        tenant_id="t1",
+        filename="a.pdf",
+        storage_path="t1/d1/a.pdf",
+        content_hash="abc123",
+        metadata_={},
+    )
+
+    async def fake_get(document_id, request, session):
+        return document
+
+    monkeypatch.setattr(documents_routes, "_get_file_document", fake_get)
+    monkeypatch.setattr(documents_routes, "platform", SimpleNamespace(minio_client=storage))
+
+    response = await documents_routes.get_document_file("d1", _request(range="bytes=10-19"), None)
+    assert response.status_code == 206
+    assert response.headers["content-range"] == "bytes 10-19/1024"
+    assert response.headers["etag"] == ETAG
+    assert await _body(response) == data[10:20]
+    # Only the requested bytes were read from storage
+    assert storage.reads == [("t1/d1/a.pdf", 10, 10)]
+
+    response = await documents_routes.get_document_file("d1", _request(), None)
+    assert response.status_code == 200 and response.headers["content-length"] == "1024"
+    assert await _body(response) == data
+
+    response = await documents_routes.get_document_file(
+        "d1", _request(**{"if-none-match": ETAG}), None
+    )
+    assert response.status_code == 304 and len(storage.reads) == 2
+
+    response = await documents_routes.get_document_file("d1", _request(range="bytes=2000-"), None)
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */1024"
+
+    # A stale If-Range gets the whole file
+    response = await documents_routes.get_document_file(
+        "d1", _request(range="bytes=0-9", **{"if-range": '"old"'}), None
+    )
+    assert response.status_code == 200
+
+
+async def test_previews_render_once_and_are_reused():
+    storage = FakeStorage({"t1/d1/a.pdf": b"%PDF-1.7"})
+    renders = []
+
+    def renderer(path, page_index, width):
+        with open(path, "rb") as f:
+            assert f.read() == b"%PDF-1.7"
+        renders.append((page_index, width))
+        return b"png"
+
+    service = PagePreviewService(storage, renderer)
+    width = preview_width(700)
+    results = await asyncio.gather(
+        *(service.get_preview("t1", "d1", "t1/d1/a.pdf", 2, width) for _ in range(5))
+    )
+
+    assert results == [b"png"] * 5
+    assert renders == [(1, 960)]
+    assert storage.objects[preview_object_name("t1", "d1", 2, 960)] == b"png"
+    assert preview_object_name("t1", "d1", 2, 960) == "t1/d1/previews/page-0002-w960.png"
+    assert (preview_width(None), preview_width(5000)) == (960, 1600)
+
+
+@pytest.mark.skipif(not HAS_PYMUPDF, reason="PyMuPDF not installed")
+def test_render_pdf_page(tmp_path):
+    import fitz
+
+    path = tmp_path / "doc.pdf"
+    with fitz.open() as pdf:
+        pdf.new_page(width=200, height=100)
+        pdf.save(str(path))
+
+    png = render_pdf_page(str(path), 0, 320)
+    assert png.startswith(b"\x89PNG")
+    pixmap = fitz.Pixmap(png)
+    assert (pixmap.width, pixmap.height) == (320, 160)
+    with pytest.raises(IndexError):
+        render_pdf_page(str(path), 1, 320)
@@ -0,0 +1,93 @@
+import os
+import time
+
+import pytest
+
+from src.core.tools import filesystem
+from src.core.tools.filesystem import CodeIndex, FilesystemToolsConfig, create_filesystem_tools
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    monkeypatch.setattr(filesystem, "_indexes", {})
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("def handler():\n    return Handler()\n")
+    (tmp_path / "src" / "util.py").write_text("import os\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "lib.js").write_text("def handler")
+    (tmp_path / "image.bin").write_bytes(b"\0def handler")
+    return tmp_path
+
+
+def _tools(root, **config):
+    config.setdefault("refresh_interval_seconds", 0)
+    tools = create_filesystem_tools(str(root), FilesystemToolsConfig(**config))
+    return {tool["name"]: tool["func"] for tool in tools}
+
+
+async def test_grep_uses_the_index_and_skips_ignored_and_binary_files(workspace):
+    tools = _tools(workspace)
+
+    result = await tools["grep_search"]("def handler")
+    assert result == "Found matches:\nsrc/app.py:1: def handler():"
+    result = await tools["grep_search"]("os", path="src")
+    assert result == "Found matches:\nsrc/util.py:1: import os"
+    assert (await tools["grep_search"]("nowhere")).startswith("No matches")
+
+    index = filesystem.get_code_index(str(workspace))
+    assert index.candidates("handler") == ["src/app.py"]
+    # Candidates are case-insensitive; matches stay exact
+    assert index.candidates("HANDLER") == ["src/app.py"]
+    assert (await tools["grep_search"]("HANDLER")).startswith("No matches")
+
+
+def test_index_refresh_is_incremental(workspace):
+    index = CodeIndex(str(workspace), FilesystemToolsConfig())
+    index.refresh(force=True)
+    assert index.candidates("import os") == ["src/util.py"]
+
+    reads = []
+    original_add = index._add
+    index._add = lambda path, *args: reads.append(path) or original_add(path, *args)
+    util = workspace / "src" / "util.py"
+    util.write_text("import sys\n")
+    os.utime(util, ns=(time.time_ns(), time.time_ns() + 10**9))
+    (workspace / "src" / "app.py").unlink()
+    index.refresh(force=True)
+
+    assert reads == ["src/util.py"]
+    assert index.candidates("import os") == []
+    assert index.candidates("import sys") == ["src/util.py"]
+    assert index.candidates("handler") == []
+
+
+async def test_paths_are_sandboxed(workspace):
+    tools = _tools(workspace)
+    (workspace.parent / "secret.txt").write_text("password")
+
+    for call in (
+        tools["read_file"]("../secret.txt"),
+        tools["list_directory"]("/etc"),
+        tools["grep_search"]("password", path=".."),
+    ):
+        assert "outside the workspace" in await call
+
+
+async def test_calls_are_time_and_output_bounded(workspace, monkeypatch):
+    (workspace / "big.txt").write_text("line\n" * 5000)
+    tools = _tools(workspace, max_output_chars=100, max_matches=3)
+
+    result = await tools["read_file"]("big.txt")
+    assert result.startswith("--- File: big.txt (1-5000/5000) (truncated at line")
+    assert result.endswith("(output truncated at 100 characters)")
+    assert "(truncated at 3)" in await tools["grep_search"]("line")
+    assert (await tools["list_directory"]()).splitlines()[0] == "[FILE] big.txt"
+
+    def slow(*args):
+        time.sleep(0.5)
+        return "late"
+
+    monkeypatch.setattr(filesystem.Workspace, "list_directory", lambda self, path, dl: slow())
+    tools = _tools(workspace, timeout_seconds=0.01)
+    monkeypatch.setattr(filesystem, "TIMEOUT_GRACE_SECONDS", 0.05)
+    assert "timed out" in await tools["list_directory"]()
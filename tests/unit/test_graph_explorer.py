@@ -0,0 +1,124 @@
+from src.core.generation.application.prompts.entity_extraction import ExtractedRelationship
+from src.core.graph.application import explorer
+from src.core.graph.application.explorer import (
+    SEARCH_NODES_QUERY,
+    SEARCH_NODES_SCAN_QUERY,
+    TOP_NODES_QUERY,
+    GraphExplorer,
+    build_fulltext_query,
+    mark_graph_changed,
+    read_graph_version,
+)
+from src.core.graph.application.writer import GraphWriter
+
+
+class VersionedExplorer(GraphExplorer):
+    """Explorer with an in-memory version counter instead of Redis."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.versions: dict[str, int] = {}
+
+    async def _read_version(self, tenant_id):
+        return str(self.versions.get(tenant_id, 0))
+
+
+class RecordingGraph:
+    def __init__(self, fail_fulltext: bool = False):
+        self.fail_fulltext = fail_fulltext
+        self.reads: list[tuple[str, dict]] = []
+
+    async def execute_read(self, query, params=None):
+        self.reads.append((query, params))
+        if query == SEARCH_NODES_QUERY and self.fail_fulltext:
+            raise RuntimeError("There is no such fulltext schema index: entity_search")
+        return [{"id": "Kubernetes", "label": "Kubernetes", "degree": 3}]
+
+
+def test_fulltext_query_escapes_and_matches_prefixes():
+    lucene = build_fulltext_query("Kube c++", "tenant:1")
+
+    assert "name:kube^4" in lucene and "name:kube*^2" in lucene
+    assert "description:c\\+\\+*" in lucene
+    assert lucene.endswith('tenant_id:"tenant\\:1"')
+    assert build_fulltext_query("   ", "t1") is None
+
+
+async def test_top_nodes_cached_until_graph_version_changes():
+    explorer = VersionedExplorer(revalidate_after=0.0)
+    graph = RecordingGraph()
+
+    await explorer.top_nodes(graph, "t1", limit=15)
+    await explorer.top_nodes(graph, "t1", limit=15)
+    assert len(graph.reads) == 1
+    assert graph.reads[0] == (TOP_NODES_QUERY, {"tenant_id": "t1", "limit": 15})
+
+    # A different limit is a separate payload of the same entry
+    await explorer.top_nodes(graph, "t1", limit=30)
+    assert len(graph.reads) == 2
+
+    explorer.versions["t1"] = 1
+    await explorer.top_nodes(graph, "t1", limit=15)
+    assert len(graph.reads) == 3
+
+    explorer.invalidate("t1")
+    await explorer.top_nodes(graph, "t1", limit=15)
+    assert len(graph.reads) == 4
+
+
+async def test_graph_version_uses_the_pooled_cache_client(monkeypatch):
+    class CountingRedis:
+        def __init__(self):
+            self.values: dict[str, int] = {}
+
+        async def incr(self, key):
+            self.values[key] = self.values.get(key, 0) + 1
+
+        async def get(self, key):
+            value = self.values.get(key)
+            return None if value is None else str(value).encode()
+
+    client = CountingRedis()
+    lookups = []
+    monkeypatch.setattr(explorer, "get_cache_client", lambda: lookups.append(1) or client)
+
+    assert await read_graph_version("t1") == "0"
+    await mark_graph_changed("t1")
+    await mark_graph_changed("t1")
+
+    assert await read_graph_version("t1") == "2"
+    assert len(lookups) == 4 and list(client.values) == ["graph_explorer:version:t1"]
+
+
+async def test_search_falls_back_to_scan_without_fulltext_index():
+    explorer = VersionedExplorer()
+    graph = RecordingGraph(fail_fulltext=True)
+
+    nodes = await explorer.search_nodes(graph, "t1", "kube", limit=5)
+
+    assert nodes[0]["id"] == "Kubernetes"
+    assert [q for q, _ in graph.reads] == [SEARCH_NODES_QUERY, SEARCH_NODES_SCAN_QUERY]
+    assert graph.reads[1][1] == {"tenant_id": "t1", "q": "kube", "limit": 5}
+    assert await explorer.search_nodes(graph, "t1", "", limit=5) == []
+
+
+def test_writer_maintains_degree_on_create():
+    writer = GraphWriter()
+    base_query, _ = writer._build_base_query_and_params(
+        document_id="d1",
+        chunk_id="c1",
+        tenant_id="t1",
+        filename=None,
+        entities_param=[{"name": "A", "type": "CONCEPT", "description": ""}],
+    )
+    [(rel_query, _)] = writer._build_relationship_queries(
+        relationships=[ExtractedRelationship(source="A", target="B", type="uses", description="")],
+        tenant_id="t1",
+    )
+
+    assert "e.degree = 0" in base_query
+    # Only newly created edges count, and only in ON CREATE
+    on_create, on_match = rel_query.split("ON MATCH SET")
+    assert "s.degree = coalesce(s.degree, 0) + 1" in on_create
+    assert "t.degree = coalesce(t.degree, 0) + 1" in on_create
+    assert "degree" not in on_match
@@ -0,0 +1,154 @@
+import pytest
+
+from src.core.graph.application import garbage_collector as gc_module
+from src.core.graph.application.garbage_collector import (
+    DELETE_EMPTY_COMMUNITIES_QUERY,
+    DELETE_ORPHAN_ENTITIES_QUERY,
+    DELETE_TENANT_BATCH_QUERY,
+    PAGE_COMMUNITIES_QUERY,
+    PAGE_ENTITIES_QUERY,
+    GraphGarbageCollector,
+    StreamOrderError,
+    diff_sorted,
+    paginate,
+)
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+async def _collect(stream):
+    return [item async for item in stream]
+
+
+class FakeGraph:
+    """Tenant graph with documents, chunks, entities and a community hierarchy."""
+
+    def __init__(self):
+        self.nodes = {
+            "Document": {"d1", "d2", "d3"},
+            "Chunk": {"c1", "c2", "c3", "c4", "c5"},
+        }
+        # entity -> mentioned by a chunk
+        self.entities = {"alpha": True, "beta": False, "gamma": False}
+        # community -> (member entities, child communities)
+        self.communities = {"l0a": ({"alpha"}, set()), "l0b": ({"beta"}, set())}
+        self.communities["l1"] = (set(), {"l0b"})
+        self.writes: list[dict] = []
+
+    async def execute_read(self, query, params=None):
+        after, limit = params.get("after", ""), params.get("limit")
+        if query == PAGE_ENTITIES_QUERY:
+            names = sorted(n for n in self.entities if n > after)[:limit]
+            return [{"id": n, "live": self.entities[n]} for n in names]
+        if query == PAGE_COMMUNITIES_QUERY:
+            ids = sorted(c for c in self.communities if c > after)[:limit]
+            return [{"id": c, "live": self._community_live(c)} for c in ids]
+        label = "Document" if ":Document" in query else "Chunk"
+        ids = sorted(i for i in self.nodes[label] if i > after)[:limit]
+        return [{"id": i} for i in ids]
+
+    async def execute_write(self, query, params=None):
+        ids = params["ids"]
+        self.writes.append({"ids": list(ids)})
+        if query == DELETE_ORPHAN_ENTITIES_QUERY:
+            doomed = [n for n in ids if not self.entities[n]]
+            for name in doomed:
+                del self.entities[name]
+                for members, _ in self.communities.values():
+                    members.discard(name)
+        elif query == DELETE_EMPTY_COMMUNITIES_QUERY:
+            doomed = [c for c in ids if not self._community_live(c)]
+            for cid in doomed:
+                del self.communities[cid]
+                for _, children in self.communities.values():
+                    children.discard(cid)
+        else:
+            label = "Document" if ":Document" in query else "Chunk"
+            doomed = [i for i in ids if i in self.nodes[label]]
+            self.nodes[label] -= set(doomed)
+        return [{"deleted": len(doomed)}]
+
+    def _community_live(self, cid):
+        members, children = self.communities[cid]
+        return bool(members or children)
+
+
+@pytest.fixture(autouse=True)
+def no_side_effects(monkeypatch):
+    changed = []
+
+    async def reconcile(graph, tenant_id):
+        return 0
+
+    async def mark(tenant_id):
+        changed.append(tenant_id)
+
+    monkeypatch.setattr(gc_module, "reconcile_entity_degrees", reconcile)
+    monkeypatch.setattr(gc_module, "mark_graph_changed", mark)
+    return changed
+
+
+async def test_diff_sorted_yields_missing_and_rejects_unordered_streams():
+    missing = diff_sorted(_aiter(["a", "b", "c", "e"]), _aiter(["b", "d", "e"]))
+    assert await _collect(missing) == ["a", "c"]
+
+    with pytest.raises(StreamOrderError):
+        await _collect(diff_sorted(_aiter(["a", "c", "b"]), _aiter([])))
+
+
+async def test_paginate_uses_keyset_cursor():
+    calls = []
+
+    async def fetch(after, limit):
+        calls.append(after)
+        return [i for i in ["a", "b", "c", "d", "e"] if i > after][:limit]
+
+    assert await _collect(paginate(fetch, 2)) == ["a", "b", "c", "d", "e"]
+    assert calls == ["", "b", "d"]
+
+
+async def test_collect_prunes_in_bounded_batches(no_side_effects):
+    graph = FakeGraph()
+    progress = []
+    gc = GraphGarbageCollector(
+        graph, batch_size=2, on_progress=lambda p: progress.append((p.phase, p.deleted))
+    )
+
+    report = await gc.collect(
+        "t1", valid_document_ids=_aiter(["d1", "d3"]), valid_chunk_ids=_aiter(["c1", "c3"])
+    )
+
+    assert graph.nodes == {"Document": {"d1", "d3"}, "Chunk": {"c1", "c3"}}
+    assert set(graph.entities) == {"alpha"}
+    # l0b lost its only member, which in turn emptied its parent l1
+    assert set(graph.communities) == {"l0a"}
+    assert report.deleted == {"documents": 1, "chunks": 3, "entities": 2, "communities": 2}
+    assert all(len(w["ids"]) <= 2 for w in graph.writes)
+    assert ("chunks", 3) in progress
+    assert no_side_effects == ["t1"]
+
+
+async def test_delete_tenant_batches_per_label(no_side_effects):
+    class CountingGraph:
+        def __init__(self):
+            self.remaining = {"Chunk": 5, "Entity": 2}
+            self.queries = []
+
+        async def execute_write(self, query, params=None):
+            self.queries.append(query)
+            label = next((k for k in self.remaining if f":{k} " in query), None)
+            deleted = min(params["batch_size"], self.remaining.get(label, 0))
+            if label:
+                self.remaining[label] -= deleted
+            return [{"deleted": deleted}]
+
+    graph = CountingGraph()
+    deleted = await GraphGarbageCollector(graph, batch_size=2).delete_tenant("t1")
+
+    assert deleted == 7
+    assert graph.remaining == {"Chunk": 0, "Entity": 0}
+    assert graph.queries.count(DELETE_TENANT_BATCH_QUERY.format(label="Chunk")) == 3
+    assert no_side_effects == ["t1"]
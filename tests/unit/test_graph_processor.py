@@ -1,4 +1,5 @@
 import asyncio
+import contextlib
 import logging
 import time
 from types import SimpleNamespace
@@ -197,3 +198,60 @@ async def test_processor_supports_adaptive_concurrency_mode(caplog):
 
     messages = [record.getMessage() for record in caplog.records]
     assert any('"concurrency_mode": "adaptive"' in m for m in messages)
+
+
+@pytest.mark.asyncio
+async def test_processor_takes_cluster_leases_per_chunk(caplog):
+    caplog.set_level(logging.INFO)
+
+    class Capacity:
+        def __init__(self):
+            self.holds: list[tuple[str, str | None]] = []
+            self.in_flight = 0
+            self.peak = 0
+
+        @contextlib.asynccontextmanager
+        async def hold(self, *, work_class, kind="generate"):
+            self.holds.append((work_class, kind))
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            try:
+                yield SimpleNamespace(wait_ms=0.0)
+            finally:
+                self.in_flight -= 1
+
+        async def current_limit(self, work_class):
+            return 3
+
+    async def _extract(text, chunk_id=None, **kwargs):
+        await asyncio.sleep(0.01)
+        return ExtractionResult(entities=[], relationships=[])
+
+    capacity = Capacity()
+    chunks = [
+        _chunk(f"c{i}", "d1", f"Chunk {i} is long enough to be processed by the graph pipeline.")
+        for i in range(5)
+    ]
+
+    with (
+        patch("src.core.graph.application.processor.graph_writer"),
+        patch(
+            "src.core.graph.application.processor.resolve_graph_sync_runtime_config"
+        ) as mock_resolve,
+        patch.object(GraphProcessor, "_capacity_limiter", return_value=capacity),
+    ):
+        mock_resolve.return_value.profile = "adaptive"
+        mock_resolve.return_value.initial_concurrency = 1
+        mock_resolve.return_value.max_concurrency = 2
+        mock_resolve.return_value.adaptive_concurrency_enabled = True
+        mock_extractor = AsyncMock()
+        mock_extractor.extract = AsyncMock(side_effect=_extract)
+
+        await GraphProcessor(graph_extractor=mock_extractor).process_chunks(chunks, "tenant_1")
+
+    # One lease per chunk, reported by the extraction's own LLM calls
+    assert capacity.holds == [("ingestion", None)] * 5
+    assert capacity.peak == 2
+    messages = [record.getMessage() for record in caplog.records]
+    assert any('"concurrency_mode": "cluster"' in m for m in messages)
+    assert any('"final_concurrency_limit": 3' in m for m in messages)
@@ -1,23 +1,35 @@
 import pytest
 
+from src.core.graph.application.cypher_guard import get_cypher_guard
 from src.core.graph.domain.ports.graph_client import set_graph_client
 from src.core.tools.graph import query_graph
 
 
 class FakeGraphClient:
-    async def execute_read(self, query, parameters=None):
+    async def explain(self, query, parameters=None):
+        return {"query_type": "r", "plan": {"args": {"EstimatedRows": 2.0}}}
+
+    async def execute_bounded_read(self, query, parameters=None, *, timeout, max_rows):
         return [{"id": "1"}, {"id": "2"}]
 
 
+@pytest.fixture(autouse=True)
+def _no_graph_version(monkeypatch):
+    async def _version(_tenant_id):
+        return None
+
+    monkeypatch.setattr(get_cypher_guard(), "_version_reader", _version)
+
+
 @pytest.mark.asyncio
 async def test_query_graph_uses_injected_client():
     set_graph_client(FakeGraphClient())
-    result = await query_graph("MATCH (n) RETURN n")
-    assert "{'id': '1'}" in result
+    result = await query_graph("MATCH (n) RETURN n", tenant_id="t1")
+    assert '["1"]' in result
 
 
 @pytest.mark.asyncio
 async def test_query_graph_raises_when_not_configured():
     set_graph_client(None)
-    result = await query_graph("MATCH (n) RETURN n")
+    result = await query_graph("MATCH (n) RETURN n", tenant_id="t1")
     assert "Graph client not configured" in result
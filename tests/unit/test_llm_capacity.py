@@ -0,0 +1,337 @@
+import asyncio
+import random
+from dataclasses import replace
+
+import pytest
+
+from src.shared import llm_capacity
+from src.shared.llm_capacity import (
+    AdaptiveLimitState,
+    LLMCapacitySettings,
+    RedisLLMCapacityLimiter,
+    classify_outcome,
+    endpoint_key,
+)
+from src.shared.provider_models import RateLimitError
+
+SETTINGS = LLMCapacitySettings(
+    enabled=True,
+    redis_url="redis://test",
+    total=8,
+    reserved_chat=2,
+    reserved_ingestion=2,
+    lease_ttl_seconds=60,
+    chat_wait_timeout_seconds=1.0,
+    ingestion_wait_timeout_seconds=1.0,
+    communities_wait_timeout_seconds=1.0,
+)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.queued = []
+        self.watching = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def watch(self, key):
+        self.watching = True
+
+    def multi(self):
+        self.watching = False
+
+    def __getattr__(self, name):
+        # Commands run immediately while watching, otherwise on execute()
+        if self.watching:
+            return getattr(self.redis, name)
+
+        def queue(*args, **kwargs):
+            self.queued.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        results = []
+        for name, args, kwargs in self.queued:
+            results.append(await getattr(self.redis, name)(*args, **kwargs))
+        return results
+
+
+class FakeRedis:
+    """The Redis commands the limiter uses outside its Lua scripts."""
+
+    def __init__(self):
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.sets: dict[str, set[str]] = {}
+        self.waiting_seen: list[int] = []
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    async def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    async def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(mapping)
+
+    async def sadd(self, key, member):
+        self.sets.setdefault(key, set()).add(member)
+
+    async def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    async def zadd(self, key, mapping):
+        self.zsets.setdefault(key, {}).update(mapping)
+        self.waiting_seen.append(len(self.zsets[key]))
+
+    async def zrem(self, key, member):
+        self.zsets.get(key, {}).pop(member, None)
+
+    async def zremrangebyscore(self, key, low, high):
+        zset = self.zsets.get(key, {})
+        for member in [m for m, score in zset.items() if low <= score <= high]:
+            del zset[member]
+
+    async def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    limiter = RedisLLMCapacityLimiter(provider_key="ollama@test:11434", settings=SETTINGS)
+    limiter._redis = FakeRedis()
+    acquired: list[str] = []
+
+    async def try_acquire(*, work_class):
+        acquired.append(work_class)
+        return f"lease-{len(acquired)}"
+
+    async def release(lease_id):
+        pass
+
+    monkeypatch.setattr(limiter, "try_acquire", try_acquire)
+    monkeypatch.setattr(limiter, "release", release)
+    limiter.acquired = acquired
+    return limiter
+
+
+def _observe(state, outcome, latency_ms=100.0, now_ms=0, kind="generate", settings=SETTINGS):
+    state.observe(outcome, latency_ms, kind=kind, now_ms=now_ms, ceiling=6, settings=settings)
+
+
+def test_limit_grows_additively_and_is_capped_at_the_ceiling():
+    state = AdaptiveLimitState(limit=2.0)
+    for _ in range(4):
+        _observe(state, "ok")
+    assert 3.0 < state.limit < 4.0
+
+    for _ in range(100):
+        _observe(state, "ok")
+    assert state.limit == 6.0
+
+
+def test_rate_limits_from_many_workers_cut_the_limit_once_per_cooldown():
+    state = AdaptiveLimitState(limit=6.0)
+    # Eight workers see the same 429 burst within a second
+    for i in range(8):
+        _observe(state, "rate_limited", now_ms=10_000 + i * 100)
+    assert state.limit == pytest.approx(6.0 * 0.7)
+    assert (state.decreases, state.rate_limited) == (1, 8)
+
+    _observe(state, "rate_limited", now_ms=16_000)
+    assert state.limit == pytest.approx(6.0 * 0.7 * 0.7)
+
+    for i in range(20):
+        _observe(state, "rate_limited", now_ms=30_000 + i * 6_000)
+    assert state.limit == SETTINGS.min_limit
+
+
+def test_latency_above_baseline_and_error_rate_decrease_the_limit():
+    state = AdaptiveLimitState(limit=6.0)
+    for _ in range(10):
+        _observe(state, "ok", latency_ms=1_000)
+        # Embeddings share the class but keep their own baseline
+        _observe(state, "ok", latency_ms=50, kind="embed")
+    assert state.limit == 6.0 and state.decreases == 0
+
+    for i in range(10):
+        _observe(state, "ok", latency_ms=5_000, now_ms=10_000 + i * 1_000)
+    assert state.decreases == 2 and state.limit < 6.0
+
+    errors = AdaptiveLimitState(limit=6.0)
+    for i in range(5):
+        _observe(errors, "error", now_ms=10_000 + i)
+    assert errors.error_rate >= SETTINGS.error_rate_threshold
+    assert errors.decreases == 1
+
+
+def test_variable_latency_without_congestion_keeps_the_limit():
+    # Output length varies call to call: lognormal latency around 2s, no load
+    rng = random.Random(7)
+    state = AdaptiveLimitState(limit=6.0)
+    for i in range(2_000):
+        _observe(state, "ok", latency_ms=rng.lognormvariate(7.6, 0.8), now_ms=i * 500)
+
+    assert state.limit == 6.0
+
+
+def test_limit_grows_again_within_the_decrease_cooldown():
+    state = AdaptiveLimitState(limit=6.0)
+    _observe(state, "rate_limited", now_ms=10_000)
+    for i in range(5):
+        _observe(state, "ok", now_ms=10_100 + i)
+
+    assert state.decreases == 1 and state.limit > 6.0 * 0.7
+
+
+def test_state_round_trips_through_the_redis_hash():
+    state = AdaptiveLimitState(limit=6.0)
+    _observe(state, "ok", latency_ms=120)
+    _observe(state, "rate_limited", now_ms=50_000)
+
+    restored = AdaptiveLimitState.from_hash(state.to_hash(), default_limit=1)
+
+    assert restored.to_hash() == state.to_hash()
+    assert restored.baseline_ms == {"generate": 120.0}
+    assert AdaptiveLimitState.from_hash({}, default_limit=4).limit == 4.0
+
+
+def test_classify_outcome():
+    class ServerError(Exception):
+        status_code = 503
+
+    class BadRequest(Exception):
+        status_code = 400
+
+    assert classify_outcome(None) == "ok"
+    assert classify_outcome(RateLimitError("busy", provider="ollama")) == "rate_limited"
+    assert classify_outcome(ServerError()) == "error"
+    assert classify_outcome(ConnectionError()) == "error"
+    assert classify_outcome(BadRequest()) is None
+    assert classify_outcome(asyncio.CancelledError()) is None
+    assert classify_outcome(GeneratorExit(), responded=True) == "ok"
+
+
+def test_endpoint_key():
+    assert endpoint_key("ollama") == "ollama"
+    assert endpoint_key("ollama", "http://Ollama:11434/v1") == "ollama@ollama:11434"
+    assert endpoint_key("ollama", "ollama:11434") == "ollama@ollama:11434"
+
+
+async def test_rate_limited_calls_lower_the_shared_limit(limiter):
+    assert await limiter.current_limit("ingestion") == 6
+
+    with pytest.raises(RateLimitError):
+        async with limiter.hold(work_class="ingestion"):
+            raise RateLimitError("429", provider="ollama")
+
+    assert await limiter.current_limit("ingestion") == 4
+    # Another process's limiter on the same endpoint sees the same limit
+    other = RedisLLMCapacityLimiter(provider_key=limiter.provider_key, settings=SETTINGS)
+    other._redis = limiter._redis
+    assert await other.current_limit("ingestion") == 4
+    assert await other.current_limit("chat") == 8
+
+    snapshot = await limiter.snapshot()
+    assert snapshot["endpoint"] == "ollama@test:11434"
+    assert snapshot["classes"]["ingestion"]["limit"] == 4
+    assert snapshot["classes"]["ingestion"]["rate_limited"] == 1
+    assert snapshot["classes"]["chat"]["in_flight"] == 0
+
+
+async def test_nested_calls_reuse_the_outer_lease_and_report(limiter):
+    async with limiter.hold(work_class="ingestion", kind=None):
+        async with limiter.hold(work_class="ingestion", kind="generate"):
+            await asyncio.sleep(0)
+        async with limiter.hold(work_class="ingestion", kind="generate"):
+            await asyncio.sleep(0)
+
+    assert limiter.acquired == ["ingestion"]
+    control = limiter._redis.hashes[limiter._control_keys["ingestion"]]
+    assert control["completed"] == "2" and "baseline_ms:generate" in control
+
+    # Outside the block, calls take their own lease again
+    async with limiter.hold(work_class="ingestion"):
+        pass
+    assert limiter.acquired == ["ingestion", "ingestion"]
+
+
+async def test_stream_latency_is_time_to_first_response(limiter):
+    async with limiter.hold(work_class="chat", kind="stream") as lease:
+        lease.responded()
+        await asyncio.sleep(0.05)
+
+    control = limiter._redis.hashes[limiter._control_keys["chat"]]
+    assert float(control["baseline_ms:stream"]) < 40
+
+
+async def test_queued_callers_are_tracked_until_they_acquire(limiter, monkeypatch):
+    attempts = []
+
+    async def busy_then_free(*, work_class):
+        attempts.append(work_class)
+        return None if len(attempts) < 3 else "lease"
+
+    monkeypatch.setattr(limiter, "try_acquire", busy_then_free)
+    monkeypatch.setattr(limiter, "_poll_interval", lambda work_class: 0)
+
+    async with limiter.hold(work_class="communities", kind=None) as lease:
+        assert limiter._waiting_local["communities"] == 0
+
+    assert len(attempts) == 3 and lease.wait_ms >= 0
+    assert limiter._redis.waiting_seen == [1]
+    assert limiter._redis.zsets[limiter._waiting_keys["communities"]] == {}
+
+
+async def test_waiting_past_the_timeout_raises(limiter, monkeypatch):
+    async def busy(*, work_class):
+        return None
+
+    monkeypatch.setattr(limiter, "try_acquire", busy)
+    monkeypatch.setattr(limiter, "_wait_timeout", lambda work_class: 0.01)
+    monkeypatch.setattr(limiter, "_poll_interval", lambda work_class: 0.005)
+
+    with pytest.raises(TimeoutError):
+        async with limiter.hold(work_class="chat"):
+            pass
+    assert limiter._waiting_local["chat"] == 0
+
+
+async def test_static_limits_when_adaptive_is_off(limiter):
+    limiter._settings = replace(SETTINGS, adaptive=False)
+
+    with pytest.raises(RateLimitError):
+        async with limiter.hold(work_class="ingestion"):
+            raise RateLimitError("429", provider="ollama")
+
+    assert limiter._redis.hashes == {}
+    assert await limiter.current_limit("communities") == 4
+
+
+async def test_snapshot_lists_endpoints_reported_by_any_process(monkeypatch):
+    redis = FakeRedis()
+    redis.sets[llm_capacity._ENDPOINTS_KEY] = {"ollama@gpu-2:11434"}
+    monkeypatch.setattr(llm_capacity, "_settings", SETTINGS)
+    monkeypatch.setattr(llm_capacity, "_limiters", {})
+    registry = RedisLLMCapacityLimiter(provider_key="registry", settings=SETTINGS)
+    registry._redis = redis
+    monkeypatch.setattr(llm_capacity, "_registry", registry)
+    local = llm_capacity.get_ollama_capacity_limiter("http://gpu-1:11434/v1")
+    local._redis = redis
+    llm_capacity._get_limiter("ollama@gpu-2:11434")._redis = redis
+
+    snapshots = await llm_capacity.capacity_snapshot()
+
+    assert [s["endpoint"] for s in snapshots] == ["ollama@gpu-1:11434", "ollama@gpu-2:11434"]
+    assert llm_capacity.capacity_limiter_for("ollama", "http://gpu-1:11434/v1") is local
+    assert llm_capacity.capacity_limiter_for("openai") is None
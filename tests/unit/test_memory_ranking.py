@@ -0,0 +1,202 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.core.generation.application.memory.manager import ConversationMemoryManager
+from src.core.generation.application.memory.ranking import (
+    RankingConfig,
+    RelevantMemory,
+    select_memories,
+)
+from src.core.generation.domain.memory_models import ConversationSummary, UserFact
+from src.core.tenants.application.tenant_config_cache import TenantConfigSnapshot
+
+NOW = datetime(2026, 10, 18, tzinfo=UTC)
+
+
+def _words(text: str) -> int:
+    return len(text.split())
+
+
+def _fact(content, days_old=0, **kwargs):
+    return UserFact(
+        id=content, content=content, created_at=NOW - timedelta(days=days_old), **kwargs
+    )
+
+
+def _summary(title, summary, days_old=0):
+    return ConversationSummary(
+        id=title, title=title, summary=summary, created_at=NOW - timedelta(days=days_old)
+    )
+
+
+def _session_maker(rows=None, scalars=None):
+    session = MagicMock()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    session.dirty = []
+    results = []
+    if rows is not None:
+        results.append(MagicMock(all=MagicMock(return_value=rows)))
+    for batch in scalars or []:
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = batch
+        results.append(result)
+    session.execute = AsyncMock(side_effect=results)
+    factory = MagicMock()
+    factory.return_value.__aenter__ = AsyncMock(return_value=session)
+    factory.return_value.__aexit__ = AsyncMock(return_value=None)
+    return factory, session
+
+
+def test_select_prefers_similar_recent_memories_within_limits():
+    config = RankingConfig(fact_limit=2, min_similarity=0.3, half_life_days=30)
+    python = _fact("User writes Python", days_old=1)
+    stale_python = _fact("User wrote Python in school", days_old=365)
+    cooking = _fact("User likes cooking", days_old=0)
+    summary = _summary("Deploy", "Discussed Kubernetes deploys", days_old=2)
+
+    memory = select_memories(
+        [1.0, 0.0],
+        [(stale_python, [1.0, 0.1]), (cooking, [0.0, 1.0]), (python, [1.0, 0.05])],
+        [(summary, [0.8, 0.6])],
+        _words,
+        config,
+        now=NOW,
+    )
+
+    # Unrelated fact is dropped; the older near-identical fact loses on recency
+    assert memory.facts == [python, stale_python]
+    assert memory.summaries == [summary]
+
+
+def test_select_respects_token_budget_and_prompt_format():
+    long_fact = _fact("User " + "really " * 20 + "likes Rust")
+    short_fact = _fact("User likes Go")
+    config = RankingConfig(token_budget=6)
+
+    memory = select_memories(
+        [1.0], [(long_fact, [1.0]), (short_fact, [0.9])], [], _words, config, now=NOW
+    )
+
+    assert memory.facts == [short_fact]
+    assert memory.to_prompt() == "USER FACTS:\n- User likes Go"
+    assert RelevantMemory().to_prompt() == ""
+
+
+async def test_add_user_facts_skips_duplicates_in_one_transaction():
+    existing = [
+        SimpleNamespace(content="User prefers Python.", embedding=[1.0, 0.0], embedding_model="m")
+    ]
+    factory, session = _session_maker(rows=existing)
+    manager = ConversationMemoryManager()
+    # One vector per distinct normalized fact; "User works at ACME." never reaches the provider
+    embeddings = [[0.0, 1.0], [0.99, 0.05], [1.0, 0.0], [0.6, 0.8], [0.05, 1.0]]
+
+    with (
+        patch(
+            "src.core.generation.application.memory.manager.get_session_maker",
+            return_value=factory,
+        ),
+        patch.object(manager, "_embed", AsyncMock(return_value=(embeddings, "m"))) as embed,
+    ):
+        saved = await manager.add_user_facts(
+            "t1",
+            "u1",
+            [
+                "User works at Acme",
+                "The user likes Python a lot",
+                "user prefers python",
+                "User works at ACME.",
+                "User lives in Berlin",
+                "User works at Acme corp",
+            ],
+        )
+
+    embed.assert_awaited_once()
+    assert [fact.content for fact in saved] == ["User works at Acme", "User lives in Berlin"]
+    assert saved[0].embedding == [0.0, 1.0] and saved[0].embedding_model == "m"
+    assert session.add.call_count == 2
+    session.commit.assert_awaited_once()
+
+
+async def test_relevant_memory_falls_back_without_embeddings():
+    low = _fact("User likes tea", importance=0.2)
+    high = _fact("User is a data engineer", days_old=5, importance=0.9)
+    summary = _summary("Billing", "Asked about invoices")
+    factory, session = _session_maker(scalars=[[low, high], [summary]])
+    manager = ConversationMemoryManager()
+
+    with (
+        patch(
+            "src.core.generation.application.memory.manager.get_session_maker",
+            return_value=factory,
+        ),
+        patch.object(manager, "_embed", AsyncMock(return_value=None)),
+    ):
+        memory = await manager.get_relevant_memory("t1", "u1", "what do I do?")
+
+    assert memory.facts == [high, low]
+    assert memory.summaries == [summary]
+    session.commit.assert_not_awaited()
+
+
+async def test_relevant_memory_backfills_missing_embeddings_in_the_background():
+    fact = _fact("User is a data engineer", importance=0.5)
+    ranked = _fact("User likes Rust", embedding=[1.0, 0.0], embedding_model="m")
+    factory, session = _session_maker(scalars=[[fact, ranked], [], [fact]])
+    manager = ConversationMemoryManager()
+    embed = AsyncMock(side_effect=[([[1.0, 0.0]], "m"), ([[0.9, 0.1]], "m")])
+
+    with (
+        patch(
+            "src.core.generation.application.memory.manager.get_session_maker",
+            return_value=factory,
+        ),
+        patch.object(manager, "_embed", embed),
+    ):
+        memory = await manager.get_relevant_memory("t1", "u1", "what is my job?")
+        # Only the query is embedded before answering
+        embed.assert_awaited_once_with(["what is my job?"], "t1")
+        assert memory.facts == [ranked] and fact.embedding is None
+
+        # A concurrent recall doesn't start a second backfill
+        manager._schedule_backfill("t1", "u1", [fact])
+        assert len(manager._background) == 1
+        await asyncio.gather(*manager._background)
+
+    embed.assert_awaited_with(["User is a data engineer"], "t1")
+    assert fact.embedding == [0.9, 0.1] and fact.embedding_model == "m"
+    session.commit.assert_awaited_once()
+    assert manager._backfilling == set()
+
+
+async def test_memory_embeddings_use_the_tenant_embedding_model():
+    config = {"embedding_provider": "ollama", "embedding_model": "bge"}
+    snapshot = TenantConfigSnapshot("t1", config)
+    provider = MagicMock()
+    provider.embed = AsyncMock(return_value=SimpleNamespace(embeddings=[[1.0]], model="bge"))
+    provider_factory = MagicMock()
+    provider_factory.get_embedding_provider.return_value = provider
+    manager = ConversationMemoryManager()
+
+    with (
+        patch(
+            "src.core.generation.application.memory.manager.get_tenant_config_snapshot",
+            AsyncMock(return_value=snapshot),
+        ),
+        patch(
+            "src.core.generation.application.memory.manager.build_provider_factory",
+            return_value=provider_factory,
+        ) as build,
+        patch("src.shared.kernel.runtime.get_settings"),
+    ):
+        assert await manager._embed(["fact"], "t1") == ([[1.0]], "bge")
+        await manager._embed(["other fact"], "t1")
+
+    # Built once per config snapshot
+    build.assert_called_once()
+    provider_factory.get_embedding_provider.assert_called_once_with(
+        provider_name="ollama", model="bge"
+    )
@@ -0,0 +1,139 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.dialects import postgresql
+
+from src.core.admin_ops.application.metrics.collector import MetricsCollector, QueryMetrics
+from src.core.admin_ops.application.metrics.store import (
+    MetricsStore,
+    bucket_start,
+    decode_cursor,
+    encode_cursor,
+    metrics_to_row,
+    rollup_rows,
+)
+
+T0 = datetime(2026, 10, 18, 9, 15, tzinfo=UTC)
+
+
+def _metrics(i: int, **overrides) -> QueryMetrics:
+    values = {
+        "query_id": f"q{i}",
+        "tenant_id": "t1",
+        "query": f"question {i}",
+        "timestamp": T0 + timedelta(minutes=i),
+        "total_latency_ms": 100.0 * (i + 1),
+        "tokens_used": 10,
+        "cost_estimate": 0.5,
+        "model": "gpt",
+    }
+    values.update(overrides)
+    return QueryMetrics(**values)
+
+
+class RecordingStore(MetricsStore):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches: list[list[str]] = []
+
+    async def _write_batch(self, batch):
+        self.batches.append([m.query_id for m in batch])
+
+
+def test_rollup_rows_group_by_hour_operation_and_model():
+    rows = [
+        metrics_to_row(_metrics(0)),
+        metrics_to_row(_metrics(1, success=False, cache_hit=True)),
+        metrics_to_row(_metrics(50)),  # 10:05, next bucket
+        metrics_to_row(_metrics(2, model="other")),
+    ]
+
+    increments = {(r["bucket_start"].hour, r["model"]): r for r in rollup_rows(rows)}
+
+    first = increments[(9, "gpt")]
+    assert first["query_count"] == 2 and first["error_count"] == 1 and first["cache_hits"] == 1
+    assert first["tokens_used"] == 20 and first["cost_estimate"] == 1.0
+    assert first["total_latency_ms"] == 300.0 and first["max_latency_ms"] == 200.0
+    assert increments[(10, "gpt")]["query_count"] == 1
+    assert increments[(9, "other")]["query_count"] == 1
+
+
+def test_bucket_start_and_cursor_round_trip():
+    assert bucket_start(datetime(2026, 1, 1, 5, 59, 59)) == datetime(2026, 1, 1, 5, tzinfo=UTC)
+
+    metrics = _metrics(3)
+    assert decode_cursor(encode_cursor(metrics)) == (metrics.timestamp, "q3")
+    assert QueryMetrics.from_dict(metrics.to_dict()) == metrics
+
+
+async def test_flush_writes_in_batches_and_bounds_the_buffer():
+    store = RecordingStore(batch_size=2, max_pending=3, flush_interval=60)
+
+    accepted = [store.enqueue(_metrics(i)) for i in range(4)]
+    assert accepted == [True, True, True, False]
+    assert store.stats.dropped == 1
+
+    assert await store.flush() == 3
+    assert store.batches == [["q0", "q1"], ["q2"]]
+    await store.close()
+
+
+async def test_cancelled_write_requeues_batch():
+    store = RecordingStore(batch_size=10, flush_interval=60)
+    started = asyncio.Event()
+
+    async def slow_write(batch):
+        started.set()
+        await asyncio.sleep(10)
+
+    store._write_batch = slow_write
+    for i in range(3):
+        store.enqueue(_metrics(i))
+    flushing = asyncio.create_task(store.flush())
+    await started.wait()
+    flushing.cancel()
+    await asyncio.gather(flushing, return_exceptions=True)
+
+    assert [m.query_id for m in store._pending] == ["q0", "q1", "q2"]
+    store._pending.clear()
+    await store.close()
+
+
+async def test_collector_enqueues_and_falls_back_to_buffer():
+    store = RecordingStore(flush_interval=60)
+    collector = MetricsCollector(store=store)
+    await collector.record(_metrics(0))
+    assert store.pending_count == 1
+    store._pending.clear()
+    await store.close()
+
+    offline = MetricsCollector(enable_persistence=False)
+    for i in range(3):
+        await offline.record(_metrics(i))
+    recent = await offline.get_recent(tenant_id="t1", limit=2)
+    assert [m.query_id for m in recent] == ["q2", "q1"]
+
+
+def test_list_recent_uses_keyset_condition():
+    captured = {}
+
+    class Session:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def execute(self, stmt):
+            captured["sql"] = str(stmt.compile(dialect=postgresql.dialect()))
+            raise RuntimeError("stop")
+
+    store = MetricsStore(session_factory=Session)
+    try:
+        asyncio.run(store.list_recent(tenant_id="t1", cursor=encode_cursor(_metrics(0))))
+    except RuntimeError:
+        pass
+
+    sql = captured["sql"]
+    assert "(query_metrics.timestamp, query_metrics.query_id) <" in sql
+    assert "ORDER BY query_metrics.timestamp DESC, query_metrics.query_id DESC" in sql
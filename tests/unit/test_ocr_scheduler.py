@@ -0,0 +1,69 @@
+import threading
+
+import fitz  # PyMuPDF
+
+from src.core.ingestion.infrastructure.extraction.local.ocr_scheduler import (
+    OCR_FAILED,
+    OcrResultCache,
+    OcrScheduler,
+    contiguous_runs,
+)
+
+
+def _pdf(page_texts: list[str]) -> fitz.Document:
+    doc = fitz.open()
+    for text in page_texts:
+        doc.new_page().insert_text((72, 72), text)
+    return fitz.open(stream=doc.tobytes(), filetype="pdf")
+
+
+class RecordingConverter:
+    def __init__(self, fail_on: str | None = None):
+        self.fail_on = fail_on
+        self.calls: list[int] = []
+        self.threads: set[str] = set()
+
+    def __call__(self, pdf_bytes: bytes):
+        self.threads.add(threading.current_thread().name)
+        sub_doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+        texts = [page.get_text().strip() for page in sub_doc]
+        self.calls.append(len(texts))
+        if self.fail_on in texts:
+            raise RuntimeError("marker crashed")
+        return " | ".join(texts), [], {}
+
+
+def test_contiguous_runs_split_on_gaps_and_size():
+    assert contiguous_runs([7, 1, 2, 3, 4, 9, 10], max_pages=3) == [[1, 2, 3], [4], [7], [9, 10]]
+
+
+async def test_runs_are_batched_and_cached_by_page_content():
+    doc = _pdf([f"page {i}" for i in range(6)])
+    converter = RecordingConverter()
+    cache = OcrResultCache()
+    scheduler = OcrScheduler(converter, max_pages_per_batch=2, max_workers=2, cache=cache)
+
+    results = await scheduler.run(doc, [0, 1, 2, 4, 5])
+
+    assert results == {0: "page 0 | page 1", 2: "page 2", 4: "page 4 | page 5"}
+    assert sorted(converter.calls) == [1, 2, 2]
+    assert "MainThread" not in converter.threads
+
+    # Same pages in a different file: served from the cache
+    again = await OcrScheduler(converter, max_pages_per_batch=2, cache=cache).run(
+        _pdf([f"page {i}" for i in range(6)]), [0, 1, 2, 4, 5]
+    )
+    assert again == results
+    assert len(converter.calls) == 3 and cache.hits == 3
+
+
+async def test_failed_run_is_marked_and_not_cached():
+    doc = _pdf(["a", "b", "c"])
+    converter = RecordingConverter(fail_on="b")
+    scheduler = OcrScheduler(converter, max_pages_per_batch=1)
+
+    results = await scheduler.run(doc, [0, 1, 2])
+
+    assert results == {0: "a", 1: OCR_FAILED, 2: "c"}
+    await scheduler.run(doc, [1])
+    assert converter.calls.count(1) == 4
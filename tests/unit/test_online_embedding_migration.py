@@ -0,0 +1,180 @@
+import pytest
+
+from src.core.admin_ops.application import online_migration
+from src.core.admin_ops.application.online_migration import OnlineEmbeddingMigrator
+from src.core.tenants.application.active_vector_collection import (
+    EMBEDDING_MIGRATION_KEY,
+    resolve_shadow_vector_collection,
+)
+
+
+class FakeStore:
+    def __init__(self, name):
+        self.name = name
+        self.rows = {}
+        self.dropped = False
+
+    async def connect(self):
+        pass
+
+    async def upsert_chunks(self, chunks, flush=True):
+        for chunk in chunks:
+            self.rows[chunk["chunk_id"]] = chunk
+        return len(chunks)
+
+    async def flush(self):
+        pass
+
+    async def get_stats(self):
+        return {"num_entities": len(self.rows)}
+
+    async def drop_collection(self):
+        self.dropped = True
+        return True
+
+
+class FakeEmbeddings:
+    def __init__(self):
+        self.calls = 0
+
+    async def embed_texts(self, texts):
+        self.calls += 1
+        return [[float(len(t))] * 3 for t in texts], None
+
+
+class FakeSparse:
+    def embed_batch(self, texts):
+        return [{1: 0.5} for _ in texts]
+
+
+class InMemoryMigrator(OnlineEmbeddingMigrator):
+    """Migrator over an in-memory tenant config and chunk table."""
+
+    def __init__(self, chunks, **kwargs):
+        self.stores = {}
+        self.embeddings = FakeEmbeddings()
+        super().__init__(
+            session_factory=None,
+            settings=None,
+            vector_store_factory=self._store,
+            embedding_service_factory=lambda state: self.embeddings,
+            sparse_service=FakeSparse(),
+            **kwargs,
+        )
+        self.config = {"embedding_model": "old-model", "embedding_dimensions": 1536}
+        self.chunks = chunks
+
+    def _store(self, dimensions, collection_name=None):
+        return self.stores.setdefault(collection_name, FakeStore(collection_name))
+
+    async def _load_config(self, tenant_id):
+        return dict(self.config)
+
+    async def _count_chunks(self, tenant_id):
+        return len(self.chunks)
+
+    async def _update_config(self, tenant_id, mutate):
+        config = dict(self.config)
+        mutate(config)
+        self.config = config
+        return config
+
+    async def _read_batch(self, tenant_id, cursor):
+        ordered = sorted(self.chunks, key=lambda c: c["id"])
+        remaining = [c for c in ordered if cursor is None or c["id"] > cursor]
+        return remaining[: self.batch_size]
+
+
+def _chunk(i):
+    return {"id": f"c{i:03d}", "document_id": "d1", "content": f"text {i}", "metadata": {"page": i}}
+
+
+@pytest.fixture(autouse=True)
+def no_invalidation(monkeypatch):
+    async def noop(tenant_id=None):
+        return None
+
+    monkeypatch.setattr(online_migration, "invalidate_tenant_config", noop)
+
+
+async def test_backfill_and_cutover_swap_collection_and_model():
+    migrator = InMemoryMigrator([_chunk(i) for i in range(5)], batch_size=2)
+
+    state = await migrator.start("t1", "openai", "new-model", 3)
+    assert resolve_shadow_vector_collection(migrator.config)["target_collection"] == (
+        state["target_collection"]
+    )
+
+    result = await migrator.run("t1")
+
+    shadow = migrator.stores[state["target_collection"]]
+    assert len(shadow.rows) == 5
+    assert shadow.rows["c001"]["page"] == 1
+    assert shadow.rows["c001"]["sparse_vector"] == {1: 0.5}
+    assert result["status"] == "complete"
+    assert migrator.config["active_vector_collection"] == state["target_collection"]
+    assert migrator.config["previous_vector_collection"] == "amber_t1"
+    assert migrator.config["embedding_model"] == "new-model"
+    assert migrator.config["embedding_dimensions"] == 3
+    assert EMBEDDING_MIGRATION_KEY not in migrator.config
+
+
+async def test_backfill_resumes_from_cursor():
+    migrator = InMemoryMigrator([_chunk(i) for i in range(4)], batch_size=2, checkpoint_every=1)
+    await migrator.start("t1", "openai", "new-model", 3)
+
+    calls = 0
+    original = migrator._write_batch
+
+    async def failing_write(*args):
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise RuntimeError("embedding provider down")
+        await original(*args)
+
+    migrator._write_batch = failing_write
+    with pytest.raises(RuntimeError):
+        await migrator.backfill("t1")
+
+    state = migrator.config[EMBEDDING_MIGRATION_KEY]
+    assert state["status"] == "failed"
+    assert state["cursor"] == "c001"
+    # Failed migrations keep receiving dual-writes so they can be resumed
+    assert resolve_shadow_vector_collection(migrator.config) is not None
+
+    migrator._write_batch = original
+    embed_calls = migrator.embeddings.calls
+    state = await migrator.backfill("t1")
+
+    assert state["status"] == "ready"
+    assert state["migrated_chunks"] == 4
+    assert migrator.embeddings.calls == embed_calls + 1
+
+
+async def test_cutover_refuses_when_shadow_lags():
+    migrator = InMemoryMigrator([_chunk(i) for i in range(3)])
+    state = await migrator.start("t1", "openai", "new-model", 3)
+    await migrator.backfill("t1")
+
+    # A dual-write was lost: the shadow is missing a vector
+    migrator.stores[state["target_collection"]].rows.pop("c000")
+    migrator.config[EMBEDDING_MIGRATION_KEY]["cursor"] = "c999"
+
+    with pytest.raises(ValueError, match="not switching"):
+        await migrator.cutover("t1")
+    assert "active_vector_collection" not in migrator.config
+
+
+async def test_abort_drops_shadow_and_stops_dual_writes():
+    migrator = InMemoryMigrator([_chunk(0)])
+    state = await migrator.start("t1", "openai", "new-model", 3)
+
+    assert await migrator.abort("t1")
+    assert migrator.stores[state["target_collection"]].dropped
+    assert resolve_shadow_vector_collection(migrator.config) is None
+
+    # A new migration can start once the previous one is aborted, but not twice
+    await migrator.start("t1", "openai", "new-model", 3)
+    with pytest.raises(ValueError, match="already running"):
+        await migrator.start("t1", "openai", "new-model", 3)
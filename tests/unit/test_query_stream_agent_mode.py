@@ -49,6 +49,12 @@ class StubAgentOrchestrator:
             sources=[{"chunk_id": "chunk-1", "document_id": "doc-1", "score": 0.95}],
         )
 
+    async def run_stream(self, **_kwargs):
+        yield {"event": "tool_call", "data": {"step": 1, "id": "c1", "name": "list_files"}}
+        yield {"event": "token", "data": "Agent "}
+        yield {"event": "token", "data": "answer"}
+        yield {"event": "done", "data": {"answer": "Agent answer", "steps": 2, "trace": []}}
+
 
 def _build_post_request() -> Request:
     scope = {
@@ -137,4 +143,5 @@ async def test_query_stream_agent_mode_emits_done(monkeypatch):
     assert "event: conversation_id" in payload
     assert "event: done" in payload
     assert "Agent answer" in payload
+    assert "event: agent_step" in payload
     assert "event: processing_error" not in payload
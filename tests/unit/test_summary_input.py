@@ -0,0 +1,81 @@
+from src.core.generation.application.intelligence.summary_input import (
+    GAP_MARKER,
+    SummaryInputConfig,
+    build_summary_input,
+    cluster_order,
+    plan_map_groups,
+    select_chunks,
+)
+
+
+def _words(text: str) -> int:
+    return len(text.split())
+
+
+def _document():
+    """Three topics; the last one only appears at the end of the document."""
+    chunks, embeddings = [], []
+    for i in range(30):
+        topic = 0 if i < 20 else (1 if i < 27 else 2)
+        chunks.append(f"topic{topic} chunk{i} " + "word " * 8)
+        vector = [0.0, 0.0, 0.0]
+        vector[topic] = 1.0
+        vector[(topic + 1) % 3] = 0.01 * (i % 5)
+        embeddings.append(vector)
+    return chunks, embeddings
+
+
+def test_cluster_order_groups_topics_centroid_first():
+    _, embeddings = _document()
+
+    clusters = cluster_order(embeddings, 3)
+
+    assert [len(c) for c in clusters] == [20, 7, 3]
+    assert set(clusters[2]) == {27, 28, 29}
+    # Off-topic components are 0.00-0.04; the centroid sits at their mean
+    assert clusters[0][0] % 5 == 2
+
+
+def test_select_covers_every_cluster_within_budget():
+    chunks, embeddings = _document()
+    config = SummaryInputConfig(token_budget=40, max_clusters=3)
+
+    selected = select_chunks(chunks, embeddings, config, count_tokens=_words)
+
+    assert selected == sorted(selected)
+    assert sum(_words(chunks[i]) for i in selected) <= 40
+    topics = {chunks[i].split()[0] for i in selected}
+    assert topics == {"topic0", "topic1", "topic2"}
+
+
+def test_select_without_embeddings_samples_whole_document():
+    chunks, _ = _document()
+    config = SummaryInputConfig(token_budget=40, max_clusters=4)
+
+    selected = select_chunks(chunks, None, config, count_tokens=_words)
+
+    assert len(selected) == 4
+    assert selected[0] < 8 and selected[-1] >= 22
+
+
+def test_short_document_is_used_whole():
+    chunks = ["first part.", "second part."]
+
+    config = SummaryInputConfig()
+
+    selected = select_chunks(chunks, None, config, count_tokens=_words)
+
+    assert selected == [0, 1]
+    assert build_summary_input(chunks, selected, config) == "first part.\n\nsecond part."
+    assert GAP_MARKER in build_summary_input(["a", "b", "c"], [0, 2], config)
+
+
+def test_map_groups_are_bounded_and_budgeted():
+    chunks, embeddings = _document()
+    config = SummaryInputConfig(token_budget=30, max_map_groups=2)
+
+    groups = plan_map_groups(chunks, embeddings, config, count_tokens=_words)
+
+    assert len(groups) == 2
+    for group in groups:
+        assert sum(_words(chunks[i]) for i in group) <= 30
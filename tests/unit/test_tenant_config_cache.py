@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+
+from src.core.cache import invalidation
+from src.core.tenants.application import tenant_config_cache
+from src.core.tenants.application.tenant_config_cache import (
+    TENANT_CONFIG_CHANNEL,
+    TenantConfigCache,
+    TenantConfigSnapshot,
+    derive_from_config,
+    invalidate_tenant_config,
+)
+
+
+class VersionedCache(TenantConfigCache):
+    """Cache with an in-memory version counter instead of Redis."""
+
+    def __init__(self, loader, **kwargs):
+        super().__init__(loader=loader, **kwargs)
+        self.versions: dict[str, int] = {}
+
+    async def _read_version(self, tenant_id):
+        return f"0:{self.versions.get(tenant_id, 0)}"
+
+
+def test_snapshot_is_read_only_copy():
+    source = {"top_k": 5, "weights": {"vector": 1.0}}
+    snapshot = TenantConfigSnapshot("t1", source, version="0:1")
+
+    source["weights"]["vector"] = 0.0
+    copy = snapshot.to_dict()
+    copy["top_k"] = 10
+
+    assert snapshot["top_k"] == 5
+    assert snapshot.get("weights") == {"vector": 1.0}
+    assert "top_k" in snapshot and len(snapshot) == 2
+    with pytest.raises(TypeError):
+        snapshot["top_k"] = 1  # type: ignore[index]
+
+
+def test_derive_memoizes_only_on_snapshots():
+    snapshot = TenantConfigSnapshot("t1", {"ollama_base_url": "http://x"})
+    built = []
+
+    def builder():
+        built.append(object())
+        return built[-1]
+
+    first = derive_from_config(snapshot, ("factory", "http://x"), builder)
+    assert derive_from_config(snapshot, ("factory", "http://x"), builder) is first
+    derive_from_config({"ollama_base_url": "http://x"}, ("factory", "http://x"), builder)
+
+    assert len(built) == 2
+    assert snapshot.active_collection == snapshot.active_collection
+
+
+async def test_concurrent_gets_share_one_load():
+    calls = 0
+
+    async def loader(tenant_id):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"top_k": 7}
+
+    cache = VersionedCache(loader)
+    snapshots = await asyncio.gather(*(cache.get("t1") for _ in range(5)))
+
+    assert calls == 1
+    assert all(s is snapshots[0] for s in snapshots)
+    assert snapshots[0]["top_k"] == 7
+
+
+async def test_version_bump_triggers_reload_after_revalidation_window():
+    config = {"top_k": 1}
+
+    async def loader(tenant_id):
+        return dict(config)
+
+    cache = VersionedCache(loader, revalidate_after=0.0)
+    first = await cache.get("t1")
+    assert await cache.get("t1") is first
+
+    config["top_k"] = 2
+    cache.versions["t1"] = 1
+    second = await cache.get("t1")
+
+    assert second is not first
+    assert second["top_k"] == 2
+
+
+async def test_invalidate_drops_snapshot():
+    calls = 0
+
+    async def loader(tenant_id):
+        nonlocal calls
+        calls += 1
+        return {}
+
+    cache = VersionedCache(loader)
+    await cache.get("t1")
+    await cache.get("t2")
+    cache.invalidate("t1")
+    await cache.get("t1")
+    cache.invalidate()
+    await cache.get("t2")
+
+    assert calls == 4
+
+
+async def test_versions_and_broadcasts_share_the_pooled_client(monkeypatch):
+    class PooledRedis:
+        def __init__(self):
+            self.values: dict[str, int] = {}
+            self.published: list[tuple[str, str]] = []
+
+        async def incr(self, key):
+            self.values[key] = self.values.get(key, 0) + 1
+
+        async def mget(self, *keys):
+            return [self.values.get(key) for key in keys]
+
+        async def publish(self, channel, message):
+            self.published.append((channel, message))
+
+    client = PooledRedis()
+    for module in (tenant_config_cache, invalidation):
+        monkeypatch.setattr(module, "get_cache_client", lambda: client)
+
+    async def loader(tenant_id):
+        return {}
+
+    cache = TenantConfigCache(loader)
+    assert (await cache.get("t1")).version == "0:0"
+    await invalidate_tenant_config("t1")
+    await invalidate_tenant_config()
+
+    assert await cache._read_version("t1") == "1:1"
+    assert [message for _, message in client.published] == ["t1", "*"]
+    assert {channel for channel, _ in client.published} == {TENANT_CONFIG_CHANNEL}
@@ -0,0 +1,178 @@
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.core.admin_ops.application import tenant_stats
+from src.core.admin_ops.application.tenant_stats import (
+    GRAPH_COUNTS_QUERY,
+    TenantStatsRecorder,
+    TenantStatsService,
+    needs_reconcile,
+    stats_to_dict,
+)
+from src.core.generation.application.prompts.entity_extraction import (
+    ExtractedEntity,
+    ExtractedRelationship,
+    ExtractionResult,
+)
+from src.core.graph.application import writer as writer_module
+from src.core.graph.application.writer import GraphWriter
+
+NOW = datetime(2026, 10, 18, 13, tzinfo=UTC)
+
+
+class FakeSession:
+    def __init__(self, rows=None):
+        self.rows = list(rows or [])
+        self.statements = []
+        self.commits = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        row = self.rows.pop(0) if self.rows and "count(" in str(stmt) else None
+        return SimpleNamespace(one=lambda: row)
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        pass
+
+
+def _compiled(stmt):
+    return stmt.compile(compile_kwargs={"literal_binds": True})
+
+
+async def test_recorder_merges_deltas_and_clamps_at_zero():
+    session = FakeSession()
+    recorder = TenantStatsRecorder(session_factory=lambda: session)
+
+    recorder.add("t1", entities_total=3, relationships_total=2)
+    recorder.add("t1", entities_total=-1, communities_total=0)
+    recorder.add("t2", relationships_total=-4)
+    with pytest.raises(ValueError):
+        recorder.add("t1", documents_total=1)
+
+    assert await recorder.flush() == 2
+    insert, t1_update, t2_update = session.statements
+    assert "ON CONFLICT (tenant_id) DO NOTHING" in str(_compiled(insert))
+    sql = str(_compiled(t1_update))
+    assert "greatest(tenant_stats.entities_total + 2, 0)" in sql
+    assert "greatest(tenant_stats.relationships_total + 2, 0)" in sql
+    assert "communities_total" not in sql
+    assert "greatest(tenant_stats.relationships_total + -4, 0)" in str(_compiled(t2_update))
+    assert session.commits == 1
+    assert await recorder.flush() == 0
+
+
+async def test_reconcile_locks_the_row_and_overwrites_every_counter():
+    class Graph:
+        async def execute_read(self, query, parameters):
+            assert query == GRAPH_COUNTS_QUERY and parameters == {"tenant_id": "t1"}
+            return [{"entities": 40, "relationships": 90, "communities": 5}]
+
+    session = FakeSession(
+        rows=[
+            SimpleNamespace(total=10, ready=7, processing=2, failed=1),
+            SimpleNamespace(total=120, vectors=118),
+        ]
+    )
+    service = TenantStatsService(session_factory=lambda: session)
+
+    counts = await service.reconcile("t1", Graph())
+
+    assert "FOR UPDATE" in str(session.statements[1])
+    assert {k: v for k, v in counts.items() if k != "reconciled_at"} == {
+        "entities_total": 40,
+        "relationships_total": 90,
+        "communities_total": 5,
+        "documents_total": 10,
+        "documents_ready": 7,
+        "documents_processing": 2,
+        "documents_failed": 1,
+        "chunks_total": 120,
+        "vectors_total": 118,
+    }
+    update_sql = str(session.statements[-1])
+    assert update_sql.startswith("UPDATE tenant_stats") and "reconciled_at" in update_sql
+    assert session.commits == 1
+
+
+def test_reconcile_is_due_when_missing_or_stale():
+    assert needs_reconcile(stats_to_dict(None))
+    assert needs_reconcile({"reconciled_at": NOW - timedelta(hours=2)}, now=NOW)
+    assert not needs_reconcile({"reconciled_at": NOW - timedelta(minutes=5)}, now=NOW)
+
+
+async def test_graph_writer_reports_only_what_it_created(monkeypatch):
+    deltas = []
+    monkeypatch.setattr(
+        writer_module, "record_graph_delta", lambda tenant_id, **kw: deltas.append((tenant_id, kw))
+    )
+
+    class Graph:
+        async def execute_write_batch(self, statements):
+            assert "entities_created" in statements[0][0]
+            assert all("relationships_created" in query for query, _ in statements[1:])
+            return [[{"entities_created": 1}], [{"relationships_created": 1}], []]
+
+    result = ExtractionResult(
+        entities=[
+            ExtractedEntity(name="A", type="CONCEPT", description="a"),
+            ExtractedEntity(name="B", type="CONCEPT", description="b"),
+        ],
+        relationships=[
+            ExtractedRelationship(source="A", target="B", type="USES", description="", weight=1),
+            ExtractedRelationship(source="B", target="A", type="OWNS", description="", weight=1),
+        ],
+    )
+    with (
+        patch.object(writer_module, "get_graph_client", return_value=Graph()),
+        patch("src.core.graph.application.communities.lifecycle.CommunityLifecycleManager"),
+    ):
+        await GraphWriter().write_extraction_result("d1", "c1", "t1", result)
+
+    assert deltas == [("t1", {"entities_total": 1, "relationships_total": 1})]
+
+
+async def test_community_recount_sets_the_absolute_value(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(tenant_stats, "_session_maker", lambda: lambda: session)
+
+    class Graph:
+        async def execute_read(self, query, parameters):
+            return [{"communities": 12}]
+
+    assert await tenant_stats.recount_communities(Graph(), "t1") == 12
+    sql = str(_compiled(session.statements[0]))
+    assert "DO UPDATE SET communities_total = 12" in sql
+
+
+async def test_reconcile_scheduling_coalesces_on_the_pooled_client(monkeypatch):
+    keys: dict[str, str] = {}
+
+    class PooledRedis:
+        async def set(self, key, value, nx=False, ex=None):
+            if nx and key in keys:
+                return None
+            keys[key] = value
+            return True
+
+    class Dispatcher:
+        async def dispatch(self, task_name, args=None):
+            return f"task-{args[0]}"
+
+    monkeypatch.setattr(tenant_stats, "get_cache_client", lambda: PooledRedis())
+
+    first = await tenant_stats.schedule_stats_reconcile(Dispatcher(), "t1")
+    again = await tenant_stats.schedule_stats_reconcile(Dispatcher(), "t1")
+
+    assert (first, again) == ("task-t1", None)